@@ -0,0 +1,401 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "kage",
+# ]
+#
+# [tool.uv.sources]
+# kage = { path = "../", editable = true }
+# ///
+"""ベンチマーク用の合成データセット生成スクリプト。
+
+メモ・タスク・タグ・プロジェクト・用語 (同義語) と各中間テーブルを、ORM を通さず
+テーブル単位の一括 INSERT で生成します。乱数のシードと基準日時を固定しているため、
+同じ規模・シードからは常に同じ内容 (ID・本文・日時) のデータベースができます。
+
+規模はメモ件数で指定し、その他の件数はメモ件数に比例させます (`DatasetSpec.for_memos`)。
+`tests/benchmarks` のベンチマークはこのモジュールでデータベースを作成します。
+
+使用方法:
+    uv run python scripts/bench_dataset.py --size 100k --output storage/bench/bench_100k.db
+
+    # 既定のプリセット: 1k / 100k / 1m (数値も指定可)
+    uv run python scripts/bench_dataset.py --size 1m --output /tmp/bench_1m.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from sqlmodel import SQLModel
+
+# Ensure src is on sys.path to import app modules
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from database import create_sqlite_engine  # noqa: E402
+from logic.repositories.fulltext import ensure_fts_schema  # noqa: E402
+from models import (  # noqa: E402
+    AiSuggestionStatus,
+    Memo,
+    MemoStatus,
+    MemoTagLink,
+    Project,
+    ProjectStatus,
+    Synonym,
+    Tag,
+    Task,
+    TaskStatus,
+    TaskTagLink,
+    Term,
+    TermStatus,
+    TermTagLink,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy import Connection, Engine, Table
+
+DATASET_VERSION: Final[int] = 1
+"""生成ロジックのバージョン (生成内容を変えたら上げ、キャッシュしたデータベースを作り直させる)"""
+
+PRESETS: Final[dict[str, int]] = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+"""規模のプリセット (メモ件数)"""
+
+ANCHOR: Final[datetime] = datetime(2025, 6, 30, 12, 0)  # noqa: DTZ001 - アプリは naive なローカル時刻で保存する
+"""データの基準日時。作成日時は基準日時から過去 365 日に分布させる"""
+
+BATCH_SIZE: Final[int] = 10_000
+
+WORDS: Final = (
+    "会議",
+    "予算",
+    "議事録",
+    "プロジェクト",
+    "見積もり",
+    "レビュー",
+    "リリース",
+    "障害対応",
+    "顧客",
+    "提案書",
+    "スケジュール",
+    "採用",
+    "研修",
+    "経費精算",
+    "データベース",
+    "設計",
+)
+VERBS: Final = ("確認", "共有", "検討", "作成", "整理")
+
+MEMO_STATUSES: Final = (
+    (MemoStatus.INBOX, 30),
+    (MemoStatus.ACTIVE, 30),
+    (MemoStatus.IDEA, 10),
+    (MemoStatus.ARCHIVE, 30),
+)
+TASK_STATUSES: Final = (
+    (TaskStatus.TODO, 30),
+    (TaskStatus.TODAYS, 5),
+    (TaskStatus.PROGRESS, 10),
+    (TaskStatus.WAITING, 5),
+    (TaskStatus.COMPLETED, 40),
+    (TaskStatus.CANCELED, 5),
+    (TaskStatus.DRAFT, 5),
+)
+PROJECT_LINK_RATIO: Final[float] = 0.6
+"""プロジェクトに紐づけるタスクの割合"""
+
+MEMO_LINK_RATIO: Final[float] = 0.7
+"""メモに紐づけるタスクの割合"""
+
+PROJECT_STATUSES: Final = (
+    (ProjectStatus.ACTIVE, 50),
+    (ProjectStatus.ON_HOLD, 10),
+    (ProjectStatus.COMPLETED, 30),
+    (ProjectStatus.CANCELLED, 10),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetSpec:
+    """生成する件数
+
+    Attributes:
+        memos: メモ件数
+        tasks: タスク件数 (`MEMO_LINK_RATIO` の割合でメモに、`PROJECT_LINK_RATIO` の割合でプロジェクトに紐づける)
+        projects: プロジェクト件数
+        tags: タグ件数
+        terms: 用語件数 (各用語に同義語を 1 件付ける)
+        tags_per_memo: メモ 1 件あたりのタグ数 (0〜この値)
+        tags_per_task: タスク 1 件あたりのタグ数 (0〜この値)
+    """
+
+    memos: int
+    tasks: int
+    projects: int
+    tags: int
+    terms: int
+    tags_per_memo: int = 3
+    tags_per_task: int = 2
+
+    @classmethod
+    def for_memos(cls, memos: int) -> DatasetSpec:
+        """メモ件数から、その他の件数を比例させた規模を作る。"""
+        return cls(
+            memos=memos,
+            tasks=memos * 2,
+            projects=max(10, memos // 50),
+            tags=max(20, min(2_000, memos // 100)),
+            terms=max(100, memos // 10),
+        )
+
+    @classmethod
+    def parse(cls, size: str) -> DatasetSpec:
+        """プリセット名 (1k/100k/1m) またはメモ件数の文字列から規模を作る。"""
+        key = size.strip().lower()
+        if key in PRESETS:
+            return cls.for_memos(PRESETS[key])
+        return cls.for_memos(int(key.replace("_", "")))
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetSummary:
+    """生成結果の件数"""
+
+    spec: DatasetSpec
+    memo_tag_links: int
+    task_tag_links: int
+    seconds: float
+
+
+class _Generator:
+    """シード付きの乱数で各テーブルの行を生成する (行の生成順も乱数の消費順として固定される)"""
+
+    def __init__(self, spec: DatasetSpec, seed: int) -> None:
+        self.spec = spec
+        self.rng = random.Random(seed)  # noqa: S311 - 暗号用途ではない
+        self.tag_ids = [self.uuid() for _ in range(spec.tags)]
+        self.project_ids = [self.uuid() for _ in range(spec.projects)]
+        self.memo_ids = [self.uuid() for _ in range(spec.memos)]
+        self.term_ids = [self.uuid() for _ in range(spec.terms)]
+        self.task_ids: list[uuid.UUID] = []
+        """生成済みのタスクID (`tasks` の行を生成したものから追加される)"""
+
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def sentence(self, length: int) -> str:
+        rng = self.rng
+        return "、".join(f"{rng.choice(WORDS)}について{rng.choice(VERBS)}" for _ in range(length))
+
+    def moment(self) -> datetime:
+        return ANCHOR - timedelta(seconds=self.rng.randrange(365 * 24 * 60 * 60))
+
+    def pick(self, weighted: tuple[tuple[Any, int], ...]) -> Any:  # noqa: ANN401
+        values, weights = zip(*weighted, strict=True)
+        return self.rng.choices(values, weights=weights)[0]
+
+    def sample(self, population: list[uuid.UUID], upper: int) -> list[uuid.UUID]:
+        return self.rng.sample(population, self.rng.randint(0, min(upper, len(population))))
+
+    def tags(self) -> Iterator[dict[str, Any]]:
+        for index, tag_id in enumerate(self.tag_ids):
+            created = self.moment()
+            yield {
+                "id": tag_id,
+                "name": f"tag-{index:05d}",
+                "description": None,
+                "color": f"#{self.rng.randrange(0x1000000):06x}",
+                "created_at": created,
+                "updated_at": created,
+            }
+
+    def projects(self) -> Iterator[dict[str, Any]]:
+        for project_id in self.project_ids:
+            created = self.moment()
+            yield {
+                "id": project_id,
+                "title": self.sentence(1),
+                "description": self.sentence(4),
+                "status": self.pick(PROJECT_STATUSES),
+                "due_date": (created + timedelta(days=90)).date(),
+                "created_at": created,
+                "updated_at": created,
+            }
+
+    def memos(self) -> Iterator[dict[str, Any]]:
+        for memo_id in self.memo_ids:
+            created = self.moment()
+            yield {
+                "id": memo_id,
+                "title": self.sentence(1),
+                "content": self.sentence(8),
+                "status": self.pick(MEMO_STATUSES),
+                "ai_suggestion_status": AiSuggestionStatus.NOT_REQUESTED,
+                "ai_analysis_log": None,
+                "processed_at": None,
+                "created_at": created,
+                "updated_at": created,
+            }
+
+    def tasks(self) -> Iterator[dict[str, Any]]:
+        rng = self.rng
+        for _ in range(self.spec.tasks):
+            task_id = self.uuid()
+            self.task_ids.append(task_id)
+            created = self.moment()
+            status = self.pick(TASK_STATUSES)
+            completed = min(created + timedelta(hours=rng.randrange(1, 24 * 14)), ANCHOR)
+            yield {
+                "id": task_id,
+                "title": self.sentence(1),
+                "description": self.sentence(3),
+                "status": status,
+                "due_date": (created + timedelta(days=rng.randrange(1, 60))).date(),
+                "completed_at": completed if status == TaskStatus.COMPLETED else None,
+                "is_recurring": False,
+                "recurrence_rule": None,
+                "project_id": rng.choice(self.project_ids) if rng.random() < PROJECT_LINK_RATIO else None,
+                "memo_id": rng.choice(self.memo_ids) if self.memo_ids and rng.random() < MEMO_LINK_RATIO else None,
+                "created_at": created,
+                "updated_at": created,
+            }
+
+    def terms(self) -> Iterator[dict[str, Any]]:
+        for index, term_id in enumerate(self.term_ids):
+            created = self.moment()
+            yield {
+                "id": term_id,
+                "key": f"term-{index:07d}",
+                "title": self.sentence(1),
+                "description": self.sentence(3),
+                "status": TermStatus.APPROVED,
+                "source_url": None,
+                "created_at": created,
+                "updated_at": created,
+            }
+
+    def synonyms(self) -> Iterator[dict[str, Any]]:
+        for index, term_id in enumerate(self.term_ids):
+            yield {"id": self.uuid(), "text": f"synonym-{index:07d}", "term_id": term_id}
+
+    def links(self, owner_key: str, owner_ids: list[uuid.UUID], upper: int) -> Iterator[dict[str, Any]]:
+        for owner_id in owner_ids:
+            for tag_id in self.sample(self.tag_ids, upper):
+                yield {owner_key: owner_id, "tag_id": tag_id}
+
+
+def _insert(conn: Connection, table: Table, rows: Iterator[dict[str, Any]]) -> int:
+    count = 0
+    batch: list[dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            conn.execute(table.insert(), batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        conn.execute(table.insert(), batch)
+        count += len(batch)
+    return count
+
+
+def generate_dataset(engine: Engine, spec: DatasetSpec, *, seed: int = 0) -> DatasetSummary:
+    """空のデータベースに合成データを生成し、全文検索インデックスを構築する。
+
+    Args:
+        engine: 生成先のエンジン (テーブルがなければ作成する)
+        spec: 生成する件数
+        seed: 乱数のシード
+
+    Returns:
+        DatasetSummary: 生成した件数と所要時間
+    """
+    started = time.perf_counter()
+    SQLModel.metadata.create_all(engine)
+    gen = _Generator(spec, seed)
+    with engine.begin() as conn:
+        _insert(conn, _table(Tag), gen.tags())
+        _insert(conn, _table(Project), gen.projects())
+        _insert(conn, _table(Memo), gen.memos())
+        _insert(conn, _table(Task), gen.tasks())
+        _insert(conn, _table(Term), gen.terms())
+        _insert(conn, _table(Synonym), gen.synonyms())
+        memo_links = _insert(conn, _table(MemoTagLink), gen.links("memo_id", gen.memo_ids, spec.tags_per_memo))
+        task_links = _insert(conn, _table(TaskTagLink), gen.links("task_id", gen.task_ids, spec.tags_per_task))
+        _insert(conn, _table(TermTagLink), gen.links("term_id", gen.term_ids, 1))
+    ensure_fts_schema(engine)
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    return DatasetSummary(
+        spec=spec,
+        memo_tag_links=memo_links,
+        task_tag_links=task_links,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def build_database(path: Path, spec: DatasetSpec, *, seed: int = 0) -> DatasetSummary | None:
+    """ファイルにデータセットを作成する (同じ版の既存ファイルがあれば再利用して None を返す)。
+
+    Args:
+        path: 作成するデータベースファイル
+        spec: 生成する件数
+        seed: 乱数のシード
+
+    Returns:
+        DatasetSummary | None: 生成した場合はその結果、既存ファイルを再利用した場合は None
+    """
+    marker = path.with_suffix(path.suffix + ".ok")
+    stamp = f"v{DATASET_VERSION} seed={seed} {spec}"
+    if path.exists() and marker.exists() and marker.read_text(encoding="utf-8") == stamp:
+        return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in (path, marker, path.with_name(path.name + "-wal"), path.with_name(path.name + "-shm")):
+        stale.unlink(missing_ok=True)
+    engine = create_sqlite_engine(path)
+    try:
+        summary = generate_dataset(engine, spec, seed=seed)
+    finally:
+        engine.dispose()
+    marker.write_text(stamp, encoding="utf-8")
+    return summary
+
+
+def _table(model: type[SQLModel]) -> Table:
+    return model.__table__  # type: ignore[attr-defined]
+
+
+def main() -> None:
+    """コマンドライン引数に従ってデータセットを作成する。"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", default="1k", help="規模 (1k / 100k / 1m またはメモ件数)")
+    parser.add_argument("--output", type=Path, required=True, help="作成するデータベースファイル")
+    parser.add_argument("--seed", type=int, default=0, help="乱数のシード")
+    args = parser.parse_args()
+
+    spec = DatasetSpec.parse(args.size)
+    summary = build_database(args.output, spec, seed=args.seed)
+    if summary is None:
+        print(f"既存のデータセットを再利用します: {args.output}")  # noqa: T201
+        return
+    print(  # noqa: T201
+        f"memos={spec.memos:,} tasks={spec.tasks:,} projects={spec.projects:,} tags={spec.tags:,} "
+        f"terms={spec.terms:,} memo_tag={summary.memo_tag_links:,} task_tag={summary.task_tag_links:,} "
+        f"({summary.seconds:.1f}s) -> {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "kage",
+# ]
+#
+# [tool.uv.sources]
+# kage = { path = "../", editable = true }
+# ///
+"""SQLite チューニングプロファイルのベンチマークスクリプト。
+
+UI スレッドの読み取りと AI ジョブワーカーの書き込みが同時に走る状況を再現し、
+既定の `create_engine` (rollback journal) と `database.create_sqlite_engine` (WAL + PRAGMA)
+で読み取りレイテンシを比較します。一時ディレクトリの DB を使うため既存データには影響しません。
+
+使用方法:
+    uv run python scripts/bench_db_profile.py
+
+    # 書き込み件数・読み取り回数を変更
+    uv run python scripts/bench_db_profile.py --writes 500 --reads 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlalchemy import create_engine, func
+from sqlmodel import Session, SQLModel, select
+
+# Ensure src is on sys.path to import app modules
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from database import create_sqlite_engine  # noqa: E402
+from models import Memo  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy import Engine
+
+
+def _run(engine: Engine, *, writes: int, reads: int) -> list[float]:
+    """書き込みスレッドと並行して読み取りを実行し、読み取りレイテンシ (ms) を返す。"""
+    SQLModel.metadata.create_all(engine)
+    latencies: list[float] = []
+    done = threading.Event()
+
+    def writer() -> None:
+        try:
+            for i in range(writes):
+                with Session(engine) as session:
+                    session.add(Memo(title=f"bench {i}", content="x" * 512))
+                    session.commit()
+        finally:
+            done.set()
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    for _ in range(reads):
+        start = time.perf_counter()
+        with Session(engine) as session:
+            session.exec(select(func.count()).select_from(Memo)).one()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if done.is_set():
+            break
+    thread.join()
+    engine.dispose()
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1] if len(ordered) >= 20 else ordered[-1]  # noqa: PLR2004
+    print(  # noqa: T201
+        f"{label:<10} reads={len(ordered):>5}  p50={statistics.median(ordered):7.3f}ms  "
+        f"p95={p95:7.3f}ms  max={ordered[-1]:7.3f}ms"
+    )
+
+
+def main() -> None:
+    """ベンチマークを実行して結果を表示する。"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=300, help="書き込みスレッドのコミット回数")
+    parser.add_argument("--reads", type=int, default=5000, help="読み取り回数の上限")
+    args = parser.parse_args()
+
+    factories: dict[str, Callable[[Path], Engine]] = {
+        "baseline": lambda p: create_engine(f"sqlite:///{p}", connect_args={"check_same_thread": False}),
+        "tuned": create_sqlite_engine,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, factory in factories.items():
+            db_path = Path(tmp) / f"{label}.db"
+            _report(label, _run(factory(db_path), writes=args.writes, reads=args.reads))
+
+
+if __name__ == "__main__":
+    main()
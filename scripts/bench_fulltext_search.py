@@ -0,0 +1,138 @@
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "kage",
+# ]
+#
+# [tool.uv.sources]
+# kage = { path = "../", editable = true }
+# ///
+"""全文検索 (FTS5 trigram) と LIKE 検索のベンチマークスクリプト。
+
+一時ディレクトリの DB に指定件数のメモを生成し、同じクエリを
+`MemoRepository.search_fulltext` (FTS5) と従来相当の LIKE 検索で実行して所要時間を比較します。
+
+使用方法:
+    uv run python scripts/bench_fulltext_search.py
+
+    # 件数を指定 (既定: 10000 100000)
+    uv run python scripts/bench_fulltext_search.py --rows 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlmodel import Session, SQLModel
+
+# Ensure src is on sys.path to import app modules
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from database import create_sqlite_engine  # noqa: E402
+from logic.repositories.fulltext import MEMO_FTS, ensure_fts_schema  # noqa: E402
+from logic.repositories.memo import MemoRepository  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy import Engine
+
+WORDS = (
+    "会議",
+    "予算",
+    "議事録",
+    "プロジェクト",
+    "見積もり",
+    "レビュー",
+    "リリース",
+    "障害対応",
+    "顧客",
+    "提案書",
+    "スケジュール",
+    "採用",
+    "研修",
+    "経費精算",
+    "データベース",
+    "設計",
+)
+QUERIES = ("議事録", "経費精算", "障害対応 顧客", "データベース設計")
+BATCH_SIZE = 10_000
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    return "、".join(rng.choice(WORDS) + "について" + rng.choice(("確認", "共有", "検討")) for _ in range(length))
+
+
+def _seed(engine: Engine, rows: int) -> None:
+    """メモを一括生成する (ORM を通さず executemany で投入)。"""
+    SQLModel.metadata.create_all(engine)
+    rng = random.Random(rows)  # noqa: S311
+    base = datetime(2025, 1, 1)  # noqa: DTZ001
+    insert = (
+        "INSERT INTO memos (id, created_at, updated_at, title, content, status, ai_suggestion_status) "
+        "VALUES (?, ?, ?, ?, ?, 'INBOX', 'NOT_REQUESTED')"
+    )
+    with engine.begin() as conn:
+        for start in range(0, rows, BATCH_SIZE):
+            batch = []
+            for i in range(start, min(rows, start + BATCH_SIZE)):
+                ts = (base + timedelta(seconds=i)).isoformat(sep=" ")
+                batch.append((uuid.uuid4().hex, ts, ts, _sentence(rng, 2), _sentence(rng, 8)))
+            conn.exec_driver_sql(insert, batch)
+
+
+def _measure(func: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _compare(repo: MemoRepository, *, limit: int, repeat: int) -> None:
+    for query in QUERIES:
+        like_ms = _measure(
+            lambda q=query: repo._search_like(MEMO_FTS, q, limit=limit, with_details=False),  # noqa: SLF001
+            repeat,
+        )
+        fts_ms = _measure(lambda q=query: repo.search_fulltext(q, limit=limit), repeat)
+        ratio = like_ms / max(fts_ms, 1e-6)
+        print(f"  {query:<12} LIKE {like_ms:9.2f}ms  FTS5 {fts_ms:9.2f}ms  x{ratio:6.1f}")  # noqa: T201
+
+
+def main() -> None:
+    """ベンチマークを実行して結果を表示する。"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="生成するメモ件数")
+    parser.add_argument("--repeat", type=int, default=5, help="各クエリの計測回数 (中央値を表示)")
+    parser.add_argument("--limit", type=int, default=50, help="1 回の検索で取得する件数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            engine = create_sqlite_engine(Path(tmp) / f"bench_{rows}.db")
+            _seed(engine, rows)
+            start = time.perf_counter()
+            ensure_fts_schema(engine)
+            print(f"rows={rows:>9,}  索引構築 {time.perf_counter() - start:7.2f}s")  # noqa: T201
+
+            with Session(engine) as session:
+                _compare(MemoRepository(session), limit=args.limit, repeat=args.repeat)
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""ベンチマーク結果の保存形式と、コミット間の比較スクリプト。
+
+結果は JSON Lines (1 行 1 ベンチマーク) で追記します。1 行は次の形式です (時間はすべて秒)。
+
+    {"schema": 1, "commit": "24051a2", "dirty": false, "recorded_at": "2026-01-05T03:00:00+00:00",
+     "machine": {"platform": "Linux-6.8.0-x86_64-with-glibc2.39", "python": "3.12.7", "cpu_count": 8},
+     "dataset": "100k", "benchmark": "task_search", "rounds": 5,
+     "min": 0.012, "median": 0.013, "mean": 0.0131, "stddev": 0.0004, "max": 0.014}
+
+同じファイルに複数コミットの結果を貯め、`compare` でデータセットとベンチマークごとに中央値を比較します。
+マシン情報が異なる結果どうしの比較は警告を表示します。
+
+使用方法:
+    # 直近 2 コミットの結果を比較 (中央値が 10% 以上遅くなったら終了コード 1)
+    uv run python scripts/bench_results.py compare
+
+    # コミットとしきい値を指定
+    uv run python scripts/bench_results.py compare --baseline 7cceab2 --current 24051a2 --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from functools import cache
+from pathlib import Path
+from typing import Any, Final
+
+SCHEMA_VERSION: Final[int] = 1
+"""結果の行形式のバージョン"""
+
+DEFAULT_RESULTS_PATH: Final[Path] = Path(".benchmarks/results.jsonl")
+"""結果ファイルの既定の保存先"""
+
+DEFAULT_THRESHOLD: Final[float] = 0.10
+"""退行とみなす中央値の増加率"""
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """1 ベンチマークの計測結果 (結果ファイルの 1 行)"""
+
+    commit: str
+    dirty: bool
+    recorded_at: str
+    machine: dict[str, Any]
+    dataset: str
+    benchmark: str
+    rounds: int
+    min: float
+    median: float
+    mean: float
+    stddev: float
+    max: float
+    schema: int = field(default=SCHEMA_VERSION)
+
+    @classmethod
+    def from_samples(cls, benchmark: str, dataset: str, samples: list[float]) -> BenchmarkResult:
+        """計測した所要時間 (秒) から、現在の環境の結果を作る。"""
+        env = environment()
+        return cls(
+            commit=env["commit"],
+            dirty=env["dirty"],
+            recorded_at=datetime.now(UTC).isoformat(timespec="seconds"),
+            machine=env["machine"],
+            dataset=dataset,
+            benchmark=benchmark,
+            rounds=len(samples),
+            min=min(samples),
+            median=statistics.median(samples),
+            mean=statistics.fmean(samples),
+            stddev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            max=max(samples),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, sort_keys=True)
+
+    @classmethod
+    def from_json(cls, line: str) -> BenchmarkResult:
+        data = json.loads(line)
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """同じデータセット・ベンチマークの 2 コミット間の比較"""
+
+    dataset: str
+    benchmark: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """中央値の増加率 (0.1 なら 10% 遅い)"""
+        return self.current / self.baseline - 1 if self.baseline > 0 else 0.0
+
+
+@cache
+def environment() -> dict[str, Any]:
+    """コミットとマシンの情報を返す (プロセス内で 1 回だけ取得する)。"""
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD") or "unknown",
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+        },
+    }
+
+
+def append_results(path: Path, results: list[BenchmarkResult]) -> None:
+    """結果ファイルへ追記する。"""
+    if not results:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.writelines(result.to_json() + "\n" for result in results)
+
+
+def load_results(path: Path) -> list[BenchmarkResult]:
+    """結果ファイルを読み込む (未対応の形式の行は読み飛ばす)。"""
+    if not path.exists():
+        return []
+    results: list[BenchmarkResult] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        result = BenchmarkResult.from_json(line)
+        if result.schema == SCHEMA_VERSION:
+            results.append(result)
+    return results
+
+
+def compare(results: list[BenchmarkResult], baseline: str, current: str) -> list[Comparison]:
+    """2 コミットの結果を、データセット・ベンチマークごとに中央値で比較する (同じコミットの結果は最新を使う)。"""
+    latest: dict[tuple[str, str, str], BenchmarkResult] = {}
+    for result in results:
+        latest[(result.commit, result.dataset, result.benchmark)] = result
+    comparisons: list[Comparison] = []
+    for (commit, dataset, benchmark), result in sorted(latest.items()):
+        if commit != current:
+            continue
+        base = latest.get((baseline, dataset, benchmark))
+        if base is not None:
+            comparisons.append(Comparison(dataset, benchmark, base.median, result.median))
+    return comparisons
+
+
+def _git(*args: str) -> str:
+    try:
+        completed = subprocess.run(["git", *args], capture_output=True, text=True, check=True)  # noqa: S603, S607
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    return completed.stdout.strip()
+
+
+def _recent_commits(results: list[BenchmarkResult]) -> list[str]:
+    commits: list[str] = []
+    for result in sorted(results, key=lambda result: result.recorded_at):
+        if result.commit in commits:
+            commits.remove(result.commit)
+        commits.append(result.commit)
+    return commits
+
+
+def _run_compare(args: argparse.Namespace) -> int:
+    results = load_results(args.file)
+    commits = _recent_commits(results)
+    current = args.current or (commits[-1] if commits else None)
+    baseline = args.baseline or next((commit for commit in reversed(commits) if commit != current), None)
+    if current is None or baseline is None:
+        print(f"比較できる 2 コミット分の結果がありません: {args.file}")  # noqa: T201
+        return 1
+
+    machines = {json.dumps(r.machine, sort_keys=True) for r in results if r.commit in (baseline, current)}
+    if len(machines) > 1:
+        print("警告: 異なるマシンで計測した結果を比較しています")  # noqa: T201
+
+    regressions = 0
+    print(f"baseline={baseline} current={current}")  # noqa: T201
+    for item in compare(results, baseline, current):
+        regressed = item.change > args.threshold
+        regressions += regressed
+        mark = "  <-- 退行" if regressed else ""
+        print(  # noqa: T201
+            f"  {item.dataset:>6} {item.benchmark:<40} {item.baseline * 1000:10.2f}ms -> "
+            f"{item.current * 1000:10.2f}ms {item.change:+7.1%}{mark}"
+        )
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    """コマンドライン引数に従って結果を比較する。"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compare_parser = subparsers.add_parser("compare", help="2 コミットの結果を比較する")
+    compare_parser.add_argument("--file", type=Path, default=DEFAULT_RESULTS_PATH, help="結果ファイル")
+    compare_parser.add_argument("--baseline", help="比較元のコミット (既定: 直前に計測したコミット)")
+    compare_parser.add_argument("--current", help="比較先のコミット (既定: 最後に計測したコミット)")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="退行とみなす中央値の増加率")
+    args = parser.parse_args()
+    sys.exit(_run_compare(args))
+
+
+if __name__ == "__main__":
+    main()
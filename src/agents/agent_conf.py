@@ -52,3 +52,4 @@ class OpenVINODevice(Enum):
 
 SQLITE_DB_PATH = f"{STORAGE_DIR}/agents.db"
 LLM_MODEL_DIR = f"{STORAGE_DIR}/llms"
+LLM_CACHE_DB_PATH = f"{STORAGE_DIR}/llm_cache.db"
@@ -1,26 +1,40 @@
 from __future__ import annotations
 
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Final, TypeVar, cast
+from uuid import uuid4
 
 from langgraph.graph import StateGraph
 from pydantic import BaseModel
 from typing_extensions import TypedDict
 
 from agents.agent_conf import HuggingFaceModel, LLMProvider
-from agents.utils import agents_logger, get_memory, get_model
+from agents.build_cache import cached_runnable, compiled_graph
+from agents.checkpoint_store import CheckpointStore, get_checkpoint_store
+from agents.model_registry import MODEL_REGISTRY
+from agents.response_cache import get_response_cache
+from agents.streaming import AgentStreamEvent, message_chunk_text
+from agents.utils import agents_logger, get_model
 from errors import KageError, ValidationError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Hashable, Iterator
 
     from langchain_core.language_models.chat_models import BaseChatModel
     from langchain_core.outputs import outputs
+    from langchain_core.prompts import BasePromptTemplate
+    from langchain_core.runnables import Runnable
     from langchain_core.runnables.config import RunnableConfig
     from langgraph.graph.state import CompiledStateGraph
 
+AGENT_ID_KEY: Final = "kage_agent_id"
+"""実行 config の configurable に格納する、処理を委譲するエージェントインスタンスの ID"""
+
+_live_agents: weakref.WeakValueDictionary[str, BaseAgent[Any, Any]] = weakref.WeakValueDictionary()
+
 
 class AgentStatus(Enum):
     """エージェントの実行状態."""
@@ -68,6 +82,44 @@ ValidateType = TypeVar("ValidateType", bound=BaseModel)
 KwargsAny = Any
 
 
+class _NodeDispatcher[AgentT]:
+    """共有グラフの構築時に `create_graph` の self として渡すオブジェクト
+
+    ``self.method`` の参照を、実行時の config に含まれるエージェント ID から
+    インスタンスを引いて ``method`` を呼ぶ関数に置き換える。
+    """
+
+    def __init__(self, agent_class: type[AgentT]) -> None:
+        self._agent_class = agent_class
+
+    def as_agent(self) -> AgentT:
+        """`create_graph` の self として渡せるよう、エージェントの型として返す
+
+        Returns:
+            AgentT: このディスパッチャ (メソッドの参照だけを受け付ける)
+        """
+        return cast("AgentT", self)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("__") or not hasattr(self._agent_class, name):
+            raise AttributeError(name)
+        if not callable(getattr(self._agent_class, name)):
+            err_msg = f"create_graph ではメソッド以外の属性を参照できません: {self._agent_class.__name__}.{name}"
+            raise TypeError(err_msg)
+
+        # config は引数名で判定されて渡されるため、名前を変えないこと
+        def _dispatch(state: Any, config) -> Any:  # noqa: ANN001, ANN401
+            agent_id = config.get("configurable", {}).get(AGENT_ID_KEY)
+            agent = _live_agents.get(agent_id) if agent_id else None
+            if agent is None:
+                err_msg = f"Agent instance for graph node '{name}' is not available: {agent_id}"
+                raise RuntimeError(err_msg)
+            return getattr(agent, name)(state)
+
+        _dispatch.__name__ = name
+        return _dispatch
+
+
 class BaseAgent[StateType: BaseAgentState, ReturnType](ABC):
     """LangGraphエージェントのベースクラス.
 
@@ -80,10 +132,11 @@ class BaseAgent[StateType: BaseAgentState, ReturnType](ABC):
         _state (type[Any]): エージェントの状態の型
         -- オプション項目 --
         _status (AgentStatus): エージェントの実行状態 (デフォルトはIDLE)
-        _model (BaseChatModel | None): 使用するLLMモデル (デフォルトはNone、_get_modelで初期化)
+        _model (BaseChatModel | None): 使用するLLMモデル (デフォルトはNone、get_modelで初期化。FAKE 以外は共有モデル)
         _model_name (str | None): 使用するモデルの名前 (デフォルトはNone)
         _fake_responses (list[str] | None): FAKEプロバイダ用のダミー応答リスト (デフォルトはNone)
         _graph (CompiledStateGraph | None): エージェントのグラフ (デフォルトはNone、_create_graphで初期化)
+        _checkpointing (bool): 共有ストアへチェックポイントを保存するか (1 回で完結するエージェントは False)
     """
 
     # 必須
@@ -97,6 +150,9 @@ class BaseAgent[StateType: BaseAgentState, ReturnType](ABC):
     _model_name: HuggingFaceModel | str | None = None
     _fake_responses: list[BaseModel] | None = None
     _graph: CompiledStateGraph | None = None
+    _model_release: weakref.finalize | None = None
+    _model_id: str | None = None
+    _checkpointing: bool = True
     # 旧仕様互換は撤去済み
 
     def __init__(
@@ -118,12 +174,15 @@ class BaseAgent[StateType: BaseAgentState, ReturnType](ABC):
             device (str | None): OPENVINO モデル利用時の実行デバイス
         """
         self._model_name = model_name
-        self._memory = get_memory()
+        self._checkpoints: CheckpointStore | None = get_checkpoint_store() if self._checkpointing else None
         self._verbose = verbose
         self._error_response = error_response
         self._device = device
 
         self.provider = provider
+        self._agent_id = str(uuid4())
+        _live_agents[self._agent_id] = self
+        self._runnables: dict[Hashable, Any] = {}
         self._graph = self._create_graph()
 
     @property
@@ -171,24 +230,90 @@ class BaseAgent[StateType: BaseAgentState, ReturnType](ABC):
     def _create_graph(self) -> CompiledStateGraph:
         """LangGraphのグラフを作成.
 
+        グラフはエージェントクラスごとに 1 回だけコンパイルして共有する。
+        ノードは実行時の config (`get_config`) で指定されたインスタンスへ処理を委譲する。
+
         Returns:
             作成されたStateGraphインスタンス
         """
-        graph_builder = self.create_graph(StateGraph(self._state))
-        return graph_builder.compile(checkpointer=self._memory)
+        agent_class = type(self)
+
+        def _build() -> CompiledStateGraph:
+            dispatcher = _NodeDispatcher(agent_class).as_agent()
+            graph_builder = agent_class.create_graph(dispatcher, StateGraph(self._state))
+            checkpointer = self._checkpoints.saver if self._checkpoints is not None else None
+            return graph_builder.compile(checkpointer=checkpointer)
+
+        return compiled_graph(agent_class, _build)
 
     def get_model(self) -> BaseChatModel:
         """LLMモデルを取得.
 
+        FAKE 以外のプロバイダはプロセス共有のモデルレジストリから取得し、
+        同じ (プロバイダ, モデル, デバイス) のエージェント間で重みを共有する。
+        参照はエージェントの破棄時 (または `close` 呼び出し時) に返却される。
+
         Returns:
             BaseChatModel: 使用するLLMモデル
         """
         if not self._model:
-            self._model = get_model(self.provider, self._model_name, self._fake_responses, device=self._device)
+            if self.provider == LLMProvider.FAKE:
+                # FAKE は応答の進行状態を持つためエージェントごとに構築する
+                self._model = get_model(self.provider, self._model_name, self._fake_responses, device=self._device)
+            else:
+                lease = MODEL_REGISTRY.acquire(self.provider, self._model_name, device=self._device)
+                self._model_release = weakref.finalize(self, lease.release)
+                self._model = lease.model
+                self._model_id = f"{lease.key.provider.value}:{lease.key.model_name}"
+                self._runnables = lease.runnables
         return self._model
 
+    def get_structured_runnable(
+        self, schema: type[BaseModel], prompt: BasePromptTemplate | None = None
+    ) -> Runnable[Any, Any]:
+        """構造化出力のランナー (``prompt | model.with_structured_output(schema)``) を取得する.
+
+        ランナーはモデル単位でキャッシュされ、同じモデルを使うエージェント間で再利用される。
+        プロンプトは同一インスタンスで識別するため、モジュール定数など生成済みのものを渡すこと。
+        FAKE 以外でプロンプトを指定した場合は、応答を `agents.response_cache` に保存して再利用する。
+
+        Args:
+            schema: 構造化出力の Pydantic モデル型
+            prompt: 前段に接続するプロンプト (None の場合はモデルのみ)
+
+        Returns:
+            Runnable[Any, Any]: 構造化出力を返すランナー
+        """
+        model = self.get_model()
+
+        def _build() -> Runnable[Any, Any]:
+            structured = model.with_structured_output(schema)
+            if prompt is None:
+                return structured
+            response_cache = get_response_cache() if self.provider != LLMProvider.FAKE else None
+            if response_cache is None:
+                return prompt | structured
+            model_id = self._model_id or self.provider.value
+            return response_cache.wrap(prompt, structured, schema=schema, model_id=model_id)
+
+        return cached_runnable(self._runnables, (schema, id(prompt)), _build)
+
+    def close(self) -> None:
+        """共有モデルの参照を返却する (以降の get_model で再取得される)"""
+        if self._model_release is not None:
+            self._model_release()
+            self._model_release = None
+        self._model = None
+        self._runnables = {}
+
     def get_config(self, thread_id: str) -> RunnableConfig:
-        return {"configurable": {"thread_id": thread_id}}
+        return {"configurable": {"thread_id": thread_id, AGENT_ID_KEY: self._agent_id}}
+
+    def _run_config(self, thread_id: str) -> RunnableConfig:
+        """実行用の config を返し、チェックポイントを保存するスレッドの利用を記録する。"""
+        if self._checkpoints is not None:
+            self._checkpoints.touch(thread_id)
+        return self.get_config(thread_id)
 
     def _create_return_response(self, final_response: dict[str, Any] | Any) -> ReturnType | AgentError:  # noqa: ANN401
         """レスポンスを ReturnType に変換するメソッド（デフォルト実装）。
@@ -206,12 +331,19 @@ class BaseAgent[StateType: BaseAgentState, ReturnType](ABC):
             return final_response
         return final_response  # type: ignore[return-value]
 
-    def invoke(self, state: StateType, thread_id: str) -> ReturnType | AgentError:
+    def invoke(
+        self,
+        state: StateType,
+        thread_id: str,
+        *,
+        on_event: Callable[[AgentStreamEvent], None] | None = None,
+    ) -> ReturnType | AgentError:
         """ユーザー入力を処理して応答を生成し、常に型付き結果を返す。
 
         Args:
             state (StateType): エージェントの状態
             thread_id (str): スレッドID
+            on_event: 途中経過 (ノード完了・トークン) を受け取るコールバック。指定時はグラフを stream で実行する
 
         Returns:
             ReturnType | AgentError: 正常系は dataclass、異常系は AgentError
@@ -224,10 +356,13 @@ class BaseAgent[StateType: BaseAgentState, ReturnType](ABC):
 
         if self._verbose:
             agents_logger.debug(f"Invoking agent with input: {state} in thread: {thread_id}")
-        response = self._graph.invoke(
-            state,
-            self.get_config(thread_id),
-        )
+        if on_event is None:
+            response = self._graph.invoke(
+                state,
+                self._run_config(thread_id),
+            )
+        else:
+            response = self._invoke_streaming(state, thread_id, on_event)
         if self._verbose:
             agents_logger.debug(f"Graph invoke response: {response}")
 
@@ -246,6 +381,46 @@ class BaseAgent[StateType: BaseAgentState, ReturnType](ABC):
         else:
             return converted
 
+    def _invoke_streaming(
+        self,
+        state: StateType,
+        thread_id: str,
+        on_event: Callable[[AgentStreamEvent], None],
+    ) -> dict[str, Any] | Any:  # noqa: ANN401
+        """グラフを stream で実行し、途中経過を通知しながら最終状態を返す。"""
+        if not self._graph:
+            err_msg = "Graph is not initialized. Please create the graph before invoking."
+            agents_logger.error(err_msg)
+            raise RuntimeError(err_msg)
+
+        final_state: dict[str, Any] | Any = None
+        for mode, chunk in self._graph.stream(
+            state,
+            self._run_config(thread_id),
+            stream_mode=["updates", "messages", "values"],
+        ):
+            if mode == "values":
+                final_state = chunk
+            elif mode == "updates" and isinstance(chunk, dict):
+                for node, update in chunk.items():
+                    payload = update if isinstance(update, dict) else None
+                    self._emit_event(on_event, AgentStreamEvent(kind="node", node=node, update=payload))
+            elif mode == "messages":
+                message, metadata = chunk
+                text = message_chunk_text(message)
+                if text:
+                    node = str(metadata.get("langgraph_node", "")) if isinstance(metadata, dict) else ""
+                    self._emit_event(on_event, AgentStreamEvent(kind="token", node=node, text=text))
+        return final_state
+
+    @staticmethod
+    def _emit_event(on_event: Callable[[AgentStreamEvent], None], event: AgentStreamEvent) -> None:
+        # 表示側の例外でエージェントの実行を止めない
+        try:
+            on_event(event)
+        except Exception as e:
+            agents_logger.warning(f"Stream event listener failed: {e}")
+
     def stream(self, state: StateType, thread_id: str) -> Iterator[dict[str, Any] | Any]:
         """ユーザー入力をストリーミングして応答を生成.
 
@@ -266,7 +441,7 @@ class BaseAgent[StateType: BaseAgentState, ReturnType](ABC):
 
         yield from self._graph.stream(
             state,
-            self.get_config(thread_id),
+            self._run_config(thread_id),
             stream_mode="messages",
         )
 
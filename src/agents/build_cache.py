@@ -0,0 +1,146 @@
+"""コンパイル済みグラフ・構造化出力ランナーのキャッシュ
+
+エージェントを生成するたびに `StateGraph` をコンパイルし、呼び出しのたびに
+``prompt | model.with_structured_output(schema)`` を組み立てるコストを避けるため、
+一度構築したものを再利用する。
+
+- グラフ: エージェントクラスごとに 1 回だけコンパイルする。ノードは実行時の config に含まれる
+  エージェント ID から実行中のインスタンスを引いて処理を委譲するため、インスタンス間で共有できる
+- ランナー: (スキーマ, プロンプト) ごとに、モデルに紐づくキャッシュ (共有モデルはレジストリのエントリ) へ保持する
+
+再利用のたびに、初回構築にかかった時間を「節約した時間」として集計する。
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+from agents.utils import agents_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from langgraph.graph.state import CompiledStateGraph
+
+
+@dataclass(frozen=True, slots=True)
+class BuildStats:
+    """構築キャッシュの監視用カウンタ
+
+    Attributes:
+        graph_builds: グラフをコンパイルした回数
+        graph_reuses: コンパイル済みグラフを再利用した回数
+        runnable_builds: ランナーを構築した回数
+        runnable_reuses: 構築済みランナーを再利用した回数
+        saved_seconds: 再利用により省略できた構築時間の合計 (秒)
+    """
+
+    graph_builds: int
+    graph_reuses: int
+    runnable_builds: int
+    runnable_reuses: int
+    saved_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class _Built[T]:
+    value: T
+    build_seconds: float
+
+
+class _BuildCounters:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.graph_builds = self.graph_reuses = 0
+        self.runnable_builds = self.runnable_reuses = 0
+        self.saved_seconds = 0.0
+
+
+_counters: Final = _BuildCounters()
+_graph_lock: Final = threading.Lock()
+_graphs: dict[type, _Built[CompiledStateGraph]] = {}
+
+
+def compiled_graph(agent_class: type, build: Callable[[], CompiledStateGraph]) -> CompiledStateGraph:
+    """エージェントクラスのコンパイル済みグラフを取得する (未構築なら build で構築する)
+
+    Args:
+        agent_class: エージェントクラス
+        build: グラフを構築・コンパイルする関数
+
+    Returns:
+        CompiledStateGraph: 共有のコンパイル済みグラフ
+    """
+    with _graph_lock:
+        cached = _graphs.get(agent_class)
+        if cached is None:
+            started = time.perf_counter()
+            cached = _graphs[agent_class] = _Built(build(), time.perf_counter() - started)
+            with _counters.lock:
+                _counters.graph_builds += 1
+            agents_logger.debug("Compiled graph for {} in {:.1f} ms", agent_class.__name__, cached.build_seconds * 1000)
+            return cached.value
+    with _counters.lock:
+        _counters.graph_reuses += 1
+        _counters.saved_seconds += cached.build_seconds
+    agents_logger.debug(
+        "Reused compiled graph for {} (saved {:.1f} ms)", agent_class.__name__, cached.build_seconds * 1000
+    )
+    return cached.value
+
+
+def cached_runnable[T](cache: dict[Hashable, Any], key: Hashable, build: Callable[[], T]) -> T:
+    """キャッシュ済みのランナーを取得する (未構築なら build で構築して保持する)
+
+    同時に構築された場合は先に登録されたものを使う (構築は冪等な前提)。
+
+    Args:
+        cache: ランナーを保持する辞書 (モデル単位)
+        key: ランナーのキー
+        build: ランナーを構築する関数
+
+    Returns:
+        T: 構築済みのランナー
+    """
+    cached: _Built[T] | None = cache.get(key)
+    if cached is not None:
+        with _counters.lock:
+            _counters.runnable_reuses += 1
+            _counters.saved_seconds += cached.build_seconds
+        return cached.value
+    started = time.perf_counter()
+    value = build()
+    built: _Built[T] = cache.setdefault(key, _Built(value, time.perf_counter() - started))
+    with _counters.lock:
+        _counters.runnable_builds += 1
+    return built.value
+
+
+def get_build_stats() -> BuildStats:
+    """構築キャッシュの監視用カウンタを取得する"""
+    with _counters.lock:
+        return BuildStats(
+            graph_builds=_counters.graph_builds,
+            graph_reuses=_counters.graph_reuses,
+            runnable_builds=_counters.runnable_builds,
+            runnable_reuses=_counters.runnable_reuses,
+            saved_seconds=_counters.saved_seconds,
+        )
+
+
+def reset_build_stats() -> None:
+    """監視用カウンタを 0 に戻す (キャッシュ自体は維持する)"""
+    with _counters.lock:
+        _counters.reset()
+
+
+def clear_graph_cache() -> None:
+    """コンパイル済みグラフをすべて破棄する (チェックポインタを差し替える場合などに使用する)"""
+    with _graph_lock:
+        _graphs.clear()
@@ -0,0 +1,167 @@
+"""LangGraph チェックポイントの共有ストア
+
+エージェントごとに SQLite 接続と `SqliteSaver` を作らず、プロセスで 1 つの接続 (WAL) と saver を共有する。
+
+- 接続: `check_same_thread=False` の接続を 1 本だけ開き、読み書きは `SqliteSaver` のロックで直列化する
+- 不要なチェックポイント: 1 回きりの呼び出しで完結するエージェント (ワンライナー・レビュー) は
+  `BaseAgent._checkpointing = False` でチェックポイントを保存しない
+- 掃除: スレッドごとの最終利用時刻を `checkpoint_threads` に記録し、`max_age_seconds` を過ぎたスレッドと、
+  新しい順に `max_threads` 件を超えたスレッドのチェックポイントを削除する。起動時と `gc_interval` 回の利用ごとに実行する
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from agents.agent_conf import SQLITE_DB_PATH
+from agents.utils import agents_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DEFAULT_MAX_AGE_SECONDS: Final[int] = 7 * 24 * 60 * 60
+"""チェックポイントを残す既定の期間 (7 日)"""
+
+DEFAULT_MAX_THREADS: Final[int] = 500
+"""チェックポイントを残す既定のスレッド数"""
+
+DEFAULT_GC_INTERVAL: Final[int] = 100
+"""掃除を実行する間隔 (スレッドの利用回数)"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoint_threads (
+    thread_id TEXT PRIMARY KEY,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_checkpoint_threads_last_used_at ON checkpoint_threads (last_used_at);
+"""
+
+# SqliteSaver が作成するテーブルのうち thread_id を持つもの
+_CHECKPOINT_TABLES: Final = ("checkpoints", "writes")
+
+
+class CheckpointStore:
+    """プロセスで共有する LangGraph チェックポイントの保存先 (スレッドセーフ)"""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS,
+        max_threads: int = DEFAULT_MAX_THREADS,
+        gc_interval: int = DEFAULT_GC_INTERVAL,
+    ) -> None:
+        """CheckpointStore を初期化し、古いチェックポイントを掃除する
+
+        Args:
+            path: SQLite ファイルのパス
+            max_age_seconds: 最後に使われてからチェックポイントを残す期間 (秒)
+            max_threads: チェックポイントを残すスレッド数
+            gc_interval: 掃除を実行する間隔 (スレッドの利用回数)
+        """
+        self.max_age_seconds = max_age_seconds
+        self.max_threads = max(0, max_threads)
+        self.gc_interval = max(1, gc_interval)
+        self._touches = 0
+        self._touch_lock = threading.Lock()
+
+        db_path = Path(path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn = conn
+        self.saver = SqliteSaver(conn)
+        with self.saver.cursor() as cur:
+            cur.executescript(_SCHEMA)
+        self.collect_garbage()
+
+    def touch(self, thread_id: str) -> None:
+        """スレッドの最終利用時刻を記録する (`gc_interval` 回ごとに掃除も行う)"""
+        with self.saver.cursor() as cur:
+            cur.execute(
+                "INSERT INTO checkpoint_threads (thread_id, last_used_at) VALUES (?, ?) "
+                "ON CONFLICT(thread_id) DO UPDATE SET last_used_at = excluded.last_used_at",
+                (thread_id, time.time()),
+            )
+        with self._touch_lock:
+            self._touches += 1
+            due = self._touches % self.gc_interval == 0
+        if due:
+            self.collect_garbage()
+
+    def collect_garbage(self, *, now: float | None = None) -> int:
+        """期限切れ・上限超過のスレッドと、利用記録のないスレッドのチェックポイントを削除する
+
+        Args:
+            now: 基準時刻 (UNIX 秒。省略時は現在時刻)
+
+        Returns:
+            int: 削除したスレッド数
+        """
+        cutoff = (time.time() if now is None else now) - self.max_age_seconds
+        with self.saver.cursor() as cur:
+            expired = cur.execute(
+                "SELECT thread_id FROM checkpoint_threads WHERE last_used_at < ?", (cutoff,)
+            ).fetchall()
+            overflow = cur.execute(
+                "SELECT thread_id FROM checkpoint_threads ORDER BY last_used_at DESC LIMIT -1 OFFSET ?",
+                (self.max_threads,),
+            ).fetchall()
+            # 利用記録を取る前に保存されたチェックポイント
+            untracked = cur.execute(
+                "SELECT DISTINCT thread_id FROM checkpoints "
+                "WHERE thread_id NOT IN (SELECT thread_id FROM checkpoint_threads)"
+            ).fetchall()
+            thread_ids = {row[0] for row in (*expired, *overflow, *untracked)}
+            self._delete_threads(cur, thread_ids)
+        if thread_ids:
+            agents_logger.debug("Removed checkpoints of {} threads", len(thread_ids))
+        return len(thread_ids)
+
+    def thread_count(self) -> int:
+        """利用記録のあるスレッド数を返す"""
+        with self.saver.cursor(transaction=False) as cur:
+            row = cur.execute("SELECT COUNT(*) FROM checkpoint_threads").fetchone()
+        return int(row[0]) if row else 0
+
+    def close(self) -> None:
+        """接続を閉じる"""
+        with self.saver.lock:
+            self._conn.close()
+
+    @staticmethod
+    def _delete_threads(cur: sqlite3.Cursor, thread_ids: Iterable[str]) -> None:
+        params = [(thread_id,) for thread_id in thread_ids]
+        if not params:
+            return
+        for table in (*_CHECKPOINT_TABLES, "checkpoint_threads"):
+            cur.executemany(f"DELETE FROM {table} WHERE thread_id = ?", params)  # noqa: S608
+
+
+_store: CheckpointStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """プロセス共有のチェックポイントストアを返す (初回呼び出し時に作成する)"""
+    global _store  # noqa: PLW0603
+    with _store_lock:
+        if _store is None:
+            _store = CheckpointStore(SQLITE_DB_PATH)
+        return _store
+
+
+__all__ = [
+    "DEFAULT_GC_INTERVAL",
+    "DEFAULT_MAX_AGE_SECONDS",
+    "DEFAULT_MAX_THREADS",
+    "CheckpointStore",
+    "get_checkpoint_store",
+]
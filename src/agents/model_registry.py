@@ -0,0 +1,347 @@
+"""プロセス共有の LLM モデルレジストリ
+
+エージェントごとに `get_model` を呼ぶと、同じ OpenVINO モデルの重みがエージェントの数だけ読み込まれる。
+このモジュールは (プロバイダ, モデル名, デバイス) をキーにモデルを 1 つだけ読み込み、全エージェントで共有する。
+
+- 遅延読み込み: 最初に `acquire` されたときに読み込む。同じキーの同時読み込みは 1 回にまとめる
+- 参照カウント: `acquire` で +1、`ModelLease.release` で -1。参照中のモデルは破棄しない
+- LRU 破棄: 読み込み済みモデルの推定サイズ合計がメモリ予算を超えた場合、参照されていないものから古い順に破棄する
+- ウォームアップ: 読み込み直後に登録済みのフックを呼ぶ。`preload` で事前に読み込んでおくこともできる
+
+FAKE プロバイダのモデルは応答の進行状態をインスタンスに持つため共有しない (常に新規に構築する)。
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from agents.agent_conf import HuggingFaceModel, LLMProvider, OpenVINODevice
+from agents.utils import agents_logger, build_openvino_model, get_model
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from langchain_core.language_models.chat_models import BaseChatModel
+
+DEFAULT_MEMORY_BUDGET_BYTES: Final[int] = 12 * 1024**3
+"""読み込み済みモデルの推定サイズ合計の既定上限 (12 GiB)"""
+
+DEFAULT_GOOGLE_MODEL: Final = "gemini-2.0-flash"
+
+
+@dataclass(frozen=True, slots=True)
+class ModelKey:
+    """モデルを共有する単位
+
+    Attributes:
+        provider: LLM プロバイダ
+        model_name: モデル名 (既定モデルは具体名に正規化済み)
+        device: 実行デバイス (OpenVINO 以外は None)
+    """
+
+    provider: LLMProvider
+    model_name: str | None
+    device: str | None
+
+    @classmethod
+    def create(
+        cls, provider: LLMProvider, model_name: HuggingFaceModel | str | None = None, *, device: str | None = None
+    ) -> ModelKey:
+        """既定値を補ってキーを生成する (省略指定と明示指定が同じキーになるようにする)
+
+        Args:
+            provider: LLM プロバイダ
+            model_name: モデル名
+            device: 実行デバイス
+
+        Returns:
+            ModelKey: 正規化したキー
+        """
+        name = model_name.value if isinstance(model_name, HuggingFaceModel) else model_name
+        if provider == LLMProvider.OPENVINO:
+            return cls(
+                provider,
+                name or HuggingFaceModel.QWEN_3_8B_INT4.value,
+                (device or OpenVINODevice.CPU.value).upper(),
+            )
+        if provider == LLMProvider.GOOGLE:
+            return cls(provider, name or DEFAULT_GOOGLE_MODEL, None)
+        return cls(provider, name, None)
+
+
+@dataclass(frozen=True, slots=True)
+class LoadedModel:
+    """ローダーの戻り値
+
+    Attributes:
+        model: 構築したチャットモデル
+        size_bytes: メモリ予算の計算に使う推定サイズ (リモート API のモデルは 0)
+    """
+
+    model: BaseChatModel
+    size_bytes: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ModelEntryStats:
+    """レジストリ内のモデルの監視用情報
+
+    Attributes:
+        key: モデルのキー
+        loaded: 読み込み済みかどうか
+        ref_count: 参照中のエージェント数
+        size_bytes: 推定サイズ
+        acquisitions: `acquire` された回数
+    """
+
+    key: ModelKey
+    loaded: bool
+    ref_count: int
+    size_bytes: int
+    acquisitions: int
+
+
+@dataclass(eq=False)
+class ModelLease:
+    """共有モデルの利用権
+
+    `release` するまでモデルは破棄されない。`release` は何度呼んでもよい。
+    ``runnables`` はモデル単位で共有するランナーのキャッシュで、モデルの破棄とともに破棄される。
+    """
+
+    key: ModelKey
+    model: BaseChatModel
+    runnables: dict[Hashable, Any] = field(default_factory=dict)
+    _registry: ModelRegistry | None = field(default=None, repr=False)
+
+    def release(self) -> None:
+        """参照を返却する"""
+        registry, self._registry = self._registry, None
+        if registry is not None:
+            registry.release(self.key)
+
+
+@dataclass(eq=False)
+class _Entry:
+    model: BaseChatModel | None = None
+    size_bytes: int = 0
+    ref_count: int = 0
+    acquisitions: int = 0
+    load_lock: threading.Lock = field(default_factory=threading.Lock)
+    runnables: dict[Hashable, Any] = field(default_factory=dict)
+
+
+type WarmupHook = Callable[[ModelKey, "BaseChatModel"], None]
+type ModelLoader = Callable[[ModelKey], LoadedModel]
+
+
+def _directory_size(path: str) -> int:
+    root = Path(path)
+    if root.is_file():
+        return root.stat().st_size
+    return sum(entry.stat().st_size for entry in root.rglob("*") if entry.is_file())
+
+
+def load_registry_model(key: ModelKey) -> LoadedModel:
+    """キーに対応するモデルを構築する (既定のローダー)
+
+    Args:
+        key: モデルのキー
+
+    Returns:
+        LoadedModel: 構築したモデルと推定サイズ
+    """
+    if key.provider == LLMProvider.OPENVINO:
+        model_name: HuggingFaceModel | str | None = key.model_name
+        # 不正なモデル名は build_openvino_model 側で ValidationError にする
+        with contextlib.suppress(ValueError):
+            model_name = HuggingFaceModel(key.model_name)
+        model, model_path = build_openvino_model(model_name, device=key.device)
+        return LoadedModel(model, _directory_size(model_path))
+    return LoadedModel(get_model(key.provider, key.model_name, device=key.device))
+
+
+class ModelRegistry:
+    """参照カウント付きの共有モデルレジストリ (スレッドセーフ)"""
+
+    def __init__(
+        self,
+        *,
+        memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+        loader: ModelLoader = load_registry_model,
+    ) -> None:
+        """ModelRegistry を初期化する
+
+        Args:
+            memory_budget_bytes: 読み込み済みモデルの推定サイズ合計の上限
+            loader: キーからモデルを構築する関数
+        """
+        self.memory_budget_bytes = memory_budget_bytes
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[ModelKey, _Entry] = OrderedDict()
+        self._warmup_hooks: list[WarmupHook] = []
+
+    # ==============================================================================
+    # 取得・返却
+    # ==============================================================================
+
+    def acquire(
+        self, provider: LLMProvider, model_name: HuggingFaceModel | str | None = None, *, device: str | None = None
+    ) -> ModelLease:
+        """共有モデルを取得する (未読み込みならここで読み込む)
+
+        Args:
+            provider: LLM プロバイダ
+            model_name: モデル名
+            device: 実行デバイス
+
+        Returns:
+            ModelLease: モデルの利用権。使い終わったら `release` する
+
+        Raises:
+            ValueError: FAKE プロバイダが指定された場合 (共有しないため)
+        """
+        if provider == LLMProvider.FAKE:
+            msg = "FAKE プロバイダのモデルは共有できません"
+            raise ValueError(msg)
+        key = ModelKey.create(provider, model_name, device=device)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+            entry.ref_count += 1
+            entry.acquisitions += 1
+            self._entries.move_to_end(key)
+        try:
+            model = self._ensure_loaded(key, entry)
+        except BaseException:
+            self.release(key)
+            raise
+        return ModelLease(key, model, entry.runnables, self)
+
+    def release(self, key: ModelKey) -> None:
+        """参照を 1 つ返却する (通常は `ModelLease.release` を使う)
+
+        Args:
+            key: モデルのキー
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.ref_count == 0:
+                return
+            entry.ref_count -= 1
+            if entry.model is None and entry.ref_count == 0:
+                # 読み込みに失敗したエントリは残さない
+                del self._entries[key]
+                return
+            self._evict_over_budget(protect=None)
+
+    def preload(
+        self, provider: LLMProvider, model_name: HuggingFaceModel | str | None = None, *, device: str | None = None
+    ) -> None:
+        """モデルを事前に読み込み、参照なしの状態でキャッシュしておく
+
+        Args:
+            provider: LLM プロバイダ
+            model_name: モデル名
+            device: 実行デバイス
+        """
+        self.acquire(provider, model_name, device=device).release()
+
+    # ==============================================================================
+    # ウォームアップ・監視
+    # ==============================================================================
+
+    def add_warmup_hook(self, hook: WarmupHook) -> None:
+        """読み込み直後に呼ぶフックを登録する (例外はログに記録して無視する)
+
+        Args:
+            hook: (キー, モデル) を受け取る関数
+        """
+        with self._lock:
+            self._warmup_hooks.append(hook)
+
+    def evict_idle(self) -> int:
+        """参照されていないモデルをすべて破棄する
+
+        Returns:
+            int: 破棄したモデル数
+        """
+        with self._lock:
+            idle = [key for key, entry in self._entries.items() if entry.ref_count == 0]
+            for key in idle:
+                del self._entries[key]
+        if idle:
+            agents_logger.info("Evicted {} idle model(s) from registry", len(idle))
+        return len(idle)
+
+    def stats(self) -> list[ModelEntryStats]:
+        """監視用の情報を取得する (古い順)"""
+        with self._lock:
+            return [
+                ModelEntryStats(
+                    key=key,
+                    loaded=entry.model is not None,
+                    ref_count=entry.ref_count,
+                    size_bytes=entry.size_bytes,
+                    acquisitions=entry.acquisitions,
+                )
+                for key, entry in self._entries.items()
+            ]
+
+    @property
+    def loaded_bytes(self) -> int:
+        """読み込み済みモデルの推定サイズ合計"""
+        with self._lock:
+            return sum(entry.size_bytes for entry in self._entries.values() if entry.model is not None)
+
+    # ==============================================================================
+    # 内部処理
+    # ==============================================================================
+
+    def _ensure_loaded(self, key: ModelKey, entry: _Entry) -> BaseChatModel:
+        # 同じキーの読み込みはエントリ単位のロックで 1 回にまとめ、他のキーの取得はブロックしない
+        with entry.load_lock:
+            if entry.model is not None:
+                return entry.model
+            agents_logger.info("Loading shared model: {}", key)
+            loaded = self._loader(key)
+            self._run_warmup_hooks(key, loaded.model)
+            with self._lock:
+                entry.model = loaded.model
+                entry.size_bytes = loaded.size_bytes
+                self._evict_over_budget(protect=key)
+            return loaded.model
+
+    def _run_warmup_hooks(self, key: ModelKey, model: BaseChatModel) -> None:
+        with self._lock:
+            hooks = list(self._warmup_hooks)
+        for hook in hooks:
+            try:
+                hook(key, model)
+            except Exception as e:
+                # ウォームアップの失敗で読み込みを失敗させない
+                agents_logger.warning("Model warm-up hook failed for {}: {}", key, e)
+
+    def _evict_over_budget(self, *, protect: ModelKey | None) -> None:
+        # 呼び出し側で self._lock を保持していること
+        total = sum(entry.size_bytes for entry in self._entries.values() if entry.model is not None)
+        for key in list(self._entries):
+            if total <= self.memory_budget_bytes:
+                return
+            entry = self._entries[key]
+            if key == protect or entry.ref_count > 0 or entry.model is None:
+                continue
+            total -= entry.size_bytes
+            del self._entries[key]
+            agents_logger.info("Evicted model {} from registry ({} bytes)", key, entry.size_bytes)
+
+
+MODEL_REGISTRY: Final = ModelRegistry()
+"""全エージェントで共有するモデルレジストリ"""
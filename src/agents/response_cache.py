@@ -0,0 +1,292 @@
+"""構造化出力の LLM 応答キャッシュ
+
+同じプロンプト・同じ入力を同じモデルへ送った場合に、前回の構造化出力を再利用する。
+ワンライナーの再計算、週次レビューで同じダイジェストを送り直す場合、変更のないメモへの AI 再実行などで
+LLM 呼び出しを省略できる。
+
+- キー: (プロンプトテンプレート, 描画済みプロンプト, プロバイダ:モデル, スキーマ) の SHA-256
+- 保存先: ローカルの SQLite ファイル (`LLM_CACHE_DB_PATH`)。プロセスを再起動しても有効
+- 破棄: 登録から `ttl_seconds` を過ぎたものは使わずに削除する。件数が `max_entries` を超えたら
+  最後に使われた時刻が古いものから削除する
+- 監視: ヒット数・ミス数などは `stats` で取得できる
+
+スキーマの検証に通った応答だけを保存する。FAKE プロバイダの応答は保存しない (`BaseAgent` 側で除外する)。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel, ValidationError
+
+from agents.agent_conf import LLM_CACHE_DB_PATH
+from agents.utils import agents_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from langchain_core.prompts import BasePromptTemplate
+    from langchain_core.runnables import Runnable
+    from langchain_core.runnables.config import RunnableConfig
+
+DEFAULT_TTL_SECONDS: Final[int] = 7 * 24 * 60 * 60
+"""応答を再利用する既定の期間 (7 日)"""
+
+DEFAULT_MAX_ENTRIES: Final[int] = 5000
+"""保持する応答の既定の上限件数"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    schema_name TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_llm_responses_last_used_at ON llm_responses (last_used_at);
+CREATE INDEX IF NOT EXISTS ix_llm_responses_created_at ON llm_responses (created_at);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseCacheStats:
+    """応答キャッシュの監視用カウンタ (プロセス起動後の累計)
+
+    Attributes:
+        hits: キャッシュから応答を返した回数
+        misses: LLM を呼び出した回数
+        writes: 応答を保存した回数
+        evictions: 期限切れ・上限超過で削除した件数
+    """
+
+    hits: int
+    misses: int
+    writes: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        """ヒット率 (未使用なら 0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _fingerprint(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def schema_fingerprint(schema: type[BaseModel]) -> str:
+    """スキーマの識別子を返す (フィールド定義が変わると別の値になる)"""
+    definition = json.dumps(schema.model_json_schema(), ensure_ascii=False, sort_keys=True)
+    return f"{schema.__module__}.{schema.__qualname__}:{_fingerprint(definition)[:16]}"
+
+
+def make_cache_key(template_id: str, rendered_prompt: str, model_id: str, schema_id: str) -> str:
+    """応答キャッシュのキーを生成する
+
+    Args:
+        template_id: プロンプトテンプレートの識別子
+        rendered_prompt: 入力を埋め込んだプロンプト
+        model_id: "プロバイダ:モデル名"
+        schema_id: `schema_fingerprint` の値
+
+    Returns:
+        str: SHA-256 の16進文字列
+    """
+    payload = json.dumps(
+        {"template": template_id, "prompt": rendered_prompt, "model": model_id, "schema": schema_id},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return _fingerprint(payload)
+
+
+class LlmResponseCache:
+    """SQLite に保存する構造化出力の応答キャッシュ (スレッドセーフ)"""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """LlmResponseCache を初期化する
+
+        Args:
+            path: SQLite ファイルのパス
+            ttl_seconds: 応答を再利用する期間 (秒)
+            max_entries: 保持する上限件数
+        """
+        self._path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._writes = self._evictions = 0
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    # ==============================================================================
+    # 読み書き
+    # ==============================================================================
+
+    def get(self, key: str) -> str | None:
+        """保存済みの応答を取得する (期限切れ・未登録なら None)"""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM llm_responses WHERE key = ? AND created_at >= ?",
+                (key, now - self.ttl_seconds),
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE llm_responses SET last_used_at = ? WHERE key = ?", (now, key))
+        with self._lock:
+            if row is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return None if row is None else str(row[0])
+
+    def put(self, key: str, schema_name: str, payload: str) -> None:
+        """応答を保存し、期限切れ・上限超過の応答を削除する"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, schema_name, payload, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, schema_name, payload, now, now),
+            )
+            evicted = conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,)).rowcount
+            evicted += conn.execute(
+                "DELETE FROM llm_responses WHERE key NOT IN "
+                "(SELECT key FROM llm_responses ORDER BY last_used_at DESC LIMIT ?)",
+                (self.max_entries,),
+            ).rowcount
+        with self._lock:
+            self._writes += 1
+            self._evictions += evicted
+
+    def clear(self) -> None:
+        """保存済みの応答をすべて削除する"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM llm_responses")
+
+    def count(self) -> int:
+        """保存済みの応答数を返す"""
+        with self._connect() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0])
+
+    def stats(self) -> ResponseCacheStats:
+        """監視用カウンタを返す"""
+        with self._lock:
+            return ResponseCacheStats(self._hits, self._misses, self._writes, self._evictions)
+
+    def reset_stats(self) -> None:
+        """監視用カウンタを 0 に戻す"""
+        with self._lock:
+            self._hits = self._misses = self._writes = self._evictions = 0
+
+    # ==============================================================================
+    # ランナー
+    # ==============================================================================
+
+    def wrap(
+        self,
+        prompt: BasePromptTemplate,
+        structured: Runnable[Any, Any],
+        *,
+        schema: type[BaseModel],
+        model_id: str,
+    ) -> Runnable[Any, Any]:
+        """``prompt | structured`` と同じ入出力で、応答をキャッシュするランナーを返す
+
+        Args:
+            prompt: 前段のプロンプト
+            structured: ``model.with_structured_output(schema)``
+            schema: 構造化出力の Pydantic モデル型
+            model_id: "プロバイダ:モデル名"
+
+        Returns:
+            Runnable[Any, Any]: キャッシュ付きのランナー
+        """
+        template_id = _fingerprint(repr(prompt))
+        schema_id = schema_fingerprint(schema)
+
+        def _invoke(inputs: dict[str, Any], config: RunnableConfig) -> Any:  # noqa: ANN401
+            prompt_value = prompt.invoke(inputs, config)
+            key = make_cache_key(template_id, prompt_value.to_string(), model_id, schema_id)
+            cached = self.get(key)
+            if cached is not None:
+                try:
+                    return schema.model_validate_json(cached)
+                except ValidationError:
+                    agents_logger.warning("Discarded invalid cached response for {}", schema.__name__)
+            result = structured.invoke(prompt_value, config)
+            if isinstance(result, schema):
+                self.put(key, schema.__name__, result.model_dump_json())
+            return result
+
+        return RunnableLambda(_invoke, name=f"Cached{schema.__name__}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """1 操作ごとに接続を開き、トランザクションを確定して閉じる"""
+        with closing(sqlite3.connect(self._path, timeout=5)) as conn, conn:
+            yield conn
+
+
+_cache_lock: Final = threading.Lock()
+_cache: LlmResponseCache | None = None
+_cache_enabled = True
+
+
+def get_response_cache() -> LlmResponseCache | None:
+    """プロセス共有の応答キャッシュを返す (無効化されている場合は None)"""
+    global _cache  # noqa: PLW0603
+    if not _cache_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = LlmResponseCache(LLM_CACHE_DB_PATH)
+            except sqlite3.Error as exc:
+                agents_logger.warning("LLM response cache is unavailable: {}", str(exc))
+                return None
+        return _cache
+
+
+def set_response_cache(cache: LlmResponseCache | None, *, enabled: bool = True) -> None:
+    """プロセス共有の応答キャッシュを差し替える (テスト・無効化用)
+
+    構築済みのランナーには反映されないため、エージェント生成前に呼ぶこと。
+
+    Args:
+        cache: 使用するキャッシュ (None の場合は次回の取得時に既定のパスで作成する)
+        enabled: False の場合はキャッシュを使わない
+    """
+    global _cache, _cache_enabled  # noqa: PLW0603
+    with _cache_lock:
+        _cache = cache
+        _cache_enabled = enabled
+
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES",
+    "DEFAULT_TTL_SECONDS",
+    "LlmResponseCache",
+    "ResponseCacheStats",
+    "get_response_cache",
+    "make_cache_key",
+    "schema_fingerprint",
+    "set_response_cache",
+]
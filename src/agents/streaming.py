@@ -0,0 +1,91 @@
+"""エージェント実行の途中経過 (ノード・トークン) のイベント
+
+`BaseAgent.invoke(..., on_event=...)` を指定すると、グラフを stream で実行し、途中経過を
+`AgentStreamEvent` として通知する。
+
+- node: ノードが完了したとき。`update` にノードが返した状態の差分が入る
+- token: LLM がトークン (チャンク) を出力したとき。構造化出力の場合は JSON 文字列の断片が入る
+
+構造化出力の断片は JSON として不完全なため、`partial_json_string_values` で途中までの文字列値を取り出して表示に使う。
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Literal
+
+AgentStreamEventKind = Literal["node", "token"]
+
+_INCOMPLETE_UNICODE_ESCAPE = re.compile(r"\\u[0-9a-fA-F]{0,3}$")
+
+
+@dataclass(frozen=True, slots=True)
+class AgentStreamEvent:
+    """エージェント実行の途中経過
+
+    Attributes:
+        kind: イベントの種類 ("node" または "token")
+        node: イベントを発生させたノード名
+        text: token イベントで追加されたテキスト
+        update: node イベントでノードが返した状態の差分
+    """
+
+    kind: AgentStreamEventKind
+    node: str
+    text: str = ""
+    update: dict[str, Any] | None = None
+
+
+def message_chunk_text(message: Any) -> str:  # noqa: ANN401
+    """メッセージチャンクに含まれるテキストを取り出す。
+
+    通常の content に加え、ツール呼び出しによる構造化出力の引数 (JSON 断片) も対象にする。
+
+    Args:
+        message: LangGraph の messages モードで流れてくるメッセージチャンク
+
+    Returns:
+        str: 追加されたテキスト (含まれない場合は空文字)
+    """
+    parts: list[str] = []
+    content = getattr(message, "content", "")
+    if isinstance(content, str):
+        parts.append(content)
+    elif isinstance(content, list):
+        parts.extend(
+            item.get("text", "") if isinstance(item, dict) else str(item) for item in content if item is not None
+        )
+    for chunk in getattr(message, "tool_call_chunks", None) or []:
+        args = chunk.get("args") if isinstance(chunk, dict) else None
+        if isinstance(args, str):
+            parts.append(args)
+    return "".join(parts)
+
+
+def partial_json_string_values(text: str, key: str) -> list[str]:
+    """不完全な JSON 文字列から、指定キーの文字列値を出現順に取り出す。
+
+    閉じられていない最後の値は、その時点までの文字列を返す。
+
+    Args:
+        text: 出力途中の JSON 文字列
+        key: 取り出すキー名 (例: "title")
+
+    Returns:
+        list[str]: 見つかった値 (デコードできないエスケープを含む場合はそのままの文字列)
+    """
+    pattern = re.compile(rf'"{re.escape(key)}"\s*:\s*"((?:[^"\\]|\\.)*)')
+    values: list[str] = []
+    for match in pattern.finditer(text):
+        # 出力途中で途切れた \uXXXX エスケープは次のチャンクで揃うまで表示しない
+        raw = _INCOMPLETE_UNICODE_ESCAPE.sub("", match.group(1))
+        try:
+            values.append(json.loads(f'"{raw}"'))
+        except json.JSONDecodeError:
+            values.append(raw)
+    return values
+
+
+__all__ = ["AgentStreamEvent", "AgentStreamEventKind", "message_chunk_text", "partial_json_string_values"]
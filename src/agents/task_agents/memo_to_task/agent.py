@@ -3,22 +3,29 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, cast
+from uuid import uuid4
 
 from langgraph.graph import END, START, StateGraph
 from pydantic import ValidationError
 
 from agents.base import AgentError, BaseAgent, KwargsAny
 from agents.task_agents.memo_to_task.prompt import (
+    batch_classification_prompt,
     classification_prompt,
     quick_action_prompt,
     responsibility_prompt,
     schedule_prompt,
+    task_assessment_prompt,
     task_seed_prompt,
 )
 from agents.task_agents.memo_to_task.schema import (
+    MemoBatchItem,
+    MemoBatchSuggestion,
     MemoClassification,
     MemoProcessingDecision,
     MemoToTaskAgentOutput,
@@ -26,6 +33,7 @@ from agents.task_agents.memo_to_task.schema import (
     QuickActionAssessment,
     ResponsibilityAssessment,
     ScheduleAssessment,
+    TaskAssessment,
     TaskDraft,
     TaskDraftSeed,
     TaskListSuggestion,
@@ -37,12 +45,13 @@ from agents.task_agents.memo_to_task.state import MemoToTaskResult, MemoToTaskSt
 from agents.utils import LLMProvider, agents_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from langchain_core.prompts import ChatPromptTemplate
     from langchain_core.runnables import RunnableSerializable
     from pydantic import BaseModel
 
+    from agents.streaming import AgentStreamEvent
     from models import MemoRead
 
 
@@ -55,6 +64,14 @@ PROJECT_PLAN_RETRY_HINT = (
     '"2025-10-25T10:00:00+09:00" または "2025-10-25"。不要なら null。route は '
     '"next_action"|"progress"|"waiting"|"calendar" のいずれかのみ。JSON のみを出力。'
 )
+DEFAULT_BULK_MAX_WORKERS = 4
+"""複数タスク評価 (`evaluate_bulk`) の既定の並列数。"""
+DEFAULT_BATCH_SIZE = 8
+"""`invoke_batch` で 1 回の LLM 呼び出しにまとめるメモ数の既定値。"""
+BATCH_RETRY_HINT = (
+    "出力は items 配列のみ。各要素は memo_index, decision, reason, project_title, next_actions を含め、"
+    "入力メモすべてについて 1 件ずつ返してください。JSON のみを出力。"
+)
 
 
 _DEFAULT_FAKE_RESPONSES: list[MemoToTaskAgentOutput] = [
@@ -162,6 +179,19 @@ def _fake_schedule_factory(params: dict[str, object]) -> ScheduleAssessment:
     return ScheduleAssessment(requires_specific_date=requires_date, due_date=due_date, reason=reason)
 
 
+def _fake_task_assessment_factory(params: dict[str, object]) -> TaskAssessment:
+    quick = _fake_quick_factory(params)
+    responsibility = _fake_responsibility_factory(params)
+    schedule = _fake_schedule_factory(params)
+    return TaskAssessment(
+        is_quick_action=quick.is_quick_action,
+        should_delegate=responsibility.should_delegate,
+        requires_specific_date=schedule.requires_specific_date,
+        due_date=schedule.due_date,
+        reason=quick.reason,
+    )
+
+
 def _fake_project_factory(params: dict[str, object]) -> ProjectPlanSuggestion:
     title_hint = params.get("project_title_hint", "メモプロジェクト")
     title = str(title_hint) if isinstance(title_hint, str) else "メモプロジェクト"
@@ -174,13 +204,36 @@ def _fake_project_factory(params: dict[str, object]) -> ProjectPlanSuggestion:
     return ProjectPlanSuggestion(project_title=title, next_actions=[task])
 
 
+def _fake_batch_factory(params: dict[str, object]) -> MemoBatchSuggestion:
+    batch_memos = params.get("batch_memos")
+    entries = cast("list[dict[str, object]]", batch_memos if isinstance(batch_memos, list) else [])
+    items: list[MemoBatchItem] = []
+    for position, entry in enumerate(entries):
+        classification = _fake_classification_factory(entry)
+        seed = _fake_seed_factory(entry)
+        is_idea = classification.decision == "idea"
+        actions = [] if is_idea else [TaskDraft(title=seed.title, description=seed.description)]
+        items.append(
+            MemoBatchItem(
+                memo_index=position,
+                reason=classification.reason,
+                decision=classification.decision,
+                project_title=classification.project_title,
+                next_actions=actions,
+            )
+        )
+    return MemoBatchSuggestion(items=items)
+
+
 _FAKE_SCHEMA_FACTORIES: dict[type[BaseModel], Callable[[dict[str, object]], BaseModel]] = {
     MemoClassification: _fake_classification_factory,
     TaskDraftSeed: _fake_seed_factory,
     QuickActionAssessment: _fake_quick_factory,
     ResponsibilityAssessment: _fake_responsibility_factory,
     ScheduleAssessment: _fake_schedule_factory,
+    TaskAssessment: _fake_task_assessment_factory,
     ProjectPlanSuggestion: _fake_project_factory,
+    MemoBatchSuggestion: _fake_batch_factory,
 }
 
 
@@ -196,6 +249,8 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
         provider: LLMProvider = LLMProvider.FAKE,
         *,
         persist_on_finalize: bool = False,
+        bulk_max_workers: int = DEFAULT_BULK_MAX_WORKERS,
+        combine_assessments: bool = False,
         **kwargs: KwargsAny,
     ) -> None:
         """エージェント初期化。
@@ -203,9 +258,14 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
         Args:
             provider: 利用するLLMプロバイダ
             persist_on_finalize: finalize時にApplication Service経由で永続化を行うか（テスト用）
+            bulk_max_workers: 複数タスク評価を並列に行うスレッド数 (OPENVINO は常に 1)
+            combine_assessments: 複数タスク評価で quick/delegate/schedule を 1 回の呼び出しにまとめるか
             **kwargs: 親クラス引数（model_name等）
         """
         self._persist_on_finalize = persist_on_finalize
+        # ローカル推論は同時実行しても速くならないため直列にする
+        self._bulk_max_workers = 1 if provider == LLMProvider.OPENVINO else max(1, bulk_max_workers)
+        self._combine_assessments = combine_assessments
         self._fake_response_index: int = 0
         super().__init__(provider, **kwargs)
         if provider == LLMProvider.FAKE:
@@ -286,7 +346,13 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
 
         return graph_builder
 
-    def invoke(self, state: MemoToTaskState, thread_id: str) -> MemoToTaskResult | AgentError:
+    def invoke(
+        self,
+        state: MemoToTaskState,
+        thread_id: str,
+        *,
+        on_event: Callable[[AgentStreamEvent], None] | None = None,
+    ) -> MemoToTaskResult | AgentError:
         if self.provider == LLMProvider.FAKE:
             fake_output = self.next_fake_response()
             if fake_output is not None:
@@ -297,7 +363,7 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
                     project_plan=fake_output.project_plan,
                     processed_data=self._state,
                 )
-        return super().invoke(state, thread_id)
+        return super().invoke(state, thread_id, on_event=on_event)
 
     def next_fake_response(self) -> MemoToTaskAgentOutput | None:
         """FAKEプロバイダ用のプリセット応答を返す。"""
@@ -316,6 +382,124 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
             project_plan=raw.project_plan,
         )
 
+    def invoke_batch(
+        self,
+        states: Sequence[MemoToTaskState],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[MemoToTaskResult | AgentError]:
+        """複数メモをまとめて処理する。
+
+        分類とタスク抽出は `batch_size` 件ずつ 1 回の構造化出力呼び出しにまとめ、結果を各メモの
+        state に事前設定してから通常のグラフを実行する。quick/delegate/schedule の評価はメモごとに行う。
+        バッチ応答に含まれなかった・不正だったメモは、通常どおり 1 件ずつ分類とタスク抽出を行う。
+
+        Args:
+            states: メモごとの状態
+            batch_size: 1 回の呼び出しにまとめるメモ数
+
+        Returns:
+            入力と同じ順序の結果一覧
+        """
+        if self.provider == LLMProvider.FAKE and self._fake_responses:
+            return [self.invoke(state, str(uuid4())) for state in states]
+
+        results: list[MemoToTaskResult | AgentError | None] = [None] * len(states)
+        groups: dict[tuple[object, ...], list[int]] = {}
+        for index, state in enumerate(states):
+            groups.setdefault(self._batch_group_key(state), []).append(index)
+
+        for indexes in groups.values():
+            for start in range(0, len(indexes), max(1, batch_size)):
+                chunk = indexes[start : start + max(1, batch_size)]
+                items = self._classify_batch([states[i] for i in chunk])
+                fallbacks = 0
+                for position, index in enumerate(chunk):
+                    item = items.get(position)
+                    if item is None:
+                        fallbacks += 1
+                        state = states[index]
+                    else:
+                        state = self._prefill_from_batch_item(states[index], item)
+                    results[index] = self.invoke(state, str(uuid4()))
+                agents_logger.info("Batch classification: size={} fallbacks={}", len(chunk), fallbacks)
+
+        return [result if result is not None else AgentError("バッチ処理の結果がありません") for result in results]
+
+    def _batch_group_key(self, state: MemoToTaskState) -> tuple[object, ...]:
+        """同じプロンプトで処理できる state をまとめるためのキーを返す。"""
+        overrides = self._prompt_overrides(state)
+        return (
+            tuple(state["existing_tags"]),
+            str(state["current_datetime_iso"]),
+            *(str(overrides[key]) for key in sorted(overrides)),
+        )
+
+    def _classify_batch(self, states: Sequence[MemoToTaskState]) -> dict[int, MemoBatchItem]:
+        """複数メモの分類とタスク抽出を 1 回の構造化出力で行い、チャンク内の位置ごとに返す。
+
+        検証に失敗した場合は 1 回だけ修正指示付きで再試行する。呼び出し自体が失敗した場合や、
+        位置が範囲外・重複した要素は無視する (該当メモは単体処理にフォールバックする)。
+
+        Args:
+            states: 同じグループに属するメモの状態
+
+        Returns:
+            チャンク内の位置をキーとした結果
+        """
+        batch_memos: list[dict[str, object]] = []
+        blocks: list[str] = []
+        for position, state in enumerate(states):
+            _, memo_text, memo_meta = self._get_memo_context(state)
+            batch_memos.append({"memo_index": position, "memo_text": memo_text, **memo_meta})
+            blocks.append(
+                f"[{position}] タイトル: {memo_meta['memo_title']}\n"
+                f"ステータス: {memo_meta['memo_status']}\n"
+                f"本文:\n{memo_text}"
+            )
+        first = states[0]
+        params: dict[str, object] = {
+            "batch_memos": batch_memos,
+            "memos_block": "\n\n".join(blocks),
+            "existing_tags": first["existing_tags"],
+            "current_datetime_iso": first["current_datetime_iso"],
+            **self._prompt_overrides(first),
+        }
+        runner = self._get_structured_runner("_batch_runner", batch_classification_prompt, MemoBatchSuggestion)
+        suggestion: BaseModel | AgentError | None = None
+        for retry_hint in ("", BATCH_RETRY_HINT):
+            try:
+                raw = runner.invoke({**params, "retry_hint": retry_hint})
+            except Exception as exc:
+                agents_logger.warning("Batch classification failed: {}", str(exc))
+                return {}
+            suggestion = self.validate_output(raw, MemoBatchSuggestion)
+            if isinstance(suggestion, MemoBatchSuggestion):
+                break
+        if not isinstance(suggestion, MemoBatchSuggestion):
+            return {}
+
+        items: dict[int, MemoBatchItem] = {}
+        for item in suggestion.items:
+            if 0 <= item.memo_index < len(states) and item.memo_index not in items:
+                items[item.memo_index] = item
+        return items
+
+    def _prefill_from_batch_item(self, state: MemoToTaskState, item: MemoBatchItem) -> MemoToTaskState:
+        """バッチ結果を state に設定し、グラフの分類・タスク抽出ノードを省略できるようにする。
+
+        idea 以外でタスクが 1 件も返らなかった場合は分類結果だけを設定し、タスク抽出は単体で行う。
+        """
+        prefilled = cast("MemoToTaskState", dict(state))
+        prefilled["classification"] = MemoClassification(
+            reason=item.reason,
+            decision=item.decision,
+            project_title=item.project_title,
+        )
+        if item.decision != "idea" and item.next_actions:
+            prefilled["routed_tasks"] = [self._sanitize_action_model(task) for task in item.next_actions]
+        return prefilled
+
     def _create_return_response(
         self, final_response: dict[str, KwargsAny] | KwargsAny
     ) -> MemoToTaskResult | AgentError:
@@ -401,8 +585,7 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
             runner = self._build_fake_runner(schema)
             setattr(self, attr_name, runner)
             return runner
-        structured_llm = self.get_model().with_structured_output(schema)
-        runner = prompt | structured_llm
+        runner = cast("RunnableSerializable", self.get_structured_runnable(schema, prompt))
         setattr(self, attr_name, runner)
         return runner
 
@@ -533,6 +716,7 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
                 "QuickActionAssessment": self._sanitize_quick_action_raw,
                 "ResponsibilityAssessment": self._sanitize_responsibility_raw,
                 "ScheduleAssessment": self._sanitize_schedule_raw,
+                "TaskAssessment": self._sanitize_task_assessment_raw,
             }
             handler = handlers.get(schema.__name__)
             if handler is None:
@@ -563,6 +747,13 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
             fixed["requires_specific_date"] = bool(fixed.get("due_date"))
         return fixed
 
+    def _sanitize_task_assessment_raw(self, raw: dict[str, object]) -> dict[str, object]:
+        fixed = self._sanitize_schedule_raw(raw)
+        fixed.setdefault("is_quick_action", False)
+        fixed.setdefault("should_delegate", False)
+        fixed.setdefault("reason", "")
+        return fixed
+
     def _repair_classification_response(  # noqa: C901
         self,
         raw_response: object,
@@ -657,6 +848,11 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
             次ノードに必要なフラグと `classification` を含む辞書。
             検証失敗時は `error` を含む。
         """
+        prefilled = state.get("classification")
+        if isinstance(prefilled, MemoClassification):
+            # invoke_batch で分類済み
+            return self._classification_update(prefilled)
+
         _, memo_text, memo_meta = self._get_memo_context(state)
         runner = self._get_structured_runner("_classifier_runner", classification_prompt, MemoClassification)
         response = runner.invoke(
@@ -671,19 +867,24 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
         )
         classification = self._repair_classification_response(response)
         if isinstance(classification, MemoClassification):
-            update: dict[str, object] = {"classification": classification}
-            if classification.decision == "task":
-                update["requires_action"] = True
-                update["suggested_status"] = "active"
-            elif classification.decision == "project":
-                update["requires_project"] = True
-                update["suggested_status"] = "active"
-            else:
-                update["requires_action"] = False
-                update["suggested_status"] = "idea"
-            return update
+            return self._classification_update(classification)
         return {"error": classification}
 
+    @staticmethod
+    def _classification_update(classification: MemoClassification) -> dict[str, object]:
+        """分類結果から後続の分岐に使うフラグを組み立てる。"""
+        update: dict[str, object] = {"classification": classification}
+        if classification.decision == "task":
+            update["requires_action"] = True
+            update["suggested_status"] = "active"
+        elif classification.decision == "project":
+            update["requires_project"] = True
+            update["suggested_status"] = "active"
+        else:
+            update["requires_action"] = False
+            update["suggested_status"] = "idea"
+        return update
+
     def _handle_idea(self, state: MemoToTaskState) -> dict[str, object]:
         """アイデア扱いのメモをそのまま保持する。
 
@@ -762,6 +963,11 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
         Returns:
             `routed_tasks` と `task_seed` を含む辞書。検証失敗時は `error` を返す。
         """
+        prefilled_tasks = state.get("routed_tasks")
+        if prefilled_tasks:
+            # invoke_batch で抽出済み
+            return self._task_list_update(self._normalize_routed_tasks(list(prefilled_tasks)))
+
         _, memo_text, memo_meta = self._get_memo_context(state)
         params = {
             "memo_text": memo_text,
@@ -789,7 +995,11 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
             return {"routed_tasks": tasks, "task_seed": seed, "suggested_status": "active", "requires_action": True}
 
         tasks = list(suggestion.next_actions or [])
-        tasks = self._normalize_routed_tasks(tasks)
+        return self._task_list_update(self._normalize_routed_tasks(tasks))
+
+    @staticmethod
+    def _task_list_update(tasks: list[TaskDraft]) -> dict[str, object]:
+        """抽出したタスク一覧と、先頭タスクから組み立てた `TaskDraftSeed` を返す。"""
         seed: TaskDraftSeed | None = None
         if tasks:
             first_task = tasks[0]
@@ -883,79 +1093,114 @@ class MemoToTaskAgent(BaseAgent[MemoToTaskState, MemoToTaskResult]):
         return "evaluate_bulk" if isinstance(tasks, list) and len(tasks) > 1 else "evaluate_quick_action"
 
     def _evaluate_bulk(self, state: MemoToTaskState) -> dict[str, object]:
-        """複数タスクに対して quick/delegate/schedule を順次適用する。
+        """複数タスクに対して quick/delegate/schedule を適用する。
 
-        各タスクに対し、既存の評価プロンプトを用いてルートや期日を決定し、
-        変更後のタスク配列を `routed_tasks` として返す。
+        タスクごとの評価は互いに独立しているため、`bulk_max_workers` 本のスレッドで並列に行う。
+        `combine_assessments` が有効な場合は 3 つの評価を 1 回の呼び出し (`TaskAssessment`) で行う。
+        結果の順序は入力の `routed_tasks` と同じ。
         """
-        tasks = state.get("routed_tasks") or []
-        evaluated: list[TaskDraft] = []
-        for t in tasks:
-            # タスク個別コンテキストを形成
-            _, memo_text, memo_meta = self._get_memo_context(state)
-            task_context = {
-                "task_title": t.title,
-                "task_description": t.description or "",
-                "memo_text": memo_text,
-                **memo_meta,
-                **self._prompt_overrides(state),
-            }
-
-            # quick 判定
-            quick = self._invoke_schema_once(
-                "_quick_runner",
-                quick_action_prompt,
-                QuickActionAssessment,
-                {**task_context},
-            )
-            if isinstance(quick, AgentError):
-                # 評価失敗時はそのままの route を維持
-                evaluated.append(t)
-                continue
-
-            if isinstance(quick, QuickActionAssessment) and quick.is_quick_action:
-                # クイックなら progress + 推定2分
-                updated = t.model_copy(update={"route": "progress", "estimate_minutes": QUICK_ACTION_THRESHOLD_MINUTES})
-                evaluated.append(updated)
-                continue
-
-            # delegate 判定
-            resp = self._invoke_schema_once(
-                "_responsibility_runner",
-                responsibility_prompt,
-                ResponsibilityAssessment,
-                {**task_context},
-            )
-            if isinstance(resp, AgentError):
-                evaluated.append(t)
-                continue
-            if isinstance(resp, ResponsibilityAssessment) and resp.should_delegate:
-                evaluated.append(t.model_copy(update={"route": "waiting"}))
-                continue
+        tasks = list(state.get("routed_tasks") or [])
+        if not tasks:
+            return {"routed_tasks": [], "suggested_status": "active"}
 
-            # schedule 判定
-            sched_params = {**task_context, "current_datetime_iso": state["current_datetime_iso"]}
-            sched = self._invoke_schema_once(
-                "_schedule_runner",
-                schedule_prompt,
-                ScheduleAssessment,
-                sched_params,
-            )
-            if isinstance(sched, AgentError):
-                evaluated.append(t)
-                continue
-            if isinstance(sched, ScheduleAssessment) and sched.requires_specific_date:
-                due = sched.due_date if isinstance(sched.due_date, str) else None
-                evaluated.append(t.model_copy(update={"route": "calendar", "due_date": due}))
-                continue
+        # メモ文脈はすべてのタスクで共通
+        _, memo_text, memo_meta = self._get_memo_context(state)
+        memo_context: dict[str, object] = {
+            "memo_text": memo_text,
+            **memo_meta,
+            **self._prompt_overrides(state),
+            "current_datetime_iso": state["current_datetime_iso"],
+        }
 
-            # いずれにも該当しなければ next_action に整列
-            evaluated.append(t.model_copy(update={"route": "next_action"}))
+        # ランナーは並列実行前に構築しておく (スレッド間で同じランナーを共有する)
+        if self._combine_assessments:
+            self._get_structured_runner("_task_assessment_runner", task_assessment_prompt, TaskAssessment)
+            assess = partial(self._assess_task_combined, memo_context=memo_context)
+        else:
+            self._get_structured_runner("_quick_runner", quick_action_prompt, QuickActionAssessment)
+            self._get_structured_runner("_responsibility_runner", responsibility_prompt, ResponsibilityAssessment)
+            self._get_structured_runner("_schedule_runner", schedule_prompt, ScheduleAssessment)
+            assess = partial(self._assess_task, memo_context=memo_context)
+
+        workers = min(self._bulk_max_workers, len(tasks))
+        if workers <= 1:
+            evaluated = [assess(task) for task in tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="MemoToTaskBulk") as executor:
+                # map は入力順に結果を返す
+                evaluated = list(executor.map(assess, tasks))
 
         # 正規化と重複 next_action の整合
         normalized = self._normalize_routed_tasks(evaluated)
         return {"routed_tasks": normalized, "suggested_status": "active"}
 
+    def _assess_task(self, task: TaskDraft, memo_context: dict[str, object]) -> TaskDraft:
+        """Quick → delegate → schedule の順に評価し、該当したルートを設定したタスクを返す。
+
+        評価に失敗した場合は元のタスクをそのまま返す。
+        """
+        task_context = {
+            "task_title": task.title,
+            "task_description": task.description or "",
+            **memo_context,
+        }
+
+        quick = self._invoke_schema_once("_quick_runner", quick_action_prompt, QuickActionAssessment, task_context)
+        if isinstance(quick, AgentError):
+            # 評価失敗時はそのままの route を維持
+            return task
+        if isinstance(quick, QuickActionAssessment) and quick.is_quick_action:
+            # クイックなら progress + 推定2分
+            return task.model_copy(update={"route": "progress", "estimate_minutes": QUICK_ACTION_THRESHOLD_MINUTES})
+        return self._assess_delegate_or_schedule(task, task_context)
+
+    def _assess_delegate_or_schedule(self, task: TaskDraft, task_context: dict[str, object]) -> TaskDraft:
+        """クイックアクションでないタスクを delegate → schedule の順に評価する (`_assess_task` の続き)。"""
+        resp = self._invoke_schema_once(
+            "_responsibility_runner",
+            responsibility_prompt,
+            ResponsibilityAssessment,
+            task_context,
+        )
+        if isinstance(resp, AgentError):
+            return task
+        if isinstance(resp, ResponsibilityAssessment) and resp.should_delegate:
+            return task.model_copy(update={"route": "waiting"})
+
+        sched = self._invoke_schema_once("_schedule_runner", schedule_prompt, ScheduleAssessment, task_context)
+        if isinstance(sched, AgentError):
+            return task
+        if isinstance(sched, ScheduleAssessment) and sched.requires_specific_date:
+            due = sched.due_date if isinstance(sched.due_date, str) else None
+            return task.model_copy(update={"route": "calendar", "due_date": due})
+
+        # いずれにも該当しなければ next_action に整列
+        return task.model_copy(update={"route": "next_action"})
+
+    def _assess_task_combined(self, task: TaskDraft, memo_context: dict[str, object]) -> TaskDraft:
+        """3 つの評価を 1 回の呼び出しで行い、`_assess_task` と同じ優先順でルートを設定する。"""
+        task_context = {
+            "task_title": task.title,
+            "task_description": task.description or "",
+            **memo_context,
+        }
+        assessment = self._invoke_schema_once(
+            "_task_assessment_runner",
+            task_assessment_prompt,
+            TaskAssessment,
+            task_context,
+        )
+        if not isinstance(assessment, TaskAssessment):
+            return task
+        if assessment.is_quick_action:
+            return task.model_copy(update={"route": "progress", "estimate_minutes": QUICK_ACTION_THRESHOLD_MINUTES})
+        if assessment.should_delegate:
+            return task.model_copy(update={"route": "waiting"})
+        if assessment.requires_specific_date:
+            due = assessment.due_date if isinstance(assessment.due_date, str) else None
+            return task.model_copy(update={"route": "calendar", "due_date": due})
+        return task.model_copy(update={"route": "next_action"})
+
     def _apply_quick_action(self, state: MemoToTaskState) -> dict[str, object]:
         """クイックアクションとして実行可能なタスクの案を確定する。"""
         task = self._build_task_from_seed(state, {"route": "progress"})
@@ -101,6 +101,56 @@ JSON のみで回答してください（複数タスクの場合は配列で）
     ]
 )
 
+batch_classification_prompt = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """あなたは GTD の Clarify/Organize フェーズを支援するアナリストです。
+複数のメモが番号付きで渡されます。メモごとに独立して判断し、他のメモの内容を混ぜないでください。
+1. 分類 (decision): 以下から一つだけ選ぶ。
+- idea: 調査や構想レベルで、まだ具体的な実行手順が定まっていない。
+- task: 単一または数ステップで完了可能な具体的行動。長期管理が不要。
+- project: 数か月間にわたり作業を要し、継続的に管理が必要。
+reason は「背景→判断→次の動き」を 120 文字以内で記述し、project の場合は project_title に推奨
+プロジェクト名を入れる（それ以外は null）。
+2. タスク抽出 (next_actions): idea の場合は空配列。task/project の場合は以下の制約で抽出する。
+- 推奨タスク数は {recommended_task_count} 件です（必要に応じて1から10件まで調整可）。{task_count_hint}
+- 各タスクの title は 50〜60 文字以内で主体と成果を命令形で記述。
+- description は 200 文字以内で完了条件・依存関係・必要リソースを説明（空文字可）。
+- due_date は ISO8601 形式の文字列または null（必要時のみ）。
+- priority は "low" | "normal" | "high" のいずれか。
+- tags は provided_tags から 1〜3 個を厳選（該当なしは空配列）。
+- route は "next_action" | "progress" | "waiting" | "calendar" のいずれか。少なくとも 1 件は next_action を含める。
+出力粒度ヒント: {detail_hint}
+追加指示:
+{custom_instructions}
+""",
+        ),
+        (
+            "human",
+            """メモ一覧:
+{memos_block}
+
+provided_tags: {existing_tags}
+現在時刻: {current_datetime_iso}
+修正指示（ある場合）: {retry_hint}
+items 配列に、すべてのメモについて memo_index を付けて 1 件ずつ返してください。JSON のみで回答してください。""",
+        ),
+        (
+            "system",
+            """Few-shot 例（正しい出力形）：
+入力: [0] 本文=「金曜までに上長へ週次レポートを提出する」 / [1] 本文=「将来やってみたいことのメモ」
+出力: {{
+    "items": [
+        {{"memo_index":0,"decision":"task","reason":"具体的な単一行動で外部依存が少ないため","project_title":null,
+          "next_actions":[{{"title":"週次レポートを上長へ提出する","description":"金曜までにメールで送付","due_date":null,"priority":"normal","tags":[],"estimate_minutes":30,"route":"next_action"}}]}},
+        {{"memo_index":1,"decision":"idea","reason":"構想段階で実行手順が未確定","project_title":null,"next_actions":[]}}
+    ]
+}}""",
+        ),
+    ]
+)
+
 quick_action_prompt = ChatPromptTemplate.from_messages(
     [
         (
@@ -225,3 +275,45 @@ JSON のみで回答してください。""",
         ),
     ]
 )
+
+task_assessment_prompt = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """あなたは GTD Clarify フェーズでタスクの扱いを判定するアシスタントです。
+次の 3 点を順に判断してください。
+1. is_quick_action: 準備物の取得・移動時間・外部待ち時間を含めて 2 分以内に完了するか。
+2. should_delegate: 他人に完全に委譲し自身はただ待つだけのタスクか（作業者に自身を含みそうなら false）。
+3. requires_specific_date: 明示的な締切・イベント・外部要因により日時が必要か。必要なら due_date に
+   provided_current_datetime から計算した日時を ISO8601 文字列で入れる（不要なら null）。
+reason には判断に寄与した要素を 120 文字以内で記述します。
+出力粒度ヒント: {detail_hint}
+追加指示:
+{custom_instructions}
+""",
+        ),
+        (
+            "human",
+            """タスクタイトル: {task_title}
+タスク説明: {task_description}
+メモID: {memo_id}
+メモタイトル: {memo_title}
+メモステータス: {memo_status}
+メモ全文:
+{memo_text}
+
+provided_current_datetime: {current_datetime_iso}
+修正指示（ある場合）: {retry_hint}
+JSON のみで回答してください。""",
+        ),
+        (
+            "system",
+            """Few-shot 例（正しい出力形）：
+入力: タイトル=「顧客Aと打合せ」 説明=「来週火曜の午後に訪問」 provided_current_datetime="2025-12-09T10:00:00+09:00"
+    出力: {{"is_quick_action": false, "should_delegate": false, "requires_specific_date": true,
+        "due_date": "2025-12-16T15:00:00+09:00", "reason": "訪問日時が指定されている"}}
+必ず "is_quick_action" と "should_delegate" と "requires_specific_date" と "due_date" と "reason" のみを
+含む JSON を返してください。""",
+        ),
+    ]
+)
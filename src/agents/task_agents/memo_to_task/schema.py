@@ -102,6 +102,16 @@ class ScheduleAssessment(BaseModel):
     due_date: str | None = Field(default=None, description="推奨される期日 (必要な場合)")
 
 
+class TaskAssessment(BaseModel):
+    """quick/delegate/schedule の 3 つの評価を 1 回でまとめた結果。"""
+
+    reason: str = Field(description="判断理由")
+    is_quick_action: bool = Field(description="2分以内で完了できる場合は True")
+    should_delegate: bool = Field(description="委譲が望ましい場合は True")
+    requires_specific_date: bool = Field(description="特定日時が必要なら True")
+    due_date: str | None = Field(default=None, description="推奨される期日 (必要な場合)")
+
+
 class ProjectPlanSuggestion(BaseModel):
     """プロジェクト分類時の初期プラン。"""
 
@@ -115,6 +125,22 @@ class TaskListSuggestion(BaseModel):
     next_actions: list[TaskDraft] = Field(description="抽出されたタスク候補一覧")
 
 
+class MemoBatchItem(BaseModel):
+    """バッチ処理で 1 メモ分の分類とタスク抽出をまとめた結果。"""
+
+    memo_index: int = Field(description="入力メモの番号 (0 始まり)")
+    reason: str = Field(description="判断理由。")
+    decision: MemoProcessingDecision = Field(description="メモを idea/task/project のどれで扱うか。")
+    project_title: str | None = Field(default=None, description="project の場合に推奨されるプロジェクト名。")
+    next_actions: list[TaskDraft] = Field(default_factory=list, description="idea 以外の場合に抽出したタスク候補一覧")
+
+
+class MemoBatchSuggestion(BaseModel):
+    """複数メモを 1 回の呼び出しで分類・タスク抽出した結果。"""
+
+    items: list[MemoBatchItem] = Field(description="メモごとの結果一覧")
+
+
 def _ensure_iso8601(value: str) -> None:
     """与えられた文字列が ISO8601 として解釈できるか検証する。"""
     normalized = _normalize_iso8601(value)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if __package__ is None:  # pragma: no cover
     import sys
@@ -17,7 +17,7 @@ from agents.task_agents.one_liner.state import OneLinerOutput, OneLinerResult, O
 from agents.utils import agents_logger
 
 if TYPE_CHECKING:
-    from langchain_core.runnables import RunnableSerializable
+    from langchain_core.runnables import Runnable
     from pydantic import BaseModel
 
 _fake_responses: list[BaseModel] = [
@@ -36,6 +36,8 @@ class OneLinerAgent(BaseAgent[OneLinerState, OneLinerResult]):
     _name = "OneLinerAgent"
     _description = "ユーザーメッセージに素早く応答するワンライナーエージェント"
     _state = OneLinerState
+    # 1 回の呼び出しで完結するためチェックポイントを保存しない
+    _checkpointing = False
 
     _fake_responses = _fake_responses
 
@@ -48,11 +50,9 @@ class OneLinerAgent(BaseAgent[OneLinerState, OneLinerResult]):
         graph_builder.add_edge(START, "chatbot")
         return graph_builder
 
-    def _create_agent(self) -> RunnableSerializable:
-        # モデル取得 & シンプルチェーン作成
-        self._model = self.get_model()
-        structured_llm = self._model.with_structured_output(OneLinerOutput)
-        return one_liner_prompt | structured_llm
+    def _create_agent(self) -> Runnable[Any, Any]:
+        # モデル単位でキャッシュされたチェーンを取得
+        return self.get_structured_runnable(OneLinerOutput, one_liner_prompt)
 
     def chatbot(self, state: OneLinerState) -> dict[str, object]:
         """チャットボットノードの処理."""
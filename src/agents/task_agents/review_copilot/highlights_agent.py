@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, NotRequired, cast
+from typing import TYPE_CHECKING, Any, NotRequired, cast
 
 from langchain_core.prompts import ChatPromptTemplate
 from langgraph.graph import START, StateGraph
@@ -14,7 +14,26 @@ from agents.base import AgentError, BaseAgent, BaseAgentResponse, BaseAgentState
 from agents.utils import agents_logger
 
 if TYPE_CHECKING:  # pragma: no cover
-    from langchain_core.runnables import RunnableSerializable
+    from langchain_core.runnables import Runnable
+
+
+_HIGHLIGHTS_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "あなたはポジティブなエグゼクティブアシスタントです。\n"
+            "完了タスクのブリーフを読み取り、励ますトーンの導入文と3件の箇条書きを生成してください。\n"
+            "各箇条書きは30文字以内のタイトルと、質的な成果を表す説明文を含めます。\n"
+            "出力粒度ヒント: {detail_hint}\n"
+            "追加指示:\n"
+            "{custom_instructions}\n",
+        ),
+        (
+            "human",
+            "完了タスク一覧:\n{task_summaries}\n\n求めるトーン: {tone_hint}\n",
+        ),
+    ]
+)
 
 
 class HighlightsState(BaseAgentState):
@@ -64,6 +83,7 @@ class ReviewHighlightsAgent(BaseAgent[HighlightsState, HighlightsAgentResult]):
     _name = "ReviewHighlightsAgent"
     _description = "週次レビュー向けに3件の成果サマリーを組み立てる"
     _state = HighlightsState
+    _checkpointing = False
     _fake_responses = _fake_responses
 
     def __init__(self, provider: LLMProvider = LLMProvider.FAKE, **kwargs: KwargsAny) -> None:
@@ -75,26 +95,8 @@ class ReviewHighlightsAgent(BaseAgent[HighlightsState, HighlightsAgentResult]):
         graph_builder.add_edge(START, "summarize")
         return graph_builder
 
-    def _create_chain(self) -> RunnableSerializable:
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "あなたはポジティブなエグゼクティブアシスタントです。\n"
-                    "完了タスクのブリーフを読み取り、励ますトーンの導入文と3件の箇条書きを生成してください。\n"
-                    "各箇条書きは30文字以内のタイトルと、質的な成果を表す説明文を含めます。\n"
-                    "出力粒度ヒント: {detail_hint}\n"
-                    "追加指示:\n"
-                    "{custom_instructions}\n",
-                ),
-                (
-                    "human",
-                    "完了タスク一覧:\n{task_summaries}\n\n求めるトーン: {tone_hint}\n",
-                ),
-            ]
-        )
-        structured_llm = self.get_model().with_structured_output(HighlightsAgentOutput)
-        return prompt | structured_llm
+    def _create_chain(self) -> Runnable[Any, Any]:
+        return self.get_structured_runnable(HighlightsAgentOutput, _HIGHLIGHTS_PROMPT)
 
     def _generate_highlights(self, state: HighlightsState) -> dict[str, object]:
         chain = self._create_chain()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, NotRequired, cast
+from typing import TYPE_CHECKING, Any, NotRequired, cast
 
 from langchain_core.prompts import ChatPromptTemplate
 from langgraph.graph import START, StateGraph
@@ -14,7 +14,28 @@ from agents.base import AgentError, BaseAgent, BaseAgentResponse, BaseAgentState
 from agents.utils import agents_logger
 
 if TYPE_CHECKING:  # pragma: no cover
-    from langchain_core.runnables import RunnableSerializable
+    from langchain_core.runnables import Runnable
+
+
+_MEMO_AUDIT_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            (
+                "あなたはメモ整理のアシスタントです。\n"
+                "各メモを読み、task/reference/someday/discard のいずれかの扱いを提案し、"
+                "短い説明を返してください。\n"
+                "出力粒度ヒント: {detail_hint}\n"
+                "追加指示:\n"
+                "{custom_instructions}\n"
+            ),
+        ),
+        (
+            "human",
+            "未処理メモ:\n{memo_list}\n\n背景: {tone_hint}",
+        ),
+    ]
+)
 
 
 class MemoAuditState(BaseAgentState):
@@ -62,6 +83,7 @@ class MemoAuditSuggestionAgent(BaseAgent[MemoAuditState, MemoAuditAgentResult]):
     _name = "MemoAuditSuggestionAgent"
     _description = "棚卸し対象メモを振り分ける提案を行う"
     _state = MemoAuditState
+    _checkpointing = False
     _fake_responses = _fake_responses
 
     def __init__(self, provider: LLMProvider = LLMProvider.FAKE, **kwargs: KwargsAny) -> None:
@@ -73,28 +95,8 @@ class MemoAuditSuggestionAgent(BaseAgent[MemoAuditState, MemoAuditAgentResult]):
         graph_builder.add_edge(START, "audit")
         return graph_builder
 
-    def _chain(self) -> RunnableSerializable:
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    (
-                        "あなたはメモ整理のアシスタントです。\n"
-                        "各メモを読み、task/reference/someday/discard のいずれかの扱いを提案し、"
-                        "短い説明を返してください。\n"
-                        "出力粒度ヒント: {detail_hint}\n"
-                        "追加指示:\n"
-                        "{custom_instructions}\n"
-                    ),
-                ),
-                (
-                    "human",
-                    "未処理メモ:\n{memo_list}\n\n背景: {tone_hint}",
-                ),
-            ]
-        )
-        structured_llm = self.get_model().with_structured_output(MemoAuditAgentOutput)
-        return prompt | structured_llm
+    def _chain(self) -> Runnable[Any, Any]:
+        return self.get_structured_runnable(MemoAuditAgentOutput, _MEMO_AUDIT_PROMPT)
 
     def _suggest_routes(self, state: MemoAuditState) -> dict[str, object]:
         chain = self._chain()
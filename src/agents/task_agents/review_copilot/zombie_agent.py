@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal, NotRequired, cast
+from typing import TYPE_CHECKING, Any, Literal, NotRequired, cast
 
 from langchain_core.prompts import ChatPromptTemplate
 from langgraph.graph import START, StateGraph
@@ -14,11 +14,32 @@ from agents.base import AgentError, BaseAgent, BaseAgentResponse, BaseAgentState
 from agents.utils import agents_logger
 
 if TYPE_CHECKING:  # pragma: no cover
-    from langchain_core.runnables import RunnableSerializable
+    from langchain_core.runnables import Runnable
 
 ZombieActionType = Literal["split", "defer", "someday", "delete"]
 
 
+_ZOMBIE_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            (
+                "あなたは生産性コーチです。\n"
+                "各タスクが停滞している理由を推測し、最大3件の処置案を返してください。\n"
+                "処置案は split/defer/someday/delete のいずれかを使用し、理由とサブタスク案を含めます。\n"
+                "出力粒度ヒント: {detail_hint}\n"
+                "追加指示:\n"
+                "{custom_instructions}\n"
+            ),
+        ),
+        (
+            "human",
+            "停滞タスク一覧:\n{tasks}\n\n背景: {tone_hint}",
+        ),
+    ]
+)
+
+
 class ZombieTaskState(BaseAgentState):
     tasks: list[dict[str, object]]
     tone_hint: str
@@ -77,6 +98,7 @@ class ZombieSuggestionAgent(BaseAgent[ZombieTaskState, ZombieAgentResult]):
     _name = "ZombieSuggestionAgent"
     _description = "長期間停滞したタスクのケアプランを提案する"
     _state = ZombieTaskState
+    _checkpointing = False
     _fake_responses = _fake_responses
 
     def __init__(self, provider: LLMProvider = LLMProvider.FAKE, **kwargs: KwargsAny) -> None:
@@ -88,28 +110,8 @@ class ZombieSuggestionAgent(BaseAgent[ZombieTaskState, ZombieAgentResult]):
         graph_builder.add_edge(START, "suggest")
         return graph_builder
 
-    def _chain(self) -> RunnableSerializable:
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    (
-                        "あなたは生産性コーチです。\n"
-                        "各タスクが停滞している理由を推測し、最大3件の処置案を返してください。\n"
-                        "処置案は split/defer/someday/delete のいずれかを使用し、理由とサブタスク案を含めます。\n"
-                        "出力粒度ヒント: {detail_hint}\n"
-                        "追加指示:\n"
-                        "{custom_instructions}\n"
-                    ),
-                ),
-                (
-                    "human",
-                    "停滞タスク一覧:\n{tasks}\n\n背景: {tone_hint}",
-                ),
-            ]
-        )
-        structured_llm = self.get_model().with_structured_output(ZombieAgentOutput)
-        return prompt | structured_llm
+    def _chain(self) -> Runnable[Any, Any]:
+        return self.get_structured_runnable(ZombieAgentOutput, _ZOMBIE_PROMPT)
 
     def _suggest_actions(self, state: ZombieTaskState) -> dict[str, object]:
         chain = self._chain()
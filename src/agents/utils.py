@@ -36,10 +36,14 @@ def get_sqlite_conn() -> sqlite3.Connection:
 def get_memory() -> SqliteSaver:
     """メモリ用のSQLiteセーバーを取得する関数。
 
+    接続はプロセスで共有する (`agents.checkpoint_store.CheckpointStore`)。
+
     Returns:
         SqliteSaver: メモリ用のSQLiteセーバーオブジェクト。
     """
-    return SqliteSaver(get_sqlite_conn())
+    from agents.checkpoint_store import get_checkpoint_store
+
+    return get_checkpoint_store().saver
 
 
 class FakeListChatModelWithBindTools(FakeListChatModel):
@@ -163,48 +167,7 @@ def get_model(
             max_retries=3,
         )
     elif provider == LLMProvider.OPENVINO:
-        try:
-            from langchain_openvino_genai import (  # pyright: ignore[reportMissingImports]
-                ChatOpenVINO,
-                OpenVINOLLM,
-                load_model,
-            )
-        except ImportError as e:
-            err_msg = (
-                "langchain-openvino-genai is not installed. "
-                "Please install it with 'uv sync --extra openvino' or 'pip install .[openvino]' to use."
-            )
-            agents_logger.exception(err_msg)
-            raise ImportError(err_msg) from e
-
-        if model_name is None:
-            warning_msg = "Model name is not specified. Using default model."
-            agents_logger.warning(warning_msg)
-            model_name = HuggingFaceModel.QWEN_3_8B_INT4
-
-        if not isinstance(model_name, HuggingFaceModel):
-            err_msg = f"Invalid model name for OPENVINO provider: {model_name}. Must be a HuggingFaceModel enum."
-            agents_logger.error(err_msg)
-            raise ValidationError(err_msg)
-
-        # モデルのロード
-        model_path = load_model(
-            model_name.value,
-            download_path=LLM_MODEL_DIR,
-        )
-        requested_device = (device or OpenVINODevice.CPU.value).upper()
-        try:
-            resolved_device = OpenVINODevice(requested_device).value
-        except ValueError as exc:
-            err_msg = f"Invalid OpenVINO device specified: {device}"
-            agents_logger.error(err_msg)  # noqa: TRY400
-            raise ValidationError(err_msg) from exc
-
-        ov_llm = OpenVINOLLM.from_model_path(
-            model_path=model_path,
-            device=resolved_device,
-        )
-        llm = ChatOpenVINO(llm=ov_llm)
+        llm, _ = build_openvino_model(model_name, device=device)
     elif provider == LLMProvider.FAKE:
         # FAKEプロバイダ用のダミー応答を設定
         # もし指定されていない場合はデフォルトの応答を使用
@@ -223,3 +186,63 @@ def get_model(
         raise NotImplementedError(err_msg)
 
     return llm
+
+
+def build_openvino_model(
+    model_name: HuggingFaceModel | str | None = None, *, device: str | None = None
+) -> tuple[BaseChatModel, str]:
+    """OpenVINO モデルを読み込み、チャットモデルを構築する関数。
+
+    Args:
+        model_name (HuggingFaceModel | str | None): 使用するモデル。None の場合は既定モデル。
+        device (str | None): 実行デバイス (CPU/GPU 等)。None の場合は CPU。
+
+    Raises:
+        ImportError: langchain-openvino-genai がインストールされていない場合に発生します。
+        ValidationError: モデル名・デバイスが不正な場合に発生します。
+
+    Returns:
+        tuple[BaseChatModel, str]: 構築したチャットモデルと、重みを配置したモデルディレクトリのパス。
+    """
+    try:
+        from langchain_openvino_genai import (  # pyright: ignore[reportMissingImports]
+            ChatOpenVINO,
+            OpenVINOLLM,
+            load_model,
+        )
+    except ImportError as e:
+        err_msg = (
+            "langchain-openvino-genai is not installed. "
+            "Please install it with 'uv sync --extra openvino' or 'pip install .[openvino]' to use."
+        )
+        agents_logger.exception(err_msg)
+        raise ImportError(err_msg) from e
+
+    if model_name is None:
+        warning_msg = "Model name is not specified. Using default model."
+        agents_logger.warning(warning_msg)
+        model_name = HuggingFaceModel.QWEN_3_8B_INT4
+
+    if not isinstance(model_name, HuggingFaceModel):
+        err_msg = f"Invalid model name for OPENVINO provider: {model_name}. Must be a HuggingFaceModel enum."
+        agents_logger.error(err_msg)
+        raise ValidationError(err_msg)
+
+    # モデルのロード
+    model_path = load_model(
+        model_name.value,
+        download_path=LLM_MODEL_DIR,
+    )
+    requested_device = (device or OpenVINODevice.CPU.value).upper()
+    try:
+        resolved_device = OpenVINODevice(requested_device).value
+    except ValueError as exc:
+        err_msg = f"Invalid OpenVINO device specified: {device}"
+        agents_logger.error(err_msg)  # noqa: TRY400
+        raise ValidationError(err_msg) from exc
+
+    ov_llm = OpenVINOLLM.from_model_path(
+        model_path=model_path,
+        device=resolved_device,
+    )
+    return ChatOpenVINO(llm=ov_llm), str(model_path)
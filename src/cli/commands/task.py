@@ -21,6 +21,7 @@ from models import TaskRead, TaskStatus, TaskUpdate
 
 if TYPE_CHECKING:
     from logic.application.task_application_service import TaskApplicationService
+    from models import TaskStats
 
 app = typer.Typer(help="タスク CRUD / ステータス操作")
 console = Console()
@@ -126,46 +127,10 @@ def _change_status(task_id: uuid.UUID, update_data: TaskUpdate) -> TaskRead:
 
 @elapsed_time()
 @with_spinner("Collecting task stats...")
-def _get_today_count() -> int:  # [AI GENERATED]
-    # NOTE: `logic.queries.task_queries.GetTodayTasksCountQuery` は削除されました。
-    # TODO: コンテキストカウントを提供するクエリ/サービス実装を復活させるか、
-    #       Application Service 側に集計メソッドを追加してください。
-    # 元の実装:
-    # from logic.queries.task_queries import GetTodayTasksCountQuery
-    # service = _get_service()
-    # return service.get_today_tasks_count(GetTodayTasksCountQuery())
-
-    # 安全なフォールバック: プレースホルダー値を返します（将来的に実装で置換してください）。
-    # CLI の動作を壊さないため 0 を返します。
-    return 0
-
-
-@elapsed_time()
-@with_spinner("Collecting task stats...")
-def _get_completed_count() -> int:  # [AI GENERATED]
-    # NOTE: 集計用のクエリ/サービスがリポジトリから削除されている可能性があります。
-    # TODO: コンテキストカウントを提供するクエリ/サービス実装を復活させるか、
-    #       Application Service 側に集計メソッドを追加してください。
-    # 元の実装:
-    # service = _get_service()
-    # return service.get_completed_tasks_count()
-
-    # 安全なフォールバック: プレースホルダー値を返します（将来的に実装で置換してください）。
-    return 0
-
-
-@elapsed_time()
-@with_spinner("Collecting task stats...")
-def _get_overdue_count() -> int:  # [AI GENERATED]
-    # NOTE: 集計用のクエリ/サービスがリポジトリから削除されている可能性があります。
-    # TODO: コンテキストカウントを提供するクエリ/サービス実装を復活させるか、
-    #       Application Service 側に集計メソッドを追加してください。
-    # 元の実装:
-    # service = _get_service()
-    # return service.get_overdue_tasks_count()
-
-    # 安全なフォールバック: プレースホルダー値を返します（将来的に実装で置換してください）。
-    return 0
+def _load_task_stats() -> TaskStats:
+    """ステータス別件数と期限超過件数を集計クエリで取得する"""
+    apps = ApplicationServices.create()
+    return apps.stats.get_task_stats()
 
 
 def _print_stats(today: int, completed: int, overdue: int, elapsed: float) -> None:  # [AI GENERATED]
@@ -404,19 +369,11 @@ def task_stats(
     Args:
         show_overdue: 期限超過を表示するかどうか
     """
-    today_res = _get_today_count()
-    completed_res = _get_completed_count()
-    overdue_res = _get_overdue_count() if show_overdue else None
-
-    # 最大のelapsedを代表値とする（3回計測されるため）
-    elapsed = max(
-        today_res.elapsed,
-        completed_res.elapsed,
-        overdue_res.elapsed if overdue_res is not None else 0.0,
-    )
+    stats_res = _load_task_stats()
+    stats = stats_res.result
     _print_stats(
-        today=today_res.result,
-        completed=completed_res.result,
-        overdue=overdue_res.result if overdue_res is not None else 0,
-        elapsed=elapsed,
+        today=stats.count(TaskStatus.TODAYS),
+        completed=stats.count(TaskStatus.COMPLETED),
+        overdue=stats.overdue if show_overdue else 0,
+        elapsed=stats_res.elapsed,
     )
@@ -2,19 +2,26 @@
 
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from alembic import command
 from alembic.config import Config
 from loguru import logger
-from sqlalchemy import create_engine
 from sqlmodel import SQLModel
 
+from database import SqliteProfile, apply_profile, create_sqlite_engine
+
+if TYPE_CHECKING:
+    from settings.models import DatabaseSettings
+
 # データベース保存先ディレクトリ（環境変数がなければFlet指定のstorageフォルダ）
 STORAGE_DIR: str = os.environ.get("FLET_APP_STORAGE_DATA", "./storage/data")
 # データベースファイルのパス
 DB_PATH: Path = Path(STORAGE_DIR) / "tasks.db"
-# データベースエンジンの作成
-engine = create_engine(f"sqlite:///{DB_PATH}", echo=False)
+# データベースエンジンの作成 (WAL などの PRAGMA は接続時に適用される)
+engine = create_sqlite_engine(DB_PATH)
+# 参照系ユースケース専用の読み取りエンジン (query_only=ON)
+read_engine = create_sqlite_engine(DB_PATH, read_only=True)
 
 
 # Alembicの設定ファイルのパス
@@ -31,6 +38,19 @@ def migrate_db() -> None:
     logger.info("Database migrated to the latest version.")
 
 
+# 設定ファイルのデータベース設定をエンジンへ反映する関数
+def configure_engines(settings: "DatabaseSettings") -> None:
+    """`DatabaseSettings` のチューニング値を書き込み/読み取りエンジンへ適用する。
+
+    Args:
+        settings: アプリ設定のデータベース節
+    """
+    profile = SqliteProfile.from_settings(settings)
+    apply_profile(engine, profile)
+    apply_profile(read_engine, profile)
+    logger.info(f"データベースプロファイルを適用しました: journal_mode={profile.journal_mode}")
+
+
 # アプリケーションのタイトル
 APP_TITLE: str = "Kage"
 
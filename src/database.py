@@ -0,0 +1,293 @@
+"""SQLite エンジンの生成とチューニングプロファイル。
+
+UI スレッドの読み取りと `MemoAiJobWorker` の書き込みが同じ DB ファイルへ同時に
+アクセスするため、接続確立時 (connect イベント) に PRAGMA を適用して WAL モードで運用する。
+
+- 書き込み用エンジン: WAL / synchronous=NORMAL / mmap / cache / temp_store / busy_timeout を適用
+- 読み取り専用エンジン: 上記に加えて ``query_only=ON`` を適用し、参照系ユースケース専用に使う
+
+設定値は `settings.models.DatabaseSettings` から `SqliteProfile.from_settings` で生成する。
+`config` から import されるため、本モジュールはモジュールレベルで `settings` を import しない。
+"""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+from loguru import logger
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import QueuePool, StaticPool
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy import Engine
+
+    from settings.models import DatabaseSettings
+
+# 既定値 (settings.models.DatabaseSettings からも参照する)
+DB_DEFAULT_JOURNAL_MODE: Final = "WAL"
+DB_DEFAULT_SYNCHRONOUS: Final = "NORMAL"
+DB_DEFAULT_MMAP_SIZE: Final[int] = 256 * 1024 * 1024
+DB_DEFAULT_CACHE_SIZE_KIB: Final[int] = 64 * 1024
+DB_DEFAULT_TEMP_STORE: Final = "MEMORY"
+DB_DEFAULT_BUSY_TIMEOUT_MS: Final[int] = 5000
+DB_DEFAULT_POOL_SIZE: Final[int] = 5
+DB_DEFAULT_MAX_OVERFLOW: Final[int] = 10
+
+JOURNAL_MODES: Final[frozenset[str]] = frozenset({"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"})
+SYNCHRONOUS_MODES: Final[frozenset[str]] = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+TEMP_STORE_MODES: Final[frozenset[str]] = frozenset({"DEFAULT", "FILE", "MEMORY"})
+
+_MEMORY_DB: Final[str] = ":memory:"
+
+
+@dataclass(frozen=True)
+class SqliteProfile:
+    """SQLite 接続に適用するチューニング値。
+
+    Attributes:
+        journal_mode: ジャーナルモード。既定は WAL (読み取りが書き込みにブロックされない)。
+        synchronous: fsync の厳密さ。WAL では NORMAL で十分な耐久性が得られる。
+        mmap_size: メモリマップ I/O に使うバイト数。0 で無効。
+        cache_size_kib: ページキャッシュサイズ (KiB)。
+        temp_store: 一時テーブル/インデックスの保存先。
+        busy_timeout_ms: ロック競合時に待機する最大ミリ秒。
+        pool_size: 書き込み用コネクションプールの常駐接続数。
+        max_overflow: プール上限を超えて一時的に開ける接続数。
+    """
+
+    journal_mode: str = DB_DEFAULT_JOURNAL_MODE
+    synchronous: str = DB_DEFAULT_SYNCHRONOUS
+    mmap_size: int = DB_DEFAULT_MMAP_SIZE
+    cache_size_kib: int = DB_DEFAULT_CACHE_SIZE_KIB
+    temp_store: str = DB_DEFAULT_TEMP_STORE
+    busy_timeout_ms: int = DB_DEFAULT_BUSY_TIMEOUT_MS
+    pool_size: int = DB_DEFAULT_POOL_SIZE
+    max_overflow: int = DB_DEFAULT_MAX_OVERFLOW
+
+    def __post_init__(self) -> None:
+        # PRAGMA はパラメータバインドできないため、文字列化する前に値を検証する
+        object.__setattr__(self, "journal_mode", self.journal_mode.upper())
+        object.__setattr__(self, "synchronous", self.synchronous.upper())
+        object.__setattr__(self, "temp_store", self.temp_store.upper())
+        if self.journal_mode not in JOURNAL_MODES:
+            msg = f"journal_mode が不正です: {self.journal_mode}"
+            raise ValueError(msg)
+        if self.synchronous not in SYNCHRONOUS_MODES:
+            msg = f"synchronous が不正です: {self.synchronous}"
+            raise ValueError(msg)
+        if self.temp_store not in TEMP_STORE_MODES:
+            msg = f"temp_store が不正です: {self.temp_store}"
+            raise ValueError(msg)
+        for name in ("mmap_size", "cache_size_kib", "busy_timeout_ms", "max_overflow"):
+            if int(getattr(self, name)) < 0:
+                msg = f"{name} は 0 以上で指定してください"
+                raise ValueError(msg)
+        if self.pool_size < 1:
+            msg = "pool_size は 1 以上で指定してください"
+            raise ValueError(msg)
+
+    @classmethod
+    def from_settings(cls, settings: DatabaseSettings) -> SqliteProfile:
+        """`DatabaseSettings` からプロファイルを生成する。
+
+        Args:
+            settings: アプリ設定のデータベース節
+
+        Returns:
+            SqliteProfile: 設定値を反映したプロファイル
+        """
+        return cls(
+            journal_mode=settings.journal_mode,
+            synchronous=settings.synchronous,
+            mmap_size=settings.mmap_size,
+            cache_size_kib=settings.cache_size_kib,
+            temp_store=settings.temp_store,
+            busy_timeout_ms=settings.busy_timeout_ms,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+        )
+
+    def pragmas(self, *, read_only: bool = False) -> list[tuple[str, str | int]]:
+        """接続ごとに実行する PRAGMA の一覧を返す。
+
+        Args:
+            read_only: 読み取り専用接続かどうか
+
+        Returns:
+            list[tuple[str, str | int]]: (PRAGMA 名, 値) のリスト
+        """
+        statements: list[tuple[str, str | int]] = [
+            ("busy_timeout", self.busy_timeout_ms),
+            ("journal_mode", self.journal_mode),
+            ("synchronous", self.synchronous),
+            ("mmap_size", self.mmap_size),
+            # 負数指定で KiB 単位になる
+            ("cache_size", -self.cache_size_kib),
+            ("temp_store", self.temp_store),
+        ]
+        if read_only:
+            statements.append(("query_only", "ON"))
+        return statements
+
+
+class _PragmaListener:
+    """connect イベントで PRAGMA を適用するリスナー。
+
+    プロファイルは `apply_profile` で差し替えられるよう可変にしておく。
+    """
+
+    def __init__(self, profile: SqliteProfile, *, read_only: bool) -> None:
+        self.profile = profile
+        self.read_only = read_only
+
+    def __call__(self, dbapi_connection: Any, _connection_record: Any) -> None:  # noqa: ANN401
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self.profile.pragmas(read_only=self.read_only):
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+class _ResizableQueuePool(QueuePool):
+    """`Engine.dispose` で作り直すときに、プールサイズを変更できる QueuePool。
+
+    QueuePool のサイズは生成時に固定されるため、`resize_on_recreate` で次のサイズを予約し、
+    dispose 時の `recreate` で新しいサイズのプールを生成する (接続イベントのリスナーは引き継がれる)。
+    """
+
+    _next_size: tuple[int, int] | None = None
+
+    def resize_on_recreate(self, pool_size: int, max_overflow: int) -> None:
+        """次の `recreate` で生成するプールのサイズを指定する。
+
+        Args:
+            pool_size: 常駐接続数
+            max_overflow: プール上限を超えて一時的に開ける接続数
+        """
+        self._next_size = (pool_size, max_overflow)
+
+    def recreate(self) -> QueuePool:
+        """プールを作り直す (サイズが予約されていればそのサイズで生成する)。"""
+        if self._next_size is None:
+            return super().recreate()
+        pool_size, max_overflow = self._next_size
+        self.logger.info("Pool recreating with pool_size=%d max_overflow=%d", pool_size, max_overflow)
+        return self.__class__(
+            self._creator,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pre_ping=self._pre_ping,
+            use_lifo=self._pool.use_lifo,
+            timeout=self._timeout,
+            recycle=self._recycle,
+            echo=self.echo,
+            logging_name=self._orig_logging_name,
+            reset_on_return=self._reset_on_return,
+            _dispatch=self.dispatch,
+            dialect=self._dialect,
+        )
+
+
+_LISTENERS: weakref.WeakKeyDictionary[Engine, _PragmaListener] = weakref.WeakKeyDictionary()
+
+
+def _is_memory_database(db_path: Path | str) -> bool:
+    return str(db_path) in (_MEMORY_DB, "")
+
+
+def create_sqlite_engine(
+    db_path: Path | str,
+    profile: SqliteProfile | None = None,
+    *,
+    read_only: bool = False,
+    echo: bool = False,
+) -> Engine:
+    """チューニング済みの SQLite エンジンを生成する。
+
+    ファイル DB には `QueuePool` (`apply_profile` でサイズを変更できる派生クラス) を使い、
+    スレッド間で接続を使い回す。
+    インメモリ DB は接続ごとに別 DB になってしまうため `StaticPool` で単一接続を共有する。
+
+    Args:
+        db_path: DB ファイルのパス (``":memory:"`` でインメモリ)
+        profile: 適用するプロファイル (未指定時は既定値)
+        read_only: True の場合 ``query_only=ON`` を適用した参照専用エンジンを返す
+        echo: SQL をログ出力するかどうか
+
+    Returns:
+        Engine: connect イベントに PRAGMA 適用フックを登録したエンジン
+    """
+    profile = profile or SqliteProfile()
+    connect_args: dict[str, Any] = {
+        "check_same_thread": False,
+        "timeout": profile.busy_timeout_ms / 1000,
+    }
+
+    if _is_memory_database(db_path):
+        engine = create_engine(
+            f"sqlite:///{_MEMORY_DB}",
+            echo=echo,
+            connect_args=connect_args,
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(
+            f"sqlite:///{db_path}",
+            echo=echo,
+            connect_args=connect_args,
+            poolclass=_ResizableQueuePool,
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+        )
+
+    listener = _PragmaListener(profile, read_only=read_only)
+    event.listen(engine, "connect", listener)
+    _LISTENERS[engine] = listener
+    return engine
+
+
+def get_profile(engine: Engine) -> SqliteProfile | None:
+    """エンジンに適用されているプロファイルを返す。
+
+    Args:
+        engine: `create_sqlite_engine` で生成したエンジン
+
+    Returns:
+        SqliteProfile | None: 未登録のエンジンの場合は None
+    """
+    listener = _LISTENERS.get(engine)
+    return listener.profile if listener is not None else None
+
+
+def apply_profile(engine: Engine, profile: SqliteProfile) -> None:
+    """エンジンのプロファイルを差し替え、既存接続を破棄する。
+
+    PRAGMA は接続確立時に適用されるため、プールを dispose して次回接続から反映させる。
+    プールサイズが変わる場合は、dispose 時に新しいサイズでプールを作り直す
+    (インメモリ DB の `StaticPool` は単一接続のためサイズを持たない)。
+
+    Args:
+        engine: `create_sqlite_engine` で生成したエンジン
+        profile: 新しいプロファイル
+
+    Raises:
+        ValueError: PRAGMA 適用フックが登録されていないエンジンの場合
+    """
+    listener = _LISTENERS.get(engine)
+    if listener is None:
+        msg = "create_sqlite_engine で生成されたエンジンではありません"
+        raise ValueError(msg)
+    current = listener.profile
+    pool = engine.pool
+    resized = (current.pool_size, current.max_overflow) != (profile.pool_size, profile.max_overflow)
+    if resized and isinstance(pool, _ResizableQueuePool):
+        pool.resize_on_recreate(profile.pool_size, profile.max_overflow)
+        logger.info(f"コネクションプールのサイズを変更します: {profile.pool_size} (+{profile.max_overflow})")
+    listener.profile = profile
+    engine.dispose()
+    logger.debug(f"SQLite プロファイルを適用しました: {profile}")
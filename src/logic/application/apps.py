@@ -13,12 +13,16 @@ from logic.application.memo_to_task_application_service import (
 from logic.application.one_liner_application_service import OneLinerApplicationService
 from logic.application.project_application_service import ProjectApplicationService
 from logic.application.review_application_service import WeeklyReviewApplicationService
+from logic.application.stats_application_service import StatsApplicationService
 from logic.application.tag_application_service import TagApplicationService
 from logic.application.task_application_service import TaskApplicationService
 from logic.application.terminology_application_service import TerminologyApplicationService
+from logic.repositories import get_data_version
 from logic.unit_of_work import SqlModelUnitOfWork, UnitOfWork
 
 if TYPE_CHECKING:  # pragma: no cover - 型チェック専用
+    from collections.abc import Iterable
+
     from logic.application.settings_application_service import SettingsApplicationService
 
 _S = TypeVar("_S")
@@ -231,6 +235,19 @@ class ApplicationServices:
         with self._lock:
             self._services.clear()
 
+    def data_version(self, tables: Iterable[str]) -> int:
+        """指定したテーブルのデータバージョンを取得する。
+
+        画面のキャッシュが再読み込みの要否を判定するために使う。値は書き込みのコミットごとに増える。
+
+        Args:
+            tables: テーブル名の一覧
+
+        Returns:
+            int: データバージョン (前回の値と異なればデータが変更されている)
+        """
+        return get_data_version(tables)
+
     # --- invalidate API -------------------------------------------------
     def invalidate_all(self) -> None:
         """全 ApplicationService のキャッシュを無効化する。
@@ -308,3 +325,8 @@ class ApplicationServices:
     def review(self) -> WeeklyReviewApplicationService:
         """WeeklyReviewApplicationService を取得。"""
         return self.get_service(WeeklyReviewApplicationService)
+
+    @property
+    def stats(self) -> StatsApplicationService:
+        """StatsApplicationService を取得。"""
+        return self.get_service(StatsApplicationService)
@@ -1,36 +1,94 @@
-"""Memo→タスク生成ジョブのシリアライズ処理キュー。"""
+"""Memo→タスク生成ジョブの並列処理キュー。
+
+- ワーカープール: `max_workers` 本のスレッドでジョブを並列に処理する
+- プロバイダ別の同時実行数: 実行中 (RUNNING) のジョブ数をプロバイダごとに制限する
+  (ローカル推論の OpenVINO は 1、クラウドの Gemini は複数など)
+- 優先度レーン: 単一メモの対話的な生成 (INTERACTIVE) をバッチ処理 (BACKGROUND) より先に処理する。
+  INTERACTIVE が連続して `interactive_burst` 件処理されたら BACKGROUND を 1 件処理し、飢餓を防ぐ
+- 先読みレーン: アイドル時の先読み (PREFETCH) は他のレーンが空で、INTERACTIVE が待機・実行中でないときだけ処理する。
+  同じメモの INTERACTIVE/BACKGROUND が登録されたら、待機中の PREFETCH は取り下げる。満杯時は保留せず拒否する
+- 背圧: 待機中 (QUEUED) のジョブ数には上限があり、満杯時は BACKGROUND を DEFERRED として保留し、
+  INTERACTIVE と保留枠を超えた BACKGROUND は `MemoAiJobQueueFullError` で拒否する
+- 永続化: `MemoAiJobStore` を渡すとジョブを DB に保存し、実行権 (lease) を取得してから処理する。
+  起動時に `resume_pending` で未完了のジョブを再開する
+- 途中経過: 実行中のステージ (エージェントのノード名) と生成途中のタスクタイトルを `MemoAiJobProgress` として
+  イベントバスへ発行する (`subscribe_progress` はその購読の近道)。購読者がいない場合は通常の invoke で実行する
+- 状態の通知: 登録・実行開始・完了のたびにスナップショットを `MemoAiJobUpdated` としてイベントバスへ発行する。
+  画面はこれを購読して、ジョブの状態を問い合わせ続けずに結果を反映できる
+"""
 
 from __future__ import annotations
 
+import json
+import os
+import socket
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 from enum import Enum
-from threading import Event, Lock, Thread
-from typing import TYPE_CHECKING, cast
+from threading import Condition, Event, Lock, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Final, cast
 from uuid import UUID, uuid4
 
 from loguru import logger
 
-from models import ProjectStatus
+from agents.agent_conf import LLMProvider
+from agents.streaming import partial_json_string_values
+from errors import ApplicationError
+from logic.events import DomainEvent, get_event_bus
+from models import ProjectStatus, TaskStatus
 
 if TYPE_CHECKING:  # pragma: no cover - 型チェック用
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
+    from typing import Any
 
+    from agents.streaming import AgentStreamEvent
     from agents.task_agents.memo_to_task.schema import MemoToTaskAgentOutput, TaskDraft
     from logic.application.apps import ApplicationServices
-    from models import MemoRead, TaskStatus
+    from logic.application.memo_ai_job_store import MemoAiJobStore
+    from logic.events import EventBus
+    from models import MemoAiJob, MemoRead
 
 
 class MemoAiJobStatus(str, Enum):
     """メモAIジョブの状態。"""
 
     QUEUED = "queued"
+    DEFERRED = "deferred"
     RUNNING = "running"
     SUCCEEDED = "succeeded"
     FAILED = "failed"
 
 
+class MemoAiJobPriority(str, Enum):
+    """メモAIジョブの優先度レーン。"""
+
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+    PREFETCH = "prefetch"
+
+
+class MemoAiJobQueueFullError(ApplicationError):
+    """待機中のジョブ数が上限に達し、ジョブを受け付けられない場合のエラー。"""
+
+
+DEFAULT_PROVIDER_CONCURRENCY: Final[Mapping[LLMProvider, int]] = {
+    LLMProvider.OPENVINO: 1,
+    LLMProvider.GOOGLE: 4,
+    LLMProvider.FAKE: 2,
+}
+"""プロバイダごとの既定の同時実行数"""
+
+PROGRESS_STAGE_STARTED: Final[str] = "started"
+"""処理を開始した直後 (まだノードが実行されていない) のステージ名"""
+
+_TITLE_STREAMING_NODES: Final[frozenset[str]] = frozenset({"classify_memo", "generate_task_seed"})
+"""構造化出力にタスクタイトルを含むノード (トークンからタイトルを取り出す)"""
+
+_COMPLETED_STATUSES: Final = (MemoAiJobStatus.SUCCEEDED, MemoAiJobStatus.FAILED)
+
+
 @dataclass(slots=True)
 class GeneratedTaskPayload:
     """UI層へ渡す生成タスク情報。"""
@@ -45,6 +103,34 @@ class GeneratedTaskPayload:
     project_id: UUID | None
     status: TaskStatus
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "task_id": str(self.task_id),
+            "title": self.title,
+            "description": self.description,
+            "tags": list(self.tags),
+            "route": self.route,
+            "due_date": self.due_date,
+            "project_title": self.project_title,
+            "project_id": str(self.project_id) if self.project_id else None,
+            "status": self.status.value,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GeneratedTaskPayload:
+        project_id = data.get("project_id")
+        return cls(
+            task_id=UUID(data["task_id"]),
+            title=data["title"],
+            description=data.get("description"),
+            tags=tuple(data.get("tags") or ()),
+            route=data.get("route"),
+            due_date=data.get("due_date"),
+            project_title=data.get("project_title"),
+            project_id=UUID(project_id) if project_id else None,
+            status=TaskStatus(data["status"]),
+        )
+
 
 @dataclass(slots=True)
 class GeneratedProjectPayload:
@@ -56,6 +142,26 @@ class GeneratedProjectPayload:
     status: str | None
     error: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "project_id": str(self.project_id) if self.project_id else None,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GeneratedProjectPayload:
+        project_id = data.get("project_id")
+        return cls(
+            project_id=UUID(project_id) if project_id else None,
+            title=data["title"],
+            description=data.get("description"),
+            status=data.get("status"),
+            error=data.get("error"),
+        )
+
 
 @dataclass(slots=True)
 class MemoAiJobSnapshot:
@@ -69,6 +175,111 @@ class MemoAiJobSnapshot:
     project: GeneratedProjectPayload | None = None
     error_message: str | None = None
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    priority: MemoAiJobPriority = MemoAiJobPriority.INTERACTIVE
+
+    @classmethod
+    def from_stored(cls, job: MemoAiJob) -> MemoAiJobSnapshot:
+        """永続化されたジョブからスナップショットを復元する。"""
+        result: dict[str, Any] = json.loads(job.result) if job.result else {}
+        project = result.get("project")
+        return cls(
+            job_id=job.id,
+            memo_id=job.memo_id,
+            status=MemoAiJobStatus(job.status),
+            tasks=tuple(GeneratedTaskPayload.from_dict(task) for task in result.get("tasks", [])),
+            suggested_memo_status=result.get("suggested_memo_status"),
+            project=GeneratedProjectPayload.from_dict(project) if project else None,
+            error_message=job.error_message,
+            updated_at=job.updated_at.replace(tzinfo=UTC),
+            priority=MemoAiJobPriority(job.priority),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MemoAiJobUpdated(DomainEvent):
+    """ジョブの状態が変わったことの通知 (登録・実行開始・完了時に発行する)。
+
+    登録の通知は登録したスレッド、実行開始と完了の通知はワーカースレッドから発行されるため、
+    登録と実行開始の通知は前後することがある。完了の通知は常に最後で、完了時のコールバックより先に届く。
+
+    Attributes:
+        snapshot: 変化した時点のスナップショット
+    """
+
+    snapshot: MemoAiJobSnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class MemoAiJobProgress(DomainEvent):
+    """実行中のジョブの途中経過。
+
+    Attributes:
+        job_id: ジョブID
+        memo_id: 対象メモのID
+        stage: 実行中 (または直前に完了した) エージェントのノード名。処理開始直後は `PROGRESS_STAGE_STARTED`
+        partial_task_titles: 生成途中のタスクタイトル (出力中の最後のタイトルは途中までの文字列)
+    """
+
+    job_id: UUID
+    memo_id: UUID
+    stage: str
+    partial_task_titles: tuple[str, ...] = ()
+
+
+class _ProgressRelay:
+    """エージェントの途中経過を `MemoAiJobProgress` に変換し、変化があったときだけ通知する。"""
+
+    def __init__(self, record: _MemoAiJobRecord, publish: Callable[[MemoAiJobProgress], None]) -> None:
+        self._job_id = record.job_id
+        self._memo_id = record.memo.id
+        self._publish = publish
+        self._stage = PROGRESS_STAGE_STARTED
+        self._titles: tuple[str, ...] = ()
+        self._token_node = ""
+        self._tokens: list[str] = []
+
+    def start(self) -> None:
+        self._emit()
+
+    def __call__(self, event: AgentStreamEvent) -> None:
+        if event.kind == "node":
+            titles = self._titles_from_update(event.update or {})
+            self._advance(event.node, titles if titles else self._titles)
+            return
+        if event.node != self._token_node:
+            self._token_node = event.node
+            self._tokens = []
+        self._tokens.append(event.text)
+        titles = self._titles
+        if event.node in _TITLE_STREAMING_NODES:
+            streamed = tuple(title for title in partial_json_string_values("".join(self._tokens), "title") if title)
+            titles = streamed or titles
+        self._advance(event.node, titles)
+
+    def _advance(self, stage: str, titles: tuple[str, ...]) -> None:
+        if stage == self._stage and titles == self._titles:
+            return
+        self._stage = stage
+        self._titles = titles
+        self._emit()
+
+    def _emit(self) -> None:
+        self._publish(
+            MemoAiJobProgress(
+                job_id=self._job_id,
+                memo_id=self._memo_id,
+                stage=self._stage,
+                partial_task_titles=self._titles,
+            )
+        )
+
+    @staticmethod
+    def _titles_from_update(update: dict[str, Any]) -> tuple[str, ...]:
+        routed = update.get("routed_tasks")
+        if routed:
+            return tuple(title for task in routed if (title := getattr(task, "title", "")))
+        seed_title = getattr(update.get("task_seed"), "title", "")
+        return (seed_title,) if seed_title else ()
 
 
 @dataclass(slots=True)
@@ -76,6 +287,8 @@ class _MemoAiJobRecord:
     job_id: UUID
     memo: MemoRead
     status: MemoAiJobStatus = MemoAiJobStatus.QUEUED
+    priority: MemoAiJobPriority = MemoAiJobPriority.INTERACTIVE
+    provider: LLMProvider | None = None
     tasks: list[GeneratedTaskPayload] = field(default_factory=list)
     suggested_memo_status: str | None = None
     project: GeneratedProjectPayload | None = None
@@ -93,89 +306,431 @@ class _MemoAiJobRecord:
             project=self.project,
             error_message=self.error_message,
             updated_at=self.updated_at,
+            priority=self.priority,
         )
 
+    def result_payload(self) -> dict[str, Any]:
+        return {
+            "tasks": [task.to_dict() for task in self.tasks],
+            "suggested_memo_status": self.suggested_memo_status,
+            "project": self.project.to_dict() if self.project else None,
+        }
+
 
 class MemoAiJobQueue:
-    """単一並列で MemoToTaskAgent を実行するメモリキュー。"""
+    """優先度レーンとプロバイダ別の同時実行数制限を持つ MemoToTaskAgent 実行キュー。"""
 
-    def __init__(self, *, apps: ApplicationServices | None = None) -> None:
+    def __init__(  # noqa: PLR0913 - キューの調整値はすべてキーワード指定
+        self,
+        *,
+        apps: ApplicationServices | None = None,
+        max_workers: int = 4,
+        provider_concurrency: Mapping[LLMProvider, int] | None = None,
+        max_pending: int = 32,
+        max_deferred: int = 64,
+        interactive_burst: int = 3,
+        store: MemoAiJobStore | None = None,
+        history_max_entries: int = 200,
+        events: EventBus | None = None,
+    ) -> None:
+        """MemoAiJobQueue を初期化し、ワーカーを起動する。
+
+        Args:
+            apps: アプリケーションサービスのコンテナ (None の場合は既定を生成)
+            max_workers: ワーカースレッド数
+            provider_concurrency: プロバイダごとの同時実行数 (未指定のプロバイダは 1)
+            max_pending: 待機中 (QUEUED) として受け付けるジョブ数の上限
+            max_deferred: 満杯時に保留 (DEFERRED) できる BACKGROUND ジョブ数の上限
+            interactive_burst: BACKGROUND を 1 件挟むまでに連続して処理する INTERACTIVE の件数
+            store: ジョブの永続化ストア (None の場合はメモリ上のみで管理する)
+            history_max_entries: ストアに残す完了ジョブの件数
+            events: 途中経過と状態の変化を発行するイベントバス (None の場合はプロセス共有のバス)
+        """
         self._jobs: dict[UUID, _MemoAiJobRecord] = {}
-        self._queue: deque[UUID] = deque()
+        self._lanes: dict[MemoAiJobPriority, deque[UUID]] = {priority: deque() for priority in MemoAiJobPriority}
+        self._deferred: deque[UUID] = deque()
         self._lock = Lock()
-        self._has_items = Event()
-        self._worker = Thread(target=self._worker_loop, name="MemoAiJobWorker", daemon=True)
-        self._worker.start()
+        self._job_available = Condition(self._lock)
+        self._shutdown = Event()
+        self._events = events or get_event_bus()
         from logic.application.apps import ApplicationServices
 
         self._apps: ApplicationServices = apps or ApplicationServices.create()
 
+        self._provider_concurrency = dict(
+            DEFAULT_PROVIDER_CONCURRENCY if provider_concurrency is None else provider_concurrency
+        )
+        self._max_pending = max_pending
+        self._max_deferred = max_deferred
+        self._interactive_burst = interactive_burst
+        self._interactive_streak = 0
+        # 最後に INTERACTIVE のジョブを登録・完了した時刻 (アイドル判定に使う)
+        self._last_interactive_at = monotonic()
+        self._store = store
+        self._history_max_entries = history_max_entries
+        # 実行権 (lease) の所有者。プロセスとキューのインスタンスを区別する
+        self._owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
         # Cleanup/retention configuration
         self._job_retention_seconds: int = 600  # 完了したジョブの保持期間（秒）
-        self._job_max_entries: int = 10  # 最大件数制限（無制限増加防止）
+        self._job_max_entries: int = 10  # 完了ジョブの最大件数制限（無制限増加防止）
         self._cleanup_interval_seconds: int = 60  # クリーナー実行間隔（秒）
 
+        self._workers = [
+            Thread(target=self._worker_loop, name=f"MemoAiJobWorker-{index}", daemon=True)
+            for index in range(max(1, max_workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+
         # Start background cleaner to evict old/too-many jobs
         self._cleaner = Thread(target=self._cleaner_loop, name="MemoAiJobCleaner", daemon=True)
         self._cleaner.start()
 
+        if self._store is not None:
+            self._heartbeat = Thread(target=self._heartbeat_loop, name="MemoAiJobHeartbeat", daemon=True)
+            self._heartbeat.start()
+
     def enqueue(
         self,
         memo: MemoRead,
         *,
         callback: Callable[[MemoAiJobSnapshot], None] | None = None,
+        priority: MemoAiJobPriority = MemoAiJobPriority.INTERACTIVE,
+        provider: LLMProvider | None = None,
     ) -> MemoAiJobSnapshot:
-        """メモを生成キューへ登録する。"""
+        """メモを生成キューへ登録する。
+
+        Args:
+            memo: 対象のメモ
+            callback: ジョブ完了時 (成功・失敗とも) に呼ぶ関数
+            priority: 優先度レーン
+            provider: ジョブを実行する LLM プロバイダ (None の場合は設定値)
+
+        Returns:
+            MemoAiJobSnapshot: 登録直後のスナップショット (満杯で保留された場合は DEFERRED)
+
+        Raises:
+            MemoAiJobQueueFullError: 待機中のジョブ数が上限に達し、保留もできない場合
+        """
         job_id = uuid4()
-        record = _MemoAiJobRecord(job_id=job_id, memo=memo, callback=callback)
-        with self._lock:
+        record = _MemoAiJobRecord(
+            job_id=job_id,
+            memo=memo,
+            priority=priority,
+            provider=provider or self._resolve_provider(),
+            callback=callback,
+        )
+        with self._job_available:
+            if priority != MemoAiJobPriority.PREFETCH:
+                self._drop_prefetch_locked(memo.id)
+            if priority == MemoAiJobPriority.INTERACTIVE:
+                self._last_interactive_at = monotonic()
+            if self._pending_count() < self._max_pending:
+                lane = self._lanes[priority]
+            elif priority == MemoAiJobPriority.BACKGROUND and len(self._deferred) < self._max_deferred:
+                record.status = MemoAiJobStatus.DEFERRED
+                lane = self._deferred
+            else:
+                msg = f"AIジョブの待機数が上限に達しています: pending={self._pending_count()}"
+                raise MemoAiJobQueueFullError(msg)
+        if self._store is not None:
+            # ワーカーが claim する前に保存しておく。書き込みはロックの外で行い、他のスレッドを待たせない
+            # (その間に並行して登録された分だけ待機数の上限を超えることがある)
+            self._store.add(job_id, memo.id, status=record.status, priority=priority, provider=record.provider)
+        with self._job_available:
+            lane.append(job_id)
             self._jobs[job_id] = record
-            self._queue.append(job_id)
-            self._has_items.set()
-        logger.info(f"MemoAIジョブを登録しました: job_id={job_id} memo_id={memo.id}")
-        return record.to_snapshot()
+            self._job_available.notify()
+        logger.info(
+            f"MemoAIジョブを登録しました: job_id={job_id} memo_id={memo.id} "
+            f"priority={priority.value} status={record.status.value}"
+        )
+        snapshot = record.to_snapshot()
+        self._events.publish(MemoAiJobUpdated(snapshot=snapshot))
+        return snapshot
+
+    def interactive_idle_seconds(self) -> float:
+        """INTERACTIVE のジョブが最後に登録・完了してからの経過秒数を返す (待機・実行中は 0)。"""
+        with self._lock:
+            if self._active_count_locked(MemoAiJobPriority.INTERACTIVE):
+                return 0.0
+            return monotonic() - self._last_interactive_at
+
+    def active_count(self, priority: MemoAiJobPriority) -> int:
+        """指定レーンの待機中・実行中のジョブ数を返す。"""
+        with self._lock:
+            return self._active_count_locked(priority)
+
+    def count_created_since(self, priority: MemoAiJobPriority, since: datetime) -> int | None:
+        """指定時刻以降に登録されたジョブ数をストアから数える (ストアがない場合は None)。"""
+        if self._store is None:
+            return None
+        return self._store.count_created_since(priority, since)
+
+    def subscribe_progress(self, listener: Callable[[MemoAiJobProgress], None]) -> Callable[[], None]:
+        """実行中のジョブの途中経過を受け取るリスナーをイベントバスへ登録する。
+
+        リスナーはワーカースレッドから呼ばれる。登録中はエージェントをストリーミングで実行する。
+
+        Args:
+            listener: 途中経過を受け取る関数
+
+        Returns:
+            Callable[[], None]: 登録を解除する関数
+        """
+        return self._events.subscribe(MemoAiJobProgress, listener)
 
     def get_snapshot(self, job_id: UUID) -> MemoAiJobSnapshot | None:
-        """ジョブの最新状態を返す。"""
+        """ジョブの最新状態を返す (メモリ上にない場合はストアから復元する)。"""
         with self._lock:
             record = self._jobs.get(job_id)
-            if record is None:
-                return None
-            return record.to_snapshot()
+            if record is not None:
+                return record.to_snapshot()
+        if self._store is None:
+            return None
+        stored = self._store.get(job_id)
+        return MemoAiJobSnapshot.from_stored(stored) if stored is not None else None
+
+    def get_latest_snapshot(self, memo_id: UUID) -> MemoAiJobSnapshot | None:
+        """メモの最新ジョブの状態を返す (画面の再表示時にジョブの追跡を復元するために使う)。"""
+        with self._lock:
+            records = [record for record in self._jobs.values() if record.memo.id == memo_id]
+            if records:
+                return max(records, key=lambda record: record.updated_at).to_snapshot()
+        if self._store is None:
+            return None
+        stored = self._store.latest_for_memo(memo_id)
+        return MemoAiJobSnapshot.from_stored(stored) if stored is not None else None
+
+    def resume_pending(
+        self,
+        load_memo: Callable[[UUID], MemoRead],
+        *,
+        callback: Callable[[MemoAiJobSnapshot], None] | None = None,
+    ) -> list[MemoAiJobSnapshot]:
+        """ストアに残っている未完了のジョブを再開する (起動時に 1 回呼ぶ)。
+
+        実行中に中断されたジョブは、同じホストの以前のプロセスのものならすぐに、
+        それ以外は lease の期限切れ後に再開される。再試行回数の上限を超えたジョブは
+        FAILED として callback に通知する。待機数の上限は適用しない (超過分は DEFERRED になる)。
+
+        Args:
+            load_memo: メモIDからメモを読み込む関数 (メモが削除されていれば例外を送出する)
+            callback: ジョブ完了時に呼ぶ関数
+
+        Returns:
+            list[MemoAiJobSnapshot]: 再開したジョブと打ち切ったジョブのスナップショット
+        """
+        if self._store is None:
+            return []
+        recovered = self._store.recover(self._owner)
+        snapshots = [MemoAiJobSnapshot.from_stored(job) for job in recovered.abandoned]
+        for stored in recovered.resumable:
+            try:
+                memo = load_memo(stored.memo_id)
+            except Exception as exc:  # 対象メモが読めないジョブは失敗として閉じる
+                self._store.fail(stored.id, f"メモを読み込めませんでした: {exc}")
+                failed = self._store.get(stored.id)
+                if failed is not None:
+                    snapshots.append(MemoAiJobSnapshot.from_stored(failed))
+                continue
+            snapshots.append(self._readmit(stored, memo, callback))
+        if callback is not None:
+            for snapshot in snapshots:
+                if snapshot.status in _COMPLETED_STATUSES:
+                    callback(snapshot)
+        logger.info(
+            f"MemoAIジョブを再開しました: resumed={len(recovered.resumable)} abandoned={len(recovered.abandoned)}"
+        )
+        return snapshots
+
+    def _readmit(
+        self,
+        stored: MemoAiJob,
+        memo: MemoRead,
+        callback: Callable[[MemoAiJobSnapshot], None] | None,
+    ) -> MemoAiJobSnapshot:
+        record = _MemoAiJobRecord(
+            job_id=stored.id,
+            memo=memo,
+            priority=MemoAiJobPriority(stored.priority),
+            provider=LLMProvider(stored.provider) if stored.provider else self._resolve_provider(),
+            callback=callback,
+        )
+        with self._job_available:
+            if self._pending_count() < self._max_pending:
+                self._lanes[record.priority].append(record.job_id)
+                status = MemoAiJobStatus.QUEUED
+            else:
+                self._deferred.append(record.job_id)
+                status = MemoAiJobStatus.DEFERRED
+            record.status = status
+            self._jobs[record.job_id] = record
+            self._job_available.notify()
+        if self._store is not None and stored.status != status.value:
+            self._store.set_status(record.job_id, status)
+        return record.to_snapshot()
+
+    def shutdown(self) -> None:
+        """新たなジョブの取り出しを止め、ワーカーとクリーナーを終了させる (実行中のジョブは完了まで続く)。"""
+        with self._job_available:
+            self._shutdown.set()
+            self._job_available.notify_all()
 
     def _worker_loop(self) -> None:
         while True:
-            self._has_items.wait()
-            job_id = self._pop_left()
-            if job_id is None:
-                self._has_items.clear()
+            with self._job_available:
+                record = self._take_next_locked()
+                while record is None:
+                    if self._shutdown.is_set():
+                        return
+                    self._job_available.wait()
+                    record = self._take_next_locked()
+            if self._store is not None and not self._claim(record):
+                continue
+            try:
+                self._process(record)
+            finally:
+                with self._job_available:
+                    self._promote_deferred_locked()
+                    # プロバイダの実行枠が空いたため、待機中のワーカーに再評価させる
+                    self._job_available.notify_all()
+
+    def _take_next_locked(self) -> _MemoAiJobRecord | None:
+        """次に実行するジョブを選び RUNNING にする (ロック保持中に呼ぶ)。"""
+        if self._shutdown.is_set():
+            return None
+        running = self._running_by_provider()
+        lanes = [MemoAiJobPriority.INTERACTIVE, MemoAiJobPriority.BACKGROUND]
+        if self._interactive_streak >= self._interactive_burst:
+            lanes.reverse()
+        if not self._active_count_locked(MemoAiJobPriority.INTERACTIVE):
+            lanes.append(MemoAiJobPriority.PREFETCH)
+        for priority in lanes:
+            record = self._pop_runnable_locked(self._lanes[priority], running)
+            if record is None:
+                continue
+            if priority == MemoAiJobPriority.INTERACTIVE:
+                self._interactive_streak += 1
+            elif priority == MemoAiJobPriority.BACKGROUND:
+                self._interactive_streak = 0
+            record.status = MemoAiJobStatus.RUNNING
+            record.updated_at = datetime.now(UTC)
+            return record
+        return None
+
+    def _pop_runnable_locked(
+        self, lane: deque[UUID], running: dict[LLMProvider | None, int]
+    ) -> _MemoAiJobRecord | None:
+        """レーン先頭から、プロバイダの実行枠が空いている最初のジョブを取り出す。"""
+        for job_id in list(lane):
+            record = self._jobs.get(job_id)
+            if record is None:
+                lane.remove(job_id)
                 continue
+            if running.get(record.provider, 0) < self._concurrency_limit(record.provider):
+                lane.remove(job_id)
+                return record
+        return None
+
+    def _claim(self, record: _MemoAiJobRecord) -> bool:
+        """ストア上の実行権を取得する。取得できなければ (他プロセスが処理済みなど) メモリ上から外す。"""
+        assert self._store is not None  # noqa: S101 - 呼び出し側で確認済み
+        try:
+            claimed = self._store.claim(record.job_id, self._owner)
+        except Exception:
+            logger.exception(f"MemoAIジョブの実行権の取得に失敗しました: job_id={record.job_id}")
+            claimed = False
+        if not claimed:
+            with self._job_available:
+                self._jobs.pop(record.job_id, None)
+                self._job_available.notify_all()
+            logger.info(f"MemoAIジョブを他のワーカーが処理済みのためスキップしました: job_id={record.job_id}")
+        return claimed
+
+    def _drop_prefetch_locked(self, memo_id: UUID) -> None:
+        """同じメモの待機中の PREFETCH ジョブを取り下げる (ロック保持中に呼ぶ)。"""
+        lane = self._lanes[MemoAiJobPriority.PREFETCH]
+        for job_id in list(lane):
             record = self._jobs.get(job_id)
+            if record is not None and record.memo.id != memo_id:
+                continue
+            lane.remove(job_id)
+            self._jobs.pop(job_id, None)
             if record is None:
                 continue
-            self._process(record)
+            if self._store is not None:
+                self._store.fail(job_id, "同じメモの生成が依頼されたため先読みを取り下げました")
+            logger.debug(f"MemoAI先読みジョブを取り下げました: job_id={job_id} memo_id={memo_id}")
+
+    def _active_count_locked(self, priority: MemoAiJobPriority) -> int:
+        return sum(
+            1
+            for record in self._jobs.values()
+            if record.priority == priority and record.status in (MemoAiJobStatus.QUEUED, MemoAiJobStatus.RUNNING)
+        )
 
-    def _pop_left(self) -> UUID | None:
-        with self._lock:
-            if not self._queue:
-                return None
-            return self._queue.popleft()
+    def _running_by_provider(self) -> dict[LLMProvider | None, int]:
+        running: dict[LLMProvider | None, int] = {}
+        for record in self._jobs.values():
+            if record.status == MemoAiJobStatus.RUNNING:
+                running[record.provider] = running.get(record.provider, 0) + 1
+        return running
+
+    def _concurrency_limit(self, provider: LLMProvider | None) -> int:
+        if provider is None:
+            return 1
+        return max(1, self._provider_concurrency.get(provider, 1))
+
+    def _pending_count(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def _promote_deferred_locked(self) -> None:
+        """待機枠が空いた分だけ、保留中のジョブを BACKGROUND レーン (先読みは PREFETCH レーン) へ戻す。"""
+        while self._deferred and self._pending_count() < self._max_pending:
+            job_id = self._deferred.popleft()
+            record = self._jobs.get(job_id)
+            if record is None:
+                continue
+            record.status = MemoAiJobStatus.QUEUED
+            record.updated_at = datetime.now(UTC)
+            if record.priority == MemoAiJobPriority.PREFETCH:
+                self._lanes[MemoAiJobPriority.PREFETCH].append(job_id)
+            else:
+                self._lanes[MemoAiJobPriority.BACKGROUND].append(job_id)
+            if self._store is not None:
+                self._store.set_status(job_id, MemoAiJobStatus.QUEUED)
+
+    def _resolve_provider(self) -> LLMProvider:
+        from logic.application.memo_to_task_application_service import MemoToTaskApplicationService
+
+        return self._apps.get_service(MemoToTaskApplicationService).get_configured_provider()
 
     def _cleaner_loop(self) -> None:
         """バックグラウンドで古い完了ジョブを削除し、最大件数を超えたら古いものから削除する。"""
-        while True:
-            # Sleep via Event wait to be interruptible in future if needed
-            self._has_items.wait(timeout=self._cleanup_interval_seconds)
+        while not self._shutdown.wait(timeout=self._cleanup_interval_seconds):
             try:
                 self._cleanup_jobs()
             except Exception:
                 logger.exception("MemoAIジョブクリーナーで例外が発生しました")
 
+    def _heartbeat_loop(self) -> None:
+        """実行中のジョブの lease を定期的に延長する。"""
+        assert self._store is not None  # noqa: S101 - ストアがある場合のみ起動する
+        interval = max(1.0, self._store.lease_seconds / 3)
+        while not self._shutdown.wait(timeout=interval):
+            try:
+                self._store.heartbeat(self._owner)
+            except Exception:
+                logger.exception("MemoAIジョブのハートビートで例外が発生しました")
+
     def _cleanup_jobs(self) -> None:
         """内部ジョブ辞書を掃除する。
 
         - 完了（SUCCEEDED/FAILED）してから一定時間経過したジョブを削除する。
-        - 総件数が `_job_max_entries` を超えた場合、古いジョブから削除する。
+        - 完了ジョブが `_job_max_entries` を超えた場合、古いジョブから削除する。
+          待機中・実行中のジョブは削除しない。
         """
         now = datetime.now(UTC)
         retention = timedelta(seconds=self._job_retention_seconds)
@@ -183,6 +738,8 @@ class MemoAiJobQueue:
         with self._lock:
             removed.extend(self._remove_old_completed(now, retention))
             removed.extend(self._enforce_max_entries())
+        if self._store is not None:
+            self._store.prune(self._history_max_entries)
 
         if removed:
             logger.info("MemoAIジョブをクリーンアップしました: removed=%d", len(removed))
@@ -191,52 +748,29 @@ class MemoAiJobQueue:
         """完了済みで保持期間を超えたジョブを削除して、その job_id を返す。"""
         removed: list[UUID] = []
         for job_id, record in list(self._jobs.items()):
-            if record.status in (MemoAiJobStatus.SUCCEEDED, MemoAiJobStatus.FAILED) and (
-                now - record.updated_at > retention
-            ):
+            if record.status in _COMPLETED_STATUSES and (now - record.updated_at > retention):
                 removed.append(job_id)
                 del self._jobs[job_id]
-                try:
-                    while job_id in self._queue:
-                        self._queue.remove(job_id)
-                except ValueError:
-                    pass
         return removed
 
     def _enforce_max_entries(self) -> list[UUID]:
-        """総件数が上限を超えていたら、古いジョブから削除する。削除した job_id を返す。"""
-        removed: list[UUID] = []
-        if len(self._jobs) <= self._job_max_entries:
-            return removed
-
-        # sort candidates: prefer completed then by updated_at asc
-        candidates = sorted(
-            self._jobs.items(),
-            key=lambda kv: (
-                0 if kv[1].status in (MemoAiJobStatus.SUCCEEDED, MemoAiJobStatus.FAILED) else 1,
-                kv[1].updated_at,
-            ),
+        """完了ジョブが上限を超えていたら、古いものから削除する。削除した job_id を返す。"""
+        completed = sorted(
+            (record for record in self._jobs.values() if record.status in _COMPLETED_STATUSES),
+            key=lambda record: record.updated_at,
         )
-        to_remove = len(self._jobs) - self._job_max_entries
-        for i in range(to_remove):
-            job_id, _ = candidates[i]
-            try:
-                del self._jobs[job_id]
-            except KeyError:
-                continue
-            try:
-                while job_id in self._queue:
-                    self._queue.remove(job_id)
-            except ValueError:
-                pass
-            removed.append(job_id)
+        to_remove = len(completed) - self._job_max_entries
+        removed = [record.job_id for record in completed[: max(0, to_remove)]]
+        for job_id in removed:
+            del self._jobs[job_id]
         return removed
 
     def _process(self, record: _MemoAiJobRecord) -> None:
-        self._update_status(record, MemoAiJobStatus.RUNNING)
+        # RUNNING への遷移はジョブを取り出す際にロック内で済ませている
+        self._events.publish(MemoAiJobUpdated(snapshot=record.to_snapshot()))
         try:
             logger.debug(f"MemoAIジョブ処理開始: job_id={record.job_id} memo_id={record.memo.id}")
-            output = self._run_agent(record.memo)
+            output = self._run_agent(record.memo, self._progress_relay(record))
             project_payload = self._create_project_if_required(record.memo, output)
             record.project = project_payload
             project_id = project_payload.project_id if project_payload else None
@@ -252,51 +786,81 @@ class MemoAiJobQueue:
             record.error_message = str(exc)
             self._update_status(record, MemoAiJobStatus.FAILED)
         finally:
+            self._persist_result(record)
             snapshot = record.to_snapshot()
+            self._events.publish(MemoAiJobUpdated(snapshot=snapshot))
             if record.callback:
                 try:
                     record.callback(snapshot)
                 except Exception:
                     logger.exception("MemoAIジョブ完了後のコールバックで例外が発生しました")
 
-    def _run_agent(self, memo: MemoRead) -> MemoToTaskAgentOutput:
+    def _persist_result(self, record: _MemoAiJobRecord) -> None:
+        if self._store is None:
+            return
+        try:
+            completed = self._store.complete(
+                record.job_id,
+                self._owner,
+                record.status,
+                result=record.result_payload() if record.status == MemoAiJobStatus.SUCCEEDED else None,
+                error_message=record.error_message,
+            )
+        except Exception:
+            logger.exception(f"MemoAIジョブの結果の保存に失敗しました: job_id={record.job_id}")
+            return
+        if not completed:
+            logger.warning(f"MemoAIジョブの実行権が失効していたため結果を保存しませんでした: job_id={record.job_id}")
+
+    def _progress_relay(self, record: _MemoAiJobRecord) -> _ProgressRelay | None:
+        if not self._events.has_subscribers(MemoAiJobProgress):
+            return None
+        relay = _ProgressRelay(record, self._events.publish)
+        relay.start()
+        return relay
+
+    def _run_agent(self, memo: MemoRead, on_event: _ProgressRelay | None = None) -> MemoToTaskAgentOutput:
         from logic.application.memo_to_task_application_service import MemoToTaskApplicationService
 
         service = self._apps.get_service(MemoToTaskApplicationService)
-        return service.clarify_memo(memo)
+        if on_event is None:
+            return service.clarify_memo(memo)
+        return service.clarify_memo(memo, on_event=on_event)
 
     def _create_draft_tasks(
         self, memo: MemoRead, drafts: list[TaskDraft], project_id: UUID | None
     ) -> list[GeneratedTaskPayload]:
         from logic.application.task_application_service import TaskApplicationService
-        from models import TaskStatus
+        from models import TaskCreate
 
         task_service = self._apps.get_service(TaskApplicationService)
-        payloads: list[GeneratedTaskPayload] = []
-        for draft in drafts:
-            due_date_value = self._coerce_due_date(draft.due_date)
-            created_task = task_service.create(
-                title=draft.title,
-                description=draft.description or "",
-                status=TaskStatus.DRAFT,
-                memo_id=memo.id,
-                project_id=project_id,
-                due_date=due_date_value,
-            )
-            payloads.append(
-                GeneratedTaskPayload(
-                    task_id=created_task.id,
-                    title=created_task.title,
-                    description=created_task.description,
-                    tags=tuple(tag.name for tag in created_task.tags) or tuple(draft.tags or []),
-                    route=draft.route,
-                    due_date=draft.due_date,
-                    project_title=draft.project_title,
-                    project_id=created_task.project_id,
-                    status=created_task.status,
+        created_tasks = task_service.bulk_create(
+            [
+                TaskCreate(
+                    title=draft.title,
+                    description=draft.description or "",
+                    status=TaskStatus.DRAFT,
+                    memo_id=memo.id,
+                    project_id=project_id,
+                    due_date=self._coerce_due_date(draft.due_date),
                 )
+                for draft in drafts
+            ]
+        )
+        return [
+            GeneratedTaskPayload(
+                task_id=created_task.id,
+                title=created_task.title,
+                description=created_task.description,
+                tags=tuple(tag.name for tag in created_task.tags) or tuple(draft.tags or []),
+                route=draft.route,
+                due_date=draft.due_date,
+                project_title=draft.project_title,
+                project_id=created_task.project_id,
+                status=created_task.status,
             )
-        return payloads
+            for draft, created_task in zip(drafts, created_tasks, strict=True)
+        ]
 
     @staticmethod
     def _coerce_due_date(value: str | None) -> date | None:
@@ -316,6 +880,8 @@ class MemoAiJobQueue:
         with self._lock:
             record.status = status
             record.updated_at = datetime.now(UTC)
+            if record.priority == MemoAiJobPriority.INTERACTIVE:
+                self._last_interactive_at = monotonic()
 
     def _create_project_if_required(
         self, memo: MemoRead, output: MemoToTaskAgentOutput
@@ -382,22 +948,31 @@ _queue_lock = Lock()
 
 
 def get_memo_ai_job_queue() -> MemoAiJobQueue:
-    """シングルトンの MemoAiJobQueue を返す。"""
+    """シングルトンの MemoAiJobQueue を返す (ジョブはアプリの DB に永続化する)。"""
     instance = cast("MemoAiJobQueue | None", globals().get("_queue_instance"))
     if instance is None:
         with _queue_lock:
             instance = cast("MemoAiJobQueue | None", globals().get("_queue_instance"))
             if instance is None:
-                instance = MemoAiJobQueue()
+                from config import engine
+                from logic.application.memo_ai_job_store import MemoAiJobStore
+
+                instance = MemoAiJobQueue(store=MemoAiJobStore(engine))
                 globals()["_queue_instance"] = instance
     return instance
 
 
 __all__ = [
+    "DEFAULT_PROVIDER_CONCURRENCY",
     "GeneratedTaskPayload",
     "GeneratedProjectPayload",
+    "PROGRESS_STAGE_STARTED",
+    "MemoAiJobPriority",
+    "MemoAiJobProgress",
     "MemoAiJobQueue",
+    "MemoAiJobQueueFullError",
     "MemoAiJobSnapshot",
     "MemoAiJobStatus",
+    "MemoAiJobUpdated",
     "get_memo_ai_job_queue",
 ]
@@ -0,0 +1,340 @@
+"""メモAIジョブの永続化ストア。
+
+`MemoAiJobQueue` のジョブ状態を `memo_ai_jobs` テーブルへ保存し、再起動やクラッシュ後に再開できるようにする。
+
+- 実行権 (lease): ワーカーは条件付き UPDATE (`claim`) で QUEUED/DEFERRED のジョブを RUNNING にする。
+  更新できるのは 1 ワーカーだけなので、複数ワーカー・複数プロセスでも同じジョブを二重に実行しない
+- ハートビート: 実行中は `heartbeat` で lease の期限を延長する。期限切れの RUNNING はプロセスが
+  異常終了したものとみなし、`recover` で QUEUED に戻す (`max_attempts` 回を超えたら FAILED にする)。
+  起動時は同じホストの終了済みのプロセスが持っていた RUNNING も、lease の期限を待たずに QUEUED に戻す
+  (実行中のプロセスのジョブは奪わず、lease の期限切れを待つ)
+- 履歴: 完了済みのジョブは `prune` で新しいものから `keep` 件だけ残す
+
+時刻はすべて naive な UTC で保存する。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Final
+
+from sqlalchemy import delete, or_, update
+from sqlmodel import Session, col, func, select
+
+from logic.application.memo_ai_job_queue import MemoAiJobPriority, MemoAiJobStatus
+from models import MemoAiJob
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy import Engine
+
+    from agents.agent_conf import LLMProvider
+
+DEFAULT_LEASE_SECONDS: Final[int] = 120
+DEFAULT_MAX_ATTEMPTS: Final[int] = 3
+
+_CLAIMABLE: Final = (MemoAiJobStatus.QUEUED.value, MemoAiJobStatus.DEFERRED.value)
+_COMPLETED: Final = (MemoAiJobStatus.SUCCEEDED.value, MemoAiJobStatus.FAILED.value)
+
+
+def _is_owner_alive(lease_owner: str | None) -> bool:
+    """実行権を持つ owner (`ホスト名:PID:...`) のプロセスが実行中かどうか (判定できない場合は実行中とみなす)"""
+    pid = (lease_owner or "").partition(":")[2].partition(":")[0]
+    if not pid.isdigit() or sys.platform == "win32":
+        # Windows の os.kill はシグナル 0 でもプロセスを終了させるため判定しない
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # PermissionError など: プロセスは存在する
+        return True
+    return True
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+@dataclass(frozen=True, slots=True)
+class RecoveredJobs:
+    """起動時の復旧結果
+
+    Attributes:
+        resumable: 再開するジョブ (QUEUED/DEFERRED。lease 切れの RUNNING は QUEUED に戻し済み)
+        abandoned: 再試行回数を超えたため FAILED にしたジョブ
+    """
+
+    resumable: list[MemoAiJob] = field(default_factory=list)
+    abandoned: list[MemoAiJob] = field(default_factory=list)
+
+
+class MemoAiJobStore:
+    """`memo_ai_jobs` テーブルへの読み書きを行うストア (スレッドセーフ)。"""
+
+    def __init__(
+        self,
+        engine: Engine,
+        *,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        """MemoAiJobStore を初期化する。
+
+        Args:
+            engine: 書き込み用エンジン
+            lease_seconds: 実行権の有効期間 (秒)。ハートビートの間隔より十分長くすること
+            max_attempts: クラッシュ後に再実行する最大回数 (初回を含む)
+        """
+        self._engine = engine
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    # ==============================================================================
+    # 書き込み
+    # ==============================================================================
+
+    def add(
+        self,
+        job_id: UUID,
+        memo_id: UUID,
+        *,
+        status: MemoAiJobStatus,
+        priority: MemoAiJobPriority,
+        provider: LLMProvider | None,
+    ) -> None:
+        """ジョブを登録する。"""
+        now = _utcnow()
+        job = MemoAiJob(
+            id=job_id,
+            memo_id=memo_id,
+            status=status.value,
+            priority=priority.value,
+            provider=provider.value if provider is not None else None,
+            created_at=now,
+            updated_at=now,
+        )
+        with Session(self._engine) as session:
+            session.add(job)
+            session.commit()
+
+    def set_status(self, job_id: UUID, status: MemoAiJobStatus) -> None:
+        """待機中のジョブの状態を更新する (DEFERRED ⇄ QUEUED)。"""
+        stmt = (
+            update(MemoAiJob)
+            .where(col(MemoAiJob.id) == job_id, col(MemoAiJob.status).in_(_CLAIMABLE))
+            .values(status=status.value, updated_at=_utcnow())
+        )
+        with self._engine.begin() as conn:
+            conn.execute(stmt)
+
+    def claim(self, job_id: UUID, owner: str) -> bool:
+        """待機中のジョブの実行権を取得し RUNNING にする。
+
+        Args:
+            job_id: ジョブID
+            owner: ワーカー (プロセス) の識別子
+
+        Returns:
+            bool: 実行権を取得できた場合 True (他のワーカーが取得済み・削除済みなら False)
+        """
+        now = _utcnow()
+        stmt = (
+            update(MemoAiJob)
+            .where(col(MemoAiJob.id) == job_id, col(MemoAiJob.status).in_(_CLAIMABLE))
+            .values(
+                status=MemoAiJobStatus.RUNNING.value,
+                lease_owner=owner,
+                lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                attempts=MemoAiJob.attempts + 1,
+                updated_at=now,
+            )
+        )
+        with self._engine.begin() as conn:
+            return conn.execute(stmt).rowcount == 1
+
+    def heartbeat(self, owner: str) -> int:
+        """指定した owner が実行中のジョブすべての lease を延長する。
+
+        Returns:
+            int: 延長したジョブ数
+        """
+        stmt = (
+            update(MemoAiJob)
+            .where(
+                col(MemoAiJob.status) == MemoAiJobStatus.RUNNING.value,
+                col(MemoAiJob.lease_owner) == owner,
+            )
+            .values(lease_expires_at=_utcnow() + timedelta(seconds=self.lease_seconds))
+        )
+        with self._engine.begin() as conn:
+            return conn.execute(stmt).rowcount
+
+    def complete(
+        self,
+        job_id: UUID,
+        owner: str,
+        status: MemoAiJobStatus,
+        *,
+        result: dict[str, Any] | None = None,
+        error_message: str | None = None,
+    ) -> bool:
+        """実行中のジョブを完了状態にする。
+
+        Args:
+            job_id: ジョブID
+            owner: 実行権を持つワーカーの識別子
+            status: SUCCEEDED または FAILED
+            result: 生成結果 (JSON 化できる辞書)
+            error_message: 失敗時のエラーメッセージ
+
+        Returns:
+            bool: 更新できた場合 True (lease が切れて他のワーカーへ移っていた場合は False)
+        """
+        stmt = (
+            update(MemoAiJob)
+            .where(
+                col(MemoAiJob.id) == job_id,
+                col(MemoAiJob.status) == MemoAiJobStatus.RUNNING.value,
+                col(MemoAiJob.lease_owner) == owner,
+            )
+            .values(
+                status=status.value,
+                lease_owner=None,
+                lease_expires_at=None,
+                result=json.dumps(result, ensure_ascii=False) if result is not None else None,
+                error_message=error_message,
+                updated_at=_utcnow(),
+            )
+        )
+        with self._engine.begin() as conn:
+            return conn.execute(stmt).rowcount == 1
+
+    def fail(self, job_id: UUID, error_message: str) -> None:
+        """未完了のジョブを FAILED にする (対象メモが削除されていた場合など)。"""
+        stmt = (
+            update(MemoAiJob)
+            .where(col(MemoAiJob.id) == job_id, col(MemoAiJob.status).not_in(_COMPLETED))
+            .values(
+                status=MemoAiJobStatus.FAILED.value,
+                lease_owner=None,
+                lease_expires_at=None,
+                error_message=error_message,
+                updated_at=_utcnow(),
+            )
+        )
+        with self._engine.begin() as conn:
+            conn.execute(stmt)
+
+    def recover(self, owner: str | None = None) -> RecoveredJobs:
+        """起動時に再開するジョブを取得する。
+
+        lease が切れた RUNNING は QUEUED に戻す。owner を指定した場合は、同じホストの別の owner が持つ
+        RUNNING のうち、owner のプロセスが終了しているものも期限切れ前に QUEUED に戻す
+        (再起動前のプロセスのジョブを lease の期限まで待たせない)。
+        実行回数が `max_attempts` に達したものは FAILED にする。
+
+        Args:
+            owner: 起動したワーカーの識別子 (`ホスト名:PID:` で始まる形式)
+
+        Returns:
+            RecoveredJobs: 再開するジョブと、打ち切ったジョブ (いずれも登録順)
+        """
+        now = _utcnow()
+        reclaimable = col(MemoAiJob.lease_expires_at) < now
+        if owner is not None:
+            host = owner.partition(":")[0]
+            reclaimable = or_(
+                reclaimable,
+                (col(MemoAiJob.lease_owner) != owner)
+                & col(MemoAiJob.lease_owner).startswith(f"{host}:", autoescape=True),
+            )
+        abandoned: list[MemoAiJob] = []
+        with Session(self._engine, expire_on_commit=False) as session:
+            candidates = session.exec(
+                select(MemoAiJob).where(col(MemoAiJob.status) == MemoAiJobStatus.RUNNING.value, reclaimable)
+            ).all()
+            for job in candidates:
+                leased = job.lease_expires_at is not None and job.lease_expires_at >= now
+                if leased and _is_owner_alive(job.lease_owner):
+                    continue
+                job.lease_owner = None
+                job.lease_expires_at = None
+                job.updated_at = now
+                if job.attempts >= self.max_attempts:
+                    job.status = MemoAiJobStatus.FAILED.value
+                    job.error_message = "実行中に中断されたため、再試行回数の上限で打ち切りました"
+                    abandoned.append(job)
+                else:
+                    job.status = MemoAiJobStatus.QUEUED.value
+                session.add(job)
+            session.commit()
+            resumable = session.exec(
+                select(MemoAiJob).where(col(MemoAiJob.status).in_(_CLAIMABLE)).order_by(col(MemoAiJob.created_at))
+            ).all()
+        return RecoveredJobs(resumable=list(resumable), abandoned=abandoned)
+
+    def prune(self, keep: int) -> int:
+        """完了済みのジョブを新しいものから keep 件だけ残して削除する。
+
+        Returns:
+            int: 削除した件数
+        """
+        kept = (
+            select(MemoAiJob.id)
+            .where(col(MemoAiJob.status).in_(_COMPLETED))
+            .order_by(col(MemoAiJob.updated_at).desc())
+            .limit(keep)
+        )
+        stmt = delete(MemoAiJob).where(col(MemoAiJob.status).in_(_COMPLETED), col(MemoAiJob.id).not_in(kept))
+        with self._engine.begin() as conn:
+            return conn.execute(stmt).rowcount
+
+    # ==============================================================================
+    # 読み取り
+    # ==============================================================================
+
+    def get(self, job_id: UUID) -> MemoAiJob | None:
+        """ジョブを取得する。"""
+        with Session(self._engine, expire_on_commit=False) as session:
+            return session.get(MemoAiJob, job_id)
+
+    def latest_for_memo(self, memo_id: UUID) -> MemoAiJob | None:
+        """メモの最新のジョブを取得する (memo_id, updated_at の索引を使う)。"""
+        stmt = (
+            select(MemoAiJob)
+            .where(col(MemoAiJob.memo_id) == memo_id)
+            .order_by(col(MemoAiJob.updated_at).desc())
+            .limit(1)
+        )
+        with Session(self._engine, expire_on_commit=False) as session:
+            return session.exec(stmt).first()
+
+    def count_created_since(self, priority: MemoAiJobPriority, since: datetime) -> int:
+        """指定レーンで since 以降に登録されたジョブ数を数える (履歴の prune で消えた分は含まない)。"""
+        since_utc = since.astimezone(UTC).replace(tzinfo=None) if since.tzinfo else since
+        stmt = select(func.count()).where(
+            col(MemoAiJob.priority) == priority.value,
+            col(MemoAiJob.created_at) >= since_utc,
+        )
+        with Session(self._engine) as session:
+            return int(session.exec(stmt).one())
+
+    def list_by_status(self, *statuses: MemoAiJobStatus) -> list[MemoAiJob]:
+        """指定した状態のジョブを登録順に取得する (status, created_at の索引を使う)。"""
+        stmt = (
+            select(MemoAiJob)
+            .where(col(MemoAiJob.status).in_([status.value for status in statuses]))
+            .order_by(col(MemoAiJob.created_at))
+        )
+        with Session(self._engine, expire_on_commit=False) as session:
+            return list(session.exec(stmt).all())
+
+
+__all__ = ["DEFAULT_LEASE_SECONDS", "DEFAULT_MAX_ATTEMPTS", "MemoAiJobStore", "RecoveredJobs"]
@@ -0,0 +1,184 @@
+"""新しい INBOX メモの AI 提案をアイドル時に先読みするスケジューラ。
+
+設定 (`agents.prefetch.enabled`) で有効にした場合だけ動作する。一定間隔で次を確認し、条件を満たせば
+AI 提案を依頼していない INBOX メモを 1 件だけ PREFETCH レーンへ登録する。結果は AVAILABLE として保存される。
+
+- アイドル判定: INTERACTIVE のジョブが待機・実行中でなく、最後の実行から `idle_seconds` 秒が経過している
+- 同時実行: 先読みは常に 1 件ずつ (前回の先読みが完了するまで次を登録しない)
+- OpenVINO: ローカルの CPU/GPU を占有するため、先読みに使った時間の割合を `cpu_budget` 以下に抑える。
+  所要時間 d のジョブの後は d * (1 / cpu_budget - 1) 秒休む
+- クラウド (Gemini): API の利用量を抑えるため、1 日 (ローカル時刻の 0 時から) の先読み件数を `daily_quota` 件までにする
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from threading import Event, Lock, Thread
+from typing import TYPE_CHECKING, Final
+
+from loguru import logger
+
+from agents.agent_conf import LLMProvider
+from logic.application.memo_ai_job_queue import MemoAiJobPriority, MemoAiJobStatus, get_memo_ai_job_queue
+from logic.application.memo_application_service import MemoApplicationError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from uuid import UUID
+
+    from logic.application.apps import ApplicationServices
+    from logic.application.memo_ai_job_queue import MemoAiJobQueue, MemoAiJobSnapshot
+    from settings.models import AgentsSettings
+
+DEFAULT_POLL_INTERVAL_SECONDS: Final[float] = 10.0
+"""先読みの条件を確認する間隔 (秒)"""
+
+_CANDIDATE_LIMIT: Final[int] = 20
+_COMPLETED: Final = (MemoAiJobStatus.SUCCEEDED, MemoAiJobStatus.FAILED)
+
+
+@dataclass(slots=True)
+class _InFlight:
+    job_id: UUID
+    enqueued_at: datetime
+
+
+class MemoAiPrefetcher:
+    """アイドル時に INBOX メモの AI 提案を 1 件ずつ先読みする。"""
+
+    def __init__(
+        self,
+        apps: ApplicationServices,
+        *,
+        queue_factory: Callable[[], MemoAiJobQueue] = get_memo_ai_job_queue,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        """MemoAiPrefetcher を初期化する (スレッドは `start` で起動する)。
+
+        Args:
+            apps: アプリケーションサービスのコンテナ
+            queue_factory: AI ジョブキューを返す関数 (先読みが有効なときだけ呼ぶ)
+            poll_interval: 条件を確認する間隔 (秒)
+            clock: 現在時刻 (UTC) を返す関数
+        """
+        self._apps = apps
+        self._queue_factory = queue_factory
+        self._poll_interval = poll_interval
+        self._clock = clock
+        self._attempted: set[UUID] = set()
+        self._in_flight: _InFlight | None = None
+        self._cooldown_until: datetime | None = None
+        # ストアを使わないキューで 1 日の件数を数えるための記録
+        self._enqueued_at: list[datetime] = []
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+
+    def start(self) -> None:
+        """先読みのスレッドを起動する (起動済みなら何もしない)。"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._loop, name="MemoAiPrefetcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """先読みのスレッドを止める (登録済みのジョブはキューで処理が続く)。"""
+        self._stop.set()
+
+    def run_once(self) -> MemoAiJobSnapshot | None:
+        """条件を満たしていれば先読みを 1 件登録する。
+
+        Returns:
+            MemoAiJobSnapshot | None: 登録したジョブの状態 (登録しなかった場合は None)
+        """
+        settings = self._apps.settings.get_agents_settings()
+        prefetch = settings.prefetch
+        if not prefetch.enabled:
+            return None
+        queue = self._queue_factory()
+        with self._lock:
+            now = self._clock()
+            self._collect_finished(queue, now, prefetch.cpu_budget)
+            memo_id = self._next_candidate() if self._can_prefetch(settings, queue, now) else None
+            if memo_id is None:
+                return None
+            self._attempted.add(memo_id)
+            try:
+                snapshot = self._apps.memo.prefetch_ai_generation(memo_id)
+            except MemoApplicationError as exc:
+                logger.info(f"AI提案の先読みを見送りました: {exc}")
+                return None
+            self._in_flight = _InFlight(job_id=snapshot.job_id, enqueued_at=now)
+            self._enqueued_at.append(now)
+        logger.info(f"AI提案の先読みを登録しました: memo_id={memo_id} job_id={snapshot.job_id}")
+        return snapshot
+
+    def _loop(self) -> None:
+        while not self._stop.wait(timeout=self._poll_interval):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("AI提案の先読みで例外が発生しました")
+
+    def _collect_finished(self, queue: MemoAiJobQueue, now: datetime, cpu_budget: float) -> None:
+        """先読み中のジョブが完了していれば記録を外し、所要時間に応じた休止時間を設定する。"""
+        if self._in_flight is None:
+            return
+        snapshot = queue.get_snapshot(self._in_flight.job_id)
+        if snapshot is not None and snapshot.status not in _COMPLETED:
+            return
+        finished_at = snapshot.updated_at if snapshot is not None else now
+        # 待機時間も含めて数えるため、実際より長め (休止は長め) に見積もる
+        elapsed = max(timedelta(0), finished_at - self._in_flight.enqueued_at)
+        self._cooldown_until = finished_at + elapsed * (1 / cpu_budget - 1)
+        self._in_flight = None
+
+    def _can_prefetch(self, settings: AgentsSettings, queue: MemoAiJobQueue, now: datetime) -> bool:
+        # 呼び出し側で self._lock を保持していること
+        return (
+            self._in_flight is None
+            and not queue.active_count(MemoAiJobPriority.PREFETCH)
+            and queue.interactive_idle_seconds() >= settings.prefetch.idle_seconds
+            and self._within_budget(settings, queue, now)
+        )
+
+    def _within_budget(self, settings: AgentsSettings, queue: MemoAiJobQueue, now: datetime) -> bool:
+        if settings.provider == LLMProvider.OPENVINO:
+            return self._cooldown_until is None or now >= self._cooldown_until
+        if settings.provider == LLMProvider.GOOGLE:
+            return self._count_today(queue, now) < settings.prefetch.daily_quota
+        return True
+
+    def _count_today(self, queue: MemoAiJobQueue, now: datetime) -> int:
+        start_of_day = now.astimezone().replace(hour=0, minute=0, second=0, microsecond=0)
+        stored = queue.count_created_since(MemoAiJobPriority.PREFETCH, start_of_day)
+        if stored is not None:
+            return stored
+        self._enqueued_at = [enqueued for enqueued in self._enqueued_at if enqueued >= start_of_day]
+        return len(self._enqueued_at)
+
+    def _next_candidate(self) -> UUID | None:
+        for memo in self._apps.memo.list_prefetch_candidates(limit=_CANDIDATE_LIMIT):
+            if memo.id not in self._attempted:
+                return memo.id
+        return None
+
+
+_prefetcher: MemoAiPrefetcher | None = None
+_prefetcher_lock = Lock()
+
+
+def start_memo_ai_prefetcher(apps: ApplicationServices) -> MemoAiPrefetcher:
+    """プロセス共有の先読みスケジューラを起動して返す (無効時も起動し、設定の変更に追従する)。"""
+    global _prefetcher  # noqa: PLW0603
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = MemoAiPrefetcher(apps)
+        _prefetcher.start()
+        return _prefetcher
+
+
+__all__ = ["DEFAULT_POLL_INTERVAL_SECONDS", "MemoAiPrefetcher", "start_memo_ai_prefetcher"]
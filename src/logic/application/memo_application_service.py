@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import json
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any, override
+from typing import TYPE_CHECKING, Any, overload, override
 from uuid import UUID, uuid4
 
 from loguru import logger
@@ -15,8 +15,15 @@ from loguru import logger
 from agents.agent_conf import LLMProvider, OpenVINODevice
 from errors import ApplicationError, ValidationError
 from logic.application.base import BaseApplicationService
-from logic.application.memo_ai_job_queue import MemoAiJobSnapshot, MemoAiJobStatus, get_memo_ai_job_queue
+from logic.application.memo_ai_job_queue import (
+    MemoAiJobPriority,
+    MemoAiJobQueueFullError,
+    MemoAiJobSnapshot,
+    MemoAiJobStatus,
+    get_memo_ai_job_queue,
+)
 from logic.application.settings_application_service import SettingsApplicationService
+from logic.repositories import DEFAULT_PAGE_SIZE, DEFAULT_SEARCH_LIMIT, QuerySpec
 from logic.services.memo_service import MemoService
 from logic.services.tag_service import TagService
 from logic.unit_of_work import SqlModelUnitOfWork
@@ -43,6 +50,7 @@ if TYPE_CHECKING:
     from agents.task_agents.memo_to_task.state import MemoToTaskResult, MemoToTaskState
     from logic.application.apps import ApplicationServices
     from logic.application.task_application_service import TaskApplicationService
+    from logic.repositories import LoadProfileName, Page, PageOrderKey, SearchHit, SortKey
 
 logger_msg = "{msg} - (ID={memo_id})"
 
@@ -133,7 +141,7 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
 
         memo = MemoCreate(title=title, content=content, status=status)
 
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             memo_service = uow.get_service(MemoService)
             created_memo = memo_service.create(memo)
             if tag_ids:
@@ -155,7 +163,7 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         Returns:
             MemoRead: 更新されたメモ
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             memo_service = uow.get_service(MemoService)
             updated_memo = memo_service.update(memo_id, update_data)
 
@@ -175,7 +183,7 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         Returns:
             MemoRead: 更新されたメモ
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             memo_service = uow.get_service(MemoService)
             desired_tag_ids = set(tag_ids)
 
@@ -197,13 +205,64 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         Raises:
             RuntimeError: 削除エラー
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             memo_service = uow.get_service(MemoService)
             success = memo_service.delete(memo_id)
 
             logger.info(f"メモ削除完了: ID {memo_id}, 結果: {success}")
             return success
 
+    def bulk_update_status(self, memo_ids: Sequence[uuid.UUID], status: MemoStatus) -> int:
+        """複数のメモのステータスを 1 トランザクションでまとめて更新する
+
+        Args:
+            memo_ids: 対象メモのID
+            status: 設定するステータス
+
+        Returns:
+            int: 更新した件数
+        """
+        if not memo_ids:
+            return 0
+        with self._unit_of_work_factory(defer_commit=True) as uow:
+            memo_service = uow.service_factory.get_service(MemoService)
+            updated = memo_service.bulk_update_status(memo_ids, status)
+        logger.info(f"メモ一括ステータス更新完了 - {updated} 件")
+        return updated
+
+    def bulk_delete(self, memo_ids: Sequence[uuid.UUID]) -> int:
+        """複数のメモを 1 トランザクションでまとめて削除する
+
+        Args:
+            memo_ids: 削除するメモのID
+
+        Returns:
+            int: 削除した件数
+        """
+        if not memo_ids:
+            return 0
+        with self._unit_of_work_factory(defer_commit=True) as uow:
+            memo_service = uow.service_factory.get_service(MemoService)
+            deleted = memo_service.bulk_delete(memo_ids)
+        logger.info(f"メモ一括削除完了 - {deleted} 件")
+        return deleted
+
+    def bulk_link_tags(self, memo_ids: Sequence[uuid.UUID], tag_ids: Sequence[uuid.UUID]) -> int:
+        """複数のメモに複数のタグを 1 トランザクションでまとめて関連付ける
+
+        Args:
+            memo_ids: 対象メモのID
+            tag_ids: 関連付けるタグのID
+
+        Returns:
+            int: 新たに関連付けた組み合わせの件数
+        """
+        if not memo_ids or not tag_ids:
+            return 0
+        with self._unit_of_work_factory(defer_commit=True) as uow:
+            memo_service = uow.service_factory.get_service(MemoService)
+            return memo_service.bulk_link_tags(memo_ids, tag_ids)
+
     def get_by_id(self, memo_id: uuid.UUID, *, with_details: bool = False) -> MemoRead:
         """IDでメモ取得
 
@@ -214,22 +273,98 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         Returns:
             MemoRead: 指定されたIDのメモ
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(read_only=True) as uow:
             memo_service = uow.get_service(MemoService)
             return memo_service.get_by_id(memo_id, with_details=with_details)
 
-    def get_all_memos(self, *, with_details: bool = False) -> list[MemoRead]:
+    @overload
+    def get_all_memos(
+        self, *, with_details: bool = False, profile: LoadProfileName | None = None
+    ) -> list[MemoRead]: ...
+
+    @overload
+    def get_all_memos(
+        self,
+        *,
+        with_details: bool = False,
+        profile: LoadProfileName | None = None,
+        page_size: int,
+        cursor: str | None = None,
+        order_by: PageOrderKey = "created_at",
+    ) -> Page[MemoRead]: ...
+
+    def get_all_memos(
+        self,
+        *,
+        with_details: bool = False,
+        profile: LoadProfileName | None = None,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        order_by: PageOrderKey = "created_at",
+    ) -> list[MemoRead] | Page[MemoRead]:
         """全メモ取得
 
+        page_size を指定した場合はキーセットページングで 1 ページ分のみ取得する。
+        続きは戻り値の `Page.next_cursor` を cursor に渡して取得する。
+
         Args:
             with_details: 関連エンティティも取得するかどうか
+            profile: 読み込みプロファイル名 (一覧表示は ``card`` 等、必要な関連だけを読む。
+                指定時は with_details より優先)
+            page_size: 1 ページあたりの件数 (未指定時は全件)
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+            order_by: ページングのソートキー (新しい順)
 
         Returns:
-            list[MemoRead]: 全メモのリスト
+            list[MemoRead] | Page[MemoRead]: 全メモのリスト、または page_size 指定時はページング結果
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(read_only=True) as uow:
             memo_service = uow.service_factory.get_service(MemoService)
-            return memo_service.get_all(with_details=with_details)
+            if page_size is not None:
+                return memo_service.get_page(
+                    page_size=page_size, cursor=cursor, order_by=order_by, with_details=with_details, profile=profile
+                )
+            return memo_service.get_all(with_details=with_details, profile=profile)
+
+    def list_page(
+        self,
+        *,
+        query: str = "",
+        status: MemoStatus | None = None,
+        sort: PageOrderKey = "created_at",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        profile: LoadProfileName | None = None,
+    ) -> Page[MemoRead]:
+        """条件に一致するメモを 1 ページずつ取得する (一覧画面の段階読み込み用)
+
+        件数が増えても 1 回に読み込むのは page_size 件だけで、続きは戻り値の `Page.next_cursor` で取得する。
+
+        Args:
+            query: 全文検索する文字列 (空文字なら条件なし)
+            status: ステータスでの絞り込み
+            sort: 並び順のキー (新しい順)
+            page_size: 1 ページあたりの件数
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+            profile: 読み込みプロファイル名 (一覧表示は ``card``)
+
+        Returns:
+            Page[MemoRead]: ページング結果
+        """
+        spec = QuerySpec().with_text(query).with_statuses(status).order_by(sort)
+        with self._unit_of_work_factory(read_only=True) as uow:
+            memo_service = uow.get_service(MemoService)
+            return memo_service.find_page(spec, page_size=page_size, cursor=cursor, profile=profile)
+
+    def count_by_status(self) -> dict[MemoStatus, int]:
+        """ステータスごとのメモ件数を取得する (一覧のタブ表示用)。
+
+        Returns:
+            dict[MemoStatus, int]: ステータスごとの件数
+        """
+        with self._unit_of_work_factory(read_only=True) as uow:
+            memo_service = uow.get_service(MemoService)
+            return memo_service.count_by_status()
 
     def list_by_tag(self, tag_id: uuid.UUID, *, with_details: bool = False) -> list[MemoRead]:
         """タグIDでメモ一覧を取得する。
@@ -241,7 +376,7 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         Returns:
             list[MemoRead]: タグに紐づくメモ一覧
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(read_only=True) as uow:
             memo_service = uow.get_service(MemoService)
             return memo_service.list_by_tag(tag_id, with_details=with_details)
 
@@ -316,8 +451,24 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
 
     # --- AIタスク生成 -------------------------------------------------
 
-    def enqueue_ai_generation(self, memo_id: uuid.UUID) -> MemoAiJobSnapshot:
-        """メモをAIタスク生成キューに登録する。"""
+    def enqueue_ai_generation(
+        self,
+        memo_id: uuid.UUID,
+        *,
+        priority: MemoAiJobPriority = MemoAiJobPriority.INTERACTIVE,
+    ) -> MemoAiJobSnapshot:
+        """メモをAIタスク生成キューに登録する。
+
+        Args:
+            memo_id: 対象メモのID
+            priority: 優先度レーン (一括生成では BACKGROUND を指定する)
+
+        Returns:
+            MemoAiJobSnapshot: 登録直後のジョブ状態
+
+        Raises:
+            MemoApplicationError: キューが満杯で受け付けられなかった場合
+        """
         memo = self.get_by_id(memo_id, with_details=True)
         updated = self._mark_ai_status(
             memo_id,
@@ -326,7 +477,68 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
             clear_analysis_log=True,
         )
         queue = get_memo_ai_job_queue()
-        return queue.enqueue(updated, callback=self._handle_ai_job_callback)
+        try:
+            return queue.enqueue(updated, callback=self._handle_ai_job_callback, priority=priority)
+        except MemoAiJobQueueFullError as e:
+            # 受け付けられなかったため、登録前の状態へ戻す
+            self.update(
+                memo_id,
+                MemoUpdate(
+                    ai_suggestion_status=memo.ai_suggestion_status,
+                    status=memo.status,
+                    ai_analysis_log=memo.ai_analysis_log,
+                ),
+            )
+            msg = f"AIジョブが混み合っています。しばらくしてから再実行してください: memo_id={memo_id}"
+            raise MemoApplicationError(msg) from e
+
+    def enqueue_ai_generation_batch(self, memo_ids: Sequence[uuid.UUID]) -> list[MemoAiJobSnapshot]:
+        """複数のメモを BACKGROUND レーンでAIタスク生成キューに登録する。
+
+        Args:
+            memo_ids: 対象メモのID一覧
+
+        Returns:
+            list[MemoAiJobSnapshot]: 登録できたジョブの状態 (満杯で拒否されたメモは含まない)
+        """
+        snapshots: list[MemoAiJobSnapshot] = []
+        for memo_id in memo_ids:
+            try:
+                snapshots.append(self.enqueue_ai_generation(memo_id, priority=MemoAiJobPriority.BACKGROUND))
+            except MemoApplicationError:
+                logger.warning(f"AIジョブの一括登録を打ち切りました: 登録済み={len(snapshots)}/{len(memo_ids)}")
+                break
+        return snapshots
+
+    def list_prefetch_candidates(self, *, limit: int = 10) -> list[MemoRead]:
+        """AI 提案を先読みする候補 (INBOX かつ AI 提案未依頼) を新しい順に取得する。"""
+        with self._unit_of_work_factory(read_only=True) as uow:
+            memo_service = uow.get_service(MemoService)
+            return memo_service.list_prefetch_candidates(limit=limit)
+
+    def prefetch_ai_generation(self, memo_id: uuid.UUID) -> MemoAiJobSnapshot:
+        """メモを PREFETCH レーンでAIタスク生成キューに登録する。
+
+        メモの状態と AI 提案状態は変更しない。成功時にメモがまだ INBOX かつ未依頼であれば、
+        結果を保存して AVAILABLE にする。
+
+        Args:
+            memo_id: 対象メモのID
+
+        Returns:
+            MemoAiJobSnapshot: 登録直後のジョブ状態
+
+        Raises:
+            MemoApplicationError: キューが満杯で受け付けられなかった場合
+        """
+        memo = self.get_by_id(memo_id, with_details=True)
+        try:
+            return get_memo_ai_job_queue().enqueue(
+                memo, callback=self._handle_ai_job_callback, priority=MemoAiJobPriority.PREFETCH
+            )
+        except MemoAiJobQueueFullError as e:
+            msg = f"AIジョブが混み合っているため先読みを見送りました: memo_id={memo_id}"
+            raise MemoApplicationError(msg) from e
 
     def get_ai_job_snapshot(self, job_id: uuid.UUID) -> MemoAiJobSnapshot:
         """ジョブ状態を取得する。"""
@@ -337,17 +549,65 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
             raise MemoApplicationError(msg)
         return snapshot
 
+    def get_latest_ai_job(self, memo_id: uuid.UUID) -> MemoAiJobSnapshot | None:
+        """メモの最新のAIジョブ状態を取得する (画面の再表示時に追跡を復元するために使う)。"""
+        return get_memo_ai_job_queue().get_latest_snapshot(memo_id)
+
+    def resume_ai_jobs(self) -> list[MemoAiJobSnapshot]:
+        """前回の起動で完了しなかったAIジョブを再開する。
+
+        再試行回数を超えて打ち切られたジョブのメモは AI 提案状態を FAILED にする。
+
+        Returns:
+            list[MemoAiJobSnapshot]: 再開・打ち切りしたジョブの状態
+        """
+        queue = get_memo_ai_job_queue()
+        return queue.resume_pending(
+            lambda memo_id: self.get_by_id(memo_id, with_details=True),
+            callback=self._handle_ai_job_callback,
+        )
+
     def _handle_ai_job_callback(self, snapshot: MemoAiJobSnapshot) -> None:
+        if snapshot.priority == MemoAiJobPriority.PREFETCH:
+            self._handle_prefetch_callback(snapshot)
+            return
         if snapshot.status == MemoAiJobStatus.SUCCEEDED:
             self._persist_ai_snapshot(snapshot)
             self._mark_ai_status(snapshot.memo_id, ai_status=AiSuggestionStatus.AVAILABLE)
         elif snapshot.status == MemoAiJobStatus.FAILED:
             self._mark_ai_status(snapshot.memo_id, ai_status=AiSuggestionStatus.FAILED)
 
+    def _handle_prefetch_callback(self, snapshot: MemoAiJobSnapshot) -> None:
+        """先読みの結果を、メモがまだ INBOX かつ未依頼のときだけ保存する (失敗時は未依頼のまま残す)。"""
+        if snapshot.status != MemoAiJobStatus.SUCCEEDED:
+            return
+        try:
+            memo = self.get_by_id(snapshot.memo_id)
+        except Exception:
+            # 先読み中にメモが削除された場合
+            memo = None
+        if (
+            memo is not None
+            and memo.status == MemoStatus.INBOX
+            and memo.ai_suggestion_status == AiSuggestionStatus.NOT_REQUESTED
+        ):
+            self._persist_ai_snapshot(snapshot)
+            self._mark_ai_status(snapshot.memo_id, ai_status=AiSuggestionStatus.AVAILABLE)
+            return
+        # 先読み中にユーザーが処理を進めたため、結果とともに作成した下書きを片付ける
+        task_ids = [task.task_id for task in snapshot.tasks]
+        if task_ids:
+            self._get_task_service().bulk_delete(task_ids)
+        if snapshot.project is not None and snapshot.project.project_id is not None:
+            from logic.application.project_application_service import ProjectApplicationService
+
+            self._apps.get_service(ProjectApplicationService).delete(snapshot.project.project_id)
+        logger.info(f"メモの状態が変わったため先読みの結果を破棄しました: memo_id={snapshot.memo_id}")
+
     def _collect_existing_tag_names(self) -> list[str]:
         """既存タグの名称一覧を取得する。"""
         names: list[str] = []
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(read_only=True) as uow:
             tag_service = uow.get_service(TagService)
             tags = tag_service.get_all()
 
@@ -443,17 +703,19 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         self.update(snapshot.memo_id, MemoUpdate(ai_analysis_log=serialized))
 
     def approve_ai_tasks(self, memo_id: uuid.UUID, task_ids: list[uuid.UUID]) -> list[TaskRead]:
-        """Draft タスクを承認し、TaskStatus を route に応じて更新する。"""
+        """Draft タスクを承認し、TaskStatus を route に応じて 1 トランザクションで更新する。
+
+        Raises:
+            NotFoundError: 存在しないタスクが含まれる場合 (いずれのタスクも承認しない)
+        """
         if not task_ids:
             return []
 
         route_map = self._load_route_map(memo_id)
         task_service = self._get_task_service()
-        approved: list[TaskRead] = []
-        for task_id in task_ids:
-            status = self._route_to_status(route_map.get(str(task_id)))
-            updated = task_service.update(task_id, TaskUpdate(status=status))
-            approved.append(updated)
+        approved = task_service.bulk_update_status(
+            {task_id: self._route_to_status(route_map.get(str(task_id))) for task_id in task_ids}
+        )
 
         self._activate_project_from_ai_log(memo_id)
         self._remove_tasks_from_ai_log(memo_id, task_ids)
@@ -604,11 +866,14 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         self._mutate_ai_log(memo_id, _mutator)
 
     def _mutate_ai_log(self, memo_id: uuid.UUID, mutator: Callable[[dict[str, object]], None]) -> None:
-        memo = self.get_by_id(memo_id, with_details=True)
-        payload = self._ensure_ai_log_dict(memo.ai_analysis_log)
-        mutator(payload)
-        serialized = json.dumps(payload, ensure_ascii=False)
-        self.update(memo_id, MemoUpdate(ai_analysis_log=serialized))
+        # 読み取りと書き込みを同じトランザクションで行い、途中の更新と競合しないようにする
+        with self._unit_of_work_factory(defer_commit=True) as uow:
+            memo_service = uow.get_service(MemoService)
+            memo = memo_service.get_by_id(memo_id)
+            payload = self._ensure_ai_log_dict(memo.ai_analysis_log)
+            mutator(payload)
+            serialized = json.dumps(payload, ensure_ascii=False)
+            memo_service.update(memo_id, MemoUpdate(ai_analysis_log=serialized))
 
     def _ensure_ai_log_dict(self, raw: str | None) -> dict[str, object]:
         if raw:
@@ -624,23 +889,33 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         payload.setdefault("project_info", None)
         return payload
 
-    def search(
+    def search(  # noqa: PLR0913 - 検索条件をキーワード引数で受け取る
         self,
         query: str,
         *,
         with_details: bool = False,
+        profile: LoadProfileName | None = None,
         status: MemoStatus | None = None,
         tags: list[uuid.UUID] | None = None,
+        all_tags: list[uuid.UUID] | None = None,
+        sort: SortKey = "relevance",
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[MemoRead]:
         """メモ検索
 
-        タイトル・本文を横断検索し、必要に応じてステータスやタグで絞り込む。
+        タイトル・本文の全文検索とステータス・タグ条件、並び順、件数制限を 1 本の SQL にまとめて実行する。
 
         Args:
             query: 検索クエリ（空文字・空白のみなら空配列）
             with_details: 関連情報を含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
             status: ステータスでの追加フィルタ
-            tags: タグIDのリスト（OR条件）
+            tags: タグIDのリスト（いずれかを含むOR条件）
+            all_tags: タグIDのリスト（すべてを含むAND条件）
+            sort: 並び順（既定は関連度順）
+            limit: 最大取得件数（None で無制限）
+            offset: 読み飛ばす件数
 
         Returns:
             list[MemoRead]: 検索結果
@@ -648,30 +923,32 @@ class MemoApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         if not query or not query.strip():
             return []
 
-        with self._unit_of_work_factory() as uow:
+        spec = (
+            QuerySpec()
+            .with_text(query)
+            .with_statuses(status)
+            .with_any_tags(tags)
+            .with_all_tags(all_tags)
+            .order_by(sort)
+            .paginate(limit, offset)
+        )
+        with self._unit_of_work_factory(read_only=True) as uow:
             memo_service = uow.get_service(MemoService)
-            results = memo_service.search_memos(query, with_details=with_details)
-
-            # ステータスフィルタ
-            if status is not None:
-                status_items = memo_service.list_by_status(status, with_details=with_details)
-                status_ids = {m.id for m in status_items}
-                results = [m for m in results if m.id in status_ids]
-
-            # タグフィルタ（リポジトリのJOIN利用、OR条件）
-            if tags:
-                from logic.repositories import MemoRepository as _MemoRepo
-
-                memo_repo = uow.repository_factory.create(_MemoRepo)
-                matched_ids: set[uuid.UUID] = set()
-                for tag_id in tags:
-                    try:
-                        for m in memo_repo.list_by_tag(tag_id, with_details=with_details):
-                            if m.id is not None:
-                                matched_ids.add(m.id)
-                    except Exception as exc:
-                        logger.debug(f"メモのタグフィルタ処理中に例外: {exc}")
-                        continue
-                results = [m for m in results if m.id in matched_ids]
+            return memo_service.find(spec, with_details=with_details, profile=profile)
+
+    def search_with_snippets(self, query: str, *, limit: int = DEFAULT_SEARCH_LIMIT) -> list[SearchHit[MemoRead]]:
+        """メモを全文検索し、関連度と一致箇所の抜粋付きで返す
+
+        Args:
+            query: 検索クエリ（空文字・空白のみなら空配列）
+            limit: 最大取得件数
 
-            return results
+        Returns:
+            list[SearchHit[MemoRead]]: 関連度順の検索結果
+        """
+        if not query or not query.strip():
+            return []
+
+        with self._unit_of_work_factory(read_only=True) as uow:
+            memo_service = uow.get_service(MemoService)
+            return memo_service.search_hits(query, limit=limit)
@@ -7,10 +7,17 @@
 エージェントの応答(`MemoToTaskAgentOutput`)を返します。
 
 補助APIとして、タスク案のみを返す `generate_tasks_from_memo()` も提供します。
+
+複数メモをまとめて整理する場合は `clarify_memos(memos)` を使います。分類とタスク抽出を複数メモで
+1 回の LLM 呼び出しにまとめるため、1 件ずつ `clarify_memo` を呼ぶより往復回数が少なくなります。
+処理量 (メモ/分) は `get_throughput()` で単体・バッチそれぞれ確認できます。
 """
 
 from __future__ import annotations
 
+import threading
+import time
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, TypedDict, override
 from uuid import uuid4
@@ -40,6 +47,30 @@ RECOMMENDED_TASK_COUNT_BY_LEVEL: dict[AgentDetailLevel, int] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class ClarifyThroughput:
+    """Clarify の処理量 (起動後の累計)。
+
+    Attributes:
+        memo_count: エージェントで処理したメモ数
+        elapsed_seconds: 処理にかかった合計時間 (秒)
+    """
+
+    memo_count: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def memos_per_minute(self) -> float:
+        """1 分あたりの処理メモ数 (未計測なら 0)。"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.memo_count * 60 / self.elapsed_seconds
+
+    def add(self, memo_count: int, elapsed_seconds: float) -> ClarifyThroughput:
+        """計測結果を加算した新しいインスタンスを返す。"""
+        return ClarifyThroughput(self.memo_count + memo_count, self.elapsed_seconds + elapsed_seconds)
+
+
 class PromptOverrides(TypedDict):
     """プロンプトオーバーライド設定。"""
 
@@ -70,6 +101,8 @@ class MemoToTaskApplicationService(BaseApplicationService[type[SqlModelUnitOfWor
     ) -> None:
         super().__init__(unit_of_work_factory)
         self._agent: MemoToTaskAgent | None = agent
+        self._throughput_lock = threading.Lock()
+        self._throughput: dict[str, ClarifyThroughput] = {"single": ClarifyThroughput(), "batch": ClarifyThroughput()}
 
     @classmethod
     @override
@@ -80,11 +113,17 @@ class MemoToTaskApplicationService(BaseApplicationService[type[SqlModelUnitOfWor
         return cast("MemoToTaskApplicationService", instance)
 
     # Public API ---------------------------------------------------------
-    def clarify_memo(self, memo: MemoRead) -> MemoToTaskAgentOutput:
+    def clarify_memo(
+        self,
+        memo: MemoRead,
+        *,
+        on_event: Callable[[AgentStreamEvent], None] | None = None,
+    ) -> MemoToTaskAgentOutput:
         """自由記述メモを解析し、タスク候補とメモ状態の提案を返す。
 
         Args:
             memo: 解析対象のメモ情報
+            on_event: エージェントの途中経過 (ノード完了・トークン) を受け取るコールバック
 
         Returns:
             MemoToTaskAgentOutput: 推定タスクとメモ状態の提案
@@ -112,7 +151,12 @@ class MemoToTaskApplicationService(BaseApplicationService[type[SqlModelUnitOfWor
         }
         self._apply_prompt_overrides(state)
 
-        result = self._invoke_agent(state)
+        started = time.perf_counter()
+        if on_event is None:
+            result = self._invoke_agent(state)
+        else:
+            result = self._get_agent().invoke(state, str(uuid4()), on_event=on_event)
+        self._record_throughput("single", 1, time.perf_counter() - started)
         if result is None:
             msg = "エージェント応答が None でした"
             self._log_error_and_raise(msg)
@@ -121,22 +165,89 @@ class MemoToTaskApplicationService(BaseApplicationService[type[SqlModelUnitOfWor
             self._log_error_and_raise(f"エージェントがエラーを返しました: {result}")
 
         if isinstance(result, MemoToTaskResult):
-            return OutputModel(
-                tasks=list(result.tasks),
-                suggested_memo_status=result.suggested_memo_status,
-                requires_project=result.requires_project,
-                project_plan=result.project_plan,
-            )
+            return self._to_output(result)
 
         # ここには通常到達しない（AgentError か MemoToTaskResult のどちらか）
         msg_invalid = "エージェント応答の型が不正です"
         raise MemoToTaskServiceError(msg_invalid)
 
+    def clarify_memos(
+        self,
+        memos: list[MemoRead],
+        *,
+        batch_size: int | None = None,
+    ) -> list[MemoToTaskAgentOutput | MemoToTaskServiceError]:
+        """複数のメモをまとめて解析する。
+
+        分類とタスク抽出は `batch_size` 件ずつ 1 回の LLM 呼び出しにまとめる。バッチ応答から
+        取り出せなかったメモはエージェント内で 1 件ずつ処理し直す。1 件の失敗で全体を中断しないよう、
+        失敗したメモの位置には例外を返す。
+
+        Args:
+            memos: 解析対象のメモ一覧
+            batch_size: 1 回の呼び出しにまとめるメモ数 (省略時はエージェントの既定値)
+
+        Returns:
+            入力と同じ順序の解析結果。失敗したメモは `MemoToTaskServiceError`
+        """
+        from agents.task_agents.memo_to_task.schema import (
+            MemoToTaskAgentOutput as OutputModel,
+        )
+
+        outputs: list[MemoToTaskAgentOutput | MemoToTaskServiceError | None] = [None] * len(memos)
+        targets: list[int] = []
+        for index, memo in enumerate(memos):
+            if str(getattr(memo, "content", "")).strip():
+                targets.append(index)
+            else:
+                outputs[index] = OutputModel(tasks=[], suggested_memo_status="clarify")
+
+        if targets:
+            # タグ・設定の取得はバッチ全体で 1 回にまとめる
+            existing_tags = self._collect_existing_tag_names()
+            current_datetime_iso = self._current_datetime_iso()
+            states: list[MemoToTaskState] = []
+            for index in targets:
+                state: MemoToTaskState = {
+                    "memo": memos[index],
+                    "existing_tags": existing_tags,
+                    "current_datetime_iso": current_datetime_iso,
+                }
+                self._apply_prompt_overrides(state)
+                states.append(state)
+
+            agent = self._get_agent()
+            started = time.perf_counter()
+            if batch_size is None:
+                results = agent.invoke_batch(states)
+            else:
+                results = agent.invoke_batch(states, batch_size=batch_size)
+            self._record_throughput("batch", len(states), time.perf_counter() - started)
+
+            for index, result in zip(targets, results, strict=True):
+                if isinstance(result, MemoToTaskResult):
+                    outputs[index] = self._to_output(result)
+                    continue
+                msg = f"エージェントがエラーを返しました: {result}"
+                logger.error(f"{msg} (memo_id={getattr(memos[index], 'id', None)})")
+                outputs[index] = MemoToTaskServiceError(msg)
+
+        throughput = self.get_throughput()
+        batch_rate = throughput["batch"].memos_per_minute
+        single_rate = throughput["single"].memos_per_minute
+        logger.info(f"MemoToTask throughput: batch={batch_rate:.1f} memos/min single={single_rate:.1f} memos/min")
+        return [output if output is not None else MemoToTaskServiceError("結果がありません") for output in outputs]
+
     def generate_tasks_from_memo(self, memo: MemoRead) -> list[TaskDraft]:
         """メモ本文からタスク案だけを抽出するヘルパー。"""
         output = self.clarify_memo(memo)
         return list(output.tasks)
 
+    def get_throughput(self) -> dict[str, ClarifyThroughput]:
+        """単体 (`single`) とバッチ (`batch`) それぞれの処理量を返す。"""
+        with self._throughput_lock:
+            return dict(self._throughput)
+
     # Internal helpers --------------------------------------------------
     def _get_agent(self) -> MemoToTaskAgent:
         if self._agent is None:
@@ -145,6 +256,23 @@ class MemoToTaskApplicationService(BaseApplicationService[type[SqlModelUnitOfWor
             self._agent = MemoToTaskAgent(provider=self._get_provider(), device=self._get_device())
         return self._agent
 
+    @staticmethod
+    def _to_output(result: MemoToTaskResult) -> MemoToTaskAgentOutput:
+        from agents.task_agents.memo_to_task.schema import (
+            MemoToTaskAgentOutput as OutputModel,
+        )
+
+        return OutputModel(
+            tasks=list(result.tasks),
+            suggested_memo_status=result.suggested_memo_status,
+            requires_project=result.requires_project,
+            project_plan=result.project_plan,
+        )
+
+    def _record_throughput(self, mode: str, memo_count: int, elapsed_seconds: float) -> None:
+        with self._throughput_lock:
+            self._throughput[mode] = self._throughput[mode].add(memo_count, elapsed_seconds)
+
     def _invoke_agent(self, state: MemoToTaskState) -> MemoToTaskResult | AgentError:
         agent = self._get_agent()
         thread_id = str(uuid4())
@@ -270,12 +398,16 @@ class MemoToTaskApplicationService(BaseApplicationService[type[SqlModelUnitOfWor
 
 # 型ヒント用の前方宣言
 if TYPE_CHECKING:  # pragma: no cover - 型チェック専用
+    from collections.abc import Callable
+
+    from agents.streaming import AgentStreamEvent
     from agents.task_agents.memo_to_task.agent import MemoToTaskAgent
     from agents.task_agents.memo_to_task.schema import MemoToTaskAgentOutput, TaskDraft
     from agents.task_agents.memo_to_task.state import MemoToTaskState
     from models import MemoRead
 
 __all__ = [
+    "ClarifyThroughput",
     "MemoToTaskApplicationService",
     "MemoToTaskServiceError",
 ]
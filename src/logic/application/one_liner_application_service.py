@@ -12,21 +12,27 @@
 from __future__ import annotations
 
 import datetime
-from typing import Any, NoReturn, cast, override
+from typing import TYPE_CHECKING, Any, NoReturn, cast, override
 from uuid import uuid4
 
 from loguru import logger
 
 from agents.agent_conf import HuggingFaceModel, LLMProvider, OpenVINODevice
+from agents.streaming import partial_json_string_values
 from agents.task_agents.one_liner.agent import OneLinerAgent
 from agents.task_agents.one_liner.state import OneLinerState
 from errors import ApplicationError
 from logic.application import BaseApplicationService
 from logic.application.settings_application_service import SettingsApplicationService
-from logic.application.task_application_service import TaskApplicationService
+from logic.application.stats_application_service import StatsApplicationService
 from logic.unit_of_work import SqlModelUnitOfWork
 from models import TaskStatus
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from agents.streaming import AgentStreamEvent
+
 
 class OneLinerServiceError(ApplicationError):
     """一言コメント生成時のカスタム例外クラス"""
@@ -101,10 +107,20 @@ class OneLinerApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]
     def get_instance(cls, *args: Any, **kwargs: Any) -> OneLinerApplicationService: ...
 
     # Public API ---------------------------------------------------------
-    def generate_one_liner(self, query: OneLinerState | None = None) -> str:
-        """一言コメント生成 (空のクエリで自動集計)."""
+    def generate_one_liner(
+        self,
+        query: OneLinerState | None = None,
+        *,
+        on_partial: Callable[[str], None] | None = None,
+    ) -> str:
+        """一言コメント生成 (空のクエリで自動集計).
+
+        Args:
+            query: 生成に使う集計値。省略時はタスク件数を自動集計する
+            on_partial: 生成途中のメッセージを受け取るコールバック (キャッシュ利用時は呼ばれない)
+        """
         if query is not None:
-            message, _ = self._generate_with_agent(query)
+            message, _ = self._generate_with_agent(query, on_partial=on_partial)
             return message
 
         cached_message = self._get_cached_message()
@@ -113,7 +129,7 @@ class OneLinerApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]
 
         try:
             ctx = self._build_context_auto()
-            message, should_cache = self._generate_with_agent(ctx)
+            message, should_cache = self._generate_with_agent(ctx, on_partial=on_partial)
             if should_cache:
                 self._update_cache(message)
             else:
@@ -126,11 +142,11 @@ class OneLinerApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]
 
     # Internal helpers --------------------------------------------------
     def _build_context_auto(self) -> OneLinerState:
-        """タスク件数とユーザー名を取得し `OneLinerContext` を構築."""
+        """タスク件数 (GROUP BY 集計) とユーザー名を取得し `OneLinerContext` を構築."""
         from logic.application.apps import ApplicationServices
 
         apps = ApplicationServices.create()
-        task_app = apps.get_service(TaskApplicationService)
+        task_stats = apps.get_service(StatsApplicationService).get_task_stats()
 
         try:
             settings_app = cast("SettingsApplicationService", SettingsApplicationService.get_instance())
@@ -139,9 +155,9 @@ class OneLinerApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]
             user_name = ""
 
         return OneLinerState(
-            today_task_count=len(task_app.list_by_status(TaskStatus.TODAYS)),
-            completed_task_count=len(task_app.list_by_status(TaskStatus.COMPLETED)),
-            overdue_task_count=len(task_app.list_by_status(TaskStatus.OVERDUE)),
+            today_task_count=task_stats.count(TaskStatus.TODAYS),
+            completed_task_count=task_stats.count(TaskStatus.COMPLETED),
+            overdue_task_count=task_stats.overdue,
             progress_summary="",  # 未使用
             user_name=user_name,
         )
@@ -149,9 +165,15 @@ class OneLinerApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]
     def _generate_with_agent(
         self,
         state: OneLinerState,
+        *,
+        on_partial: Callable[[str], None] | None = None,
     ) -> tuple[str, bool]:
         thread_id = str(uuid4())
-        result = self._agent.invoke(cast("OneLinerState", state), thread_id)
+        if on_partial is None:
+            result = self._agent.invoke(cast("OneLinerState", state), thread_id)
+        else:
+            on_event = self._partial_response_relay(on_partial)
+            result = self._agent.invoke(cast("OneLinerState", state), thread_id, on_event=on_event)
         from agents.base import AgentError
 
         if isinstance(result, AgentError) or not getattr(result, "response", ""):
@@ -159,6 +181,25 @@ class OneLinerApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]
             return self._get_default_message(), False
         return result.response, True
 
+    @staticmethod
+    def _partial_response_relay(on_partial: Callable[[str], None]) -> Callable[[AgentStreamEvent], None]:
+        """トークンを蓄積し、構造化出力の `response` の途中経過が伸びたときだけ通知する。"""
+        buffer: list[str] = []
+        last = ""
+
+        def _relay(event: AgentStreamEvent) -> None:
+            nonlocal last
+            if event.kind != "token":
+                return
+            buffer.append(event.text)
+            values = partial_json_string_values("".join(buffer), "response")
+            text = values[-1] if values else ""
+            if text and text != last:
+                last = text
+                on_partial(text)
+
+        return _relay
+
     def _get_default_message(self) -> str:
         return "今日も一日、お疲れさまです。"
 
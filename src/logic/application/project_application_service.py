@@ -17,7 +17,9 @@ from models import ProjectCreate, ProjectRead, ProjectStatus, ProjectUpdate
 
 if TYPE_CHECKING:
     import uuid
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
+
+    from models import ProjectSummary
 
 
 class ProjectApplicationError(ApplicationError):
@@ -52,11 +54,11 @@ class ProjectApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]
             raise ProjectValidationError(msg)
 
         create_data = ProjectCreate(title=title, description=description, status=status or ProjectStatus.ACTIVE)
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             proj_service = uow.service_factory.get_service(ProjectService)
             created = proj_service.create(create_data)
             if task_ids is not None and created.id is not None:
-                self._sync_project_tasks(uow, proj_service, created.id, task_ids)
+                proj_service.sync_tasks(created.id, task_ids)
         logger.info(f"プロジェクト作成完了 - (ID={created.id})")
         return created
 
@@ -68,17 +70,17 @@ class ProjectApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]
         task_ids: Sequence[uuid.UUID] | None = None,
     ) -> ProjectRead:
         """プロジェクト更新"""
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             proj_service = uow.service_factory.get_service(ProjectService)
             updated = proj_service.update(project_id, update_data)
             if task_ids is not None:
-                self._sync_project_tasks(uow, proj_service, project_id, task_ids)
+                proj_service.sync_tasks(project_id, task_ids)
         logger.info(f"プロジェクト更新完了 - (ID={updated.id})")
         return updated
 
     def delete(self, project_id: uuid.UUID) -> bool:
         """プロジェクト削除"""
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             proj_service = uow.service_factory.get_service(ProjectService)
             success = proj_service.delete(project_id)
             logger.info(f"プロジェクト削除完了: ID {project_id}, 結果: {success}")
@@ -102,6 +104,25 @@ class ProjectApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]
             proj_service = uow.service_factory.get_service(ProjectService)
             return proj_service.list_by_status(status)
 
+    def get_summaries(self, project_ids: Iterable[uuid.UUID]) -> dict[uuid.UUID, ProjectSummary]:
+        """複数プロジェクトのタスク概要を一括取得する
+
+        一覧画面の描画用。プロジェクトごとに全タスクを取得する代わりに、
+        件数・完了数・軽量なタスク行を 1 回のクエリでまとめて取得する。
+
+        Args:
+            project_ids: 対象のプロジェクトID
+
+        Returns:
+            dict[uuid.UUID, ProjectSummary]: プロジェクトIDごとの概要
+        """
+        ids = list(project_ids)
+        if not ids:
+            return {}
+        with self._unit_of_work_factory(read_only=True) as uow:
+            proj_service = uow.service_factory.get_service(ProjectService)
+            return proj_service.get_summaries(ids)
+
     def search(
         self,
         query: str,
@@ -128,36 +149,3 @@ class ProjectApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]
                 status_ids = {p.id for p in status_items}
                 results = [p for p in results if p.id in status_ids]
             return results
-
-    def _sync_project_tasks(
-        self,
-        uow: SqlModelUnitOfWork,
-        proj_service: ProjectService,
-        project_id: uuid.UUID,
-        task_ids: Sequence[uuid.UUID],
-    ) -> None:
-        """プロジェクトとタスクの関連付けを同期する。"""
-        from logic.repositories import ProjectRepository as _ProjectRepository
-
-        project_repo = uow.repository_factory.create(_ProjectRepository)
-        project = project_repo.get_by_id(project_id, with_details=True)
-        if not hasattr(project, "tasks"):
-            msg = f"プロジェクトID {project_id} のタスク情報が取得できません。"
-            raise ProjectApplicationError(msg)
-
-        current_ids = {task.id for task in getattr(project, "tasks", []) if getattr(task, "id", None) is not None}
-
-        desired_ids_ordered: list[uuid.UUID] = []
-        desired_ids_set: set[uuid.UUID] = set()
-        for task_id in task_ids:
-            if task_id is None or task_id in desired_ids_set:
-                continue
-            desired_ids_set.add(task_id)
-            desired_ids_ordered.append(task_id)
-
-        for task_id in desired_ids_ordered:
-            if task_id not in current_ids:
-                proj_service.add_task(project_id, task_id)
-
-        for task_id in current_ids - desired_ids_set:
-            proj_service.remove_task(project_id, task_id)
@@ -0,0 +1,100 @@
+"""集計のApplication Service
+
+ホーム画面・CLI・一言コメントなどが必要とする件数統計を、読み取り専用の
+Unit of Work で 1 トランザクションにまとめて取得する。
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, override
+
+from logic.application.base import BaseApplicationService
+from logic.services.stats_service import StatsService
+from logic.unit_of_work import SqlModelUnitOfWork
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Iterable
+
+    from models import DashboardStats, MemoStats, ProjectTaskStats, TagUsage, TaskStats
+
+
+def _local_today() -> date:
+    """ローカルタイムゾーンでの今日の日付を返す。"""
+    return datetime.now().astimezone().date()
+
+
+class StatsApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
+    """集計のApplication Service"""
+
+    def __init__(self, unit_of_work_factory: type[SqlModelUnitOfWork] = SqlModelUnitOfWork) -> None:
+        super().__init__(unit_of_work_factory)
+
+    @classmethod
+    @override
+    def get_instance(cls, *args: Any, **kwargs: Any) -> StatsApplicationService: ...
+
+    def get_dashboard_stats(self, *, today: date | None = None) -> DashboardStats:
+        """タスク・メモ・プロジェクトの集計値一式を取得する
+
+        Args:
+            today: 期限超過の判定に使う基準日（既定は今日）
+
+        Returns:
+            DashboardStats: 集計値一式
+        """
+        with self._unit_of_work_factory(read_only=True) as uow:
+            stats_service = uow.service_factory.get_service(StatsService)
+            return stats_service.get_dashboard_stats(today or _local_today())
+
+    def get_task_stats(self, *, today: date | None = None) -> TaskStats:
+        """タスクのステータス別件数と期限超過件数を取得する
+
+        Args:
+            today: 期限超過の判定に使う基準日（既定は今日）
+
+        Returns:
+            TaskStats: タスクの件数統計
+        """
+        with self._unit_of_work_factory(read_only=True) as uow:
+            stats_service = uow.service_factory.get_service(StatsService)
+            return stats_service.get_task_stats(today or _local_today())
+
+    def get_project_task_stats(
+        self, project_ids: Iterable[uuid.UUID] | None = None
+    ) -> dict[uuid.UUID, ProjectTaskStats]:
+        """プロジェクトごとのタスク件数を取得する
+
+        Args:
+            project_ids: 対象のプロジェクトID（None の場合はタスクを持つ全プロジェクト）
+
+        Returns:
+            dict[uuid.UUID, ProjectTaskStats]: プロジェクトIDごとの件数統計
+        """
+        with self._unit_of_work_factory(read_only=True) as uow:
+            stats_service = uow.service_factory.get_service(StatsService)
+            return stats_service.get_project_task_stats(project_ids)
+
+    def get_memo_stats(self) -> MemoStats:
+        """メモのステータス別・AI提案状態別の件数を取得する
+
+        Returns:
+            MemoStats: メモの件数統計
+        """
+        with self._unit_of_work_factory(read_only=True) as uow:
+            stats_service = uow.service_factory.get_service(StatsService)
+            return stats_service.get_memo_stats()
+
+    def get_tag_usage(self, *, limit: int | None = None) -> list[TagUsage]:
+        """タグの利用件数を多い順に取得する
+
+        Args:
+            limit: 最大取得件数（None で無制限）
+
+        Returns:
+            list[TagUsage]: タグごとの利用件数
+        """
+        with self._unit_of_work_factory(read_only=True) as uow:
+            stats_service = uow.service_factory.get_service(StatsService)
+            return stats_service.get_tag_usage(limit=limit)
@@ -44,7 +44,7 @@ class TagApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
             raise TagValidationError(msg)
 
         create_data = TagCreate(name=name, description=description, color=color)
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             tag_service = uow.service_factory.get_service(TagService)
             created = tag_service.create(create_data)
         logger.info(f"タグ作成完了 - (ID={created.id})")
@@ -52,7 +52,7 @@ class TagApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
 
     def update(self, tag_id: uuid.UUID, update_data: TagUpdate) -> TagRead:
         """タグ更新"""
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             tag_service = uow.service_factory.get_service(TagService)
             updated = tag_service.update(tag_id, update_data)
         logger.info(f"タグ更新完了 - (ID={updated.id})")
@@ -60,7 +60,7 @@ class TagApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
 
     def delete(self, tag_id: uuid.UUID) -> bool:
         """タグ削除"""
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             tag_service = uow.service_factory.get_service(TagService)
             success = tag_service.delete(tag_id)
             logger.info(f"タグ削除完了: ID {tag_id}, 結果: {success}")
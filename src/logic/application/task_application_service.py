@@ -5,20 +5,24 @@ View層からSession管理を分離し、ビジネスロジックを調整する
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast, override
+from typing import TYPE_CHECKING, Any, cast, overload, override
 
 from loguru import logger
 
-from errors import ApplicationError, ValidationError
+from errors import ApplicationError, NotFoundError, ValidationError
 from logic.application.base import BaseApplicationService
+from logic.repositories import DEFAULT_PAGE_SIZE, DEFAULT_SEARCH_LIMIT, QuerySpec
 from logic.services.task_service import TaskService
 from logic.unit_of_work import SqlModelUnitOfWork
 from models import TaskCreate, TaskRead, TaskStatus, TaskUpdate
 
 if TYPE_CHECKING:
     import uuid
+    from collections.abc import Mapping, Sequence
     from datetime import date, datetime
 
+    from logic.repositories import Page, PageOrderKey, SearchHit, SortKey
+
 
 class TaskApplicationError(ApplicationError):
     """タスク管理のApplication Serviceで発生するエラー"""
@@ -96,7 +100,7 @@ class TaskApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
             recurrence_rule=recurrence_rule,
         )
 
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             task_service = uow.service_factory.get_service(TaskService)
             created = task_service.create(create_model)
 
@@ -113,7 +117,7 @@ class TaskApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         Returns:
             TaskRead: 更新後タスク
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             task_service = uow.service_factory.get_service(TaskService)
             updated = task_service.update(task_id, update_data)
 
@@ -129,13 +133,106 @@ class TaskApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         Returns:
             bool: 削除成功フラグ
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             task_service = uow.service_factory.get_service(TaskService)
             success = task_service.delete(task_id)
             logger.info(f"タスク削除完了: ID {task_id}, 結果: {success}")
             return success
 
     # 取得系
+    def bulk_create(self, items: Sequence[TaskCreate]) -> list[TaskRead]:
+        """複数のタスクを 1 トランザクションでまとめて作成する
+
+        Args:
+            items: 作成するタスクのデータ
+
+        Returns:
+            list[TaskRead]: 作成されたタスク (入力順)
+
+        Raises:
+            TaskContentValidationError: タイトルが空のデータが含まれる場合
+        """
+        if not items:
+            return []
+        if any(not item.title.strip() for item in items):
+            msg = "タスクタイトルを入力してください"
+            raise TaskContentValidationError(msg)
+
+        with self._unit_of_work_factory(defer_commit=True) as uow:
+            task_service = uow.service_factory.get_service(TaskService)
+            created = task_service.bulk_create(items)
+
+        logger.info(f"タスク一括作成完了 - {len(created)} 件")
+        return created
+
+    def bulk_update_status(self, status_by_task: Mapping[uuid.UUID, TaskStatus]) -> list[TaskRead]:
+        """複数のタスクのステータスを 1 トランザクションでまとめて更新する
+
+        同じステータスのタスクは 1 回の UPDATE にまとめる。
+
+        Args:
+            status_by_task: タスクIDごとの新しいステータス
+
+        Returns:
+            list[TaskRead]: 更新後のタスク (指定順)
+
+        Raises:
+            NotFoundError: 存在しないタスクが含まれる場合 (いずれのタスクも更新しない)
+        """
+        if not status_by_task:
+            return []
+        groups: dict[TaskStatus, list[uuid.UUID]] = {}
+        for task_id, status in status_by_task.items():
+            groups.setdefault(status, []).append(task_id)
+
+        with self._unit_of_work_factory(defer_commit=True) as uow:
+            task_service = uow.service_factory.get_service(TaskService)
+            for status, task_ids in groups.items():
+                task_service.bulk_update_status(task_ids, status)
+            updated = task_service.get_by_ids(list(status_by_task), with_details=True)
+            if len(updated) != len(status_by_task):
+                found = {task.id for task in updated}
+                missing = [str(task_id) for task_id in status_by_task if task_id not in found]
+                msg = f"タスクが見つかりません: {', '.join(missing)}"
+                raise NotFoundError(msg)
+
+        logger.info(f"タスク一括ステータス更新完了 - {len(updated)} 件")
+        return updated
+
+    def bulk_delete(self, task_ids: Sequence[uuid.UUID]) -> int:
+        """複数のタスクを 1 トランザクションでまとめて削除する
+
+        Args:
+            task_ids: 削除するタスクのID
+
+        Returns:
+            int: 削除した件数
+        """
+        if not task_ids:
+            return 0
+        with self._unit_of_work_factory(defer_commit=True) as uow:
+            task_service = uow.service_factory.get_service(TaskService)
+            deleted = task_service.bulk_delete(task_ids)
+
+        logger.info(f"タスク一括削除完了 - {deleted} 件")
+        return deleted
+
+    def bulk_link_tags(self, task_ids: Sequence[uuid.UUID], tag_ids: Sequence[uuid.UUID]) -> int:
+        """複数のタスクに複数のタグを 1 トランザクションでまとめて関連付ける
+
+        Args:
+            task_ids: 対象タスクのID
+            tag_ids: 関連付けるタグのID
+
+        Returns:
+            int: 新たに関連付けた組み合わせの件数
+        """
+        if not task_ids or not tag_ids:
+            return 0
+        with self._unit_of_work_factory(defer_commit=True) as uow:
+            task_service = uow.service_factory.get_service(TaskService)
+            return task_service.bulk_link_tags(task_ids, tag_ids)
+
     def get_by_id(self, task_id: uuid.UUID, *, with_details: bool = False) -> TaskRead | None:
         """IDでタスク取得
 
@@ -146,83 +243,182 @@ class TaskApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         Returns:
             TaskRead | None: 見つかったタスク（存在しない場合None想定の呼び出し元もある）
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(read_only=True) as uow:
             task_service = uow.service_factory.get_service(TaskService)
             return task_service.get_by_id(task_id, with_details=with_details)
 
-    def get_all_tasks(self) -> list[TaskRead]:
-        """全タスク取得"""
-        with self._unit_of_work_factory() as uow:
+    @overload
+    def get_all_tasks(self) -> list[TaskRead]: ...
+
+    @overload
+    def get_all_tasks(
+        self,
+        *,
+        page_size: int,
+        cursor: str | None = None,
+        order_by: PageOrderKey = "created_at",
+        with_details: bool = False,
+    ) -> Page[TaskRead]: ...
+
+    def get_all_tasks(
+        self,
+        *,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        order_by: PageOrderKey = "created_at",
+        with_details: bool = False,
+    ) -> list[TaskRead] | Page[TaskRead]:
+        """全タスク取得
+
+        page_size を指定した場合はキーセットページングで 1 ページ分のみ取得する。
+        続きは戻り値の `Page.next_cursor` を cursor に渡して取得する。
+
+        Args:
+            page_size: 1 ページあたりの件数 (未指定時は全件)
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+            order_by: ページングのソートキー (新しい順)
+            with_details: ページング時に関連エンティティも取得するかどうか
+
+        Returns:
+            list[TaskRead] | Page[TaskRead]: 全タスクのリスト、または page_size 指定時はページング結果
+        """
+        with self._unit_of_work_factory(read_only=True) as uow:
             task_service = uow.service_factory.get_service(TaskService)
+            if page_size is not None:
+                return task_service.get_page(
+                    page_size=page_size, cursor=cursor, order_by=order_by, with_details=with_details
+                )
             return task_service.get_all()
 
+    def list_page(  # noqa: PLR0913 - 検索条件をキーワード引数で受け取る
+        self,
+        *,
+        query: str = "",
+        status: TaskStatus | None = None,
+        sort: PageOrderKey = "updated_at",
+        descending: bool = True,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        with_details: bool = False,
+    ) -> Page[TaskRead]:
+        """条件に一致するタスクを 1 ページずつ取得する (一覧画面の段階読み込み用)
+
+        件数が増えても 1 回に読み込むのは page_size 件だけで、続きは戻り値の `Page.next_cursor` で取得する。
+
+        Args:
+            query: タイトル・説明を全文検索する文字列 (空文字なら条件なし)
+            status: ステータスでの絞り込み
+            sort: 並び順のキー
+            descending: 降順で並べるかどうか
+            page_size: 1 ページあたりの件数
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+            with_details: 関連エンティティを含めるかどうか
+
+        Returns:
+            Page[TaskRead]: ページング結果
+        """
+        spec = QuerySpec().with_text(query).with_statuses(status).order_by(sort, descending=descending)
+        with self._unit_of_work_factory(read_only=True) as uow:
+            task_service = uow.service_factory.get_service(TaskService)
+            return task_service.find_page(spec, page_size=page_size, cursor=cursor, with_details=with_details)
+
+    def count(self, query: str = "", *, status: TaskStatus | None = None) -> int:
+        """条件に一致するタスクの件数を取得する (一覧を読み込まずに件数だけを数える)
+
+        Args:
+            query: タイトル・説明を全文検索する文字列 (空文字なら条件なし)
+            status: ステータスでの絞り込み
+
+        Returns:
+            int: 一致件数
+        """
+        spec = QuerySpec().with_text(query).with_statuses(status)
+        with self._unit_of_work_factory(read_only=True) as uow:
+            task_service = uow.service_factory.get_service(TaskService)
+            return task_service.count(spec)
+
     def list_by_status(self, status: TaskStatus, *, with_details: bool = False) -> list[TaskRead]:
         """ステータスでタスク取得"""
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(read_only=True) as uow:
             task_service = uow.service_factory.get_service(TaskService)
             return task_service.list_by_status(status, with_details=with_details)
 
     def list_by_tag(self, tag_id: uuid.UUID, *, with_details: bool = False) -> list[TaskRead]:
         """タグIDでタスク一覧を取得する。"""
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(read_only=True) as uow:
             task_service = uow.service_factory.get_service(TaskService)
             return task_service.list_by_tag(tag_id, with_details=with_details)
 
-    def search(
+    def search(  # noqa: PLR0913 - 検索条件をキーワード引数で受け取る
         self,
         query: str,
         *,
         with_details: bool = False,
         status: TaskStatus | None = None,
         tags: list[uuid.UUID] | None = None,
+        all_tags: list[uuid.UUID] | None = None,
+        project_id: uuid.UUID | None = None,
+        due_from: date | None = None,
+        due_to: date | None = None,
+        sort: SortKey = "relevance",
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[TaskRead]:
         """タスク検索
 
-        タイトル・説明を横断検索し、必要に応じてステータスやタグで絞り込む。
+        タイトル・説明の全文検索とステータス・タグ・プロジェクト・期限日の条件、並び順、件数制限を
+        1 本の SQL にまとめて実行する。
 
         Args:
-            query: 検索クエリ（空文字・空白のみなら全件取得してフィルタ適用）
+            query: 検索クエリ（空文字・空白のみならテキスト条件なし）
             with_details: 関連情報を含めるかどうか
             status: ステータスでの追加フィルタ
             tags: タグIDのリスト（いずれかを含むOR条件）
+            all_tags: タグIDのリスト（すべてを含むAND条件）
+            project_id: 所属プロジェクトでの絞り込み
+            due_from: 期限日の下限（含む）
+            due_to: 期限日の上限（含む）
+            sort: 並び順（既定は関連度順。テキスト条件がない場合は更新日時の新しい順）
+            limit: 最大取得件数（None で無制限）
+            offset: 読み飛ばす件数
 
         Returns:
             list[TaskRead]: 検索結果
+
+        Raises:
+            ValidationError: 期限日の範囲や件数指定が不正な場合
         """
-        with self._unit_of_work_factory() as uow:
+        spec = (
+            QuerySpec()
+            .with_text(query)
+            .with_statuses(status)
+            .with_any_tags(tags)
+            .with_all_tags(all_tags)
+            .with_project(project_id)
+            .with_due_range(due_from, due_to)
+            .order_by(sort)
+            .paginate(limit, offset)
+        )
+        with self._unit_of_work_factory(read_only=True) as uow:
             task_service = uow.service_factory.get_service(TaskService)
+            return task_service.find(spec, with_details=with_details)
+
+    def search_with_snippets(self, query: str, *, limit: int = DEFAULT_SEARCH_LIMIT) -> list[SearchHit[TaskRead]]:
+        """タスクを全文検索し、関連度と一致箇所の抜粋付きで返す
+
+        Args:
+            query: 検索クエリ（空文字・空白のみなら空配列）
+            limit: 最大取得件数
 
-            # 空クエリの場合は全件取得、それ以外は検索
-            if not query or not query.strip():
-                results = task_service.get_all()
-            else:
-                results = task_service.search_tasks(query, with_details=with_details)
-
-            # ステータスフィルタ
-            if status is not None:
-                status_items = task_service.list_by_status(status, with_details=with_details)
-                status_ids = {t.id for t in status_items}
-                results = [t for t in results if t.id in status_ids]
-
-            # タグフィルタ（OR条件）
-            if tags:
-                # RepositoryのJOINを活用（直接TaskRepositoryを生成）
-                from logic.repositories import TaskRepository as _TaskRepo
-
-                task_repo = uow.repository_factory.create(_TaskRepo)
-                matched_ids: set[uuid.UUID] = set()
-                for tag_id in tags:
-                    try:
-                        for t in task_repo.list_by_tag(tag_id, with_details=with_details):
-                            if t.id is not None:
-                                matched_ids.add(t.id)
-                    except Exception as exc:
-                        # タグが存在しない場合などは単にスキップ
-                        logger.debug(f"タグフィルタ処理中に例外: {exc}")
-                        continue
-                results = [t for t in results if t.id in matched_ids]
-
-            return results
+        Returns:
+            list[SearchHit[TaskRead]]: 関連度順の検索結果
+        """
+        if not query or not query.strip():
+            return []
+
+        with self._unit_of_work_factory(read_only=True) as uow:
+            task_service = uow.service_factory.get_service(TaskService)
+            return task_service.search_hits(query, limit=limit)
 
     def sync_tags(self, task_id: uuid.UUID, tag_ids: list[uuid.UUID]) -> TaskRead:
         """タスクのタグを同期する
@@ -237,7 +433,7 @@ class TaskApplicationService(BaseApplicationService[type[SqlModelUnitOfWork]]):
         Returns:
             TaskRead: 更新されたタスク
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             task_service = uow.get_service(TaskService)
             desired_tag_ids = set(tag_ids)
 
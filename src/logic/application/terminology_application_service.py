@@ -12,6 +12,7 @@ from loguru import logger
 
 from errors import ApplicationError, NotFoundError, ValidationError
 from logic.application.base import BaseApplicationService
+from logic.repositories import DEFAULT_PAGE_SIZE, QuerySpec
 from logic.services.terminology_service import TerminologyService
 from logic.unit_of_work import SqlModelUnitOfWork
 from models import TermCreate, TermRead, TermStatus, TermUpdate
@@ -19,6 +20,8 @@ from models import TermCreate, TermRead, TermStatus, TermUpdate
 if TYPE_CHECKING:
     import uuid
 
+    from logic.repositories import Page
+
 
 class TerminologyApplicationError(ApplicationError):
     """用語管理のApplication Serviceで発生するエラー"""
@@ -93,10 +96,9 @@ class TerminologyApplicationService(BaseApplicationService[type[SqlModelUnitOfWo
             source_url=source_url.strip() if source_url else None,
         )
 
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             term_service = uow.service_factory.get_service(TerminologyService)
             created = term_service.create(create_model)
-            uow.commit()
             result = term_service.get_by_id(created.id)
 
         if result is None:
@@ -119,10 +121,9 @@ class TerminologyApplicationService(BaseApplicationService[type[SqlModelUnitOfWo
         Raises:
             TermNotFoundError: 用語が存在しない場合
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             term_service = uow.service_factory.get_service(TerminologyService)
             term_service.update(term_id, update_data)
-            uow.commit()
             result = term_service.get_by_id(term_id)
 
         if result is None:
@@ -141,7 +142,7 @@ class TerminologyApplicationService(BaseApplicationService[type[SqlModelUnitOfWo
         Returns:
             bool: 削除成功フラグ
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             term_service = uow.service_factory.get_service(TerminologyService)
             success = term_service.delete(term_id)
             logger.info(f"用語削除完了: ID={term_id}, 結果={success}")
@@ -185,6 +186,38 @@ class TerminologyApplicationService(BaseApplicationService[type[SqlModelUnitOfWo
             term_service = uow.service_factory.get_service(TerminologyService)
             return term_service.get_all()
 
+    def list_page(
+        self,
+        *,
+        status: TermStatus | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[TermRead]:
+        """用語を更新日時の新しい順に 1 ページずつ取得する (一覧画面の段階読み込み用)
+
+        Args:
+            status: ステータスでの絞り込み
+            page_size: 1 ページあたりの件数
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+
+        Returns:
+            Page[TermRead]: ページング結果
+        """
+        spec = QuerySpec().with_statuses(status).order_by("updated_at")
+        with self._unit_of_work_factory(read_only=True) as uow:
+            term_service = uow.service_factory.get_service(TerminologyService)
+            return term_service.find_page(spec, page_size=page_size, cursor=cursor)
+
+    def count_by_status(self) -> dict[TermStatus, int]:
+        """ステータスごとの用語件数を取得する
+
+        Returns:
+            dict[TermStatus, int]: ステータスごとの件数
+        """
+        with self._unit_of_work_factory(read_only=True) as uow:
+            term_service = uow.service_factory.get_service(TerminologyService)
+            return term_service.count_by_status()
+
     def search(
         self,
         query: str | None = None,
@@ -226,7 +259,7 @@ class TerminologyApplicationService(BaseApplicationService[type[SqlModelUnitOfWo
             msg = f"ファイルが見つかりません: {file_path}"
             raise TerminologyApplicationError(msg)
 
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             term_service = uow.service_factory.get_service(TerminologyService)
             result = term_service.import_from_csv(path)
             logger.info(f"CSV インポート完了: 成功={result.success_count}, 失敗={result.failed_count}")
@@ -250,7 +283,7 @@ class TerminologyApplicationService(BaseApplicationService[type[SqlModelUnitOfWo
             msg = f"ファイルが見つかりません: {file_path}"
             raise TerminologyApplicationError(msg)
 
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             term_service = uow.service_factory.get_service(TerminologyService)
             result = term_service.import_from_json(path)
             logger.info(f"JSON インポート完了: 成功={result.success_count}, 失敗={result.failed_count}")
@@ -312,7 +345,7 @@ class TerminologyApplicationService(BaseApplicationService[type[SqlModelUnitOfWo
         Raises:
             TermNotFoundError: 用語が見つからない場合
         """
-        with self._unit_of_work_factory() as uow:
+        with self._unit_of_work_factory(defer_commit=True) as uow:
             term_service = uow.service_factory.get_service(TerminologyService)
             desired_tag_ids = set(tag_ids)
 
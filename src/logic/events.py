@@ -0,0 +1,170 @@
+"""プロセス内のドメインイベントバス
+
+DB の変更や AI ジョブの進行を、書き込んだ側から画面などの購読者へ即座に通知する。
+購読者はポーリングや再検索をせずに、自分に関係する変更だけを受け取って反映できる。
+
+- 発行: リポジトリのセッションイベント (`logic.repositories.change_events`) がコミット時に
+  `MemoChanged` / `TaskChanged` / `DataChanged` を、`MemoAiJobQueue` がジョブの状態と途中経過を発行する
+- 購読: `subscribe(イベント型, リスナー)` で登録する。サブクラスのイベントも `isinstance` で配送される
+- スレッド: リスナーは発行したスレッド (コミットしたスレッドやワーカースレッド) で同期的に呼ばれる。
+  UI へ反映する場合は `page.pubsub` などで UI 側の実行コンテキストへ受け渡すこと
+- 例外: リスナーの例外はログに記録して握りつぶし、発行側や他のリスナーへ影響させない
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, cast
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+    from uuid import UUID
+
+    from models import MemoStatus, TaskStatus
+
+
+class DomainEvent:
+    """ドメインイベントの基底クラス"""
+
+    __slots__ = ()
+
+
+class ChangeKind(str, Enum):
+    """エンティティの変更種別"""
+
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+@dataclass(frozen=True, slots=True)
+class DataChanged(DomainEvent):
+    """書き込みがコミットされたテーブルの通知 (ORM の一括 DML も含む)
+
+    Attributes:
+        tables: 変更されたテーブル名 (`__tablename__`)
+    """
+
+    tables: frozenset[str]
+
+
+@dataclass(frozen=True, slots=True)
+class MemoChanged(DomainEvent):
+    """メモの作成・更新・削除の通知
+
+    Attributes:
+        memo_id: メモID
+        kind: 変更種別
+        status: 変更後のステータス (削除時は削除前の値)
+        updated_at: 変更後の更新日時 (不明な場合は None)
+    """
+
+    memo_id: UUID
+    kind: ChangeKind
+    status: MemoStatus | None = None
+    updated_at: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TaskChanged(DomainEvent):
+    """タスクの作成・更新・削除の通知
+
+    Attributes:
+        task_id: タスクID
+        kind: 変更種別
+        status: 変更後のステータス (削除時は削除前の値)
+        previous_status: 更新前のステータス (ステータスが変わっていない場合は None)
+        updated_at: 変更後の更新日時 (不明な場合は None)
+    """
+
+    task_id: UUID
+    kind: ChangeKind
+    status: TaskStatus | None = None
+    previous_status: TaskStatus | None = None
+    updated_at: datetime | None = None
+
+    @property
+    def status_changed(self) -> bool:
+        """更新でステータスが変わったかどうか"""
+        return self.previous_status is not None and self.previous_status != self.status
+
+
+class EventBus:
+    """イベント型ごとにリスナーを管理し、発行されたイベントを同期的に配送する"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._listeners: list[tuple[type[DomainEvent], Callable[[DomainEvent], None]]] = []
+
+    def subscribe[EventT: DomainEvent](
+        self, event_type: type[EventT], listener: Callable[[EventT], None]
+    ) -> Callable[[], None]:
+        """イベントのリスナーを登録する
+
+        Args:
+            event_type: 受け取るイベントの型 (サブクラスのイベントも受け取る)
+            listener: イベントを受け取る関数
+
+        Returns:
+            Callable[[], None]: 登録を解除する関数 (複数回呼んでもよい)
+        """
+        entry = (event_type, cast("Callable[[DomainEvent], None]", listener))
+        with self._lock:
+            self._listeners.append(entry)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if entry in self._listeners:
+                    self._listeners.remove(entry)
+
+        return _unsubscribe
+
+    def has_subscribers(self, event_type: type[DomainEvent]) -> bool:
+        """指定した型のイベントを受け取るリスナーがいるかどうか
+
+        Args:
+            event_type: イベントの型
+
+        Returns:
+            bool: 1 件以上登録されていれば True
+        """
+        with self._lock:
+            return any(issubclass(event_type, subscribed) for subscribed, _ in self._listeners)
+
+    def publish(self, event: DomainEvent) -> None:
+        """イベントを発行し、該当するリスナーを登録順に呼ぶ
+
+        Args:
+            event: 発行するイベント
+        """
+        with self._lock:
+            listeners = [listener for subscribed, listener in self._listeners if isinstance(event, subscribed)]
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception(f"ドメインイベントのリスナーで例外が発生しました: event={type(event).__name__}")
+
+
+_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """プロセス全体で共有するイベントバスを返す"""
+    return _bus
+
+
+__all__ = [
+    "ChangeKind",
+    "DataChanged",
+    "DomainEvent",
+    "EventBus",
+    "MemoChanged",
+    "TaskChanged",
+    "get_event_bus",
+]
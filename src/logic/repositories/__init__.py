@@ -11,9 +11,31 @@ from typing import TypeVar
 
 from sqlmodel import Session
 
-from logic.repositories.base import BaseRepository
+from logic.repositories import change_events  # noqa: F401 - コミット時の変更イベントの登録
+from logic.repositories.base import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SEARCH_LIMIT,
+    DEFER_COMMIT_KEY,
+    MAX_PAGE_SIZE,
+    BaseRepository,
+    Page,
+    PageCursor,
+    PageOrderKey,
+)
+from logic.repositories.data_version import bump_data_version, get_data_version
+from logic.repositories.fulltext import SearchHit
+from logic.repositories.loading import LoadProfile, LoadProfileName, as_loaded
 from logic.repositories.memo import MemoRepository
 from logic.repositories.project import ProjectRepository
+from logic.repositories.query import QuerySpec, SortKey, TagLink
+from logic.repositories.read_cache import (
+    PROJECT_READ_CACHE,
+    TAG_READ_CACHE,
+    CacheStats,
+    EntityReadCache,
+    get_read_cache_stats,
+    invalidate_read_caches,
+)
 from logic.repositories.tag import TagRepository
 from logic.repositories.task import TaskRepository
 from logic.repositories.term import TermRepository
@@ -77,7 +99,29 @@ class RepositoryFactory:
 
 
 __all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "DEFAULT_SEARCH_LIMIT",
+    "DEFER_COMMIT_KEY",
+    "MAX_PAGE_SIZE",
+    "PROJECT_READ_CACHE",
+    "TAG_READ_CACHE",
     "BaseRepository",
+    "CacheStats",
+    "EntityReadCache",
+    "LoadProfile",
+    "LoadProfileName",
+    "Page",
+    "PageCursor",
+    "PageOrderKey",
+    "QuerySpec",
+    "SearchHit",
+    "SortKey",
+    "TagLink",
+    "as_loaded",
+    "bump_data_version",
+    "get_data_version",
+    "get_read_cache_stats",
+    "invalidate_read_caches",
     "MemoRepository",
     "ProjectRepository",
     "TagRepository",
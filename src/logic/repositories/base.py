@@ -4,23 +4,139 @@
 DB/IO 等の技術的失敗は RepositoryError に集約して送出する。
 """
 
+import base64
+import binascii
+import json
 import uuid
-from typing import Any, TypeVar
+import weakref
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Final, Literal, TypeVar
 
 from loguru import logger
-from sqlalchemy.orm import selectinload
-from sqlmodel import Session, SQLModel, select
+from sqlalchemy import Engine, and_, column, delete, func, insert, literal_column, or_, table, text, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select as sa_select
+from sqlalchemy.orm import ONETOMANY, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import ColumnElement
+from sqlmodel import Session, SQLModel, col, select
 from sqlmodel.sql.expression import SelectOfScalar
 
-from errors import NotFoundError, RepositoryError
+from errors import NotFoundError, RepositoryError, ValidationError
+from logic.repositories.fulltext import (
+    SNIPPET_CLOSE,
+    SNIPPET_ELLIPSIS,
+    SNIPPET_OPEN,
+    SNIPPET_TOKENS,
+    FtsIndex,
+    SearchHit,
+    build_match_query,
+    make_snippet,
+)
+from logic.repositories.loading import LoadProfile, LoadProfileName, resolve_profiles
+from logic.repositories.query import QuerySpec, TagLink, compile_query
+from logic.repositories.read_cache import EntityReadCache
 from models import BaseModel
 
 _LoadOptionType = TypeVar("_LoadOptionType", bound=Any)
 
+type PageOrderKey = Literal["created_at", "updated_at"]
+"""キーセットページングのソートキー (id と組み合わせて一意な順序にする)"""
+
+DEFAULT_PAGE_SIZE: Final[int] = 50
+MAX_PAGE_SIZE: Final[int] = 500
+DEFAULT_SEARCH_LIMIT: Final[int] = 200
+
+DEFER_COMMIT_KEY: Final = "kage.defer_commit"
+"""`Session.info` のキー。True の間、リポジトリはコミットせず flush のみ行う (Unit of Work が最後に 1 回コミットする)"""
+
+# FTS5 テーブルの存在を確認済みのエンジン (作成後に消えることはないため肯定結果のみ保持)
+_FTS_READY_ENGINES: weakref.WeakSet[Engine] = weakref.WeakSet()
+
 
 # 旧例外は廃止。統一エラー (errors) を使用する。
 
 
+@dataclass(frozen=True, slots=True)
+class PageCursor:
+    """キーセットページングのカーソル
+
+    直前のページ末尾の (ソートキー値, id) を保持する。
+    呼び出し側には `encode` した不透明な文字列として渡す。
+
+    Attributes:
+        sort_value: 直前ページ末尾のソートキー値
+        entity_id: 直前ページ末尾のエンティティID
+    """
+
+    sort_value: datetime
+    entity_id: uuid.UUID
+
+    def encode(self) -> str:
+        """カーソルを URL セーフな文字列に変換する
+
+        Returns:
+            str: 不透明なカーソル文字列
+        """
+        payload = json.dumps({"v": self.sort_value.isoformat(), "id": self.entity_id.hex})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """カーソル文字列を復元する
+
+        Args:
+            token: `encode` で生成したカーソル文字列
+
+        Returns:
+            PageCursor: 復元したカーソル
+
+        Raises:
+            ValidationError: カーソル文字列が不正な場合
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+            return cls(sort_value=datetime.fromisoformat(payload["v"]), entity_id=uuid.UUID(hex=payload["id"]))
+        except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            msg = f"ページカーソルが不正です: {token}"
+            raise ValidationError(msg) from e
+
+
+@dataclass(frozen=True, slots=True)
+class Page[T]:
+    """ページング結果
+
+    Attributes:
+        items: ページ内のエンティティ
+        next_cursor: 次ページ取得用カーソル (最終ページの場合は None)
+        page_size: 要求したページサイズ
+    """
+
+    items: list[T]
+    next_cursor: str | None
+    page_size: int
+
+    @property
+    def has_next(self) -> bool:
+        """次ページが存在するかどうか"""
+        return self.next_cursor is not None
+
+    def map[U](self, func: Callable[[T], U]) -> "Page[U]":
+        """ページ内の要素を変換した新しいページを返す
+
+        Args:
+            func: 要素の変換関数 (例: ``MemoRead.model_validate``)
+
+        Returns:
+            Page[U]: 変換後のページ
+        """
+        return Page(items=[func(item) for item in self.items], next_cursor=self.next_cursor, page_size=self.page_size)
+
+
 class BaseRepository[T: BaseModel, CreateT: SQLModel, UpdateT: SQLModel]:
     """リポジトリの基底クラス
 
@@ -30,22 +146,54 @@ class BaseRepository[T: BaseModel, CreateT: SQLModel, UpdateT: SQLModel]:
 
     model_class: type[T]
 
-    def __init__(self, session: Session, *, load_options: list[_LoadOptionType] | None = None) -> None:
+    def __init__(
+        self,
+        session: Session,
+        *,
+        load_options: list[_LoadOptionType] | None = None,
+        fts_index: FtsIndex | None = None,
+        tag_link: TagLink | None = None,
+        read_cache: EntityReadCache | None = None,
+        load_profiles: dict[LoadProfileName, LoadProfile] | None = None,
+    ) -> None:
         """リポジトリを初期化する
 
         Args:
             session: データベースセッション
             load_options: 関連エンティティの事前読み込みオプション（デフォルトはNone）
+            fts_index: 全文検索インデックスの定義（デフォルトはNone: 全文検索非対応）
+            tag_link: タグ中間テーブルの定義（デフォルトはNone: タグ条件での検索非対応）
+            read_cache: プロセス共有の読み取りキャッシュ（デフォルトはNone: 常に DB を参照）
+            load_profiles: 名前付きの読み込みプロファイル（``list`` / ``detail`` は未指定時に既定値を補う）
         """
         self.session = session
         self._eager_loading_options = load_options or []
+        self._fts_index = fts_index
+        self._tag_link = tag_link
+        self._read_cache = read_cache
+        self._load_profiles = resolve_profiles(self._eager_loading_options, load_profiles)
 
         if not hasattr(self, "model_class"):
             msg = "model_class must be defined in the subclass"
             logger.error(msg)
             raise NotImplementedError(msg)
 
-    def _commit_and_refresh(self, entity: T) -> None:
+    @property
+    def commit_deferred(self) -> bool:
+        """コミットを Unit of Work に委ねているかどうか (`DEFER_COMMIT_KEY` が立っているセッション)"""
+        return bool(self.session.info.get(DEFER_COMMIT_KEY, False))
+
+    def _commit(self) -> None:
+        """変更を確定する
+
+        コミット遅延モードでは flush のみ行い、コミットは Unit of Work の終了時に 1 回だけ行う。
+        """
+        if self.commit_deferred:
+            self.session.flush()
+        else:
+            self.session.commit()
+
+    def _commit_and_refresh(self, entity: T, *, refresh: bool = False) -> None:
         """エンティティをコミットしてリフレッシュする
 
         以下の内容を実行する:
@@ -53,22 +201,81 @@ class BaseRepository[T: BaseModel, CreateT: SQLModel, UpdateT: SQLModel]:
         >>> self.session.commit()
         >>> self.session.refresh(entity)
 
+        コミット遅延モードでは flush のみ行い、属性は期限切れにならないためリフレッシュも省略する。
+
         Args:
             entity: コミットしてリフレッシュするエンティティ
+            refresh: コミット遅延モードでも DB から再読込するかどうか (DB 側で生成される値が必要な場合)
 
         Returns:
             None
         """
         self.session.add(entity)
+        if self.commit_deferred:
+            self.session.flush()
+            if refresh:
+                self.session.refresh(entity)
+            return
         self.session.commit()
         self.session.refresh(entity)
 
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """例外時に、このブロック内の変更だけを取り消す SAVEPOINT を張る
+
+        コミット遅延モードでのみ有効。通常モードでは各操作が即時コミットされるため何もしない。
+
+        Yields:
+            None
+        """
+        with self.session.begin_nested() if self.commit_deferred else nullcontext():
+            yield
+
     # _eager_loading_options があるかチェックして、あれば selectinload を使用して関連エンティティを事前読み込み
     def _apply_eager_loading(self, stmt: SelectOfScalar) -> SelectOfScalar:
         if self._eager_loading_options:
             stmt = stmt.options(*[selectinload(opt) for opt in self._eager_loading_options])
         return stmt
 
+    def get_load_profile(self, name: LoadProfileName) -> LoadProfile:
+        """名前から読み込みプロファイルを取得する
+
+        Args:
+            name: プロファイル名
+
+        Returns:
+            LoadProfile: 読み込みプロファイル
+
+        Raises:
+            ValueError: このリポジトリに存在しないプロファイル名の場合
+        """
+        profile = self._load_profiles.get(name)
+        if profile is None:
+            msg = f"{self.model_class.__name__} に読み込みプロファイル '{name}' はありません"
+            raise ValueError(msg)
+        return profile
+
+    def _apply_loading(
+        self, stmt: SelectOfScalar, *, with_details: bool = False, profile: LoadProfileName | None = None
+    ) -> SelectOfScalar:
+        """読み込みプロファイル、または with_details に応じたローダーオプションを適用する
+
+        profile を指定した場合は with_details より優先する。
+
+        Args:
+            stmt: 対象のステートメント
+            with_details: 全関連を事前読み込みするかどうか (``profile="detail"`` 相当)
+            profile: 読み込みプロファイル名
+
+        Returns:
+            SelectOfScalar: オプション適用後のステートメント
+        """
+        if profile is not None:
+            return stmt.options(*self.get_load_profile(profile).options(self.model_class))
+        if with_details:
+            return self._apply_eager_loading(stmt)
+        return stmt
+
     def _get_by_statement(self, stmt: SelectOfScalar, entity: uuid.UUID | str) -> T:
         """カスタムステートメントでエンティティを取得する
 
@@ -125,10 +332,305 @@ class BaseRepository[T: BaseModel, CreateT: SQLModel, UpdateT: SQLModel]:
         logger.info(f"{self.model_class.__name__} のエンティティが {len(results)} 件見つかりました。")
         return list(results)
 
+    def _page_by_statement(
+        self,
+        stmt: SelectOfScalar,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        order_by: PageOrderKey = "created_at",
+        descending: bool = True,
+    ) -> Page[T]:
+        """カスタムステートメントをキーセットページングで取得する
+
+        ``(order_by, id)`` の複合キーで並べ、カーソル位置より後ろの行を
+        ``page_size + 1`` 件だけ取得して次ページの有無を判定する。
+        OFFSET を使わないため、ページが進んでも走査行数が増えない。
+
+        Args:
+            stmt: 絞り込み済みのステートメント (ORDER BY は付与しないこと)
+            page_size: 1 ページあたりの件数
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+            order_by: ソートキー
+            descending: 降順で並べるかどうか
+
+        Returns:
+            Page[T]: ページング結果 (該当なしの場合は空のページ)
+
+        Raises:
+            ValidationError: ページサイズまたはカーソルが不正な場合
+            RepositoryError: 取得に失敗した場合
+        """
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            msg = f"ページサイズは 1 以上 {MAX_PAGE_SIZE} 以下で指定してください: {page_size}"
+            raise ValidationError(msg)
+
+        sort_col = col(getattr(self.model_class, order_by))
+        id_col = col(self.model_class.id)
+
+        if cursor is not None:
+            position = PageCursor.decode(cursor)
+            if descending:
+                after = or_(
+                    sort_col < position.sort_value,
+                    and_(sort_col == position.sort_value, id_col < position.entity_id),
+                )
+            else:
+                after = or_(
+                    sort_col > position.sort_value,
+                    and_(sort_col == position.sort_value, id_col > position.entity_id),
+                )
+            stmt = stmt.where(after)
+
+        if descending:
+            stmt = stmt.order_by(sort_col.desc(), id_col.desc())
+        else:
+            stmt = stmt.order_by(sort_col.asc(), id_col.asc())
+        stmt = stmt.limit(page_size + 1)
+
+        try:
+            rows = list(self.session.exec(stmt).all())
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = f"{self.model_class.__name__} のページ取得に失敗しました"
+            raise RepositoryError(msg) from e
+
+        items = rows[:page_size]
+        next_cursor: str | None = None
+        if len(rows) > page_size:
+            last = items[-1]
+            position = PageCursor(sort_value=getattr(last, order_by), entity_id=last.id)  # type: ignore[arg-type]
+            next_cursor = position.encode()
+
+        logger.debug(
+            f"{self.model_class.__name__} のページを取得しました: {len(items)} 件 (has_next={bool(next_cursor)})"
+        )
+        return Page(items=items, next_cursor=next_cursor, page_size=page_size)
+
+    def _count_grouped(self, *group_by: Any, where: tuple[Any, ...] = ()) -> dict[Any, int]:  # noqa: ANN401
+        """GROUP BY で件数を集計する
+
+        Args:
+            *group_by: 集計キーとなる列 (複数指定時はタプルがキーになる)
+            where: 追加の絞り込み条件
+
+        Returns:
+            dict[Any, int]: 集計キーごとの件数 (0 件のキーは含まれない)
+
+        Raises:
+            RepositoryError: 集計に失敗した場合
+        """
+        stmt = sa_select(*group_by, func.count()).select_from(self.model_class)
+        if where:
+            stmt = stmt.where(*where)
+        stmt = stmt.group_by(*group_by)
+        try:
+            rows = self.session.execute(stmt).all()
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = f"{self.model_class.__name__} の集計に失敗しました"
+            raise RepositoryError(msg) from e
+        if len(group_by) == 1:
+            return {row[0]: int(row[1]) for row in rows}
+        return {tuple(row[:-1]): int(row[-1]) for row in rows}
+
+    def _fts_available(self) -> bool:
+        """全文検索インデックスが利用可能か確認する"""
+        bind = self.session.get_bind()
+        if not isinstance(bind, Engine) or bind.dialect.name != "sqlite" or self._fts_index is None:
+            return False
+        if bind in _FTS_READY_ENGINES:
+            return True
+        exists = self.session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name").bindparams(
+                name=self._fts_index.table
+            )
+        ).first()
+        if exists is None:
+            return False
+        _FTS_READY_ENGINES.add(bind)
+        return True
+
+    def _require_fts_index(self) -> FtsIndex:
+        if self._fts_index is None:
+            msg = f"{self.model_class.__name__} は全文検索に対応していません"
+            raise ValidationError(msg)
+        return self._fts_index
+
+    def _fulltext_condition(self, query: str, columns: Sequence[str] | None = None) -> ColumnElement[bool]:
+        """テキスト検索の条件を全文検索インデックスで組み立てる
+
+        FTS5 が利用できる場合は MATCH した rowid への IN 条件、利用できない場合や 3 文字未満の語を
+        含む場合は LIKE (空白区切りの語をすべて含む) にする。JOIN しないため、他の条件と自由に組み合わせられる。
+
+        Args:
+            query: 検索文字列
+            columns: 照合する列 (None の場合はインデックスのすべての列)
+
+        Returns:
+            ColumnElement[bool]: WHERE 句に渡す条件
+
+        Raises:
+            ValidationError: 全文検索インデックスが定義されていないリポジトリの場合
+        """
+        index = self._require_fts_index()
+        names = tuple(columns or index.columns)
+        match = build_match_query(query, names if columns else None)
+        if match is not None and self._fts_available():
+            fts_ref = literal_column(index.table)
+            matched = sa_select(column("rowid")).select_from(table(index.table)).where(fts_ref.op("MATCH")(match))
+            return literal_column(f"{index.source_table}.rowid").in_(matched)
+        targets = [col(getattr(self.model_class, name)) for name in names]
+        terms = query.split()
+        return and_(*[or_(*[func.lower(target).contains(term.lower()) for target in targets]) for term in terms])
+
+    def _search_fts(self, index: FtsIndex, match: str, *, limit: int | None, with_details: bool) -> list[SearchHit[T]]:
+        fts_ref = literal_column(index.table)
+        fts_table = table(index.table, column("rowid"))
+        stmt = (
+            select(
+                self.model_class,
+                (-func.bm25(fts_ref)).label("score"),
+                func.snippet(fts_ref, -1, SNIPPET_OPEN, SNIPPET_CLOSE, SNIPPET_ELLIPSIS, SNIPPET_TOKENS).label(
+                    "snippet"
+                ),
+            )
+            .join(fts_table, fts_table.c.rowid == literal_column(f"{index.source_table}.rowid"))
+            .where(fts_ref.op("MATCH")(match))
+            .order_by(func.bm25(fts_ref))
+            .limit(limit)
+        )
+        if with_details and self._eager_loading_options:
+            stmt = stmt.options(*[selectinload(opt) for opt in self._eager_loading_options])
+        rows = self.session.exec(stmt).all()
+        return [SearchHit(item=item, score=float(score), snippet=snippet or "") for item, score, snippet in rows]
+
+    def _search_like(self, index: FtsIndex, query: str, *, limit: int | None, with_details: bool) -> list[SearchHit[T]]:
+        columns = [getattr(self.model_class, name) for name in index.columns]
+        conditions = [
+            or_(*[func.lower(column_).contains(term.lower()) for column_ in columns]) for term in query.split()
+        ]
+        stmt = (
+            select(self.model_class)
+            .where(and_(*conditions))
+            .order_by(col(self.model_class.updated_at).desc())
+            .limit(limit)
+        )
+        if with_details:
+            stmt = self._apply_eager_loading(stmt)
+        hits: list[SearchHit[T]] = []
+        for item in self.session.exec(stmt).all():
+            values = [getattr(item, name) for name in index.columns]
+            snippet = next((s for s in (make_snippet(v, query) for v in values) if s is not None), None)
+            hits.append(SearchHit(item=item, score=0.0, snippet=snippet or next((v for v in values if v), "")))
+        return hits
+
+    def search_fulltext(
+        self, query: str, *, limit: int | None = DEFAULT_SEARCH_LIMIT, with_details: bool = False
+    ) -> list[SearchHit[T]]:
+        """全文検索インデックスで検索し、関連度順の結果を返す
+
+        FTS5 (trigram) のインデックスが利用できない場合や、3 文字未満の語を含む場合は
+        インデックス対象列への LIKE 検索 (更新日時の新しい順) にフォールバックする。
+
+        Args:
+            query: 検索文字列 (空白区切りの語はすべて含む必要がある)
+            limit: 最大取得件数 (None で無制限)
+            with_details: 関連エンティティを含めるかどうか
+
+        Returns:
+            list[SearchHit[T]]: 関連度順のヒット一覧 (該当なしの場合は空リスト)
+
+        Raises:
+            ValidationError: 全文検索インデックスが定義されていないリポジトリの場合
+            RepositoryError: 検索に失敗した場合
+        """
+        index = self._require_fts_index()
+        if not query.strip():
+            return []
+
+        match = build_match_query(query)
+        try:
+            if match is not None and self._fts_available():
+                hits = self._search_fts(index, match, limit=limit, with_details=with_details)
+            else:
+                hits = self._search_like(index, query, limit=limit, with_details=with_details)
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = f"{self.model_class.__name__} の全文検索に失敗しました"
+            raise RepositoryError(msg) from e
+
+        logger.debug(f"{self.model_class.__name__} の全文検索: '{query}' -> {len(hits)} 件")
+        return hits
+
+    def find(self, spec: QuerySpec, *, with_details: bool = False, profile: LoadProfileName | None = None) -> list[T]:
+        """検索条件の仕様に一致するエンティティを 1 回のクエリで取得する
+
+        テキスト・ステータス・タグ・プロジェクト・期限日・並び順・LIMIT/OFFSET を
+        すべて DB 側で評価するため、呼び出し側での絞り込みや切り出しは不要。
+
+        Args:
+            spec: 検索条件
+            with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
+
+        Returns:
+            list[T]: 一致したエンティティ一覧 (該当なしの場合は空リスト)
+
+        Raises:
+            ValidationError: このエンティティが対応していない条件が指定された場合
+            RepositoryError: 検索に失敗した場合
+        """
+        stmt = compile_query(
+            spec,
+            self.model_class,
+            tag_link=self._tag_link,
+            fts_index=self._fts_index,
+            fts_enabled=bool(spec.text) and self._fts_available(),
+        )
+        stmt = self._apply_loading(stmt, with_details=with_details, profile=profile)
+        try:
+            results = list(self.session.exec(stmt).all())
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = f"{self.model_class.__name__} の検索に失敗しました"
+            raise RepositoryError(msg) from e
+
+        logger.debug(f"{self.model_class.__name__} の検索: {spec} -> {len(results)} 件")
+        return results
+
+    def count(self, spec: QuerySpec) -> int:
+        """検索条件の仕様に一致するエンティティの件数を返す (並び順・LIMIT/OFFSET は無視)
+
+        Args:
+            spec: 検索条件
+
+        Returns:
+            int: 一致件数
+
+        Raises:
+            ValidationError: このエンティティが対応していない条件が指定された場合
+            RepositoryError: 件数の取得に失敗した場合
+        """
+        stmt = compile_query(
+            spec.paginate(None),
+            self.model_class,
+            tag_link=self._tag_link,
+            fts_index=self._fts_index,
+            fts_enabled=bool(spec.text) and self._fts_available(),
+        ).order_by(None)
+        try:
+            return int(self.session.exec(select(func.count()).select_from(stmt.subquery())).one())
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = f"{self.model_class.__name__} の件数取得に失敗しました"
+            raise RepositoryError(msg) from e
+
     def check_exists(self, entity_id: uuid.UUID) -> T:
         """エンティティが存在するか確認する
 
         check_exists は get_by_id を呼び出し、存在しない場合は NotFoundError を発生させる。
+        読み取りキャッシュを持つリポジトリでは DB へ問い合わせずにキャッシュから取得する。
         リレーションが必要な場合は直接 get_by_id(with_details=True) を呼び出すこと。
 
         Args:
@@ -140,7 +642,14 @@ class BaseRepository[T: BaseModel, CreateT: SQLModel, UpdateT: SQLModel]:
         Raises:
             NotFoundError: エンティティが存在しない場合
         """
-        return self.get_by_id(entity_id)
+        if self._read_cache is None:
+            return self.get_by_id(entity_id)
+        entity = self._read_cache.get_entity(self.session, entity_id)
+        if entity is None:
+            msg = f"{self.model_class.__name__} が見つかりません: {entity_id}"
+            logger.warning(msg)
+            raise NotFoundError(msg)
+        return entity
 
     def create(self, entity_data: CreateT) -> T:
         """エンティティを作成する
@@ -165,12 +674,15 @@ class BaseRepository[T: BaseModel, CreateT: SQLModel, UpdateT: SQLModel]:
             raise RepositoryError(msg) from e
         return entity
 
-    def get_by_id(self, entity_id: uuid.UUID, *, with_details: bool = False) -> T:
+    def get_by_id(
+        self, entity_id: uuid.UUID, *, with_details: bool = False, profile: LoadProfileName | None = None
+    ) -> T:
         """IDでエンティティを取得する
 
         Args:
             entity_id: 取得するエンティティのID
             with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
 
         Returns:
             T | None: 取得されたエンティティ
@@ -179,25 +691,105 @@ class BaseRepository[T: BaseModel, CreateT: SQLModel, UpdateT: SQLModel]:
             NotFoundError: エンティティが存在しない場合
         """
         stmt = select(self.model_class).where(self.model_class.id == entity_id)
-
-        if with_details:
-            stmt = self._apply_eager_loading(stmt)
+        stmt = self._apply_loading(stmt, with_details=with_details, profile=profile)
 
         return self._get_by_statement(stmt, entity_id)
 
-    def get_all(self, *, with_details: bool = False) -> list[T]:
+    def get_all(self, *, with_details: bool = False, profile: LoadProfileName | None = None) -> list[T]:
         """全エンティティを取得する
 
+        Args:
+            with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
+
         Returns:
             list[T]: 全エンティティのリスト
         """
         stmt = select(self.model_class)
-
-        if with_details:
-            stmt = self._apply_eager_loading(stmt)
+        stmt = self._apply_loading(stmt, with_details=with_details, profile=profile)
 
         return self._gets_by_statement(stmt)
 
+    def get_page(
+        self,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        order_by: PageOrderKey = "created_at",
+        descending: bool = True,
+        with_details: bool = False,
+        profile: LoadProfileName | None = None,
+    ) -> Page[T]:
+        """全エンティティをキーセットページングで取得する
+
+        Args:
+            page_size: 1 ページあたりの件数
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+            order_by: ソートキー (``created_at`` / ``updated_at``)
+            descending: 降順で並べるかどうか
+            with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
+
+        Returns:
+            Page[T]: ページング結果
+        """
+        stmt = select(self.model_class)
+        stmt = self._apply_loading(stmt, with_details=with_details, profile=profile)
+
+        return self._page_by_statement(
+            stmt, page_size=page_size, cursor=cursor, order_by=order_by, descending=descending
+        )
+
+    def find_page(
+        self,
+        spec: QuerySpec,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        with_details: bool = False,
+        profile: LoadProfileName | None = None,
+    ) -> Page[T]:
+        """検索条件の仕様に一致するエンティティをキーセットページングで取得する
+
+        絞り込みは `find` と同じく DB 側で評価し、並び順は ``spec.sort`` (``created_at`` / ``updated_at``) と
+        ``spec.descending`` に従う。``relevance`` は更新日時として扱い、LIMIT/OFFSET は無視する。
+
+        Args:
+            spec: 検索条件
+            page_size: 1 ページあたりの件数
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+            with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
+
+        Returns:
+            Page[T]: ページング結果 (該当なしの場合は空のページ)
+
+        Raises:
+            ValidationError: 条件・ページサイズ・カーソルが不正、またはキーセットで扱えない並び順の場合
+            RepositoryError: 取得に失敗した場合
+        """
+        order_by: PageOrderKey
+        if spec.sort in ("relevance", "updated_at"):
+            order_by = "updated_at"
+        elif spec.sort == "created_at":
+            order_by = "created_at"
+        else:
+            msg = f"ページングで使える並び順は created_at / updated_at のみです: {spec.sort}"
+            raise ValidationError(msg)
+
+        stmt = compile_query(
+            spec.paginate(None),
+            self.model_class,
+            tag_link=self._tag_link,
+            fts_index=self._fts_index,
+            fts_enabled=bool(spec.text) and self._fts_available(),
+        ).order_by(None)
+        stmt = self._apply_loading(stmt, with_details=with_details, profile=profile)
+
+        return self._page_by_statement(
+            stmt, page_size=page_size, cursor=cursor, order_by=order_by, descending=spec.descending
+        )
+
     def update(self, entity_id: uuid.UUID, entity_data: UpdateT) -> T:
         """エンティティを更新する
 
@@ -238,7 +830,7 @@ class BaseRepository[T: BaseModel, CreateT: SQLModel, UpdateT: SQLModel]:
             entity = self.check_exists(entity_id)
 
             self.session.delete(entity)
-            self.session.commit()
+            self._commit()
             logger.info(f"{self.model_class.__name__} を削除しました: {entity_id}")
         except NotFoundError:
             logger.warning(f"{self.model_class.__name__} が見つかりません: {entity_id}")
@@ -248,3 +840,209 @@ class BaseRepository[T: BaseModel, CreateT: SQLModel, UpdateT: SQLModel]:
             msg = f"{self.model_class.__name__} の削除に失敗しました"
             raise RepositoryError(msg) from e
         return True
+
+    # ==============================================================================
+    # 一括操作
+    # 一括操作はコミットしない。呼び出し側 (Unit of Work) が 1 回だけコミットする。
+    # ==============================================================================
+
+    def get_by_ids(
+        self, entity_ids: Sequence[uuid.UUID], *, with_details: bool = False, profile: LoadProfileName | None = None
+    ) -> list[T]:
+        """複数のエンティティを 1 回のクエリで取得する
+
+        Args:
+            entity_ids: 取得するエンティティのID
+            with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
+
+        Returns:
+            list[T]: 取得したエンティティ (指定順、存在しない ID は含まれない)
+
+        Raises:
+            RepositoryError: 取得に失敗した場合
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids:
+            return []
+        stmt = select(self.model_class).where(col(self.model_class.id).in_(ids))
+        stmt = self._apply_loading(stmt, with_details=with_details, profile=profile)
+        try:
+            found = {entity.id: entity for entity in self.session.exec(stmt).all()}
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = f"{self.model_class.__name__} の一括取得に失敗しました"
+            raise RepositoryError(msg) from e
+        return [found[entity_id] for entity_id in ids if entity_id in found]
+
+    def bulk_create(self, items: Sequence[CreateT]) -> list[T]:
+        """複数のエンティティを 1 回のフラッシュでまとめて INSERT する
+
+        Args:
+            items: 作成するエンティティのデータ
+
+        Returns:
+            list[T]: 作成されたエンティティ (ID 採番済み、未コミット)
+
+        Raises:
+            RepositoryError: データベース操作エラー
+        """
+        if not items:
+            return []
+        try:
+            entities = [
+                self.model_class.model_validate(item.model_dump(exclude_unset=True, exclude_none=True))
+                for item in items
+            ]
+            self.session.add_all(entities)
+            self.session.flush()
+            # 新規行はまだ関連を持たないため、コレクションを空で確定して変換時の遅延ロードを防ぐ
+            collections = [rel.key for rel in sa_inspect(self.model_class).relationships if rel.uselist]
+            for entity in entities:
+                for key in collections:
+                    set_committed_value(entity, key, [])
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = f"{self.model_class.__name__} の一括作成に失敗しました"
+            raise RepositoryError(msg) from e
+        logger.info(f"{self.model_class.__name__} を一括作成しました: {len(entities)} 件")
+        return entities
+
+    def bulk_update_status(self, entity_ids: Sequence[uuid.UUID], status: Enum) -> int:
+        """複数のエンティティのステータスを 1 回の UPDATE で変更する
+
+        Args:
+            entity_ids: 更新するエンティティのID
+            status: 設定するステータス
+
+        Returns:
+            int: 更新した件数
+
+        Raises:
+            ValidationError: エンティティがステータスを持たない場合
+            RepositoryError: データベース操作エラー
+        """
+        if "status" not in self.model_class.model_fields:
+            msg = f"{self.model_class.__name__} はステータスを持たないため一括更新できません"
+            raise ValidationError(msg)
+        return self._bulk_update_values(entity_ids, {"status": status})
+
+    def bulk_delete(self, entity_ids: Sequence[uuid.UUID]) -> int:
+        """複数のエンティティをタグの関連ごと 1 回の DELETE で削除する
+
+        ORM の削除と同じく、関連も一括 DML で整理する (`_detach_dependents`)。
+
+        Args:
+            entity_ids: 削除するエンティティのID
+
+        Returns:
+            int: 削除した件数
+
+        Raises:
+            RepositoryError: データベース操作エラー
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids:
+            return 0
+        try:
+            self._detach_dependents(ids)
+            result = self.session.exec(delete(self.model_class).where(col(self.model_class.id).in_(ids)))
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = f"{self.model_class.__name__} の一括削除に失敗しました"
+            raise RepositoryError(msg) from e
+        logger.info(f"{self.model_class.__name__} を一括削除しました: {result.rowcount} 件")
+        return int(result.rowcount)
+
+    def _detach_dependents(self, ids: list[uuid.UUID]) -> None:
+        """一括削除するエンティティを参照する行を、ORM の削除と同じ規則で整理する
+
+        - 多対多 (タグの中間テーブルなど): 中間テーブルの行を削除する
+        - 1 対多で delete カスケードあり (用語の同義語など): 子の行を削除する
+        - 1 対多でカスケードなし (メモ・プロジェクトのタスクなど): 子の外部キーを NULL にする
+        """
+        for rel in sa_inspect(self.model_class).relationships:
+            if rel.secondary is None and rel.direction is not ONETOMANY:
+                continue
+            # synchronize_pairs は (このエンティティの列, 参照する側の列)
+            for _, ref_col in rel.synchronize_pairs:
+                condition = ref_col.in_(ids)
+                if rel.secondary is not None or rel.cascade.delete:
+                    self.session.exec(delete(ref_col.table).where(condition))
+                else:
+                    self.session.exec(update(ref_col.table).where(condition).values({ref_col.name: None}))
+
+    def bulk_link_tags(self, entity_ids: Sequence[uuid.UUID], tag_ids: Sequence[uuid.UUID]) -> int:
+        """複数のエンティティに複数のタグを executemany でまとめて関連付ける
+
+        既に関連付いている組み合わせはスキップする。
+
+        Args:
+            entity_ids: 対象エンティティのID
+            tag_ids: 関連付けるタグのID
+
+        Returns:
+            int: 新たに関連付けた組み合わせの件数
+
+        Raises:
+            ValidationError: エンティティがタグに対応していない場合
+            RepositoryError: データベース操作エラー
+        """
+        if self._tag_link is None:
+            msg = f"{self.model_class.__name__} はタグに対応していません"
+            raise ValidationError(msg)
+        link = self._tag_link
+        entities = list(dict.fromkeys(entity_ids))
+        tags = list(dict.fromkeys(tag_ids))
+        if not entities or not tags:
+            return 0
+        entity_col = col(getattr(link.model, link.entity_column))
+        tag_col = col(getattr(link.model, link.tag_column))
+        try:
+            existing = set(
+                self.session.exec(select(entity_col, tag_col).where(entity_col.in_(entities), tag_col.in_(tags))).all()
+            )
+            rows = [
+                {link.entity_column: entity_id, link.tag_column: tag_id}
+                for entity_id in entities
+                for tag_id in tags
+                if (entity_id, tag_id) not in existing
+            ]
+            if rows:
+                self.session.exec(insert(link.model), params=rows)
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = f"{self.model_class.__name__} のタグ一括関連付けに失敗しました"
+            raise RepositoryError(msg) from e
+        logger.info(f"{self.model_class.__name__} にタグを一括関連付けしました: {len(rows)} 件")
+        return len(rows)
+
+    def _bulk_update_values(self, entity_ids: Sequence[uuid.UUID], values: dict[str, Any]) -> int:
+        """複数のエンティティの列を 1 回の UPDATE で更新する (updated_at も更新する)
+
+        Args:
+            entity_ids: 更新するエンティティのID
+            values: 列名と設定値
+
+        Returns:
+            int: 更新した件数
+
+        Raises:
+            RepositoryError: データベース操作エラー
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids:
+            return 0
+        stmt = (
+            update(self.model_class)
+            .where(col(self.model_class.id).in_(ids))
+            .values(**values, updated_at=datetime.now())
+        )
+        try:
+            result = self.session.exec(stmt)
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = f"{self.model_class.__name__} の一括更新に失敗しました"
+            raise RepositoryError(msg) from e
+        logger.info(f"{self.model_class.__name__} を一括更新しました: {result.rowcount} 件")
+        return int(result.rowcount)
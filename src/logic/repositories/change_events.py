@@ -0,0 +1,131 @@
+"""エンティティ単位の変更イベント
+
+コミットされたメモとタスクの作成・更新・削除を `MemoChanged` / `TaskChanged` としてイベントバスへ発行する。
+
+- 書き込みは `data_version` と同じくセッションイベントで検知し、flush された ORM エンティティだけを対象にする。
+  ORM の一括 DML は対象の行が分からないため、`data_version` が発行するテーブル単位の `DataChanged` だけで通知される。
+- 同じトランザクション内で同じエンティティが複数回 flush された場合は 1 件にまとめる
+  (作成後の更新は作成、削除を含む場合は削除とし、更新前のステータスは最初の値を残す)。
+- イベントはコミット後にだけ発行し、ロールバックされた変更は破棄する。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session as OrmSession
+
+from logic.events import ChangeKind, MemoChanged, TaskChanged, get_event_bus
+from models import Memo, MemoStatus, Task, TaskStatus
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from enum import Enum
+    from uuid import UUID
+
+    from sqlalchemy.orm import UOWTransaction
+
+    from logic.events import DomainEvent
+
+_PENDING_KEY: Final = "kage.change_events.pending"
+"""`Session.info` のキー。未コミットの変更 ((エンティティ型, ID) → `_PendingChange`)"""
+
+
+@dataclass(slots=True)
+class _PendingChange:
+    entity_id: UUID
+    kind: ChangeKind
+    status: Any = None
+    previous_status: Any = None
+    updated_at: datetime | None = None
+
+    def merge(self, later: _PendingChange) -> None:
+        if later.kind == ChangeKind.DELETED:
+            self.kind = ChangeKind.DELETED
+        self.status = later.status
+        if self.kind == ChangeKind.UPDATED and self.previous_status is None:
+            self.previous_status = later.previous_status
+        self.updated_at = later.updated_at or self.updated_at
+
+
+def _coerce[EnumT: Enum](enum_type: type[EnumT], value: object) -> EnumT | None:
+    if value is None or isinstance(value, enum_type):
+        return value
+    try:
+        return enum_type(value)
+    except ValueError:
+        return None
+
+
+def _capture(obj: Memo | Task, kind: ChangeKind) -> _PendingChange:
+    state = inspect(obj, raiseerr=False)
+    if state is None:
+        err_msg = f"ORM にマップされていないオブジェクトです: {type(obj).__name__}"
+        raise TypeError(err_msg)
+    # 未ロードの属性を読み込まないよう、インスタンスの辞書から直接取得する
+    values = state.dict
+    previous = None
+    if kind == ChangeKind.UPDATED:
+        deleted = state.attrs.status.history.deleted
+        previous = deleted[0] if deleted else None
+    return _PendingChange(
+        entity_id=values["id"],
+        kind=kind,
+        status=values.get("status"),
+        previous_status=previous,
+        updated_at=values.get("updated_at"),
+    )
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _on_after_flush(session: OrmSession, _flush_context: UOWTransaction) -> None:
+    changed = [
+        *((obj, ChangeKind.CREATED) for obj in session.new),
+        *((obj, ChangeKind.DELETED) for obj in session.deleted),
+        *((obj, ChangeKind.UPDATED) for obj in session.dirty if session.is_modified(obj)),
+    ]
+    for obj, kind in changed:
+        if not isinstance(obj, (Memo, Task)):
+            continue
+        change = _capture(obj, kind)
+        pending: dict[tuple[type, UUID], _PendingChange] = session.info.setdefault(_PENDING_KEY, {})
+        key = (type(obj), change.entity_id)
+        if key in pending:
+            pending[key].merge(change)
+        else:
+            pending[key] = change
+
+
+def _to_event(entity_type: type, change: _PendingChange) -> DomainEvent:
+    if entity_type is Memo:
+        return MemoChanged(
+            memo_id=change.entity_id,
+            kind=change.kind,
+            status=_coerce(MemoStatus, change.status),
+            updated_at=change.updated_at,
+        )
+    return TaskChanged(
+        task_id=change.entity_id,
+        kind=change.kind,
+        status=_coerce(TaskStatus, change.status),
+        previous_status=_coerce(TaskStatus, change.previous_status),
+        updated_at=change.updated_at,
+    )
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _on_after_commit(session: OrmSession) -> None:
+    pending: dict[tuple[type, UUID], _PendingChange] = session.info.pop(_PENDING_KEY, {})
+    bus = get_event_bus()
+    for (entity_type, _), change in pending.items():
+        bus.publish(_to_event(entity_type, change))
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _on_after_rollback(session: OrmSession) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+__all__: list[str] = []
@@ -0,0 +1,97 @@
+"""テーブル単位のデータバージョン
+
+画面のキャッシュなどが「前回読み込んだ後にデータが変わったか」を DB へ問い合わせずに判定できるよう、
+コミットされた書き込みをテーブル単位のカウンタとしてプロセス全体で数える。
+
+- 書き込みは `read_cache` と同じくセッションイベントで検知する (flush された ORM エンティティと ORM の一括 DML)。
+- バージョンはコミット時にだけ進め、ロールバックされた書き込みは数えない。
+- バージョンを進めた後、変更されたテーブルを `DataChanged` としてイベントバスへ発行する。
+- ORM を通さない SQL (`Connection.execute` など) は検知しない。
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Final
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as OrmSession
+
+from logic.events import DataChanged, get_event_bus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.orm import ORMExecuteState, UOWTransaction
+
+_PENDING_KEY: Final = "kage.data_version.pending"
+"""`Session.info` のキー。未コミットの書き込みがあるテーブル名の集合"""
+
+_lock = threading.Lock()
+_versions: Counter[str] = Counter()
+
+
+def get_data_version(tables: Iterable[str]) -> int:
+    """指定したテーブルのデータバージョンを取得する
+
+    値はいずれかのテーブルへの書き込みがコミットされるたびに増えるため、前回取得した値と比較して変更を判定できる。
+
+    Args:
+        tables: テーブル名 (`__tablename__`)
+
+    Returns:
+        int: 指定したテーブルのバージョンの合計
+    """
+    with _lock:
+        return sum(_versions[table] for table in tables)
+
+
+def bump_data_version(tables: Iterable[str]) -> None:
+    """テーブルのデータバージョンを進め、`DataChanged` を発行する (ORM を通さずに書き込んだ場合に使用する)
+
+    Args:
+        tables: テーブル名 (`__tablename__`)
+    """
+    changed = frozenset(tables)
+    if not changed:
+        return
+    with _lock:
+        _versions.update(changed)
+    get_event_bus().publish(DataChanged(tables=changed))
+
+
+def _add_pending(session: OrmSession, tables: Iterable[str]) -> None:
+    session.info.setdefault(_PENDING_KEY, set()).update(tables)
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _on_after_flush(session: OrmSession, _flush_context: UOWTransaction) -> None:
+    changed = [*session.new, *session.deleted, *(obj for obj in session.dirty if session.is_modified(obj))]
+    tables = {name for obj in changed if (name := getattr(type(obj), "__tablename__", None))}
+    if tables:
+        _add_pending(session, tables)
+
+
+@event.listens_for(OrmSession, "do_orm_execute")
+def _on_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    name = getattr(getattr(orm_execute_state.statement, "table", None), "name", None)
+    if name:
+        _add_pending(orm_execute_state.session, [name])
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _on_after_commit(session: OrmSession) -> None:
+    pending: set[str] = session.info.pop(_PENDING_KEY, set())
+    if pending:
+        bump_data_version(pending)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _on_after_rollback(session: OrmSession) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+__all__ = ["bump_data_version", "get_data_version"]
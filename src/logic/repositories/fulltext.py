@@ -0,0 +1,192 @@
+"""SQLite FTS5 による全文検索インデックス
+
+日本語は空白で分かち書きされないため、FTS5 の ``trigram`` トークナイザで 3 文字単位の
+索引を作り、部分一致検索を索引で解決する。索引は元テーブルを参照する外部コンテンツ形式
+(``content=<table>``) とし、INSERT/UPDATE/DELETE トリガーで同期する。
+
+- スキーマは Alembic マイグレーション (``20261016_add_fulltext_search``) で作成する。
+  インメモリ DB など マイグレーションを通さない環境では `ensure_fts_schema` を使う。
+- 外部コンテンツは元テーブルの rowid で対応付けるため、VACUUM 後は `rebuild_fts_index` を実行すること。
+- trigram は 3 文字未満の語を照合できないため、その場合は `build_match_query` が None を返し、
+  呼び出し側 (`BaseRepository.search_fulltext`) が LIKE 検索へフォールバックする。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import Engine
+
+TRIGRAM_MIN_LENGTH: Final[int] = 3
+SNIPPET_OPEN: Final[str] = "["
+SNIPPET_CLOSE: Final[str] = "]"
+SNIPPET_ELLIPSIS: Final[str] = "…"
+SNIPPET_TOKENS: Final[int] = 16
+
+
+@dataclass(frozen=True, slots=True)
+class FtsIndex:
+    """全文検索インデックスの定義
+
+    Attributes:
+        source_table: 検索対象のテーブル名
+        columns: 索引に含める列名 (先頭ほど snippet の候補として優先される)
+    """
+
+    source_table: str
+    columns: tuple[str, ...]
+
+    @property
+    def table(self) -> str:
+        """FTS5 仮想テーブル名"""
+        return f"{self.source_table}_fts"
+
+    def create_statements(self) -> list[str]:
+        """仮想テーブルと同期トリガーを作成する DDL を返す
+
+        Returns:
+            list[str]: 実行順の DDL (既存の場合は何もしない)
+        """
+        # 識別子はモジュール定数のみで、ユーザー入力は含まない
+        cols = ", ".join(self.columns)
+        new_values = ", ".join(f"new.{c}" for c in self.columns)
+        old_values = ", ".join(f"old.{c}" for c in self.columns)
+        delete_row = (
+            f"INSERT INTO {self.table}({self.table}, rowid, {cols}) VALUES ('delete', old.rowid, {old_values});"  # noqa: S608
+        )
+        insert_row = f"INSERT INTO {self.table}(rowid, {cols}) VALUES (new.rowid, {new_values});"  # noqa: S608
+        return [
+            (
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+                f"{cols}, content='{self.source_table}', content_rowid='rowid', tokenize='trigram')"
+            ),
+            f"CREATE TRIGGER IF NOT EXISTS {self.table}_ai AFTER INSERT ON {self.source_table} BEGIN {insert_row} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.table}_ad AFTER DELETE ON {self.source_table} BEGIN {delete_row} END",
+            (
+                f"CREATE TRIGGER IF NOT EXISTS {self.table}_au AFTER UPDATE OF {cols} ON {self.source_table} "
+                f"BEGIN {delete_row} {insert_row} END"
+            ),
+        ]
+
+    def drop_statements(self) -> list[str]:
+        """仮想テーブルと同期トリガーを削除する DDL を返す
+
+        Returns:
+            list[str]: 実行順の DDL
+        """
+        return [
+            f"DROP TRIGGER IF EXISTS {self.table}_au",
+            f"DROP TRIGGER IF EXISTS {self.table}_ad",
+            f"DROP TRIGGER IF EXISTS {self.table}_ai",
+            f"DROP TABLE IF EXISTS {self.table}",
+        ]
+
+    def rebuild_statement(self) -> str:
+        """元テーブルから索引を再構築する文を返す"""
+        return f"INSERT INTO {self.table}({self.table}) VALUES ('rebuild')"  # noqa: S608
+
+
+MEMO_FTS: Final = FtsIndex("memos", ("title", "content"))
+TASK_FTS: Final = FtsIndex("tasks", ("title", "description"))
+PROJECT_FTS: Final = FtsIndex("projects", ("title", "description"))
+TERM_FTS: Final = FtsIndex("terms", ("key", "title", "description"))
+
+FTS_INDEXES: Final[tuple[FtsIndex, ...]] = (MEMO_FTS, TASK_FTS, PROJECT_FTS, TERM_FTS)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit[T]:
+    """全文検索のヒット
+
+    Attributes:
+        item: ヒットしたエンティティ
+        score: 関連度 (大きいほど関連が高い。LIKE フォールバック時は 0.0)
+        snippet: 一致箇所を ``[...]`` で囲んだ抜粋
+    """
+
+    item: T
+    score: float
+    snippet: str
+
+
+def build_match_query(query: str, columns: Sequence[str] | None = None) -> str | None:
+    """検索文字列を FTS5 の MATCH 式に変換する
+
+    空白区切りの各語をフレーズとして引用符で囲み、AND で結合する。
+    FTS5 の演算子 (``OR``/``NEAR``/``*`` 等) は文字列として扱われる。
+
+    Args:
+        query: ユーザー入力の検索文字列
+        columns: 照合する列 (None の場合は索引のすべての列)
+
+    Returns:
+        str | None: MATCH 式。空、または trigram で照合できない短い語を含む場合は None
+    """
+    terms = query.split()
+    if not terms or any(len(term) < TRIGRAM_MIN_LENGTH for term in terms):
+        return None
+    match = " AND ".join('"' + term.replace('"', '""') + '"' for term in terms)
+    if columns:
+        # 列名はモジュール定数の索引定義から渡され、ユーザー入力は含まない
+        return f"{{{' '.join(columns)}}} : ({match})"
+    return match
+
+
+def make_snippet(value: str | None, query: str, *, width: int = SNIPPET_TOKENS) -> str | None:
+    """LIKE フォールバック用に一致箇所の抜粋を作る
+
+    Args:
+        value: 抜粋元の文字列
+        query: 検索文字列 (先頭の語で位置を探す)
+        width: 一致箇所の前後に含める文字数
+
+    Returns:
+        str | None: 抜粋。一致しない場合は None
+    """
+    terms = query.split()
+    if not value or not terms:
+        return None
+    needle = terms[0]
+    pos = value.lower().find(needle.lower())
+    if pos < 0:
+        return None
+    start = max(0, pos - width)
+    end = min(len(value), pos + len(needle) + width)
+    head = SNIPPET_ELLIPSIS if start > 0 else ""
+    tail = SNIPPET_ELLIPSIS if end < len(value) else ""
+    matched = value[pos : pos + len(needle)]
+    return f"{head}{value[start:pos]}{SNIPPET_OPEN}{matched}{SNIPPET_CLOSE}{value[pos + len(needle) : end]}{tail}"
+
+
+def ensure_fts_schema(engine: Engine) -> None:
+    """全文検索インデックスを作成し、既存行を索引へ取り込む
+
+    マイグレーションを通さないインメモリ DB やテストで使用する。
+
+    Args:
+        engine: 対象のエンジン
+    """
+    with engine.begin() as conn:
+        for index in FTS_INDEXES:
+            for statement in index.create_statements():
+                conn.execute(text(statement))
+            conn.execute(text(index.rebuild_statement()))
+
+
+def rebuild_fts_index(engine: Engine) -> None:
+    """全文検索インデックスを元テーブルから再構築する
+
+    VACUUM で rowid が振り直された後や、索引の不整合が疑われる場合に実行する。
+
+    Args:
+        engine: 対象のエンジン
+    """
+    with engine.begin() as conn:
+        for index in FTS_INDEXES:
+            conn.execute(text(index.rebuild_statement()))
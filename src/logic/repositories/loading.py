@@ -0,0 +1,147 @@
+"""関連エンティティの読み込みプロファイル
+
+``with_details`` の全部入り / 何も読まないの二択ではなく、画面や処理ごとに必要な関連と列だけを
+読み込むための名前付きプロファイルを定義する。
+
+- ``relationships``: ``selectinload`` で事前読み込みする関連 (``"tasks.tags"`` のようにドット区切りで入れ子を指定)
+- ``columns``: ``load_only`` で読み込む列 (None の場合は全列)。それ以外の列へのアクセスは例外になる
+- ``strict``: True の場合、指定外の関連は ``raiseload`` にして暗黙の遅延読み込み (N+1) を防ぐ
+
+読み込まれなかった関連・列は `as_loaded` を通すと「存在しない属性」として扱われるため、
+読み取りモデルへの変換時には既定値 (空リスト・None 等) になる。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final, Literal
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import load_only, raiseload, selectinload
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+type LoadProfileName = Literal["list", "card", "detail", "review"]
+"""読み込みプロファイル名
+
+- ``list``: 一覧の行表示用。関連を読まない
+- ``card``: カード表示用。タグなど表示に必要な関連だけを読む
+- ``detail``: 詳細表示用。従来の ``with_details=True`` と同じく全関連を読む
+- ``review``: 週次レビュー等の集計用。集計に使う関連・列だけを読む
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class LoadProfile:
+    """読み込みプロファイル
+
+    Attributes:
+        relationships: 事前読み込みする関連のパス (ドット区切りで入れ子を指定)
+        columns: 読み込む列名 (None の場合は全列)
+        strict: 指定外の関連を raiseload にするかどうか
+    """
+
+    relationships: tuple[str, ...] = ()
+    columns: tuple[str, ...] | None = None
+    strict: bool = True
+
+    def options(self, model_class: type[Any]) -> list[Any]:
+        """SQLAlchemy のローダーオプションを生成する
+
+        Args:
+            model_class: 読み込み対象のテーブルモデル
+
+        Returns:
+            list[Any]: ``Select.options`` に渡すオプション
+        """
+        options: list[Any] = []
+        for path in self.relationships:
+            loader: Any = None
+            owner: Any = model_class
+            for name in path.split("."):
+                attr = getattr(owner, name)
+                loader = selectinload(attr) if loader is None else loader.selectinload(attr)
+                owner = attr.property.mapper.class_
+            options.append(loader)
+        if self.columns is not None:
+            options.append(load_only(*[getattr(model_class, name) for name in self.columns], raiseload=True))
+        if self.strict:
+            options.append(raiseload("*"))
+        return options
+
+
+DEFAULT_LIST_PROFILE: Final = LoadProfile()
+"""関連を読まない既定の ``list`` プロファイル"""
+
+
+def detail_profile(load_options: list[Any]) -> LoadProfile:
+    """リポジトリの ``load_options`` から ``detail`` プロファイルを生成する (従来の ``with_details=True`` 相当)
+
+    Args:
+        load_options: リポジトリの事前読み込み対象の関連属性
+
+    Returns:
+        LoadProfile: 全関連を読み込み、遅延読み込みも許可するプロファイル
+    """
+    return LoadProfile(relationships=tuple(option.key for option in load_options), strict=False)
+
+
+def resolve_profiles(
+    load_options: list[Any], profiles: Mapping[LoadProfileName, LoadProfile] | None
+) -> dict[LoadProfileName, LoadProfile]:
+    """リポジトリ固有のプロファイルに既定の ``list`` / ``detail`` を補う
+
+    Args:
+        load_options: リポジトリの事前読み込み対象の関連属性
+        profiles: リポジトリ固有のプロファイル
+
+    Returns:
+        dict[LoadProfileName, LoadProfile]: 名前→プロファイル
+    """
+    resolved: dict[LoadProfileName, LoadProfile] = {
+        "list": DEFAULT_LIST_PROFILE,
+        "detail": detail_profile(load_options),
+    }
+    resolved.update(profiles or {})
+    return resolved
+
+
+class _LoadedView:
+    """読み込み済みの属性だけを公開するエンティティのラッパー
+
+    raiseload / load_only で読み込まなかった属性は AttributeError となり、
+    pydantic の ``from_attributes`` 変換では未指定 (既定値) として扱われる。
+    """
+
+    __slots__ = ("_entity",)
+
+    def __init__(self, entity: object) -> None:
+        self._entity = entity
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        try:
+            value = getattr(self._entity, name)
+        except InvalidRequestError as e:
+            # lazy="raise" / raiseload=True の属性 (プロファイルで読み込んでいない)
+            raise AttributeError(name) from e
+        if isinstance(value, list):
+            return [as_loaded(item) for item in value]
+        return as_loaded(value)
+
+
+def as_loaded(value: Any) -> Any:  # noqa: ANN401
+    """ORM エンティティを、読み込み済みの属性だけを公開するビューに変換する
+
+    ORM エンティティ以外はそのまま返す。
+
+    Args:
+        value: 変換対象
+
+    Returns:
+        Any: ORM エンティティの場合はビュー、それ以外は元の値
+    """
+    if sa_inspect(value, raiseerr=False) is None or isinstance(value, type):
+        return value
+    return _LoadedView(value)
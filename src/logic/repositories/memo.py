@@ -6,11 +6,35 @@ from datetime import datetime
 from typing import Any, cast
 
 from loguru import logger
-from sqlmodel import Session, func, select
+from sqlmodel import Session, col, func, select
 
 from errors import NotFoundError
 from logic.repositories.base import BaseRepository
-from models import Memo, MemoCreate, MemoStatus, MemoTagLink, MemoUpdate, Tag, Task
+from logic.repositories.fulltext import MEMO_FTS
+from logic.repositories.loading import LoadProfile, LoadProfileName
+from logic.repositories.query import TagLink
+from logic.repositories.read_cache import TAG_READ_CACHE
+from models import AiSuggestionStatus, Memo, MemoCreate, MemoStatus, MemoTagLink, MemoUpdate, Tag, Task
+
+# AI 分析ログ (JSON) は一覧・集計では使わないため読み込まない
+_SUMMARY_COLUMNS = (
+    "id",
+    "title",
+    "content",
+    "status",
+    "ai_suggestion_status",
+    "processed_at",
+    "created_at",
+    "updated_at",
+)
+
+MEMO_LOAD_PROFILES: dict[LoadProfileName, LoadProfile] = {
+    "list": LoadProfile(columns=_SUMMARY_COLUMNS),
+    "card": LoadProfile(relationships=("tags",)),
+    "detail": LoadProfile(relationships=("tags", "tasks", "tasks.tags"), strict=False),
+    "review": LoadProfile(columns=_SUMMARY_COLUMNS),
+}
+"""メモの読み込みプロファイル"""
 
 
 class MemoRepository(BaseRepository[Memo, MemoCreate, MemoUpdate]):
@@ -27,7 +51,13 @@ class MemoRepository(BaseRepository[Memo, MemoCreate, MemoUpdate]):
             session: データベースセッション
         """
         self.model_class = Memo
-        super().__init__(session, load_options=[Memo.tags, Memo.tasks])
+        super().__init__(
+            session,
+            load_options=[Memo.tags, Memo.tasks],
+            fts_index=MEMO_FTS,
+            tag_link=TagLink(MemoTagLink, "memo_id"),
+            load_profiles=MEMO_LOAD_PROFILES,
+        )
 
     def _check_exists_tag(self, tag_id: uuid.UUID) -> Tag:
         """タグが存在するか確認する
@@ -41,7 +71,7 @@ class MemoRepository(BaseRepository[Memo, MemoCreate, MemoUpdate]):
         Raises:
             NotFoundError: タグが存在しない場合
         """
-        tag = self.session.get(Tag, tag_id)
+        tag = TAG_READ_CACHE.get_entity(self.session, tag_id)
         if tag is None:
             msg = f"タグが見つかりません: {tag_id}"
             logger.warning(msg)
@@ -214,12 +244,15 @@ class MemoRepository(BaseRepository[Memo, MemoCreate, MemoUpdate]):
     # ==============================================================================
     # ==============================================================================
 
-    def list_by_status(self, status: MemoStatus, *, with_details: bool = False) -> list[Memo]:
+    def list_by_status(
+        self, status: MemoStatus, *, with_details: bool = False, profile: LoadProfileName | None = None
+    ) -> list[Memo]:
         """指定されたステータスのメモ一覧を取得する
 
         Args:
             status: メモステータス
             with_details: 詳細情報を含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
 
         Returns:
             list[Memo]: 指定された条件に一致するメモ一覧
@@ -228,16 +261,18 @@ class MemoRepository(BaseRepository[Memo, MemoCreate, MemoUpdate]):
             NotFoundError: エンティティが存在しない場合
         """
         stmt = select(Memo).where(Memo.status == status)
-        if with_details:
-            stmt = self._apply_eager_loading(stmt)
+        stmt = self._apply_loading(stmt, with_details=with_details, profile=profile)
         return self._gets_by_statement(stmt)
 
-    def list_by_tag(self, tag_id: uuid.UUID, *, with_details: bool = False) -> list[Memo]:
+    def list_by_tag(
+        self, tag_id: uuid.UUID, *, with_details: bool = False, profile: LoadProfileName | None = None
+    ) -> list[Memo]:
         """指定されたタグが付与されたメモ一覧を取得する
 
         Args:
             tag_id: タグID
             with_details: 詳細情報を含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
 
         Returns:
             list[Memo]: 指定された条件に一致するメモ一覧
@@ -247,8 +282,7 @@ class MemoRepository(BaseRepository[Memo, MemoCreate, MemoUpdate]):
         """
         # 特定のタグが付与されたメモを取得
         stmt = select(Memo).join(MemoTagLink).join(Tag).where(Tag.id == tag_id)
-        if with_details:
-            stmt = self._apply_eager_loading(stmt)
+        stmt = self._apply_loading(stmt, with_details=with_details, profile=profile)
         return self._gets_by_statement(stmt)
 
     def search_by_title(self, title_query: str, *, with_details: bool = False) -> list[Memo]:
@@ -294,6 +328,7 @@ class MemoRepository(BaseRepository[Memo, MemoCreate, MemoUpdate]):
         statuses: Iterable[MemoStatus] | None = None,
         limit: int = 20,
         with_details: bool = True,
+        profile: LoadProfileName | None = None,
     ) -> list[Memo]:
         """タスク化されていない未処理メモを抽出する。"""
         status_values = list(statuses or (MemoStatus.INBOX, MemoStatus.IDEA))
@@ -309,8 +344,50 @@ class MemoRepository(BaseRepository[Memo, MemoCreate, MemoUpdate]):
             .order_by(created_col.desc())
             .limit(limit)
         )
+        stmt = self._apply_loading(stmt, with_details=with_details, profile=profile)
 
-        if with_details:
-            stmt = self._apply_eager_loading(stmt)
+        return self._gets_by_statement(stmt)
+
+    def list_prefetch_candidates(self, *, limit: int = 10) -> list[Memo]:
+        """AI 提案を先読みする候補 (INBOX かつ AI 提案未依頼) を新しい順に取得する
+
+        Args:
+            limit: 取得する最大件数
+
+        Returns:
+            list[Memo]: 候補のメモ一覧 (要約列のみ)
+
+        Raises:
+            NotFoundError: 候補が存在しない場合
+        """
+        created_col = cast("Any", Memo.created_at)
+        stmt = (
+            select(Memo)
+            .where(Memo.status == MemoStatus.INBOX)
+            .where(Memo.ai_suggestion_status == AiSuggestionStatus.NOT_REQUESTED)
+            .order_by(created_col.desc())
+            .limit(limit)
+        )
+        stmt = self._apply_loading(stmt, with_details=False, profile="list")
 
         return self._gets_by_statement(stmt)
+
+    # ==============================================================================
+    # 集計
+    # ==============================================================================
+
+    def count_by_status(self) -> dict[MemoStatus, int]:
+        """ステータスごとのメモ件数を 1 回の GROUP BY で取得する
+
+        Returns:
+            dict[MemoStatus, int]: ステータスごとの件数 (0 件のステータスは含まれない)
+        """
+        return self._count_grouped(col(Memo.status))
+
+    def count_by_status_and_ai_status(self) -> dict[tuple[MemoStatus, AiSuggestionStatus], int]:
+        """ステータス・AI提案状態ごとのメモ件数を 1 回の GROUP BY で取得する
+
+        Returns:
+            dict[tuple[MemoStatus, AiSuggestionStatus], int]: (ステータス, AI提案状態) ごとの件数
+        """
+        return self._count_grouped(col(Memo.status), col(Memo.ai_suggestion_status))
@@ -1,13 +1,26 @@
 """プロジェクトリポジトリの実装"""
 
 import uuid
+from collections.abc import Iterable
+from datetime import datetime
 
 from loguru import logger
-from sqlmodel import Session, func, select
+from sqlalchemy import update
+from sqlmodel import Session, col, select
 
-from errors import NotFoundError
+from errors import NotFoundError, RepositoryError
 from logic.repositories.base import BaseRepository
-from models import Project, ProjectCreate, ProjectStatus, ProjectUpdate, Task
+from logic.repositories.fulltext import PROJECT_FTS
+from logic.repositories.loading import LoadProfile, LoadProfileName
+from logic.repositories.read_cache import PROJECT_READ_CACHE
+from models import Project, ProjectCreate, ProjectStatus, ProjectUpdate, Task, TaskStatus
+
+PROJECT_LOAD_PROFILES: dict[LoadProfileName, LoadProfile] = {
+    "card": LoadProfile(relationships=("tasks",)),
+    "detail": LoadProfile(relationships=("tasks", "tasks.tags"), strict=False),
+    "review": LoadProfile(),
+}
+"""プロジェクトの読み込みプロファイル (``list`` は関連を読まない既定値)"""
 
 
 class ProjectRepository(BaseRepository[Project, ProjectCreate, ProjectUpdate]):
@@ -24,7 +37,13 @@ class ProjectRepository(BaseRepository[Project, ProjectCreate, ProjectUpdate]):
             session: データベースセッション
         """
         self.model_class = Project
-        super().__init__(session, load_options=[Project.tasks])
+        super().__init__(
+            session,
+            load_options=[Project.tasks],
+            fts_index=PROJECT_FTS,
+            read_cache=PROJECT_READ_CACHE,
+            load_profiles=PROJECT_LOAD_PROFILES,
+        )
 
     def _check_exists_task(self, task_id: uuid.UUID) -> Task:
         """タスクが存在するか確認する
@@ -122,17 +141,51 @@ class ProjectRepository(BaseRepository[Project, ProjectCreate, ProjectUpdate]):
 
         return project
 
+    def bulk_assign_tasks(self, project_id: uuid.UUID | None, task_ids: Iterable[uuid.UUID]) -> int:
+        """複数のタスクの所属プロジェクトを 1 回の UPDATE で変更する
+
+        コミットは行わない (呼び出し側の Unit of Work がまとめてコミットする)。
+
+        Args:
+            project_id: 設定するプロジェクトID (None の場合はプロジェクトから外す)
+            task_ids: 対象タスクのID
+
+        Returns:
+            int: 更新したタスクの件数
+
+        Raises:
+            NotFoundError: 存在しないタスクが含まれる場合
+            RepositoryError: データベース操作エラー
+        """
+        ids = list(dict.fromkeys(task_ids))
+        if not ids:
+            return 0
+        stmt = update(Task).where(col(Task.id).in_(ids)).values(project_id=project_id, updated_at=datetime.now())
+        try:
+            updated = int(self.session.exec(stmt).rowcount)
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = "タスクの所属プロジェクトの一括更新に失敗しました"
+            raise RepositoryError(msg) from e
+        if updated != len(ids):
+            msg = f"存在しないタスクが含まれています: {len(ids) - updated} 件"
+            logger.warning(msg)
+            raise NotFoundError(msg)
+        logger.debug(f"タスク {updated} 件の所属プロジェクトを {project_id} に変更しました。")
+        return updated
+
     # ==============================================================================
     # ==============================================================================
     # get functions
     # ==============================================================================
     # ==============================================================================
 
-    def list_by_status(self, status: ProjectStatus) -> list[Project]:
+    def list_by_status(self, status: ProjectStatus, *, profile: LoadProfileName | None = None) -> list[Project]:
         """指定されたステータスのプロジェクト一覧を取得する
 
         Args:
             status: プロジェクトステータス
+            profile: 読み込みプロファイル名 (未指定時は関連を遅延読み込みする)
 
         Returns:
             list[Project]: 指定された条件に一致するプロジェクト一覧
@@ -141,13 +194,16 @@ class ProjectRepository(BaseRepository[Project, ProjectCreate, ProjectUpdate]):
             NotFoundError: エンティティが存在しない場合
         """
         stmt = select(Project).where(Project.status == status)
+        stmt = self._apply_loading(stmt, profile=profile)
         return self._gets_by_statement(stmt)
 
     def search_by_title(self, title_query: str) -> list[Project]:
         """タイトルでプロジェクトを検索する
 
+        全文検索インデックスのタイトル列で照合する (3 文字未満の語を含む場合は LIKE)。
+
         Args:
-            title_query: 検索クエリ（部分一致）
+            title_query: 検索クエリ（部分一致。空白区切りの語はすべて含む必要がある）
 
         Returns:
             list[Project]: 検索条件に一致するプロジェクト一覧
@@ -155,5 +211,50 @@ class ProjectRepository(BaseRepository[Project, ProjectCreate, ProjectUpdate]):
         Raises:
             NotFoundError: エンティティが存在しない場合
         """
-        stmt = select(Project).where(func.lower(Project.title).like(f"%{title_query.lower()}%"))
+        stmt = select(Project).where(self._fulltext_condition(title_query, columns=("title",)))
         return self._gets_by_statement(stmt)
+
+    def count_by_status(self) -> dict[ProjectStatus, int]:
+        """ステータスごとのプロジェクト件数を 1 回の GROUP BY で取得する
+
+        Returns:
+            dict[ProjectStatus, int]: ステータスごとの件数 (0 件のステータスは含まれない)
+        """
+        return self._count_grouped(col(Project.status))
+
+    def list_task_rows(self, project_ids: Iterable[uuid.UUID]) -> list[tuple[uuid.UUID, uuid.UUID, str, TaskStatus]]:
+        """複数プロジェクトに属するタスクの軽量な行を 1 回のクエリで取得する
+
+        ORM エンティティや関連をロードせず、一覧表示に必要な列だけを取得する。
+
+        Args:
+            project_ids: 対象のプロジェクトID
+
+        Returns:
+            list[tuple[uuid.UUID, uuid.UUID, str, TaskStatus]]:
+                (プロジェクトID, タスクID, タイトル, ステータス) の一覧 (プロジェクト・作成日時順)
+
+        Raises:
+            RepositoryError: 取得に失敗した場合
+        """
+        ids = list(dict.fromkeys(project_ids))
+        if not ids:
+            return []
+        project_col = col(Task.project_id)
+        stmt = (
+            select(project_col, col(Task.id), col(Task.title), col(Task.status))
+            .where(project_col.in_(ids))
+            .order_by(project_col, col(Task.created_at), col(Task.id))
+        )
+        try:
+            rows = self.session.exec(stmt).all()
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = "プロジェクトのタスク一覧の取得に失敗しました"
+            raise RepositoryError(msg) from e
+        # project_id は IN 条件で絞り込み済み、id は主キーのため None にはならない
+        return [
+            (project_id, task_id, title, status)
+            for project_id, task_id, title, status in rows
+            if project_id is not None and task_id is not None
+        ]
@@ -0,0 +1,238 @@
+"""検索条件の仕様 (Specification) と SQL への変換
+
+テキスト・ステータス・タグ (OR/AND)・プロジェクト・期限日範囲・並び順・件数を
+`QuerySpec` に積み上げ、`compile_query` で 1 本の SELECT 文へ変換する。
+タグ条件は中間テーブルへのサブクエリ (IN) で表現するため、JOIN による重複行は発生しない。
+
+使用例:
+    >>> spec = QuerySpec().with_text("議事録").with_statuses(MemoStatus.INBOX).with_any_tags(tag_ids).paginate(50)
+    >>> memos = memo_repo.find(spec)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Literal
+
+from sqlalchemy import and_, column, func, literal_column, or_, table
+from sqlmodel import SQLModel, col, select
+
+from errors import ValidationError
+from logic.repositories.fulltext import FtsIndex, build_match_query
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Iterable
+    from datetime import date
+    from enum import Enum
+
+    from sqlalchemy.sql import ColumnElement
+    from sqlmodel.sql.expression import SelectOfScalar
+
+type SortKey = Literal["relevance", "created_at", "updated_at", "title", "due_date"]
+"""並び順のキー。``relevance`` は全文検索の関連度 (テキスト条件がない場合は updated_at)"""
+
+
+@dataclass(frozen=True, slots=True)
+class TagLink:
+    """タグ中間テーブルの定義
+
+    Attributes:
+        model: 中間テーブルのモデル (例: ``MemoTagLink``)
+        entity_column: エンティティ側の外部キー列名 (例: ``memo_id``)
+        tag_column: タグ側の外部キー列名
+    """
+
+    model: type[SQLModel]
+    entity_column: str
+    tag_column: str = "tag_id"
+
+
+@dataclass(frozen=True, slots=True)
+class QuerySpec:
+    """検索条件の仕様
+
+    各 ``with_*`` メソッドは条件を追加した新しい仕様を返すため、部分的な仕様を共有・合成できる。
+
+    Attributes:
+        text: 全文検索する文字列 (空白区切りの語はすべて含む)
+        statuses: ステータスの候補 (いずれかに一致)
+        any_tags: いずれかを持つタグID (OR)
+        all_tags: すべてを持つタグID (AND)
+        project_id: 所属プロジェクトID
+        due_from: 期限日の下限 (含む)
+        due_to: 期限日の上限 (含む)
+        sort: 並び順のキー
+        descending: 降順で並べるかどうか
+        limit: 最大取得件数 (None で無制限)
+        offset: 読み飛ばす件数
+    """
+
+    text: str | None = None
+    statuses: tuple[Enum, ...] = ()
+    any_tags: tuple[uuid.UUID, ...] = ()
+    all_tags: tuple[uuid.UUID, ...] = ()
+    project_id: uuid.UUID | None = None
+    due_from: date | None = None
+    due_to: date | None = None
+    sort: SortKey = "relevance"
+    descending: bool = True
+    limit: int | None = None
+    offset: int = 0
+
+    def with_text(self, text: str | None) -> QuerySpec:
+        """テキスト条件を設定する (空白のみの場合は条件なし)"""
+        normalized = text.strip() if text else ""
+        return replace(self, text=normalized or None)
+
+    def with_statuses(self, *statuses: Enum | None) -> QuerySpec:
+        """ステータス条件を設定する (None は無視)"""
+        return replace(self, statuses=tuple(s for s in statuses if s is not None))
+
+    def with_any_tags(self, tag_ids: Iterable[uuid.UUID] | None) -> QuerySpec:
+        """いずれかのタグを持つ条件を設定する"""
+        return replace(self, any_tags=tuple(dict.fromkeys(tag_ids or ())))
+
+    def with_all_tags(self, tag_ids: Iterable[uuid.UUID] | None) -> QuerySpec:
+        """すべてのタグを持つ条件を設定する"""
+        return replace(self, all_tags=tuple(dict.fromkeys(tag_ids or ())))
+
+    def with_project(self, project_id: uuid.UUID | None) -> QuerySpec:
+        """所属プロジェクト条件を設定する"""
+        return replace(self, project_id=project_id)
+
+    def with_due_range(self, due_from: date | None = None, due_to: date | None = None) -> QuerySpec:
+        """期限日の範囲条件を設定する
+
+        Raises:
+            ValidationError: 下限が上限より後の場合
+        """
+        if due_from is not None and due_to is not None and due_from > due_to:
+            msg = f"期限日の範囲が不正です: {due_from} > {due_to}"
+            raise ValidationError(msg)
+        return replace(self, due_from=due_from, due_to=due_to)
+
+    def order_by(self, sort: SortKey, *, descending: bool = True) -> QuerySpec:
+        """並び順を設定する"""
+        return replace(self, sort=sort, descending=descending)
+
+    def paginate(self, limit: int | None, offset: int = 0) -> QuerySpec:
+        """取得件数と開始位置を設定する
+
+        Raises:
+            ValidationError: 件数または開始位置が負の場合
+        """
+        if (limit is not None and limit < 0) or offset < 0:
+            msg = f"取得件数・開始位置は 0 以上で指定してください: limit={limit}, offset={offset}"
+            raise ValidationError(msg)
+        return replace(self, limit=limit, offset=offset)
+
+
+def _require_column(model: type[SQLModel], name: str) -> Any:  # noqa: ANN401
+    if not hasattr(model, name):
+        msg = f"{model.__name__} は {name} による絞り込み・並び替えに対応していません"
+        raise ValidationError(msg)
+    return col(getattr(model, name))
+
+
+def _tag_condition(
+    model: type[SQLModel], link: TagLink | None, tag_ids: tuple[uuid.UUID, ...], *, match_all: bool
+) -> ColumnElement[bool]:
+    if link is None:
+        msg = f"{model.__name__} はタグによる絞り込みに対応していません"
+        raise ValidationError(msg)
+    entity_col = col(getattr(link.model, link.entity_column))
+    tag_col = col(getattr(link.model, link.tag_column))
+    subquery = select(entity_col).where(tag_col.in_(tag_ids))
+    if match_all:
+        subquery = subquery.group_by(entity_col).having(func.count(func.distinct(tag_col)) == len(tag_ids))
+    return col(model.id).in_(subquery)  # type: ignore[attr-defined]
+
+
+def _like_condition(model: type[SQLModel], fts_index: FtsIndex | None, text: str) -> ColumnElement[bool]:
+    names = fts_index.columns if fts_index is not None else ("title",)
+    columns = [_require_column(model, name) for name in names]
+    return and_(*[or_(*[func.lower(c).contains(term.lower()) for c in columns]) for term in text.split()])
+
+
+def _filter_conditions(spec: QuerySpec, model: type[SQLModel], tag_link: TagLink | None) -> list[ColumnElement[bool]]:
+    conditions: list[ColumnElement[bool]] = []
+    if spec.statuses:
+        conditions.append(_require_column(model, "status").in_(spec.statuses))
+    if spec.any_tags:
+        conditions.append(_tag_condition(model, tag_link, spec.any_tags, match_all=False))
+    if spec.all_tags:
+        conditions.append(_tag_condition(model, tag_link, spec.all_tags, match_all=True))
+    if spec.project_id is not None:
+        conditions.append(_require_column(model, "project_id") == spec.project_id)
+    if spec.due_from is not None:
+        conditions.append(_require_column(model, "due_date") >= spec.due_from)
+    if spec.due_to is not None:
+        conditions.append(_require_column(model, "due_date") <= spec.due_to)
+    return conditions
+
+
+def _order_clauses(spec: QuerySpec, model: type[SQLModel], rank: ColumnElement[float] | None) -> list[Any]:
+    id_col = col(model.id)  # type: ignore[attr-defined]
+    if spec.sort == "relevance" and rank is not None:
+        # bm25 は小さいほど関連度が高い
+        order = [rank.asc() if spec.descending else rank.desc()]
+    else:
+        sort_col = _require_column(model, "updated_at" if spec.sort == "relevance" else spec.sort)
+        order = [sort_col.desc().nulls_last() if spec.descending else sort_col.asc().nulls_last()]
+    # 同値の行でもページ間で順序が揺れないよう id で一意にする
+    order.append(id_col.desc() if spec.descending else id_col.asc())
+    return order
+
+
+def compile_query(
+    spec: QuerySpec,
+    model: type[SQLModel],
+    *,
+    tag_link: TagLink | None = None,
+    fts_index: FtsIndex | None = None,
+    fts_enabled: bool = False,
+) -> SelectOfScalar:
+    """仕様を 1 本の SELECT 文へ変換する
+
+    テキスト条件は FTS5 索引が使える場合は MATCH (関連度順に並べ替え可能)、
+    使えない場合や 3 文字未満の語を含む場合は索引対象列への LIKE で評価する。
+
+    Args:
+        spec: 検索条件
+        model: 検索対象のモデル
+        tag_link: タグ中間テーブルの定義 (タグ条件を使う場合に必須)
+        fts_index: 全文検索インデックスの定義
+        fts_enabled: FTS5 索引が利用可能かどうか
+
+    Returns:
+        SelectOfScalar: ORDER BY / LIMIT / OFFSET まで付与した SELECT 文
+
+    Raises:
+        ValidationError: モデルが対応していない条件が指定された場合
+    """
+    stmt = select(model)
+    conditions: list[ColumnElement[bool]] = []
+    rank = None
+
+    if spec.text:
+        match = build_match_query(spec.text) if fts_enabled and fts_index is not None else None
+        if match is not None and fts_index is not None:
+            fts_ref = literal_column(fts_index.table)
+            fts_table = table(fts_index.table, column("rowid"))
+            stmt = stmt.join(fts_table, fts_table.c.rowid == literal_column(f"{fts_index.source_table}.rowid"))
+            conditions.append(fts_ref.op("MATCH")(match))
+            rank = func.bm25(fts_ref)
+        else:
+            conditions.append(_like_condition(model, fts_index, spec.text))
+
+    conditions.extend(_filter_conditions(spec, model, tag_link))
+    if conditions:
+        stmt = stmt.where(*conditions)
+
+    stmt = stmt.order_by(*_order_clauses(spec, model, rank))
+    if spec.limit is not None:
+        stmt = stmt.limit(spec.limit)
+    if spec.offset:
+        stmt = stmt.offset(spec.offset)
+    return stmt
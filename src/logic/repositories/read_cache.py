@@ -0,0 +1,340 @@
+"""タグ・プロジェクトのプロセス共有読み取りキャッシュ
+
+タグとプロジェクトは件数が少なく変更も稀なため、Unit of Work (セッション) ごとに読み直さず、
+エンジン単位のスナップショットをプロセス全体で共有する。
+
+- 読み取りはリードスルー。スナップショットが無いか、バージョンが古い場合だけ DB から全件を読み込む。
+- 書き込みはセッションイベントで検知する。リポジトリ経由かどうかを問わず、対象テーブルへの
+  flush / 一括 UPDATE・DELETE・INSERT があるとバージョンを進め、コミット・ロールバック時にも再度進める。
+- 未コミットの書き込みを含むセッションではキャッシュを使わず DB を直接参照する (自分の変更を読めるようにするため)。
+- ORM エンティティが必要な呼び出し側には、キャッシュ済みの切り離し (detached) インスタンスを
+  ``Session.merge(load=False)`` でセッションへ取り込んで返すため、DB への往復は発生しない。
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+from loguru import logger
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.sql.expression import TableClause
+
+from models import BaseModel, Project, ProjectRead, Tag, TagRead
+
+if TYPE_CHECKING:
+    import uuid
+
+    from sqlalchemy import Connection, Engine, Table
+    from sqlalchemy.orm import ORMExecuteState, UOWTransaction
+    from sqlmodel import Session
+
+_PENDING_KEY: Final = "kage.read_cache.pending"
+"""`Session.info` のキー。未コミットの書き込みがあるキャッシュの集合"""
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """読み取りキャッシュの監視用カウンタ
+
+    Attributes:
+        name: キャッシュ名
+        hits: スナップショットから応答した回数
+        misses: スナップショットを使えず DB を参照した回数 (読み込み・バイパスを含む)
+        loads: DB から全件を読み込んだ回数
+        invalidations: 書き込みによりバージョンを進めた回数
+        version: 現在のバージョン
+        size: 読み込み済みスナップショットの合計件数
+    """
+
+    name: str
+    hits: int
+    misses: int
+    loads: int
+    invalidations: int
+    version: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """ヒット率 (参照が無い場合は 0.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class _Snapshot[ModelT: BaseModel, ReadT: BaseModel]:
+    version: int
+    reads: dict[uuid.UUID, ReadT]
+    entities: dict[uuid.UUID, ModelT]
+    ids_by_name: dict[str, uuid.UUID]
+
+
+class EntityReadCache[ModelT: BaseModel, ReadT: BaseModel]:
+    """バージョン付きのリードスルーキャッシュ
+
+    名前→ID、ID→読み取りモデル、ID→ORM エンティティの参照を DB への往復なしで提供する。
+    スナップショットはエンジンごとに保持するため、テストなどで複数の DB を扱っても混ざらない。
+    """
+
+    def __init__(self, name: str, model_class: type[ModelT], read_model: type[ReadT], *, name_field: str) -> None:
+        """EntityReadCache を初期化する
+
+        Args:
+            name: 監視用のキャッシュ名
+            model_class: キャッシュ対象のテーブルモデル
+            read_model: 返却する読み取りモデル (関連は含まない)
+            name_field: 名前→ID 参照に使う列名
+        """
+        self.name = name
+        self.model_class = model_class
+        self.read_model = read_model
+        self.name_field = name_field
+        self._table: Table = model_class.__table__  # type: ignore[attr-defined]
+        self._lock = threading.RLock()
+        self._version = 0
+        self._snapshots: weakref.WeakKeyDictionary[Engine | Connection, _Snapshot[ModelT, ReadT]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._invalidations = 0
+
+    @property
+    def version(self) -> int:
+        """現在のバージョン (書き込みのたびに進む)"""
+        return self._version
+
+    def covers(self, target: object) -> bool:
+        """対象のテーブル・エンティティがこのキャッシュの管理対象かどうか"""
+        if isinstance(target, TableClause):
+            # ORM の DML 文はアノテーション付きの Table を持つため名前で比較する
+            return target.name == self._table.name
+        return isinstance(target, self.model_class)
+
+    # ==============================================================================
+    # 参照
+    # ==============================================================================
+
+    def list_reads(self, session: Session) -> list[ReadT]:
+        """全件の読み取りモデルを取得する
+
+        Args:
+            session: 呼び出し側のセッション
+
+        Returns:
+            list[ReadT]: 全件 (名前順)
+        """
+        snapshot = self._snapshot(session)
+        if snapshot is None:
+            return self._sorted(self._read_rows(session)[0].values())
+        return self._sorted(snapshot.reads.values())
+
+    def get_read(self, session: Session, entity_id: uuid.UUID) -> ReadT | None:
+        """ID で読み取りモデルを取得する
+
+        Args:
+            session: 呼び出し側のセッション
+            entity_id: エンティティのID
+
+        Returns:
+            ReadT | None: 見つかった読み取りモデル (存在しない場合は None)
+        """
+        snapshot = self._snapshot(session)
+        if snapshot is None:
+            entity = session.get(self.model_class, entity_id)
+            return None if entity is None else self.read_model.model_validate(entity.model_dump())
+        return snapshot.reads.get(entity_id)
+
+    def find_id(self, session: Session, name: str) -> uuid.UUID | None:
+        """名前で ID を取得する
+
+        Args:
+            session: 呼び出し側のセッション
+            name: `name_field` の値
+
+        Returns:
+            uuid.UUID | None: 見つかったID (存在しない場合は None)
+        """
+        snapshot = self._snapshot(session)
+        if snapshot is None:
+            stmt = select(self._table.c.id).where(self._table.c[self.name_field] == name).limit(1)
+            return session.connection().execute(stmt).scalar_one_or_none()
+        return snapshot.ids_by_name.get(name)
+
+    def get_entity(self, session: Session, entity_id: uuid.UUID) -> ModelT | None:
+        """ID でセッションに属する ORM エンティティを取得する
+
+        キャッシュ済みの切り離しインスタンスを ``merge(load=False)`` で取り込むため、
+        セッションに既に読み込まれていれば同じインスタンスが返り、DB へは問い合わせない。
+
+        Args:
+            session: 呼び出し側のセッション
+            entity_id: エンティティのID
+
+        Returns:
+            ModelT | None: 見つかったエンティティ (存在しない場合は None)
+        """
+        snapshot = self._snapshot(session)
+        if snapshot is None:
+            return session.get(self.model_class, entity_id)
+        detached = snapshot.entities.get(entity_id)
+        if detached is None:
+            return None
+        # 読み込み済みのインスタンスを merge で上書きしないよう、先に identity map を確認する
+        existing = session.identity_map.get(identity_key(self.model_class, entity_id))
+        if existing is not None:
+            return existing
+        return session.merge(detached, load=False)
+
+    # ==============================================================================
+    # 無効化・監視
+    # ==============================================================================
+
+    def invalidate(self) -> None:
+        """バージョンを進め、全エンジンのスナップショットを破棄する"""
+        with self._lock:
+            self._version += 1
+            self._invalidations += 1
+            self._snapshots.clear()
+
+    def mark_dirty(self, session: Session) -> None:
+        """セッションに未コミットの書き込みがあることを記録し、キャッシュを無効化する
+
+        コミット・ロールバック時にもう一度無効化されるまで、このセッションからの参照は DB を直接読む。
+
+        Args:
+            session: 書き込みを行ったセッション
+        """
+        session.info.setdefault(_PENDING_KEY, set()).add(self)
+        self.invalidate()
+
+    def stats(self) -> CacheStats:
+        """監視用のカウンタを取得する"""
+        with self._lock:
+            return CacheStats(
+                name=self.name,
+                hits=self._hits,
+                misses=self._misses,
+                loads=self._loads,
+                invalidations=self._invalidations,
+                version=self._version,
+                size=sum(len(snapshot.reads) for snapshot in self._snapshots.values()),
+            )
+
+    def reset_stats(self) -> None:
+        """ヒット・ミス等のカウンタを 0 に戻す (バージョンとスナップショットは維持する)"""
+        with self._lock:
+            self._hits = self._misses = self._loads = self._invalidations = 0
+
+    # ==============================================================================
+    # 内部処理
+    # ==============================================================================
+
+    def _snapshot(self, session: Session) -> _Snapshot[ModelT, ReadT] | None:
+        """最新のスナップショットを返す (未コミットの書き込みがあるセッションでは None)"""
+        if self in session.info.get(_PENDING_KEY, ()):
+            with self._lock:
+                self._misses += 1
+            return None
+        bind = session.get_bind()
+        with self._lock:
+            snapshot = self._snapshots.get(bind)
+            if snapshot is not None and snapshot.version == self._version:
+                self._hits += 1
+                return snapshot
+            self._misses += 1
+            self._loads += 1
+            version = self._version
+        # 読み込みはロックの外で行い、他のスレッドの参照や無効化を待たせない
+        reads, entities = self._read_rows(session)
+        ids_by_name: dict[str, uuid.UUID] = {}
+        for entity_id, read in reads.items():
+            ids_by_name.setdefault(getattr(read, self.name_field), entity_id)
+        snapshot = _Snapshot(version=version, reads=reads, entities=entities, ids_by_name=ids_by_name)
+        with self._lock:
+            # 読み込み中に書き込みがあった場合は古い可能性があるため、この呼び出しでだけ使い共有しない
+            if version != self._version:
+                return snapshot
+            self._snapshots[bind] = snapshot
+        logger.debug(f"読み取りキャッシュ({self.name})を読み込みました: {len(reads)} 件 (version={version})")
+        return snapshot
+
+    def _read_rows(self, session: Session) -> tuple[dict[uuid.UUID, ReadT], dict[uuid.UUID, ModelT]]:
+        # ORM を介さず列だけを読み、呼び出し側セッションの identity map を汚さない
+        rows = session.connection().execute(select(self._table)).mappings().all()
+        reads: dict[uuid.UUID, ReadT] = {}
+        entities: dict[uuid.UUID, ModelT] = {}
+        for row in rows:
+            data = dict(row)
+            entity_id: uuid.UUID = data["id"]
+            entity = self.model_class.model_validate(data)
+            make_transient_to_detached(entity)
+            entities[entity_id] = entity
+            reads[entity_id] = self.read_model.model_validate(data)
+        return reads, entities
+
+    def _sorted(self, reads: Any) -> list[ReadT]:  # noqa: ANN401
+        return sorted(reads, key=lambda read: str(getattr(read, self.name_field)))
+
+
+TAG_READ_CACHE: Final = EntityReadCache("tags", Tag, TagRead, name_field="name")
+PROJECT_READ_CACHE: Final = EntityReadCache("projects", Project, ProjectRead, name_field="title")
+_CACHES: Final = (TAG_READ_CACHE, PROJECT_READ_CACHE)
+
+
+def get_read_cache_stats() -> list[CacheStats]:
+    """全読み取りキャッシュの監視用カウンタを取得する
+
+    Returns:
+        list[CacheStats]: キャッシュごとのカウンタ
+    """
+    return [cache.stats() for cache in _CACHES]
+
+
+def invalidate_read_caches() -> None:
+    """全読み取りキャッシュを無効化する (マイグレーションや DB 切り替え後に使用する)"""
+    for cache in _CACHES:
+        cache.invalidate()
+
+
+# ==============================================================================
+# セッションイベントによる書き込み検知
+# ==============================================================================
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _on_after_flush(session: OrmSession, _flush_context: UOWTransaction) -> None:
+    # after_flush の時点では new / dirty / deleted は flush 前の状態を保持している
+    changed = [
+        *session.new,
+        *session.deleted,
+        *(obj for obj in session.dirty if session.is_modified(obj, include_collections=False)),
+    ]
+    for cache in _CACHES:
+        if any(cache.covers(obj) for obj in changed):
+            cache.mark_dirty(session)  # type: ignore[arg-type]
+
+
+@event.listens_for(OrmSession, "do_orm_execute")
+def _on_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    target = getattr(orm_execute_state.statement, "table", None)
+    for cache in _CACHES:
+        if cache.covers(target):
+            cache.mark_dirty(orm_execute_state.session)  # type: ignore[arg-type]
+
+
+@event.listens_for(OrmSession, "after_commit")
+@event.listens_for(OrmSession, "after_rollback")
+def _on_transaction_end(session: OrmSession) -> None:
+    pending: set[EntityReadCache[Any, Any]] = session.info.pop(_PENDING_KEY, set())
+    for cache in pending:
+        cache.invalidate()
@@ -3,11 +3,12 @@
 import uuid
 
 from loguru import logger
-from sqlmodel import Session, func, select
+from sqlmodel import Session, col, func, select
 
-from errors import NotFoundError
+from errors import NotFoundError, RepositoryError
 from logic.repositories.base import BaseRepository
-from models import Memo, Tag, TagCreate, TagUpdate, Task
+from logic.repositories.read_cache import TAG_READ_CACHE
+from models import Memo, MemoTagLink, Tag, TagCreate, TagRead, TagUpdate, Task, TaskTagLink
 
 
 class TagRepository(BaseRepository[Tag, TagCreate, TagUpdate]):
@@ -24,7 +25,7 @@ class TagRepository(BaseRepository[Tag, TagCreate, TagUpdate]):
             session: データベースセッション
         """
         self.model_class = Tag
-        super().__init__(session, load_options=[Tag.tasks, Tag.memos])
+        super().__init__(session, load_options=[Tag.tasks, Tag.memos], read_cache=TAG_READ_CACHE)
 
     def _check_exists_task(self, task_id: uuid.UUID) -> Task:
         """タスクが存在するか確認する
@@ -229,12 +230,53 @@ class TagRepository(BaseRepository[Tag, TagCreate, TagUpdate]):
         Raises:
             NotFoundError: エンティティが存在しない場合
         """
-        stmt = select(Tag).where(Tag.name == name)
+        if not with_details:
+            # 関連が不要な場合は読み取りキャッシュで名前を解決し、DB への往復を省く
+            tag_id = TAG_READ_CACHE.find_id(self.session, name)
+            tag = None if tag_id is None else TAG_READ_CACHE.get_entity(self.session, tag_id)
+            if tag is None:
+                msg = f"{self.model_class.__name__} が見つかりません: {name}"
+                logger.warning(msg)
+                raise NotFoundError(msg)
+            return tag
+
+        stmt = self._apply_eager_loading(select(Tag).where(Tag.name == name))
+        return self._get_by_statement(stmt, name)
 
-        if with_details:
-            stmt = self._apply_eager_loading(stmt)
+    def get_read(self, tag_id: uuid.UUID) -> TagRead:
+        """読み取りキャッシュから ID でタグを取得する
 
-        return self._get_by_statement(stmt, name)
+        Args:
+            tag_id: タグのID
+
+        Returns:
+            TagRead: 取得されたタグ (関連は含まない)
+
+        Raises:
+            NotFoundError: タグが存在しない場合
+        """
+        tag = TAG_READ_CACHE.get_read(self.session, tag_id)
+        if tag is None:
+            msg = f"{self.model_class.__name__} が見つかりません: {tag_id}"
+            logger.warning(msg)
+            raise NotFoundError(msg)
+        return tag
+
+    def list_reads(self) -> list[TagRead]:
+        """読み取りキャッシュから全てのタグを取得する
+
+        Returns:
+            list[TagRead]: 全てのタグ (名前順、関連は含まない)
+
+        Raises:
+            NotFoundError: タグが 1 件も存在しない場合
+        """
+        tags = TAG_READ_CACHE.list_reads(self.session)
+        if not tags:
+            msg = f"{self.model_class.__name__} が見つかりません"
+            logger.warning(msg)
+            raise NotFoundError(msg)
+        return tags
 
     def search_by_name(self, name_query: str, *, with_details: bool = False) -> list[Tag]:
         """タグ名でタグを検索する
@@ -255,3 +297,44 @@ class TagRepository(BaseRepository[Tag, TagCreate, TagUpdate]):
             stmt = self._apply_eager_loading(stmt)
 
         return self._gets_by_statement(stmt)
+
+    def count_usage(self, *, limit: int | None = None) -> list[tuple[Tag, int, int]]:
+        """タグごとのメモ・タスクの利用件数を取得する
+
+        中間テーブルをタグIDで GROUP BY した結果をタグへ外部結合するため、1 回のクエリで完結する。
+
+        Args:
+            limit: 最大取得件数 (None で無制限)
+
+        Returns:
+            list[tuple[Tag, int, int]]: (タグ, メモ件数, タスク件数) の一覧 (利用件数の多い順)
+
+        Raises:
+            RepositoryError: 集計に失敗した場合
+        """
+        memo_counts = (
+            select(col(MemoTagLink.tag_id).label("tag_id"), func.count().label("n"))
+            .group_by(col(MemoTagLink.tag_id))
+            .subquery()
+        )
+        task_counts = (
+            select(col(TaskTagLink.tag_id).label("tag_id"), func.count().label("n"))
+            .group_by(col(TaskTagLink.tag_id))
+            .subquery()
+        )
+        memo_n = func.coalesce(memo_counts.c.n, 0)
+        task_n = func.coalesce(task_counts.c.n, 0)
+        stmt = (
+            select(Tag, memo_n, task_n)
+            .outerjoin(memo_counts, memo_counts.c.tag_id == Tag.id)
+            .outerjoin(task_counts, task_counts.c.tag_id == Tag.id)
+            .order_by((memo_n + task_n).desc(), col(Tag.name))
+            .limit(limit)
+        )
+        try:
+            rows = self.session.exec(stmt).all()
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = "タグの利用件数の集計に失敗しました"
+            raise RepositoryError(msg) from e
+        return [(tag, int(memo_count), int(task_count)) for tag, memo_count, task_count in rows]
@@ -2,15 +2,26 @@
 
 import uuid
 from collections.abc import Iterable
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, cast
 
 from loguru import logger
-from sqlmodel import Session, func, select
+from sqlmodel import Session, col, func, or_, select
 
-from errors import NotFoundError
+from errors import NotFoundError, RepositoryError
 from logic.repositories.base import BaseRepository
-from models import Tag, Task, TaskCreate, TaskStatus, TaskTagLink, TaskUpdate
+from logic.repositories.fulltext import TASK_FTS
+from logic.repositories.loading import LoadProfile, LoadProfileName
+from logic.repositories.query import TagLink
+from logic.repositories.read_cache import TAG_READ_CACHE
+from models import CLOSED_TASK_STATUSES, Tag, Task, TaskCreate, TaskStatus, TaskTagLink, TaskUpdate
+
+TASK_LOAD_PROFILES: dict[LoadProfileName, LoadProfile] = {
+    "card": LoadProfile(relationships=("tags",)),
+    "detail": LoadProfile(relationships=("tags", "project", "memo"), strict=False),
+    "review": LoadProfile(relationships=("tags", "project", "memo")),
+}
+"""タスクの読み込みプロファイル (``list`` は関連を読まない既定値)"""
 
 
 class TaskRepository(BaseRepository[Task, TaskCreate, TaskUpdate]):
@@ -27,7 +38,13 @@ class TaskRepository(BaseRepository[Task, TaskCreate, TaskUpdate]):
             session: データベースセッション
         """
         self.model_class = Task
-        super().__init__(session, load_options=[Task.tags, Task.project, Task.memo])
+        super().__init__(
+            session,
+            load_options=[Task.tags, Task.project, Task.memo],
+            fts_index=TASK_FTS,
+            tag_link=TagLink(TaskTagLink, "task_id"),
+            load_profiles=TASK_LOAD_PROFILES,
+        )
 
     def _check_exists_tag(self, tag_id: uuid.UUID) -> Tag:
         """タグが存在するか確認する
@@ -41,7 +58,7 @@ class TaskRepository(BaseRepository[Task, TaskCreate, TaskUpdate]):
         Raises:
             NotFoundError: タグが存在しない場合
         """
-        tag = self.session.get(Tag, tag_id)
+        tag = TAG_READ_CACHE.get_entity(self.session, tag_id)
         if tag is None:
             msg = f"タグが見つかりません: {tag_id}"
             logger.warning(msg)
@@ -271,6 +288,7 @@ class TaskRepository(BaseRepository[Task, TaskCreate, TaskUpdate]):
         project_ids: list[uuid.UUID] | None = None,
         limit: int = 50,
         with_details: bool = True,
+        profile: LoadProfileName | None = None,
     ) -> list[Task]:
         """期間内に完了したタスクを取得する。"""
         completed_col = cast("Any", Task.completed_at)
@@ -288,8 +306,7 @@ class TaskRepository(BaseRepository[Task, TaskCreate, TaskUpdate]):
         if project_ids:
             stmt = stmt.where(project_col.in_(project_ids))
 
-        if with_details:
-            stmt = self._apply_eager_loading(stmt)
+        stmt = self._apply_loading(stmt, with_details=with_details, profile=profile)
 
         return self._gets_by_statement(stmt)
 
@@ -301,6 +318,7 @@ class TaskRepository(BaseRepository[Task, TaskCreate, TaskUpdate]):
         status_filter: Iterable[TaskStatus] | None = None,
         limit: int = 20,
         with_details: bool = True,
+        profile: LoadProfileName | None = None,
     ) -> list[Task]:
         """指定日時以前に作成され、未完了のタスクを取得する。"""
         statuses = list(status_filter or (TaskStatus.TODO, TaskStatus.PROGRESS, TaskStatus.WAITING))
@@ -321,7 +339,66 @@ class TaskRepository(BaseRepository[Task, TaskCreate, TaskUpdate]):
         if project_ids:
             stmt = stmt.where(project_col.in_(project_ids))
 
-        if with_details:
-            stmt = self._apply_eager_loading(stmt)
+        stmt = self._apply_loading(stmt, with_details=with_details, profile=profile)
 
         return self._gets_by_statement(stmt)
+
+    # ==============================================================================
+    # 集計
+    # ==============================================================================
+
+    def count_by_status(self) -> dict[TaskStatus, int]:
+        """ステータスごとのタスク件数を 1 回の GROUP BY で取得する
+
+        Returns:
+            dict[TaskStatus, int]: ステータスごとの件数 (0 件のステータスは含まれない)
+        """
+        return self._count_grouped(col(Task.status))
+
+    def count_by_project_and_status(
+        self, project_ids: Iterable[uuid.UUID] | None = None
+    ) -> dict[uuid.UUID, dict[TaskStatus, int]]:
+        """プロジェクト・ステータスごとのタスク件数を 1 回の GROUP BY で取得する
+
+        Args:
+            project_ids: 対象のプロジェクトID (None の場合はプロジェクトに属する全タスク)
+
+        Returns:
+            dict[uuid.UUID, dict[TaskStatus, int]]: プロジェクトIDごとのステータス別件数
+        """
+        project_col = col(Task.project_id)
+        where = [project_col.is_not(None)]
+        if project_ids is not None:
+            where.append(project_col.in_(list(project_ids)))
+        counts: dict[uuid.UUID, dict[TaskStatus, int]] = {}
+        for (project_id, status), count in self._count_grouped(
+            project_col, col(Task.status), where=tuple(where)
+        ).items():
+            counts.setdefault(project_id, {})[status] = count
+        return counts
+
+    def count_overdue(self, today: date) -> int:
+        """期限超過のタスク件数を取得する
+
+        OVERDUE ステータスのタスクと、期限日を過ぎた未完了 (完了・キャンセル以外) のタスクを数える
+        (`models.is_task_overdue` と同じ判定)。
+
+        Args:
+            today: 基準日
+
+        Returns:
+            int: 期限超過の件数
+        """
+        status_col = col(Task.status)
+        stmt = select(func.count()).where(
+            or_(
+                status_col == TaskStatus.OVERDUE,
+                (col(Task.due_date) < today) & status_col.not_in(CLOSED_TASK_STATUSES),
+            )
+        )
+        try:
+            return int(self.session.exec(stmt).one())
+        except Exception as e:
+            # 技術的失敗は RepositoryError に集約
+            msg = "期限超過タスクの集計に失敗しました"
+            raise RepositoryError(msg) from e
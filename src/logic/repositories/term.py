@@ -4,11 +4,14 @@ import uuid
 from typing import Any, cast
 
 from loguru import logger
-from sqlmodel import Session, func, or_, select
+from sqlmodel import Session, col, func, or_, select
 
 from errors import AlreadyExistsError, NotFoundError
 from logic.repositories.base import BaseRepository
-from models import Synonym, Tag, Term, TermCreate, TermStatus, TermUpdate
+from logic.repositories.fulltext import TERM_FTS
+from logic.repositories.query import TagLink
+from logic.repositories.read_cache import TAG_READ_CACHE
+from models import Synonym, Tag, Term, TermCreate, TermStatus, TermTagLink, TermUpdate
 
 
 class TermRepository(BaseRepository[Term, TermCreate, TermUpdate]):
@@ -25,7 +28,12 @@ class TermRepository(BaseRepository[Term, TermCreate, TermUpdate]):
             session: データベースセッション
         """
         self.model_class = Term
-        super().__init__(session, load_options=[Term.synonyms, Term.tags])
+        super().__init__(
+            session,
+            load_options=[Term.synonyms, Term.tags],
+            fts_index=TERM_FTS,
+            tag_link=TagLink(TermTagLink, "term_id"),
+        )
 
     def _check_exists_tag(self, tag_id: uuid.UUID) -> Tag:
         """タグが存在するか確認する
@@ -39,7 +47,7 @@ class TermRepository(BaseRepository[Term, TermCreate, TermUpdate]):
         Raises:
             NotFoundError: タグが存在しない場合
         """
-        tag = self.session.get(Tag, tag_id)
+        tag = TAG_READ_CACHE.get_entity(self.session, tag_id)
         if tag is None:
             msg = f"タグが見つかりません: {tag_id}"
             raise NotFoundError(msg)
@@ -283,19 +291,14 @@ class TermRepository(BaseRepository[Term, TermCreate, TermUpdate]):
         """
         stmt = select(Term).distinct()
 
-        # クエリ文字列での検索
+        # クエリ文字列での検索 (キー・タイトル・説明は全文検索インデックスで照合する)
         if query:
-            query_lower = query.lower()
-            conditions = [
-                func.lower(Term.key).like(f"%{query_lower}%"),
-                func.lower(Term.title).like(f"%{query_lower}%"),
-                func.lower(Term.description).like(f"%{query_lower}%"),
-            ]
+            conditions = [self._fulltext_condition(query)]
 
             # 同義語を含めた検索
             if include_synonyms:
                 stmt = stmt.outerjoin(Synonym)
-                conditions.append(func.lower(Synonym.text).like(f"%{query_lower}%"))
+                conditions.append(func.lower(Synonym.text).like(f"%{query.lower()}%"))
 
             stmt = stmt.where(or_(*conditions))
 
@@ -348,3 +351,11 @@ class TermRepository(BaseRepository[Term, TermCreate, TermUpdate]):
             list[Term]: 指定されたステータスの用語一覧
         """
         return self.search(status=status, with_details=with_details)
+
+    def count_by_status(self) -> dict[TermStatus, int]:
+        """ステータスごとの用語件数を 1 回の GROUP BY で取得する
+
+        Returns:
+            dict[TermStatus, int]: ステータスごとの件数 (0 件のステータスは含まれない)
+        """
+        return self._count_grouped(col(Term.status))
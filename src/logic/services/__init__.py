@@ -9,6 +9,7 @@ from logic.services.base import ServiceBase
 from logic.services.memo_service import MemoService
 from logic.services.project_service import ProjectService
 from logic.services.settings_service import SettingsService
+from logic.services.stats_service import StatsService
 from logic.services.tag_service import TagService
 from logic.services.task_service import TaskService
 from logic.services.terminology_service import TerminologyService
@@ -19,6 +20,7 @@ __all__ = [
     "MemoService",
     "ProjectService",
     "SettingsService",
+    "StatsService",
     "TagService",
     "TaskService",
     "TerminologyService",
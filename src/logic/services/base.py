@@ -12,6 +12,7 @@ from typing import Any, Literal, ParamSpec, Self, TypeVar, overload
 from loguru import logger
 
 from errors import AlreadyExistsError, NotFoundError, RepositoryError
+from logic.repositories.loading import as_loaded
 from models import BaseModel
 
 
@@ -89,6 +90,7 @@ def convert_read_model(
 
     単一の BaseModel または BaseModel のシーケンス（list/tuple 等）を
     指定の読み取りモデル型に変換して返す。
+    読み込みプロファイルで読み込まなかった関連・列は読み取りモデルの既定値になる。
 
     Args:
         to_model: model_validate を持つ読み取り用モデルの型
@@ -109,12 +111,12 @@ def convert_read_model(
             if is_list:
                 if isinstance(result, Sequence) and not isinstance(result, (str, bytes, bytearray)):
                     if all(isinstance(item, BaseModel) for item in result):
-                        return [to_model.model_validate(item) for item in result]
+                        return [to_model.model_validate(as_loaded(item)) for item in result]
                     raise ModelConversionError
                 raise ModelConversionError
             # [AI GENERATED] 単一モデルの場合
             if isinstance(result, BaseModel):
-                return to_model.model_validate(result)
+                return to_model.model_validate(as_loaded(result))
             raise ModelConversionError
 
         return wrapper
@@ -5,11 +5,23 @@
 """
 
 import uuid
+from collections.abc import Sequence
 
 from loguru import logger
 
 from errors import NotFoundError
-from logic.repositories import MemoRepository, RepositoryFactory
+from logic.repositories import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SEARCH_LIMIT,
+    LoadProfileName,
+    MemoRepository,
+    Page,
+    PageOrderKey,
+    QuerySpec,
+    RepositoryFactory,
+    SearchHit,
+    as_loaded,
+)
 from logic.services.base import MyBaseError, ServiceBase, convert_read_model, handle_service_errors
 from models import Memo, MemoCreate, MemoRead, MemoStatus, MemoUpdate
 
@@ -114,6 +126,88 @@ class MemoService(ServiceBase):
 
         return success
 
+    @handle_service_errors(SERVICE_NAME, "一括作成", MemoServiceError)
+    @convert_read_model(MemoRead, is_list=True)
+    def bulk_create(self, items: Sequence[MemoCreate]) -> list[Memo]:
+        """複数のメモを 1 回の INSERT でまとめて作成する
+
+        コミットは呼び出し側の Unit of Work が行う。
+
+        Args:
+            items: 作成するメモのデータ
+
+        Returns:
+            list[MemoRead]: 作成されたメモ
+        """
+        memos = self.memo_repo.bulk_create(items)
+        logger.debug(f"メモを一括作成しました: {len(memos)} 件")
+        return memos
+
+    @handle_service_errors(SERVICE_NAME, "一括更新", MemoServiceError)
+    def bulk_update_status(self, memo_ids: Sequence[uuid.UUID], status: MemoStatus) -> int:
+        """複数のメモのステータスを 1 回の UPDATE で変更する
+
+        コミットは呼び出し側の Unit of Work が行う。
+
+        Args:
+            memo_ids: 対象のメモID
+            status: 設定するステータス
+
+        Returns:
+            int: 更新した件数
+        """
+        updated = self.memo_repo.bulk_update_status(memo_ids, status)
+        logger.debug(f"メモ {updated} 件のステータスを {status} に変更しました")
+        return updated
+
+    @handle_service_errors(SERVICE_NAME, "一括削除", MemoServiceError)
+    def bulk_delete(self, memo_ids: Sequence[uuid.UUID]) -> int:
+        """複数のメモをタグの関連ごとまとめて削除する
+
+        コミットは呼び出し側の Unit of Work が行う。
+
+        Args:
+            memo_ids: 削除するメモID
+
+        Returns:
+            int: 削除した件数
+        """
+        deleted = self.memo_repo.bulk_delete(memo_ids)
+        logger.debug(f"メモを一括削除しました: {deleted} 件")
+        return deleted
+
+    @handle_service_errors(SERVICE_NAME, "タグ一括追加", MemoServiceError)
+    def bulk_link_tags(self, memo_ids: Sequence[uuid.UUID], tag_ids: Sequence[uuid.UUID]) -> int:
+        """複数のメモに複数のタグをまとめて関連付ける
+
+        コミットは呼び出し側の Unit of Work が行う。
+
+        Args:
+            memo_ids: 対象のメモID
+            tag_ids: 関連付けるタグのID
+
+        Returns:
+            int: 新たに関連付けた組み合わせの件数
+        """
+        return self.memo_repo.bulk_link_tags(memo_ids, tag_ids)
+
+    @handle_service_errors(SERVICE_NAME, "一括取得", MemoServiceError)
+    @convert_read_model(MemoRead, is_list=True)
+    def get_by_ids(
+        self, memo_ids: Sequence[uuid.UUID], *, with_details: bool = False, profile: LoadProfileName | None = None
+    ) -> list[Memo]:
+        """複数のメモを 1 回のクエリで取得する
+
+        Args:
+            memo_ids: 取得するメモID
+            with_details: 関連情報を含めるか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
+
+        Returns:
+            list[MemoRead]: 取得したメモ (指定順、存在しない ID は含まれない)
+        """
+        return self.memo_repo.get_by_ids(memo_ids, with_details=with_details, profile=profile)
+
     @handle_service_errors(SERVICE_NAME, "タグ追加", MemoServiceError)
     @convert_read_model(MemoRead)
     def add_tag(self, memo_id: uuid.UUID, tag_id: uuid.UUID) -> Memo:
@@ -202,12 +296,15 @@ class MemoService(ServiceBase):
 
     @handle_service_errors(SERVICE_NAME, "取得", MemoServiceError)
     @convert_read_model(MemoRead)
-    def get_by_id(self, memo_id: uuid.UUID, *, with_details: bool = False) -> Memo:
+    def get_by_id(
+        self, memo_id: uuid.UUID, *, with_details: bool = False, profile: LoadProfileName | None = None
+    ) -> Memo:
         """IDでメモを取得する
 
         Args:
             memo_id: 取得するメモのID
             with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
 
         Returns:
             MemoRead: 取得されたメモ
@@ -216,18 +313,19 @@ class MemoService(ServiceBase):
             NotFoundError: エンティティが存在しない場合
             MemoServiceError: メモの取得に失敗した場合
         """
-        memo = self.memo_repo.get_by_id(memo_id, with_details=with_details)
+        memo = self.memo_repo.get_by_id(memo_id, with_details=with_details, profile=profile)
         logger.debug(f"メモを取得しました: {memo.id}")
 
         return memo
 
     @handle_service_errors(SERVICE_NAME, "取得", MemoServiceError)
     @convert_read_model(MemoRead, is_list=True)
-    def get_all(self, *, with_details: bool = False) -> list[Memo]:
+    def get_all(self, *, with_details: bool = False, profile: LoadProfileName | None = None) -> list[Memo]:
         """全てのメモを取得する
 
         Args:
             with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
 
         Returns:
             list[MemoRead]: 取得されたメモのリスト
@@ -236,19 +334,99 @@ class MemoService(ServiceBase):
             NotFoundError: エンティティが存在しない場合
             MemoServiceError: メモの取得に失敗した場合
         """
-        memos = self.memo_repo.get_all(with_details=with_details)
+        memos = self.memo_repo.get_all(with_details=with_details, profile=profile)
         logger.debug(f"全てのメモを取得しました: {len(memos)} 件")
 
         return memos
 
+    @handle_service_errors(SERVICE_NAME, "ページ取得", MemoServiceError)
+    def get_page(
+        self,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        order_by: PageOrderKey = "created_at",
+        with_details: bool = False,
+        profile: LoadProfileName | None = None,
+    ) -> Page[MemoRead]:
+        """メモをキーセットページングで取得する (新しい順)
+
+        Args:
+            page_size: 1 ページあたりの件数
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+            order_by: ソートキー (``created_at`` / ``updated_at``)
+            with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
+
+        Returns:
+            Page[MemoRead]: ページング結果 (該当なしの場合は空のページ)
+
+        Raises:
+            MemoServiceError: ページサイズ・カーソルが不正、または取得に失敗した場合
+        """
+        page = self.memo_repo.get_page(
+            page_size=page_size, cursor=cursor, order_by=order_by, with_details=with_details, profile=profile
+        )
+        logger.debug(f"メモのページを取得しました: {len(page.items)} 件")
+
+        return page.map(lambda memo: MemoRead.model_validate(as_loaded(memo)))
+
+    @handle_service_errors(SERVICE_NAME, "ページ取得", MemoServiceError)
+    def find_page(
+        self,
+        spec: QuerySpec,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        with_details: bool = False,
+        profile: LoadProfileName | None = None,
+    ) -> Page[MemoRead]:
+        """検索条件の仕様に一致するメモをキーセットページングで取得する
+
+        Args:
+            spec: 検索条件 (並び順は ``created_at`` / ``updated_at``)
+            page_size: 1 ページあたりの件数
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+            with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
+
+        Returns:
+            Page[MemoRead]: ページング結果 (該当なしの場合は空のページ)
+
+        Raises:
+            MemoServiceError: 条件・ページサイズ・カーソルが不正、または取得に失敗した場合
+        """
+        page = self.memo_repo.find_page(
+            spec, page_size=page_size, cursor=cursor, with_details=with_details, profile=profile
+        )
+        logger.debug(f"条件に一致するメモのページを取得しました: {len(page.items)} 件")
+
+        return page.map(lambda memo: MemoRead.model_validate(as_loaded(memo)))
+
+    @handle_service_errors(SERVICE_NAME, "集計", MemoServiceError)
+    def count_by_status(self) -> dict[MemoStatus, int]:
+        """ステータスごとのメモ件数を取得する
+
+        Returns:
+            dict[MemoStatus, int]: ステータスごとの件数 (0 件のステータスも 0 として含む)
+
+        Raises:
+            MemoServiceError: 集計に失敗した場合
+        """
+        counts = self.memo_repo.count_by_status()
+        return {status: counts.get(status, 0) for status in MemoStatus}
+
     @handle_service_errors(SERVICE_NAME, "ステータス取得", MemoServiceError)
     @convert_read_model(MemoRead, is_list=True)
-    def list_by_status(self, status: MemoStatus, *, with_details: bool = False) -> list[Memo]:
+    def list_by_status(
+        self, status: MemoStatus, *, with_details: bool = False, profile: LoadProfileName | None = None
+    ) -> list[Memo]:
         """ステータスでメモ一覧を取得する
 
         Args:
             status: メモステータス
             with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
 
         Returns:
             list[MemoRead]: 指定されたステータスのメモ一覧
@@ -257,58 +435,112 @@ class MemoService(ServiceBase):
             NotFoundError: エンティティが存在しない場合
             MemoServiceError: メモの取得に失敗した場合
         """
-        memos = self.memo_repo.list_by_status(status, with_details=with_details)
+        memos = self.memo_repo.list_by_status(status, with_details=with_details, profile=profile)
         logger.debug(f"ステータス '{status}' のメモを {len(memos)} 件取得しました。")
 
         return memos
 
+    @handle_service_errors(SERVICE_NAME, "先読み候補取得", MemoServiceError)
+    @convert_read_model(MemoRead, is_list=True)
+    def list_prefetch_candidates(self, *, limit: int = 10) -> list[Memo]:
+        """AI 提案を先読みする候補 (INBOX かつ AI 提案未依頼) を新しい順に取得する
+
+        Args:
+            limit: 取得する最大件数
+
+        Returns:
+            list[MemoRead]: 候補のメモ一覧 (存在しない場合は空)
+        """
+        try:
+            memos = self.memo_repo.list_prefetch_candidates(limit=limit)
+        except NotFoundError:
+            memos = []
+        logger.debug(f"AI 提案の先読み候補を {len(memos)} 件取得しました。")
+        return memos
+
     @handle_service_errors(SERVICE_NAME, "タグ取得", MemoServiceError)
     @convert_read_model(MemoRead, is_list=True)
-    def list_by_tag(self, tag_id: uuid.UUID, *, with_details: bool = False) -> list[Memo]:
+    def list_by_tag(
+        self, tag_id: uuid.UUID, *, with_details: bool = False, profile: LoadProfileName | None = None
+    ) -> list[Memo]:
         """指定タグに紐づくメモ一覧を取得する。
 
         Args:
             tag_id: ひも付きを調べるタグID
             with_details: メモの関連情報を含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
 
         Returns:
             list[MemoRead]: 指定タグに紐づくメモ一覧
         """
         try:
-            memos = self.memo_repo.list_by_tag(tag_id, with_details=with_details)
+            memos = self.memo_repo.list_by_tag(tag_id, with_details=with_details, profile=profile)
         except NotFoundError:
             memos = []
         logger.debug(f"タグ({tag_id})に紐づくメモを {len(memos)} 件取得しました。")
         return memos
 
+    @handle_service_errors(SERVICE_NAME, "検索", MemoServiceError)
+    @convert_read_model(MemoRead, is_list=True)
+    def find(
+        self, spec: QuerySpec, *, with_details: bool = False, profile: LoadProfileName | None = None
+    ) -> list[Memo]:
+        """検索条件の仕様に一致するメモを取得する
+
+        Args:
+            spec: 検索条件 (テキスト・ステータス・タグ・並び順・件数など)
+            with_details: 関連エンティティを含めるかどうか
+            profile: 読み込みプロファイル名 (指定時は with_details より優先)
+
+        Returns:
+            list[MemoRead]: 一致したメモ一覧 (該当なしの場合は空リスト)
+
+        Raises:
+            MemoServiceError: 条件が不正、または検索に失敗した場合
+        """
+        results = self.memo_repo.find(spec, with_details=with_details, profile=profile)
+        logger.debug(f"条件に一致するメモを {len(results)} 件取得しました。")
+        return results
+
     @handle_service_errors(SERVICE_NAME, "検索", MemoServiceError)
     @convert_read_model(MemoRead, is_list=True)
     def search_memos(self, query: str, *, with_details: bool = False) -> list[Memo]:
         """クエリでメモを検索する
 
+        タイトルと本文の双方を全文検索インデックスで検索し、関連度順に返す。
+
         Args:
             query: 検索クエリ
             with_details: 関連エンティティを含めるかどうか
 
         Returns:
-            list[MemoRead]: 検索結果のメモ一覧
+            list[MemoRead]: 検索結果のメモ一覧 (該当なしの場合は空リスト)
 
         Raises:
-            NotFoundError: エンティティが存在しない場合
             MemoServiceError: メモの取得に失敗した場合
         """
-        try:
-            by_title = self.memo_repo.search_by_title(query, with_details=with_details)
-        except NotFoundError:
-            by_title = []
-        try:
-            by_content = self.memo_repo.search_by_content(query, with_details=with_details)
-        except NotFoundError:
-            by_content = []
-        merged: dict[uuid.UUID, Memo] = {}
-        for m in by_title + by_content:
-            if m.id is not None:
-                merged[m.id] = m
-        results = list(merged.values())
+        hits = self.memo_repo.search_fulltext(query, limit=None, with_details=with_details)
+        results = [hit.item for hit in hits]
         logger.debug(f"クエリ '{query}' に一致するメモを {len(results)} 件取得しました。")
         return results
+
+    @handle_service_errors(SERVICE_NAME, "検索", MemoServiceError)
+    def search_hits(
+        self, query: str, *, limit: int | None = DEFAULT_SEARCH_LIMIT, with_details: bool = False
+    ) -> list[SearchHit[MemoRead]]:
+        """クエリでメモを全文検索し、関連度と抜粋付きの結果を返す
+
+        Args:
+            query: 検索クエリ
+            limit: 最大取得件数 (None で無制限)
+            with_details: 関連エンティティを含めるかどうか
+
+        Returns:
+            list[SearchHit[MemoRead]]: 関連度順の検索結果 (該当なしの場合は空リスト)
+
+        Raises:
+            MemoServiceError: 検索に失敗した場合
+        """
+        hits = self.memo_repo.search_fulltext(query, limit=limit, with_details=with_details)
+        logger.debug(f"クエリ '{query}' に一致するメモを {len(hits)} 件取得しました。")
+        return [SearchHit(item=MemoRead.model_validate(hit.item), score=hit.score, snippet=hit.snippet) for hit in hits]
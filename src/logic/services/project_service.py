@@ -5,13 +5,22 @@
 """
 
 import uuid
+from collections.abc import Iterable, Sequence
 
 from loguru import logger
 
 from errors import NotFoundError
 from logic.repositories import ProjectRepository, RepositoryFactory
 from logic.services.base import MyBaseError, ServiceBase, convert_read_model, handle_service_errors
-from models import Project, ProjectCreate, ProjectRead, ProjectStatus, ProjectUpdate
+from models import (
+    Project,
+    ProjectCreate,
+    ProjectRead,
+    ProjectStatus,
+    ProjectSummary,
+    ProjectTaskRow,
+    ProjectUpdate,
+)
 
 SERVICE_NAME = "プロジェクトサービス"
 
@@ -164,6 +173,32 @@ class ProjectService(ServiceBase):
 
         return updated_project
 
+    @handle_service_errors(SERVICE_NAME, "タスク一括更新", ProjectServiceError)
+    def sync_tasks(self, project_id: uuid.UUID, task_ids: Sequence[uuid.UUID]) -> tuple[int, int]:
+        """プロジェクトに属するタスクを指定の集合に揃える
+
+        追加・解除はそれぞれ 1 回の UPDATE で行い、コミットは呼び出し側の Unit of Work が行う。
+
+        Args:
+            project_id: プロジェクトのID
+            task_ids: プロジェクトに属させるタスクのID
+
+        Returns:
+            tuple[int, int]: (追加したタスク件数, 解除したタスク件数)
+
+        Raises:
+            NotFoundError: プロジェクトまたはタスクが存在しない場合
+        """
+        self.project_repo.check_exists(project_id)
+        current_ids = {task_id for _pid, task_id, _title, _status in self.project_repo.list_task_rows([project_id])}
+        desired_ids = list(dict.fromkeys(task_id for task_id in task_ids if task_id is not None))
+        added = self.project_repo.bulk_assign_tasks(
+            project_id, [task_id for task_id in desired_ids if task_id not in current_ids]
+        )
+        removed = self.project_repo.bulk_assign_tasks(None, list(current_ids - set(desired_ids)))
+        logger.debug(f"プロジェクト({project_id})のタスクを同期しました: 追加 {added} 件 / 解除 {removed} 件")
+        return added, removed
+
     @handle_service_errors(SERVICE_NAME, "取得", ProjectServiceError)
     @convert_read_model(ProjectRead)
     def get_by_id(self, project_id: uuid.UUID, *, with_details: bool = False) -> Project:
@@ -233,3 +268,24 @@ class ProjectService(ServiceBase):
         projects = self.project_repo.search_by_title(query)
         logger.debug(f"クエリ '{query}' に一致するプロジェクトを {len(projects)} 件取得しました。")
         return projects
+
+    @handle_service_errors(SERVICE_NAME, "概要取得", ProjectServiceError)
+    def get_summaries(self, project_ids: Iterable[uuid.UUID]) -> dict[uuid.UUID, ProjectSummary]:
+        """複数プロジェクトのタスク概要 (件数・完了数・軽量なタスク行) を一括取得する
+
+        プロジェクト数に関わらず 1 回のクエリで取得する。
+
+        Args:
+            project_ids: 対象のプロジェクトID
+
+        Returns:
+            dict[uuid.UUID, ProjectSummary]: プロジェクトIDごとの概要 (タスクのないプロジェクトは空の概要)
+        """
+        ids = list(dict.fromkeys(project_ids))
+        rows: dict[uuid.UUID, list[ProjectTaskRow]] = {project_id: [] for project_id in ids}
+        for project_id, task_id, title, status in self.project_repo.list_task_rows(ids):
+            rows[project_id].append(ProjectTaskRow(id=task_id, title=title, status=status))
+        logger.debug(f"プロジェクト概要を取得しました: {len(ids)} 件")
+        return {
+            project_id: ProjectSummary(project_id=project_id, tasks=tuple(tasks)) for project_id, tasks in rows.items()
+        }
@@ -320,9 +320,10 @@ class SettingsService(ServiceBase):
             )
 
             # Database設定
+            # チューニング値は保持したまま URL のみ差し替える
             database_url = snapshot.get("database_url", "")
-            editable.database = EditableDatabaseSettings(
-                url=database_url,
+            editable.database = EditableDatabaseSettings.model_validate(
+                {**editable.database.model_dump(), "url": database_url}
             )
 
             agent = snapshot.get("agent", {})
@@ -0,0 +1,161 @@
+"""集計サービスの実装
+
+このモジュールは、タスク・メモ・プロジェクト・タグの件数統計を提供します。
+一覧を取得して Python 側で数えるのではなく、リポジトリの GROUP BY 集計を組み合わせます。
+"""
+
+import uuid
+from collections.abc import Iterable
+from datetime import date
+
+from loguru import logger
+
+from logic.repositories import MemoRepository, ProjectRepository, RepositoryFactory, TagRepository, TaskRepository
+from logic.services.base import MyBaseError, ServiceBase, handle_service_errors
+from models import (
+    AiSuggestionStatus,
+    DashboardStats,
+    MemoStats,
+    MemoStatus,
+    ProjectStatus,
+    ProjectTaskStats,
+    TagUsage,
+    TaskStats,
+)
+
+SERVICE_NAME = "集計サービス"
+
+
+class StatsServiceError(MyBaseError):
+    """集計サービス層で発生する汎用的なエラー"""
+
+    def __init__(self, message: str, operation: str = "不明な操作") -> None:
+        super().__init__(f"集計の{operation}処理でエラーが発生しました: {message}")
+        self.operation = operation
+
+
+class StatsService(ServiceBase):
+    """集計サービス
+
+    件数統計を GROUP BY の集計クエリで取得し、読み取り専用の DTO に変換します。
+    """
+
+    def __init__(
+        self,
+        task_repo: TaskRepository,
+        memo_repo: MemoRepository,
+        project_repo: ProjectRepository,
+        tag_repo: TagRepository,
+    ) -> None:
+        """StatsServiceを初期化する
+
+        Args:
+            task_repo: タスクリポジトリ
+            memo_repo: メモリポジトリ
+            project_repo: プロジェクトリポジトリ
+            tag_repo: タグリポジトリ
+        """
+        self.task_repo = task_repo
+        self.memo_repo = memo_repo
+        self.project_repo = project_repo
+        self.tag_repo = tag_repo
+
+    @classmethod
+    def build_service(cls, repo_factory: RepositoryFactory) -> "StatsService":
+        """StatsServiceのインスタンスを生成するファクトリメソッド
+
+        Returns:
+            StatsService: 集計サービスのインスタンス
+        """
+        return cls(
+            task_repo=repo_factory.create(TaskRepository),
+            memo_repo=repo_factory.create(MemoRepository),
+            project_repo=repo_factory.create(ProjectRepository),
+            tag_repo=repo_factory.create(TagRepository),
+        )
+
+    @handle_service_errors(SERVICE_NAME, "タスク集計", StatsServiceError)
+    def get_task_stats(self, today: date) -> TaskStats:
+        """タスクのステータス別件数と期限超過件数を取得する
+
+        Args:
+            today: 期限超過の判定に使う基準日
+
+        Returns:
+            TaskStats: タスクの件数統計
+        """
+        stats = TaskStats(by_status=self.task_repo.count_by_status(), overdue=self.task_repo.count_overdue(today))
+        logger.debug(f"タスク集計: total={stats.total}, overdue={stats.overdue}")
+        return stats
+
+    @handle_service_errors(SERVICE_NAME, "プロジェクト別タスク集計", StatsServiceError)
+    def get_project_task_stats(
+        self, project_ids: Iterable[uuid.UUID] | None = None
+    ) -> dict[uuid.UUID, ProjectTaskStats]:
+        """プロジェクトごとのタスク件数を取得する
+
+        Args:
+            project_ids: 対象のプロジェクトID (None の場合はタスクを持つ全プロジェクト)
+
+        Returns:
+            dict[uuid.UUID, ProjectTaskStats]: プロジェクトIDごとの件数統計 (タスクのないプロジェクトは含まれない)
+        """
+        counts = self.task_repo.count_by_project_and_status(project_ids)
+        return {
+            project_id: ProjectTaskStats(project_id=project_id, by_status=by_status)
+            for project_id, by_status in counts.items()
+        }
+
+    @handle_service_errors(SERVICE_NAME, "メモ集計", StatsServiceError)
+    def get_memo_stats(self) -> MemoStats:
+        """メモのステータス別・AI提案状態別の件数を取得する
+
+        Returns:
+            MemoStats: メモの件数統計
+        """
+        by_status: dict[MemoStatus, int] = {}
+        by_ai_status: dict[AiSuggestionStatus, int] = {}
+        for (status, ai_status), count in self.memo_repo.count_by_status_and_ai_status().items():
+            by_status[status] = by_status.get(status, 0) + count
+            by_ai_status[ai_status] = by_ai_status.get(ai_status, 0) + count
+        return MemoStats(by_status=by_status, by_ai_status=by_ai_status)
+
+    @handle_service_errors(SERVICE_NAME, "プロジェクト集計", StatsServiceError)
+    def get_project_status_counts(self) -> dict[ProjectStatus, int]:
+        """ステータスごとのプロジェクト件数を取得する
+
+        Returns:
+            dict[ProjectStatus, int]: ステータスごとの件数
+        """
+        return self.project_repo.count_by_status()
+
+    @handle_service_errors(SERVICE_NAME, "タグ集計", StatsServiceError)
+    def get_tag_usage(self, *, limit: int | None = None) -> list[TagUsage]:
+        """タグの利用件数を多い順に取得する
+
+        Args:
+            limit: 最大取得件数 (None で無制限)
+
+        Returns:
+            list[TagUsage]: タグごとの利用件数
+        """
+        return [
+            TagUsage(tag_id=tag.id, name=tag.name, memo_count=memo_count, task_count=task_count)
+            for tag, memo_count, task_count in self.tag_repo.count_usage(limit=limit)
+            if tag.id is not None
+        ]
+
+    def get_dashboard_stats(self, today: date) -> DashboardStats:
+        """ホーム画面・CLI 向けの集計値一式を取得する
+
+        Args:
+            today: 期限超過の判定に使う基準日
+
+        Returns:
+            DashboardStats: タスク・メモ・プロジェクトの件数統計
+        """
+        return DashboardStats(
+            tasks=self.get_task_stats(today),
+            memos=self.get_memo_stats(),
+            projects_by_status=self.get_project_status_counts(),
+        )
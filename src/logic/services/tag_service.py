@@ -118,8 +118,8 @@ class TagService(ServiceBase):
 
     @handle_service_errors(SERVICE_NAME, "取得", TagServiceError)
     @convert_read_model(TagRead)
-    def get_by_id(self, tag_id: uuid.UUID) -> Tag:
-        """IDでタグを取得する
+    def get_by_id(self, tag_id: uuid.UUID) -> TagRead:
+        """IDでタグを取得する (読み取りキャッシュを使用)
 
         Args:
             tag_id: タグのID
@@ -131,7 +131,7 @@ class TagService(ServiceBase):
             NotFoundError: タグが存在しない場合
             TagServiceError: タグの取得に失敗した場合
         """
-        tag = self.tag_repo.get_by_id(tag_id)
+        tag = self.tag_repo.get_read(tag_id)
         logger.debug(f"タグを取得しました: {tag.id}")
         return tag
 
@@ -156,8 +156,8 @@ class TagService(ServiceBase):
 
     @handle_service_errors(SERVICE_NAME, "取得", TagServiceError)
     @convert_read_model(TagRead, is_list=True)
-    def get_all(self) -> list[Tag]:
-        """全てのタグを取得する
+    def get_all(self) -> list[TagRead]:
+        """全てのタグを取得する (読み取りキャッシュを使用)
 
         Returns:
             list[TagRead]: 取得したタグのリスト
@@ -166,7 +166,7 @@ class TagService(ServiceBase):
             NotFoundError: エンティティが存在しない場合
             TagServiceError: タグの取得に失敗した場合
         """
-        tags = self.tag_repo.get_all()
+        tags = self.tag_repo.list_reads()
         logger.debug(f"{len(tags)} 件のタグを取得しました。")
         return tags
 
@@ -5,11 +5,21 @@
 """
 
 import uuid
+from collections.abc import Sequence
 
 from loguru import logger
 
 from errors import NotFoundError
-from logic.repositories import RepositoryFactory, TaskRepository
+from logic.repositories import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SEARCH_LIMIT,
+    Page,
+    PageOrderKey,
+    QuerySpec,
+    RepositoryFactory,
+    SearchHit,
+    TaskRepository,
+)
 from logic.services.base import MyBaseError, ServiceBase, convert_read_model, handle_service_errors
 from models import Task, TaskCreate, TaskRead, TaskStatus, TaskUpdate
 
@@ -116,6 +126,85 @@ class TaskService(ServiceBase):
         logger.debug(f"タスク '{existing_task.title}' を削除しました (ID: {task_id})")
         return success
 
+    @handle_service_errors(SERVICE_NAME, "一括作成", TaskServiceError)
+    @convert_read_model(TaskRead, is_list=True)
+    def bulk_create(self, items: Sequence[TaskCreate]) -> list[Task]:
+        """複数のタスクを 1 回の INSERT でまとめて作成する
+
+        コミットは呼び出し側の Unit of Work が行う。
+
+        Args:
+            items: 作成するタスクのデータ
+
+        Returns:
+            list[TaskRead]: 作成されたタスク
+        """
+        tasks = self.task_repo.bulk_create(items)
+        logger.debug(f"タスクを一括作成しました: {len(tasks)} 件")
+        return tasks
+
+    @handle_service_errors(SERVICE_NAME, "一括更新", TaskServiceError)
+    def bulk_update_status(self, task_ids: Sequence[uuid.UUID], status: TaskStatus) -> int:
+        """複数のタスクのステータスを 1 回の UPDATE で変更する
+
+        コミットは呼び出し側の Unit of Work が行う。
+
+        Args:
+            task_ids: 対象のタスクID
+            status: 設定するステータス
+
+        Returns:
+            int: 更新した件数
+        """
+        updated = self.task_repo.bulk_update_status(task_ids, status)
+        logger.debug(f"タスク {updated} 件のステータスを {status} に変更しました")
+        return updated
+
+    @handle_service_errors(SERVICE_NAME, "一括削除", TaskServiceError)
+    def bulk_delete(self, task_ids: Sequence[uuid.UUID]) -> int:
+        """複数のタスクをタグの関連ごとまとめて削除する
+
+        コミットは呼び出し側の Unit of Work が行う。
+
+        Args:
+            task_ids: 削除するタスクID
+
+        Returns:
+            int: 削除した件数
+        """
+        deleted = self.task_repo.bulk_delete(task_ids)
+        logger.debug(f"タスクを一括削除しました: {deleted} 件")
+        return deleted
+
+    @handle_service_errors(SERVICE_NAME, "タグ一括追加", TaskServiceError)
+    def bulk_link_tags(self, task_ids: Sequence[uuid.UUID], tag_ids: Sequence[uuid.UUID]) -> int:
+        """複数のタスクに複数のタグをまとめて関連付ける
+
+        コミットは呼び出し側の Unit of Work が行う。
+
+        Args:
+            task_ids: 対象のタスクID
+            tag_ids: 関連付けるタグのID
+
+        Returns:
+            int: 新たに関連付けた組み合わせの件数
+        """
+        return self.task_repo.bulk_link_tags(task_ids, tag_ids)
+
+    @handle_service_errors(SERVICE_NAME, "一括取得", TaskServiceError)
+    @convert_read_model(TaskRead, is_list=True)
+    def get_by_ids(self, task_ids: Sequence[uuid.UUID], *, with_details: bool = False) -> list[Task]:
+        """複数のタスクを 1 回のクエリで取得する
+
+        Args:
+            task_ids: 取得するタスクID
+            with_details: 関連情報を含めるか
+
+        Returns:
+            list[TaskRead]: 取得したタスク (指定順、存在しない ID は含まれない)
+        """
+        return self.task_repo.get_by_ids(task_ids, with_details=with_details)
+
     @handle_service_errors(SERVICE_NAME, "タグ削除", TaskServiceError)
     @convert_read_model(TaskRead)
     def remove_tag(self, task_id: uuid.UUID, tag_id: uuid.UUID) -> Task:
@@ -204,6 +293,77 @@ class TaskService(ServiceBase):
         logger.info(f"全てのタスクを取得しました: {len(tasks)} 件")
         return tasks
 
+    @handle_service_errors(SERVICE_NAME, "ページ取得", TaskServiceError)
+    def get_page(
+        self,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        order_by: PageOrderKey = "created_at",
+        with_details: bool = False,
+    ) -> Page[TaskRead]:
+        """タスクをキーセットページングで取得する (新しい順)
+
+        Args:
+            page_size: 1 ページあたりの件数
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+            order_by: ソートキー (``created_at`` / ``updated_at``)
+            with_details: 関連エンティティを含めるかどうか
+
+        Returns:
+            Page[TaskRead]: ページング結果 (該当なしの場合は空のページ)
+
+        Raises:
+            TaskServiceError: ページサイズ・カーソルが不正、または取得に失敗した場合
+        """
+        page = self.task_repo.get_page(page_size=page_size, cursor=cursor, order_by=order_by, with_details=with_details)
+        logger.debug(f"タスクのページを取得しました: {len(page.items)} 件")
+
+        return page.map(TaskRead.model_validate)
+
+    @handle_service_errors(SERVICE_NAME, "ページ取得", TaskServiceError)
+    def find_page(
+        self,
+        spec: QuerySpec,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        with_details: bool = False,
+    ) -> Page[TaskRead]:
+        """検索条件の仕様に一致するタスクをキーセットページングで取得する
+
+        Args:
+            spec: 検索条件 (並び順は ``created_at`` / ``updated_at``)
+            page_size: 1 ページあたりの件数
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+            with_details: 関連エンティティを含めるかどうか
+
+        Returns:
+            Page[TaskRead]: ページング結果 (該当なしの場合は空のページ)
+
+        Raises:
+            TaskServiceError: 条件・ページサイズ・カーソルが不正、または取得に失敗した場合
+        """
+        page = self.task_repo.find_page(spec, page_size=page_size, cursor=cursor, with_details=with_details)
+        logger.debug(f"条件に一致するタスクのページを取得しました: {len(page.items)} 件")
+
+        return page.map(TaskRead.model_validate)
+
+    @handle_service_errors(SERVICE_NAME, "件数取得", TaskServiceError)
+    def count(self, spec: QuerySpec) -> int:
+        """検索条件の仕様に一致するタスクの件数を取得する
+
+        Args:
+            spec: 検索条件 (並び順・件数は無視する)
+
+        Returns:
+            int: 一致件数
+
+        Raises:
+            TaskServiceError: 条件が不正、または件数の取得に失敗した場合
+        """
+        return self.task_repo.count(spec)
+
     @handle_service_errors(SERVICE_NAME, "ステータス取得", TaskServiceError)
     @convert_read_model(TaskRead, is_list=True)
     def list_by_status(self, status: TaskStatus, *, with_details: bool = False) -> list[Task]:
@@ -263,12 +423,31 @@ class TaskService(ServiceBase):
         logger.debug(f"タスク({task_id})にタグ({tag_id})を追加しました。")
         return task
 
+    @handle_service_errors(SERVICE_NAME, "検索", TaskServiceError)
+    @convert_read_model(TaskRead, is_list=True)
+    def find(self, spec: QuerySpec, *, with_details: bool = False) -> list[Task]:
+        """検索条件の仕様に一致するタスクを取得する
+
+        Args:
+            spec: 検索条件 (テキスト・ステータス・タグ・並び順・件数など)
+            with_details: 関連エンティティを含めるかどうか
+
+        Returns:
+            list[TaskRead]: 一致したタスク一覧 (該当なしの場合は空リスト)
+
+        Raises:
+            TaskServiceError: 条件が不正、または検索に失敗した場合
+        """
+        results = self.task_repo.find(spec, with_details=with_details)
+        logger.debug(f"条件に一致するタスクを {len(results)} 件取得しました。")
+        return results
+
     @handle_service_errors(SERVICE_NAME, "検索", TaskServiceError)
     @convert_read_model(TaskRead, is_list=True)
     def search_tasks(self, query: str, *, with_details: bool = False) -> list[Task]:
         """クエリでタスクを検索する
 
-        タイトルと説明の双方を部分一致・大文字小文字無視で検索し、重複を除去して返す。
+        タイトルと説明の双方を全文検索インデックスで検索し、関連度順に返す。
 
         Args:
             query: 検索クエリ
@@ -277,19 +456,28 @@ class TaskService(ServiceBase):
         Returns:
             list[TaskRead]: 検索結果のタスク一覧
         """
-        # タイトルと説明の両方を検索し、IDで重複排除
-        try:
-            by_title = self.task_repo.search_by_title(query, with_details=with_details)
-        except NotFoundError:
-            by_title = []
-        try:
-            by_desc = self.task_repo.search_by_description(query, with_details=with_details)
-        except NotFoundError:
-            by_desc = []
-        merged: dict[uuid.UUID, Task] = {}
-        for t in by_title + by_desc:
-            if t.id is not None:
-                merged[t.id] = t
-        results = list(merged.values())
+        hits = self.task_repo.search_fulltext(query, limit=None, with_details=with_details)
+        results = [hit.item for hit in hits]
         logger.debug(f"クエリ '{query}' に一致するタスクを {len(results)} 件取得しました。")
         return results
+
+    @handle_service_errors(SERVICE_NAME, "検索", TaskServiceError)
+    def search_hits(
+        self, query: str, *, limit: int | None = DEFAULT_SEARCH_LIMIT, with_details: bool = False
+    ) -> list[SearchHit[TaskRead]]:
+        """クエリでタスクを全文検索し、関連度と抜粋付きの結果を返す
+
+        Args:
+            query: 検索クエリ
+            limit: 最大取得件数 (None で無制限)
+            with_details: 関連エンティティを含めるかどうか
+
+        Returns:
+            list[SearchHit[TaskRead]]: 関連度順の検索結果 (該当なしの場合は空リスト)
+
+        Raises:
+            TaskServiceError: 検索に失敗した場合
+        """
+        hits = self.task_repo.search_fulltext(query, limit=limit, with_details=with_details)
+        logger.debug(f"クエリ '{query}' に一致するタスクを {len(hits)} 件取得しました。")
+        return [SearchHit(item=TaskRead.model_validate(hit.item), score=hit.score, snippet=hit.snippet) for hit in hits]
@@ -12,7 +12,7 @@ from pathlib import Path
 
 from loguru import logger
 
-from logic.repositories import RepositoryFactory, TagRepository
+from logic.repositories import DEFAULT_PAGE_SIZE, Page, QuerySpec, RepositoryFactory, TagRepository, as_loaded
 from logic.repositories.term import TermRepository
 from logic.services.base import MyBaseError, ServiceBase, convert_read_model, handle_service_errors
 from models import Term, TermCreate, TermRead, TermStatus, TermUpdate
@@ -230,6 +230,40 @@ class TerminologyService(ServiceBase):
         logger.debug(f"{len(terms)} 件の用語を取得しました。")
         return terms
 
+    @handle_service_errors(SERVICE_NAME, "ページ取得", TerminologyServiceError)
+    def find_page(
+        self, spec: QuerySpec, *, page_size: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+    ) -> Page[TermRead]:
+        """検索条件の仕様に一致する用語をキーセットページングで取得する (同義語・タグを含む)
+
+        Args:
+            spec: 検索条件 (並び順は ``created_at`` / ``updated_at``)
+            page_size: 1 ページあたりの件数
+            cursor: 直前ページの `Page.next_cursor` (先頭ページは None)
+
+        Returns:
+            Page[TermRead]: ページング結果 (該当なしの場合は空のページ)
+
+        Raises:
+            TerminologyServiceError: 条件・ページサイズ・カーソルが不正、または取得に失敗した場合
+        """
+        page = self.term_repo.find_page(spec, page_size=page_size, cursor=cursor, with_details=True)
+        logger.debug(f"条件に一致する用語のページを取得しました: {len(page.items)} 件")
+        return page.map(lambda term: TermRead.model_validate(as_loaded(term)))
+
+    @handle_service_errors(SERVICE_NAME, "集計", TerminologyServiceError)
+    def count_by_status(self) -> dict[TermStatus, int]:
+        """ステータスごとの用語件数を取得する
+
+        Returns:
+            dict[TermStatus, int]: ステータスごとの件数 (0 件のステータスも 0 として含む)
+
+        Raises:
+            TerminologyServiceError: 集計に失敗した場合
+        """
+        counts = self.term_repo.count_by_status()
+        return {status: counts.get(status, 0) for status in TermStatus}
+
     # ==============================================================================
     # Search operations
     # ==============================================================================
@@ -452,7 +486,9 @@ class TerminologyService(ServiceBase):
             reader = csv.DictReader(f)
             for row_num, row in enumerate(reader, start=2):  # ヘッダー行を1行目とする
                 try:
-                    self._import_term_from_csv_row(row)
+                    # 失敗した行の途中までの変更 (用語・同義語・タグ) だけを取り消す
+                    with self.term_repo.savepoint():
+                        self._import_term_from_csv_row(row)
                     success_count += 1
                 except Exception as e:
                     failed_count += 1
@@ -498,32 +534,33 @@ class TerminologyService(ServiceBase):
 
         for idx, item in enumerate(data, start=1):
             try:
-                # 用語作成
-                term_data = TermCreate(
-                    key=item["key"],
-                    title=item["title"],
-                    description=item.get("description"),
-                    status=TermStatus(item.get("status", "draft")),
-                    source_url=item.get("source_url"),
-                )
-                term = self.term_repo.create(term_data)
-
-                # 同義語追加
-                if term.id:
-                    for synonym in item.get("synonyms", []):
-                        self.term_repo.add_synonym(term.id, synonym)
-
-                    # タグ追加
-                    for tag_name in item.get("tags", []):
-                        # タグを検索または作成
-                        try:
-                            tag = self.tag_repo.get_by_name(tag_name)
-                        except Exception:
-                            from models import TagCreate
-
-                            tag = self.tag_repo.create(TagCreate(name=tag_name))
-                        if tag.id:
-                            self.term_repo.add_tag(term.id, tag.id)
+                with self.term_repo.savepoint():
+                    # 用語作成
+                    term_data = TermCreate(
+                        key=item["key"],
+                        title=item["title"],
+                        description=item.get("description"),
+                        status=TermStatus(item.get("status", "draft")),
+                        source_url=item.get("source_url"),
+                    )
+                    term = self.term_repo.create(term_data)
+
+                    # 同義語追加
+                    if term.id:
+                        for synonym in item.get("synonyms", []):
+                            self.term_repo.add_synonym(term.id, synonym)
+
+                        # タグ追加
+                        for tag_name in item.get("tags", []):
+                            # タグを検索または作成
+                            try:
+                                tag = self.tag_repo.get_by_name(tag_name)
+                            except Exception:
+                                from models import TagCreate
+
+                                tag = self.tag_repo.create(TagCreate(name=tag_name))
+                            if tag.id:
+                                self.term_repo.add_tag(term.id, tag.id)
 
                 success_count += 1
             except Exception as e:
@@ -10,7 +10,7 @@ from loguru import logger
 
 from agents.task_agents.review_copilot import ReviewCopilotAgent
 from errors import NotFoundError
-from logic.repositories import MemoRepository, ProjectRepository, RepositoryFactory, TaskRepository
+from logic.repositories import MemoRepository, ProjectRepository, RepositoryFactory, TaskRepository, as_loaded
 from logic.services.base import MyBaseError, ServiceBase, handle_service_errors
 from models import (
     CompletedTaskDigest,
@@ -163,6 +163,7 @@ class WeeklyReviewInsightsService(ServiceBase):
                 period_end,
                 project_ids=project_filters or None,
                 limit=self.review_settings.max_completed_tasks,
+                profile="review",
             )
         )
         stale_entities = self._safe_fetch(
@@ -171,12 +172,14 @@ class WeeklyReviewInsightsService(ServiceBase):
                 project_ids=project_filters or None,
                 status_filter=DEFAULT_STATUS_FILTER,
                 limit=self.review_settings.max_stale_tasks,
+                profile="review",
             )
         )
         memo_entities = self._safe_fetch(
             lambda: self.memo_repo.list_unprocessed_memos(
                 created_after=period_start,
                 limit=self.review_settings.max_unprocessed_memos,
+                profile="review",
             )
         )
 
@@ -184,8 +187,10 @@ class WeeklyReviewInsightsService(ServiceBase):
         stale = [self._build_stale_digest(task, reference=period_end) for task in stale_entities]
 
         active_projects = [
-            ProjectRead.model_validate(project)
-            for project in self._safe_fetch(lambda: self.project_repo.list_by_status(ProjectStatus.ACTIVE))
+            ProjectRead.model_validate(as_loaded(project))
+            for project in self._safe_fetch(
+                lambda: self.project_repo.list_by_status(ProjectStatus.ACTIVE, profile="review")
+            )
         ]
         filtered_projects = (
             [project for project in active_projects if project.id in project_filters]
@@ -195,7 +200,7 @@ class WeeklyReviewInsightsService(ServiceBase):
 
         memo_digests = []
         for memo in memo_entities:
-            memo_read = MemoRead.model_validate(memo)
+            memo_read = MemoRead.model_validate(as_loaded(memo))
             memo_digests.append(
                 MemoAuditDigest(
                     memo=memo_read,
@@ -215,13 +220,13 @@ class WeeklyReviewInsightsService(ServiceBase):
         return start, period_end
 
     def _build_completed_digest(self, task_entity: object) -> CompletedTaskDigest:
-        task_read = TaskRead.model_validate(task_entity)
+        task_read = TaskRead.model_validate(as_loaded(task_entity))
         memo_excerpt = self._memo_excerpt(getattr(task_entity, "memo", None))
         project_title = self._project_title(task_entity)
         return CompletedTaskDigest(task=task_read, memo_excerpt=memo_excerpt, project_title=project_title)
 
     def _build_stale_digest(self, task_entity: object, *, reference: datetime) -> ZombieTaskDigest:
-        task_read = TaskRead.model_validate(task_entity)
+        task_read = TaskRead.model_validate(as_loaded(task_entity))
         created_at: datetime = getattr(task_entity, "created_at", reference) or reference
         stale_days = max((reference - created_at).days, 0)
         memo_excerpt = self._memo_excerpt(getattr(task_entity, "memo", None))
@@ -11,9 +11,9 @@ from typing import TYPE_CHECKING, Self, TypeVar
 
 from sqlmodel import Session
 
-from config import engine
+from config import engine, read_engine
 from logic.factory import ServiceFactory
-from logic.repositories import RepositoryFactory
+from logic.repositories import DEFER_COMMIT_KEY, RepositoryFactory
 from logic.services import ServiceBase
 
 if TYPE_CHECKING:
@@ -79,17 +79,51 @@ class SqlModelUnitOfWork(UnitOfWork):
     """SQLModel用Unit of Work実装
 
     SQLModelのSessionを使用してトランザクション管理を行います。
+    read_only=True の場合は読み取り専用エンジン (query_only=ON) のセッションを使用します。
+    defer_commit=True の場合はリポジトリのコミットを flush に置き換え、正常終了時に 1 回だけコミットします。
     """
 
-    def __init__(self) -> None:
-        """SqlModelUnitOfWorkの初期化"""
+    def __init__(self, *, read_only: bool = False, defer_commit: bool = False) -> None:
+        """SqlModelUnitOfWorkの初期化
+
+        Args:
+            read_only: 参照系ユースケース向けに読み取り専用エンジンを使用するかどうか
+            defer_commit: 更新系ユースケース全体を 1 トランザクション・1 コミットにまとめるかどうか
+
+        Raises:
+            ValueError: read_only と defer_commit を同時に指定した場合
+        """
+        if read_only and defer_commit:
+            msg = "read_only と defer_commit は同時に指定できません"
+            raise ValueError(msg)
+        self._read_only = read_only
+        self._defer_commit = defer_commit
         self._session: Session | None = None
         self._repository_factory: RepositoryFactory | None = None
         self._service_factory: ServiceFactory | None = None
 
     def __enter__(self) -> Self:
         """セッション開始とファクトリ初期化"""
-        self._session = Session(engine)
+        if self._defer_commit:
+            # コミット後も戻り値のエンティティを参照できるよう、コミット時に属性を期限切れにしない
+            self._session = Session(engine, expire_on_commit=False, info={DEFER_COMMIT_KEY: True})
+            # pysqlite は最初の DML まで BEGIN を遅らせるため、明示的に BEGIN しないと SAVEPOINT が
+            # 外側のトランザクションになり、RELEASE の時点でコミットされてしまう。
+            # また、コミット遅延モードは更新系ユースケース専用で、ほとんどが「読み取ってから書き込む」。
+            # DEFERRED で始めると、読み取り後に他の接続がコミットした場合に最初の書き込みが
+            # SQLITE_BUSY (busy_timeout で待たずに即失敗) になるため、IMMEDIATE で先に書き込みロックを取る。
+            # SQLite の書き込みはもともと 1 接続ずつなので、直列化が早まるのは最初の書き込みより前の
+            # 読み取りの間だけで、読み取り専用の UoW や通常モードの UoW はロックを取らない。
+            try:
+                self._session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+            except BaseException:
+                # ロック待ちのタイムアウト (SQLITE_BUSY) などでは __exit__ が呼ばれないため、
+                # ここで閉じないとセッションの接続がプールへ返却されない
+                self._session.close()
+                self._session = None
+                raise
+        else:
+            self._session = Session(read_engine if self._read_only else engine)
         self._repository_factory = RepositoryFactory(self._session)
         self._service_factory = ServiceFactory(self._repository_factory)
         return self
@@ -100,11 +134,18 @@ class SqlModelUnitOfWork(UnitOfWork):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """セッション終了とクリーンアップ"""
-        if exc_type is not None:
-            self.rollback()
-        if self._session:
-            self._session.close()
+        """セッション終了とクリーンアップ
+
+        例外時はロールバックし、コミット遅延モードでは正常終了時にコミットする。
+        """
+        try:
+            if exc_type is not None:
+                self.rollback()
+            elif self._defer_commit:
+                self.commit()
+        finally:
+            if self._session:
+                self._session.close()
 
     def commit(self) -> None:
         """変更をコミット"""
@@ -116,6 +157,16 @@ class SqlModelUnitOfWork(UnitOfWork):
         if self._session:
             self._session.rollback()
 
+    @property
+    def read_only(self) -> bool:
+        """読み取り専用モードかどうか"""
+        return self._read_only
+
+    @property
+    def defer_commit(self) -> bool:
+        """コミット遅延モードかどうか"""
+        return self._defer_commit
+
     @property
     def session(self) -> Session:
         """現在のセッションを取得
@@ -1,9 +1,10 @@
 import flet as ft
 from loguru import logger
 
-from config import APP_TITLE, migrate_db
+from config import APP_TITLE, configure_engines, migrate_db
 from logging_conf import setup_logger
 from logic.application.apps import ApplicationServices
+from logic.application.memo_ai_prefetcher import start_memo_ai_prefetcher
 from router import configure_routes  # [AI UPDATED] 新しいルーティングシステムを使用
 from settings.manager import apply_page_settings, get_config_manager  # [AI GENERATED] 設定管理を追加
 
@@ -23,7 +24,9 @@ def main(page: ft.Page) -> None:
     # DBマイグレーション実行
     migrate_db()
     # 設定ファイル読み込み（初期生成含む）
-    get_config_manager()
+    config_manager = get_config_manager()
+    # データベースのチューニング設定を適用
+    configure_engines(config_manager.settings.database)
     # 設定適用（テーマ等）
     apply_page_settings(page)
     page.padding = 0
@@ -52,6 +55,15 @@ def main(page: ft.Page) -> None:
 
     apps = ApplicationServices.create()
 
+    # 前回の起動で完了しなかった AI ジョブを再開
+    try:
+        apps.memo.resume_ai_jobs()
+    except Exception:
+        logger.exception("AIジョブの再開に失敗しました。")
+
+    # 設定で有効にした場合、アイドル時に新しい INBOX メモの AI 提案を先読みする
+    start_memo_ai_prefetcher(apps)
+
     # 新しいviewsシステムを使用したルーティング設定
     configure_routes(page, apps)
 
@@ -59,6 +59,7 @@ from enum import Enum
 from typing import List, Optional
 
 from pydantic import ConfigDict
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -235,6 +236,10 @@ class TaskStatus(str, Enum):
     OVERDUE = "overdue"
 
 
+CLOSED_TASK_STATUSES: tuple[TaskStatus, ...] = (TaskStatus.COMPLETED, TaskStatus.CANCELED)
+"""期限超過の判定から除外する、終了済みのタスクステータス"""
+
+
 class TermStatus(str, Enum):
     """用語のステータス
 
@@ -995,6 +1000,55 @@ class SynonymUpdate(SQLModel):
     term_id: uuid.UUID | None = None
 
 
+# ==============================================================================
+# ==============================================================================
+# Job Models (ジョブモデル)
+# ==============================================================================
+# ==============================================================================
+
+
+class MemoAiJob(SQLModel, table=True):
+    """メモ→タスク生成ジョブの永続化モデル
+
+    再起動やクラッシュをまたいでジョブを再開するため、`MemoAiJobQueue` の状態を保存する。
+    状態値は `logic.application.memo_ai_job_queue.MemoAiJobStatus` の値を文字列で保持する。
+    メモの削除をジョブの有無で妨げないよう、memo_id には外部キーを張らない。
+
+    Attributes:
+        id: ジョブID。
+        memo_id: 対象メモのID。
+        status: ジョブの状態 (queued/deferred/running/succeeded/failed)。
+        priority: 優先度レーン (interactive/background/prefetch)。
+        provider: 実行する LLM プロバイダ。
+        attempts: 実行を開始した回数。
+        lease_owner: 実行中のワーカー (プロセス) の識別子。
+        lease_expires_at: 実行権の有効期限 (UTC)。期限切れの RUNNING はクラッシュとみなして再開する。
+        result: 生成結果 (JSON)。
+        error_message: 失敗時のエラーメッセージ。
+        created_at: 登録日時 (UTC)。
+        updated_at: 最終更新日時 (UTC)。
+    """
+
+    __tablename__ = "memo_ai_jobs"
+    __table_args__ = (
+        Index("ix_memo_ai_jobs_memo_id_updated_at", "memo_id", "updated_at"),
+        Index("ix_memo_ai_jobs_status_created_at", "status", "created_at"),
+    )
+
+    id: uuid.UUID = Field(primary_key=True)
+    memo_id: uuid.UUID
+    status: str
+    priority: str
+    provider: str | None = Field(default=None)
+    attempts: int = Field(default=0)
+    lease_owner: str | None = Field(default=None)
+    lease_expires_at: datetime | None = Field(default=None)
+    result: str | None = Field(default=None)
+    error_message: str | None = Field(default=None)
+    created_at: datetime
+    updated_at: datetime
+
+
 # ==============================================================================
 # Review DTO modules
 # ==============================================================================
@@ -1015,12 +1069,29 @@ from .review import (  # noqa: E402  # pylint: disable=wrong-import-position
     ZombieTaskInsight,
     ZombieTaskSuggestion,
 )
+from .stats import (  # noqa: E402  # pylint: disable=wrong-import-position
+    DashboardStats,
+    MemoStats,
+    ProjectSummary,
+    ProjectTaskRow,
+    ProjectTaskStats,
+    TagUsage,
+    TaskStats,
+    is_task_overdue,
+)
 
 __all__ = [
     "CompletedTaskDigest",
+    "DashboardStats",
     "MemoAuditDigest",
     "MemoAuditInsight",
+    "MemoStats",
+    "ProjectSummary",
+    "ProjectTaskRow",
+    "ProjectTaskStats",
     "ReviewPeriod",
+    "TagUsage",
+    "TaskStats",
     "WeeklyReviewHighlightsItem",
     "WeeklyReviewHighlightsPayload",
     "WeeklyReviewInsights",
@@ -1031,4 +1102,5 @@ __all__ = [
     "ZombieTaskDigest",
     "ZombieTaskInsight",
     "ZombieTaskSuggestion",
+    "is_task_overdue",
 ]
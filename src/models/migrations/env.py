@@ -1,3 +1,4 @@
+import re
 import sys
 from logging.config import fileConfig
 from pathlib import Path
@@ -29,6 +30,23 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 # target_metadata = Base.metadata
 target_metadata = SQLModel.metadata
+# 全文検索 (FTS5) の仮想テーブルと、SQLite が自動生成するシャドウテーブル (`*_fts_data` など)。
+# モデルには定義せずマイグレーションの SQL で作成するため、autogenerate の比較対象から外す
+# (外さないと `alembic check` / `revision --autogenerate` が索引の削除を提案する)。
+FTS_TABLE_PATTERN = re.compile(r".+_fts(_.+)?")
+
+
+def include_object(
+    _object: object,
+    name: str | None,
+    type_: str,
+    _reflected: bool,  # noqa: FBT001 - alembic から位置引数で呼ばれる
+    _compare_to: object,
+) -> bool:
+    """Autogenerate で比較するオブジェクトかどうか (全文検索のテーブルは除外する)"""
+    return not (type_ == "table" and name is not None and FTS_TABLE_PATTERN.fullmatch(name))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -53,6 +71,7 @@ def run_migrations_offline() -> None:
         target_metadata=Base.metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -73,7 +92,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=Base.metadata)
+        context.configure(connection=connection, target_metadata=Base.metadata, include_object=include_object)
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,70 @@
+"""add fulltext search
+
+Revision ID: 20261016_add_fulltext_search
+Revises: 20251208_add_project_draft_status
+Create Date: 2026-10-16 09:00:00.000000
+
+メモ/タスク/プロジェクト/用語に FTS5 (trigram) の外部コンテンツ索引と同期トリガーを追加する。
+マイグレーションは履歴として固定するため、DDL は logic.repositories.fulltext を参照せずに記述する。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_add_fulltext_search"
+down_revision: Union[str, Sequence[str], None] = "20251208_add_project_draft_status"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (元テーブル, 索引対象列)
+_INDEXES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("memos", ("title", "content")),
+    ("tasks", ("title", "description")),
+    ("projects", ("title", "description")),
+    ("terms", ("key", "title", "description")),
+)
+
+
+def _is_sqlite() -> bool:
+    bind = op.get_bind()
+    return bind.dialect.name == "sqlite"
+
+
+def upgrade() -> None:
+    if not _is_sqlite():
+        # FTS5 は SQLite 専用のため、他の DB では LIKE 検索のまま運用する。
+        return
+
+    for source, columns in _INDEXES:
+        fts = f"{source}_fts"
+        cols = ", ".join(columns)
+        new_values = ", ".join(f"new.{c}" for c in columns)
+        old_values = ", ".join(f"old.{c}" for c in columns)
+        delete_row = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old_values});"
+        insert_row = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new_values});"
+
+        op.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{cols}, content='{source}', content_rowid='rowid', tokenize='trigram')"
+        )
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN {insert_row} END")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN {delete_row} END")
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {source} "
+            f"BEGIN {delete_row} {insert_row} END"
+        )
+        # 既存行を索引へ取り込む
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if not _is_sqlite():
+        return
+
+    for source, _columns in reversed(_INDEXES):
+        fts = f"{source}_fts"
+        op.execute(f"DROP TRIGGER IF EXISTS {fts}_au")
+        op.execute(f"DROP TRIGGER IF EXISTS {fts}_ad")
+        op.execute(f"DROP TRIGGER IF EXISTS {fts}_ai")
+        op.execute(f"DROP TABLE IF EXISTS {fts}")
@@ -0,0 +1,46 @@
+"""add memo ai jobs
+
+Revision ID: 20261016_add_memo_ai_jobs
+Revises: 20261016_add_fulltext_search
+Create Date: 2026-10-16 12:00:00.000000
+
+メモ→タスク生成ジョブを再起動後に再開できるよう、ジョブの状態を保存するテーブルを追加する。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_add_memo_ai_jobs"
+down_revision: Union[str, Sequence[str], None] = "20261016_add_fulltext_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "memo_ai_jobs",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("memo_id", sa.Uuid(), nullable=False),
+        sa.Column("status", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("priority", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("provider", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("lease_owner", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+        sa.Column("result", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("error_message", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_memo_ai_jobs_memo_id_updated_at", "memo_ai_jobs", ["memo_id", "updated_at"], unique=False)
+    op.create_index("ix_memo_ai_jobs_status_created_at", "memo_ai_jobs", ["status", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_memo_ai_jobs_status_created_at", table_name="memo_ai_jobs")
+    op.drop_index("ix_memo_ai_jobs_memo_id_updated_at", table_name="memo_ai_jobs")
+    op.drop_table("memo_ai_jobs")
@@ -0,0 +1,206 @@
+"""集計 (件数統計) のDTO定義。
+
+いずれも SQL の GROUP BY で集計した結果を保持する読み取り専用の値オブジェクト。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - 型チェック専用
+    from collections.abc import Iterable, Mapping
+    from datetime import date
+    from uuid import UUID
+
+    from models import AiSuggestionStatus, MemoStatus, ProjectStatus, TaskRead, TaskStatus
+
+
+def is_task_overdue(status: TaskStatus, due_date: date | None, today: date) -> bool:
+    """期限超過のタスクかどうかを判定する。
+
+    OVERDUE ステータス、または期限日を過ぎた未完了 (`CLOSED_TASK_STATUSES` 以外) のタスクを期限超過とする。
+    `TaskRepository.count_overdue` はこの判定を SQL で行う。
+
+    Args:
+        status: タスクのステータス
+        due_date: 期限日
+        today: 基準日
+
+    Returns:
+        bool: 期限超過の場合 True
+    """
+    from models import CLOSED_TASK_STATUSES, TaskStatus
+
+    if status == TaskStatus.OVERDUE:
+        return True
+    return due_date is not None and due_date < today and status not in CLOSED_TASK_STATUSES
+
+
+@dataclass(frozen=True, slots=True)
+class TaskStats:
+    """タスクのステータス別件数と期限超過件数。
+
+    Attributes:
+        by_status: ステータスごとの件数 (0 件のステータスは含まれない)
+        overdue: 期限超過の件数 (OVERDUE ステータス、または期限日を過ぎた未完了タスク)
+    """
+
+    by_status: Mapping[TaskStatus, int] = field(default_factory=dict)
+    overdue: int = 0
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[TaskRead], today: date) -> TaskStats:
+        """取得済みのタスク一覧から集計する (集計クエリを使えない場合の代替)。
+
+        Args:
+            tasks: 集計対象のタスク
+            today: 期限超過の判定に使う基準日
+
+        Returns:
+            TaskStats: タスクの件数統計
+        """
+        by_status: dict[TaskStatus, int] = {}
+        overdue = 0
+        for task in tasks:
+            by_status[task.status] = by_status.get(task.status, 0) + 1
+            overdue += is_task_overdue(task.status, task.due_date, today)
+        return cls(by_status=by_status, overdue=overdue)
+
+    @property
+    def total(self) -> int:
+        """全タスク件数。"""
+        return sum(self.by_status.values())
+
+    def count(self, *statuses: TaskStatus) -> int:
+        """指定ステータスの件数の合計を返す。"""
+        return sum(self.by_status.get(status, 0) for status in statuses)
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectTaskStats:
+    """プロジェクト単位のタスク件数。
+
+    Attributes:
+        project_id: プロジェクトID
+        by_status: ステータスごとの件数 (0 件のステータスは含まれない)
+    """
+
+    project_id: UUID
+    by_status: Mapping[TaskStatus, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """プロジェクトに属するタスク件数。"""
+        return sum(self.by_status.values())
+
+    @property
+    def completed(self) -> int:
+        """完了済みタスク件数。"""
+        from models import TaskStatus
+
+        return self.by_status.get(TaskStatus.COMPLETED, 0)
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectTaskRow:
+    """プロジェクト画面向けの軽量なタスク行。
+
+    Attributes:
+        id: タスクID
+        title: タスクタイトル
+        status: タスクステータス
+    """
+
+    id: UUID
+    title: str
+    status: TaskStatus
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectSummary:
+    """プロジェクト単位のタスク概要 (件数と軽量なタスク行)。
+
+    Attributes:
+        project_id: プロジェクトID
+        tasks: プロジェクトに属するタスク行 (作成日時順)
+    """
+
+    project_id: UUID
+    tasks: tuple[ProjectTaskRow, ...] = ()
+
+    @property
+    def task_count(self) -> int:
+        """プロジェクトに属するタスク件数。"""
+        return len(self.tasks)
+
+    @property
+    def completed_count(self) -> int:
+        """完了済みタスク件数。"""
+        from models import TaskStatus
+
+        return sum(1 for task in self.tasks if task.status == TaskStatus.COMPLETED)
+
+    @property
+    def task_ids(self) -> list[UUID]:
+        """タスクIDの一覧。"""
+        return [task.id for task in self.tasks]
+
+
+@dataclass(frozen=True, slots=True)
+class MemoStats:
+    """メモのステータス別・AI提案状態別の件数。
+
+    Attributes:
+        by_status: ステータスごとの件数
+        by_ai_status: AI提案状態ごとの件数
+    """
+
+    by_status: Mapping[MemoStatus, int] = field(default_factory=dict)
+    by_ai_status: Mapping[AiSuggestionStatus, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """全メモ件数。"""
+        return sum(self.by_status.values())
+
+    def count(self, *statuses: MemoStatus) -> int:
+        """指定ステータスの件数の合計を返す。"""
+        return sum(self.by_status.get(status, 0) for status in statuses)
+
+
+@dataclass(frozen=True, slots=True)
+class TagUsage:
+    """タグの利用件数。
+
+    Attributes:
+        tag_id: タグID
+        name: タグ名
+        memo_count: タグが付いたメモの件数
+        task_count: タグが付いたタスクの件数
+    """
+
+    tag_id: UUID
+    name: str
+    memo_count: int = 0
+    task_count: int = 0
+
+    @property
+    def total(self) -> int:
+        """メモとタスクを合わせた利用件数。"""
+        return self.memo_count + self.task_count
+
+
+@dataclass(frozen=True, slots=True)
+class DashboardStats:
+    """ホーム画面・CLI 向けの集計値一式。
+
+    Attributes:
+        tasks: タスクの件数統計
+        memos: メモの件数統計
+        projects_by_status: プロジェクトのステータスごとの件数
+    """
+
+    tasks: TaskStats = field(default_factory=TaskStats)
+    memos: MemoStats = field(default_factory=MemoStats)
+    projects_by_status: Mapping[ProjectStatus, int] = field(default_factory=dict)
@@ -15,7 +15,9 @@ if TYPE_CHECKING:
 
     from logic.application.apps import ApplicationServices
 
-from views.layout import build_layout
+from logic.events import DataChanged
+from views.layout import ViewCache, build_layout
+from views.shared.page_events import connect_page_events
 
 
 def configure_routes(page: ft.Page, apps: ApplicationServices) -> None:
@@ -28,9 +30,15 @@ def configure_routes(page: ft.Page, apps: ApplicationServices) -> None:
     Notes:
         新しいviewsレイアウトシステムを使用し、
         build_layout関数でサイドバー統合レイアウトを構築する。
+        最近表示した View はページごとの ViewCache で保持し、ルート移動のたびに再読み込みしない。
+        ドメインイベントはページごとの PageEvents で page.pubsub へ中継し、表示中の View へ即座に反映する。
     """
     import flet as ft  # noqa: F401
 
+    view_cache = ViewCache()
+    page_events = connect_page_events(page)
+    page_events.subscribe(DataChanged, lambda event: view_cache.notify_data_changed(event.tables))
+
     def route_change(e: ft.RouteChangeEvent) -> None:
         """ルート変更イベントハンドラ。
 
@@ -45,7 +53,7 @@ def configure_routes(page: ft.Page, apps: ApplicationServices) -> None:
             page.views.clear()
 
             # Build new layout with sidebar
-            new_view = build_layout(page, route, apps)
+            new_view = build_layout(page, route, apps, view_cache=view_cache)
             page.views.append(new_view)
 
             page.update()
@@ -71,9 +79,19 @@ def configure_routes(page: ft.Page, apps: ApplicationServices) -> None:
             # Go to home if no views left
             page.go("/")
 
+    def close(_: ft.ControlEvent) -> None:
+        """ページ (セッション) 終了時に View とイベントの購読を破棄する。
+
+        Args:
+            _: 終了イベント（未使用）
+        """
+        view_cache.clear()
+        page_events.close()
+
     # Set up Flet routing events
     page.on_route_change = route_change
     page.on_view_pop = view_pop
+    page.on_close = close
 
     # Navigate to initial route
     page.go(page.route or "/")
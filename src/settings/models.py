@@ -16,6 +16,16 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from agents.agent_conf import HuggingFaceModel, LLMProvider, OpenVINODevice  # [AI GENERATED] Enum によるバリデーション
+from database import (
+    DB_DEFAULT_BUSY_TIMEOUT_MS,
+    DB_DEFAULT_CACHE_SIZE_KIB,
+    DB_DEFAULT_JOURNAL_MODE,
+    DB_DEFAULT_MAX_OVERFLOW,
+    DB_DEFAULT_MMAP_SIZE,
+    DB_DEFAULT_POOL_SIZE,
+    DB_DEFAULT_SYNCHRONOUS,
+    DB_DEFAULT_TEMP_STORE,
+)
 
 # テーマ定数
 AVAILABLE_THEMES: Final[list[tuple[str, str]]] = [
@@ -245,6 +255,42 @@ class AgentRuntimeSettings(BaseModel):
     )
 
 
+class AiPrefetchSettings(BaseModel):
+    """新しい INBOX メモの AI 提案を、アプリのアイドル中に先読みする設定。"""
+
+    model_config = ConfigDict(frozen=True)
+
+    enabled: bool = Field(default=False, description="先読みを有効にする (既定は無効)")
+    idle_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="最後の対話的な AI 実行からこの秒数が経過したら先読みを始める",
+    )
+    cpu_budget: float = Field(
+        default=0.25,
+        gt=0.0,
+        le=1.0,
+        description=(
+            "OpenVINO 実行時に先読みへ使う時間の割合の上限 "
+            "(所要時間 d の先読みの後は d * (1 / cpu_budget - 1) 秒休止する)"
+        ),
+    )
+    daily_quota: int = Field(
+        default=30,
+        ge=0,
+        description="クラウドプロバイダ実行時に 1 日に先読みするメモ数の上限",
+    )
+
+
+class EditableAiPrefetchSettings(BaseModel):
+    model_config = ConfigDict(frozen=False)
+
+    enabled: bool = Field(default=False)
+    idle_seconds: int = Field(default=30, ge=0)
+    cpu_budget: float = Field(default=0.25, gt=0.0, le=1.0)
+    daily_quota: int = Field(default=30, ge=0)
+
+
 class AgentsSettings(BaseModel):
     """エージェント全体設定 (互換性考慮せず再構築)。"""
 
@@ -269,6 +315,10 @@ class AgentsSettings(BaseModel):
         default_factory=ReviewPromptSettings,
         description="週次レビューエージェント向けプロンプト設定。",
     )
+    prefetch: AiPrefetchSettings | EditableAiPrefetchSettings = Field(
+        default_factory=AiPrefetchSettings,
+        description="INBOX メモの AI 提案の先読み設定。",
+    )
 
     def get_model_name(self, agent_key: str) -> HuggingFaceModel | str | None:  # [AI GENERATED]
         """現在の provider に応じて該当エージェントのモデル名 (Enum/str/None) を返す。
@@ -331,6 +381,15 @@ class AgentsSettings(BaseModel):
             return ReviewPromptSettings.model_validate(v.model_dump())
         return v
 
+    @field_validator("prefetch", mode="before")
+    @classmethod
+    def _from_editable_prefetch(
+        cls, v: AiPrefetchSettings | EditableAiPrefetchSettings | dict[str, Any] | None
+    ) -> AiPrefetchSettings | dict[str, Any] | None:
+        if isinstance(v, EditableAiPrefetchSettings) and not isinstance(v, AiPrefetchSettings):
+            return AiPrefetchSettings.model_validate(v.model_dump())
+        return v
+
 
 class EditableHuggingFaceAgentModels(BaseModel):
     model_config = ConfigDict(frozen=False)
@@ -368,6 +427,7 @@ class EditableAgentsSettings(BaseModel):
     review_prompt: EditableReviewPromptSettings | ReviewPromptSettings = Field(
         default_factory=EditableReviewPromptSettings
     )
+    prefetch: EditableAiPrefetchSettings | AiPrefetchSettings = Field(default_factory=EditableAiPrefetchSettings)
 
     def get_model_name(self, agent_key: str) -> HuggingFaceModel | str | None:  # [AI GENERATED]
         if self.provider in (LLMProvider.OPENVINO,):
@@ -425,17 +485,72 @@ class EditableAgentsSettings(BaseModel):
             return EditableReviewPromptSettings.model_validate(v.model_dump())
         return v
 
+    @field_validator("prefetch", mode="before")
+    @classmethod
+    def _convert_prefetch(
+        cls, v: EditableAiPrefetchSettings | AiPrefetchSettings | dict[str, Any] | None
+    ) -> EditableAiPrefetchSettings | dict[str, Any] | None:
+        if isinstance(v, AiPrefetchSettings) and not isinstance(v, EditableAiPrefetchSettings):
+            return EditableAiPrefetchSettings.model_validate(v.model_dump())
+        return v
+
+
+SqliteJournalMode = Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"]
+SqliteSynchronous = Literal["OFF", "NORMAL", "FULL", "EXTRA"]
+SqliteTempStore = Literal["DEFAULT", "FILE", "MEMORY"]
+
 
 class DatabaseSettings(BaseModel):
-    """データベース接続に関する設定。"""
+    """データベース接続に関する設定。
+
+    SQLite のチューニング値は `database.SqliteProfile` に変換され、接続確立時に PRAGMA として適用される。
+    """
 
     model_config = ConfigDict(frozen=True)
 
-    # 既存の SQLite 利用を想定し最低限のフィールドのみ。将来拡張時は別モデルへ分離。
     url: str = Field(
         default="sqlite:///storage/data/tasks.db",
         description="接続 URL。既定はアプリ内 SQLite ファイル。",
     )
+    journal_mode: SqliteJournalMode = Field(
+        default=DB_DEFAULT_JOURNAL_MODE,
+        description="SQLite のジャーナルモード。WAL では読み取りが書き込みにブロックされない。",
+    )
+    synchronous: SqliteSynchronous = Field(
+        default=DB_DEFAULT_SYNCHRONOUS,
+        description="SQLite の synchronous。WAL 利用時は NORMAL を推奨。",
+    )
+    mmap_size: int = Field(
+        default=DB_DEFAULT_MMAP_SIZE,
+        ge=0,
+        description="メモリマップ I/O に使う最大バイト数。0 で無効。",
+    )
+    cache_size_kib: int = Field(
+        default=DB_DEFAULT_CACHE_SIZE_KIB,
+        ge=0,
+        description="接続ごとのページキャッシュサイズ (KiB)。",
+    )
+    temp_store: SqliteTempStore = Field(
+        default=DB_DEFAULT_TEMP_STORE,
+        description="一時テーブル/インデックスの保存先。",
+    )
+    busy_timeout_ms: int = Field(
+        default=DB_DEFAULT_BUSY_TIMEOUT_MS,
+        ge=0,
+        description="ロック競合時に待機する最大ミリ秒。",
+    )
+    pool_size: int = Field(
+        default=DB_DEFAULT_POOL_SIZE,
+        ge=1,
+        le=64,
+        description="コネクションプールの常駐接続数 (再起動後に反映)。",
+    )
+    max_overflow: int = Field(
+        default=DB_DEFAULT_MAX_OVERFLOW,
+        ge=0,
+        le=64,
+        description="プール上限を超えて一時的に開ける接続数 (再起動後に反映)。",
+    )
 
 
 class EditableDatabaseSettings(BaseModel):
@@ -447,6 +562,14 @@ class EditableDatabaseSettings(BaseModel):
         default="sqlite:///storage/data/tasks.db",
         description="接続 URL。既定はアプリ内 SQLite ファイル。",
     )
+    journal_mode: SqliteJournalMode = Field(default=DB_DEFAULT_JOURNAL_MODE)
+    synchronous: SqliteSynchronous = Field(default=DB_DEFAULT_SYNCHRONOUS)
+    mmap_size: int = Field(default=DB_DEFAULT_MMAP_SIZE, ge=0)
+    cache_size_kib: int = Field(default=DB_DEFAULT_CACHE_SIZE_KIB, ge=0)
+    temp_store: SqliteTempStore = Field(default=DB_DEFAULT_TEMP_STORE)
+    busy_timeout_ms: int = Field(default=DB_DEFAULT_BUSY_TIMEOUT_MS, ge=0)
+    pool_size: int = Field(default=DB_DEFAULT_POOL_SIZE, ge=1, le=64)
+    max_overflow: int = Field(default=DB_DEFAULT_MAX_OVERFLOW, ge=0, le=64)
 
 
 class AppSettings(BaseModel):
@@ -32,6 +32,7 @@ class DailyReviewCard(ft.Container):
         review: dict[str, Any],
         on_action_click: Callable[[str], None] | None = None,
         is_loading: bool = False,
+        partial_message: str | None = None,
     ) -> None:
         """デイリーレビューカードを初期化。
 
@@ -39,10 +40,12 @@ class DailyReviewCard(ft.Container):
             review: デイリーレビュー情報（message, color, icon, action_text, action_route）
             on_action_click: アクションボタンクリック時のコールバック
             is_loading: AI一言生成中の場合True
+            partial_message: 生成途中のAI一言 (ローディング中に表示する)
         """
         self.review = review
         self.on_action_click = on_action_click
         self.is_loading = is_loading
+        self.partial_message = partial_message
 
         super().__init__(
             content=self._build_content(),
@@ -90,7 +93,7 @@ class DailyReviewCard(ft.Container):
                 [
                     ft.ProgressRing(width=16, height=16, stroke_width=2),
                     ft.Text(
-                        "AI一言を生成中...",
+                        self.partial_message or "AI一言を生成中...",
                         size=18,
                         weight=ft.FontWeight.NORMAL,
                         color=get_on_surface_color(),
@@ -146,15 +149,23 @@ class DailyReviewCard(ft.Container):
 
         return ft.Column(controls, spacing=0)
 
-    def update_review(self, review: dict[str, Any], *, is_loading: bool = False) -> None:
+    def update_review(
+        self,
+        review: dict[str, Any],
+        *,
+        is_loading: bool = False,
+        partial_message: str | None = None,
+    ) -> None:
         """レビュー情報を更新する。
 
         Args:
             review: 新しいレビュー情報
             is_loading: AI一言生成中の場合True
+            partial_message: 生成途中のAI一言 (ローディング中に表示する)
         """
         self.review = review
         self.is_loading = is_loading
+        self.partial_message = partial_message
         self.content = self._build_content()
         self.bgcolor = self._get_background_color()
         self.border = ft.border.all(BORDER_WIDTH.thin, self._get_border_color())
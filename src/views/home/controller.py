@@ -34,6 +34,8 @@ from typing import TYPE_CHECKING
 from loguru import logger
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .query import HomeQuery
     from .state import HomeViewState
 
@@ -108,17 +110,28 @@ class HomeController:
             self.state.update_daily_review_message(message)
             logger.debug("[Controller] daily_reviewにメッセージを反映")
 
-    def generate_one_liner_sync(self) -> str | None:
+    def set_one_liner_partial(self, text: str) -> None:
+        """生成途中のAI一言メッセージを State に反映する。
+
+        Args:
+            text: その時点までに生成されたメッセージ
+        """
+        self.state.set_one_liner_partial(text)
+
+    def generate_one_liner_sync(self, on_partial: Callable[[str], None] | None = None) -> str | None:
         """AI一言メッセージを同期的に生成する。
 
         バックグラウンドスレッドから呼び出される公開メソッド。
 
+        Args:
+            on_partial: 生成途中のメッセージを受け取るコールバック
+
         Returns:
             生成されたメッセージ(失敗時はNone)
         """
         try:
             logger.debug("[Controller] AI一言生成開始（同期処理）")
-            result = self.query.get_one_liner_message()
+            result = self.query.get_one_liner_message(on_partial)
             logger.debug(f"[Controller] AI一言生成結果: {result[:50] if result else 'None'}...")
         except Exception as e:
             logger.error(f"[Controller] AI一言メッセージの生成に失敗しました: {e}")
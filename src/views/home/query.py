@@ -30,6 +30,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Protocol
 
 from loguru import logger
@@ -42,17 +43,22 @@ from models import (
     ProjectRead,
     ProjectStatus,
     TaskRead,
+    TaskStats,
     TaskStatus,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from agents.task_agents.one_liner.state import OneLinerState
+    from logic.repositories import LoadProfileName
+    from models import DashboardStats
 
 
 class MemoServicePort(Protocol):
     """MemoApplicationService互換のポート。"""
 
-    def get_all_memos(self, *, with_details: bool = False) -> list[MemoRead]:
+    def get_all_memos(self, *, with_details: bool = False, profile: LoadProfileName | None = None) -> list[MemoRead]:
         """メモを全件取得する。"""
         ...
 
@@ -73,11 +79,24 @@ class ProjectServicePort(Protocol):
         ...
 
 
+class StatsServicePort(Protocol):
+    """StatsApplicationService互換のポート。"""
+
+    def get_dashboard_stats(self) -> DashboardStats:
+        """タスク・メモ・プロジェクトの集計値を取得する。"""
+        ...
+
+
 class OneLinerServicePort(Protocol):
     """OneLinerApplicationService互換のポート。"""
 
-    def generate_one_liner(self, query: OneLinerState | None = None) -> str:
-        """一言メッセージを生成する。"""
+    def generate_one_liner(
+        self,
+        query: OneLinerState | None = None,
+        *,
+        on_partial: Callable[[str], None] | None = None,
+    ) -> str:
+        """一言メッセージを生成する (on_partial には生成途中のメッセージが渡される)。"""
         ...
 
 
@@ -108,9 +127,12 @@ class HomeQuery(Protocol):
         """
         ...
 
-    def get_one_liner_message(self) -> str | None:
+    def get_one_liner_message(self, on_partial: Callable[[str], None] | None = None) -> str | None:
         """AI一言メッセージのみを生成する。
 
+        Args:
+            on_partial: 生成途中のメッセージを受け取るコールバック
+
         Returns:
             生成されたメッセージ（失敗時はNone）
         """
@@ -161,9 +183,12 @@ class InMemoryHomeQuery:
         """
         return self._stats
 
-    def get_one_liner_message(self) -> str | None:
+    def get_one_liner_message(self, on_partial: Callable[[str], None] | None = None) -> str | None:  # noqa: ARG002
         """AI一言メッセージのみを生成する（InMemory実装では常にNone）。
 
+        Args:
+            on_partial: 生成途中のメッセージを受け取るコールバック (InMemory実装では呼ばれない)
+
         Returns:
             None（テスト用実装のため）
         """
@@ -183,6 +208,7 @@ class ApplicationHomeQuery(HomeQuery):
         task_service: タスクデータ取得用サービス
         project_service: プロジェクトデータ取得用サービス
         one_liner_service: 一言メッセージ生成用サービス
+        stats_service: 件数集計用サービス (指定時は一覧を読み込まずに SQL 集計で件数を求める)
         max_inbox_items: Inboxメモの最大表示件数
     """
 
@@ -190,10 +216,12 @@ class ApplicationHomeQuery(HomeQuery):
     task_service: TaskServicePort
     project_service: ProjectServicePort
     one_liner_service: OneLinerServicePort
+    stats_service: StatsServicePort | None = None
     max_inbox_items: int = 20
     _memo_cache: list[MemoRead] | None = field(default=None, init=False, repr=False)
     _task_cache: list[TaskRead] | None = field(default=None, init=False, repr=False)
     _project_cache: list[ProjectRead] | None = field(default=None, init=False, repr=False)
+    _stats_cache: DashboardStats | None = field(default=None, init=False, repr=False)
 
     def get_daily_review(self) -> dict[str, Any]:
         """タスクとメモの状況を基にデイリーレビューを生成する。
@@ -206,15 +234,24 @@ class ApplicationHomeQuery(HomeQuery):
         """
         # HomeView 側での非同期AI生成に備え、ここではシナリオのみを構築する。
         # LLM呼び出しは UI スレッドをブロックしないようバックグラウンドで実行する。
-        return self._build_daily_review(self._get_tasks(), self._get_memos())
-
-    def get_one_liner_message(self) -> str | None:
+        stats = self._get_dashboard_stats()
+        if stats is not None:
+            return self._build_daily_review(stats.tasks, inbox_count=stats.memos.count(MemoStatus.INBOX))
+        # 集計サービスがない場合も、期限超過は集計クエリと同じ判定 (is_task_overdue) で数える
+        task_stats = TaskStats.from_tasks(self._get_tasks(), datetime.now().astimezone().date())
+        inbox_count = sum(1 for memo in self._get_memos() if memo.status == MemoStatus.INBOX)
+        return self._build_daily_review(task_stats, inbox_count=inbox_count)
+
+    def get_one_liner_message(self, on_partial: Callable[[str], None] | None = None) -> str | None:
         """AI一言メッセージのみを生成する。
 
+        Args:
+            on_partial: 生成途中のメッセージを受け取るコールバック
+
         Returns:
             生成されたメッセージ（失敗時はNone）
         """
-        return self._generate_one_liner_message()
+        return self._generate_one_liner_message(on_partial)
 
     def get_inbox_memos(self) -> list[dict[str, Any]]:
         """Inboxステータスのメモを最新順で返す。"""
@@ -224,6 +261,13 @@ class ApplicationHomeQuery(HomeQuery):
 
     def get_stats(self) -> dict[str, int]:
         """タスク・プロジェクトの集計値を返す。"""
+        stats = self._get_dashboard_stats()
+        if stats is not None:
+            return {
+                "todays_tasks": stats.tasks.count(TaskStatus.TODAYS),
+                "todo_tasks": stats.tasks.count(TaskStatus.TODO),
+                "active_projects": stats.projects_by_status.get(ProjectStatus.ACTIVE, 0),
+            }
         tasks = self._get_tasks()
         projects = self._get_projects()
         return {
@@ -232,10 +276,18 @@ class ApplicationHomeQuery(HomeQuery):
             "active_projects": sum(1 for project in projects if project.status == ProjectStatus.ACTIVE),
         }
 
+    def _get_dashboard_stats(self) -> DashboardStats | None:
+        if self.stats_service is None:
+            return None
+        if self._stats_cache is None:
+            self._stats_cache = self.stats_service.get_dashboard_stats()
+        return self._stats_cache
+
     def _get_memos(self) -> list[MemoRead]:
         if self._memo_cache is None:
             try:
-                self._memo_cache = self.memo_service.get_all_memos(with_details=True)
+                # ホームはメモの列だけを使うため、関連は読み込まない
+                self._memo_cache = self.memo_service.get_all_memos(profile="list")
             except NotFoundError as e:
                 # メモが存在しない場合は空リストで扱う（UIではエラーにしない）
                 logger.info("No memos found in MemoService: {}", e)
@@ -279,133 +331,108 @@ class ApplicationHomeQuery(HomeQuery):
             return float("-inf")
         return created_at.timestamp()
 
-    def _build_daily_review(self, tasks: list[TaskRead], memos: list[MemoRead]) -> dict[str, Any]:
-        """タスクとメモの状況からシナリオベースのレビューを構築する。
+    def _build_daily_review(self, task_stats: TaskStats, *, inbox_count: int) -> dict[str, Any]:
+        """タスクの件数統計と Inbox のメモ件数からシナリオベースのレビューを構築する。
 
         AI一言メッセージは含まれない（呼び出し側で付与する）。
 
         Args:
-            tasks: 全タスクのリスト
-            memos: 全メモのリスト
+            task_stats: タスクの件数統計
+            inbox_count: Inbox のメモ件数
 
         Returns:
             シナリオベースのレビュー情報（icon, color, message, action_text, action_route, priority）
         """
-        # タスクリストを複数回走査するのではなく、単一パスで分類する。
-        # 理由: 大きなタスクリストでの効率化（O(n)）と可読性向上のため。
-        todays_tasks: list[TaskRead] = []
-        todo_tasks: list[TaskRead] = []
-        progress_tasks: list[TaskRead] = []
-        overdue_tasks: list[TaskRead] = []
-        completed_tasks: list[TaskRead] = []
-
-        for task in tasks:
-            status = task.status
-            if status == TaskStatus.TODAYS:
-                todays_tasks.append(task)
-            elif status == TaskStatus.TODO:
-                todo_tasks.append(task)
-            elif status == TaskStatus.PROGRESS:
-                progress_tasks.append(task)
-            elif status == TaskStatus.OVERDUE:
-                overdue_tasks.append(task)
-            elif status == TaskStatus.COMPLETED:
-                completed_tasks.append(task)
-
-        # メモのInbox抽出は単純なフィルタでよい（メモは通常少数）
-        inbox_memos = [memo for memo in memos if memo.status == MemoStatus.INBOX]
         return self._select_review_scenario(
-            todays_tasks=todays_tasks,
-            todo_tasks=todo_tasks,
-            progress_tasks=progress_tasks,
-            overdue_tasks=overdue_tasks,
-            completed_tasks=completed_tasks,
-            inbox_memos=inbox_memos,
+            todays_count=task_stats.count(TaskStatus.TODAYS),
+            todo_count=task_stats.count(TaskStatus.TODO),
+            progress_count=task_stats.count(TaskStatus.PROGRESS),
+            overdue_count=task_stats.overdue,
+            completed_count=task_stats.count(TaskStatus.COMPLETED),
+            inbox_count=inbox_count,
         )
 
     def _select_review_scenario(
         self,
         *,
-        todays_tasks: list[TaskRead],
-        todo_tasks: list[TaskRead],
-        progress_tasks: list[TaskRead],
-        overdue_tasks: list[TaskRead],
-        completed_tasks: list[TaskRead],
-        inbox_memos: list[MemoRead],
+        todays_count: int,
+        todo_count: int,
+        progress_count: int,
+        overdue_count: int,
+        completed_count: int,
+        inbox_count: int,
     ) -> dict[str, Any]:
         """デイリーレビュー表示用のシナリオを判定して返す。
 
         Args:
-            todays_tasks: 今日のタスク一覧
-            todo_tasks: TODO 状態のタスク一覧
-            progress_tasks: 進行中のタスク一覧
-            overdue_tasks: 期限超過のタスク一覧
-            completed_tasks: 完了済みタスク一覧
-            inbox_memos: Inbox のメモ一覧
+            todays_count: 今日のタスク件数
+            todo_count: TODO 状態のタスク件数
+            progress_count: 進行中のタスク件数
+            overdue_count: 期限超過のタスク件数
+            completed_count: 完了済みタスク件数
+            inbox_count: Inbox のメモ件数
 
         Returns:
             選択されたシナリオのデータ辞書
         """
         review_scenarios = [
             (
-                bool(overdue_tasks),
+                overdue_count > 0,
                 {
                     "icon": "error",
                     "color": "amber",
-                    "message": f"{len(overdue_tasks)}件の期限超過タスクがあります。優先的に対処しましょう。",
+                    "message": f"{overdue_count}件の期限超過タスクがあります。優先的に対処しましょう。",
                     "action_text": "期限超過のタスクを確認",
                     "action_route": "/tasks",
                     "priority": "high",
                 },
             ),
             (
-                not todays_tasks and bool(todo_tasks),
+                todays_count == 0 and todo_count > 0,
                 {
                     "icon": "coffee",
                     "color": "blue",
-                    "message": (
-                        f"今日のタスクがまだ設定されていません。{len(todo_tasks)}件のTODOから選んで始めましょう！"
-                    ),
+                    "message": (f"今日のタスクがまだ設定されていません。{todo_count}件のTODOから選んで始めましょう！"),
                     "action_text": "タスクを設定する",
                     "action_route": "/tasks",
                     "priority": "medium",
                 },
             ),
             (
-                bool(todays_tasks) and not progress_tasks,
+                todays_count > 0 and progress_count == 0,
                 {
                     "icon": "play_arrow",
                     "color": "green",
-                    "message": f"{len(todays_tasks)}件のタスクが待っています。さあ、最初の一歩を踏み出しましょう！",
+                    "message": f"{todays_count}件のタスクが待っています。さあ、最初の一歩を踏み出しましょう！",
                     "action_text": "タスクを開始する",
                     "action_route": "/tasks",
                     "priority": "medium",
                 },
             ),
             (
-                bool(progress_tasks),
+                progress_count > 0,
                 {
                     "icon": "trending_up",
                     "color": "primary",
-                    "message": f"{len(progress_tasks)}件のタスクが進行中です。良いペースです、その調子で続けましょう！",
+                    "message": f"{progress_count}件のタスクが進行中です。良いペースです、その調子で続けましょう！",
                     "action_text": "進行中のタスクを見る",
                     "action_route": "/tasks",
                     "priority": "normal",
                 },
             ),
             (
-                bool(inbox_memos),
+                inbox_count > 0,
                 {
                     "icon": "lightbulb",
                     "color": "purple",
-                    "message": f"{len(inbox_memos)}件のメモがあります。AIにタスクを生成させて整理しましょう。",
+                    "message": f"{inbox_count}件のメモがあります。AIにタスクを生成させて整理しましょう。",
                     "action_text": "メモを整理する",
                     "action_route": "/memos",
                     "priority": "medium",
                 },
             ),
             (
-                bool(completed_tasks) and not todays_tasks,
+                completed_count > 0 and todays_count == 0,
                 {
                     "icon": "check_circle",
                     "color": "green",
@@ -436,8 +463,10 @@ class ApplicationHomeQuery(HomeQuery):
         # AI一言メッセージはget_daily_review()で付与される
         return selected
 
-    def _generate_one_liner_message(self) -> str | None:
+    def _generate_one_liner_message(self, on_partial: Callable[[str], None] | None = None) -> str | None:
         try:
-            return self.one_liner_service.generate_one_liner()
+            if on_partial is None:
+                return self.one_liner_service.generate_one_liner()
+            return self.one_liner_service.generate_one_liner(on_partial=on_partial)
         except Exception:
             return None
@@ -46,6 +46,7 @@ class HomeViewState(BaseViewState):
     stats: dict[str, int] = field(default_factory=dict)
     is_loading_one_liner: bool = False
     one_liner_message: str | None = None
+    one_liner_partial: str | None = None
 
     def set_daily_review(self, review: dict[str, Any]) -> None:
         """デイリーレビュー情報を設定する。
@@ -78,6 +79,8 @@ class HomeViewState(BaseViewState):
             is_loading: ローディング中の場合True
         """
         self.is_loading_one_liner = is_loading
+        if is_loading:
+            self.one_liner_partial = None
 
     def set_one_liner_message(self, message: str | None) -> None:
         """AI一言メッセージを設定する。
@@ -87,6 +90,16 @@ class HomeViewState(BaseViewState):
         """
         self.one_liner_message = message
         self.is_loading_one_liner = False
+        self.one_liner_partial = None
+
+    def set_one_liner_partial(self, text: str) -> None:
+        """生成途中のAI一言メッセージを設定する (ローディング中のみ反映)。
+
+        Args:
+            text: その時点までに生成されたメッセージ
+        """
+        if self.is_loading_one_liner:
+            self.one_liner_partial = text
 
     def update_daily_review_message(self, message: str) -> None:
         """デイリーレビューのメッセージフィールドを更新する。
@@ -37,6 +37,7 @@ from logic.application.apps import ApplicationServicesError
 from logic.application.memo_application_service import MemoApplicationService
 from logic.application.one_liner_application_service import OneLinerApplicationService
 from logic.application.project_application_service import ProjectApplicationService
+from logic.application.stats_application_service import StatsApplicationService
 from logic.application.task_application_service import TaskApplicationService
 from views.shared.base_view import BaseView, BaseViewProps
 
@@ -53,6 +54,9 @@ class HomeView(BaseView):
     MVP+State+Query方式でリファクタリング済み。
     """
 
+    keep_alive = True
+    data_tables = ("memos", "tasks", "projects")
+
     def __init__(self, props: BaseViewProps, query: HomeQuery | None = None) -> None:
         """HomeViewを初期化する。
 
@@ -102,11 +106,13 @@ class HomeView(BaseView):
             task_service = self.apps.get_service(TaskApplicationService)
             project_service = self.apps.get_service(ProjectApplicationService)
             one_liner_service = self.apps.get_service(OneLinerApplicationService)
+            stats_service = self.apps.get_service(StatsApplicationService)
             return ApplicationHomeQuery(
                 memo_service=memo_service,
                 task_service=task_service,
                 project_service=project_service,
                 one_liner_service=one_liner_service,
+                stats_service=stats_service,
             )
         except Exception as e:
             # ApplicationServices が利用できない場合はエラーとして扱わず
@@ -115,6 +121,11 @@ class HomeView(BaseView):
             # InMemoryHomeQueryはHomeQueryProtocolを実装しているため、型的に安全
             return InMemoryHomeQuery()  # type: ignore[return-value]
 
+    def reload_data(self) -> ft.Control:
+        """ホームのデータを読み直して再構築する (AI一言は再生成しない)。"""
+        self.controller.refresh_data()
+        return self.build()
+
     @property
     def home_state(self) -> HomeViewState:
         """Home専用Stateを取得する。"""
@@ -171,6 +182,7 @@ class HomeView(BaseView):
                 review=self.home_state.daily_review,
                 on_action_click=self._handle_action_click,
                 is_loading=self.home_state.is_loading_one_liner,
+                partial_message=self.home_state.one_liner_partial,
             )
         return self._daily_review_card
 
@@ -186,6 +198,7 @@ class HomeView(BaseView):
         self._daily_review_card.update_review(
             self.home_state.daily_review,
             is_loading=self.home_state.is_loading_one_liner,
+            partial_message=self.home_state.one_liner_partial,
         )
 
     def _build_inbox_memos_section(self) -> ft.Control:
@@ -258,7 +271,7 @@ class HomeView(BaseView):
             start_time = time.time()
             logger.info("[非同期スレッド] AI一言生成開始")
             try:
-                message = self.controller.generate_one_liner_sync()
+                message = self.controller.generate_one_liner_sync(on_partial=self._handle_one_liner_partial)
                 elapsed = time.time() - start_time
                 msg_preview = message[:50] if message else "None"
                 logger.info(f"[非同期スレッド] AI一言生成完了（{elapsed:.2f}秒）: {msg_preview}...")
@@ -278,6 +291,11 @@ class HomeView(BaseView):
         thread.start()
         logger.info(f"[非同期] バックグラウンドスレッド起動完了（Thread ID: {thread.ident}）")
 
+    def _handle_one_liner_partial(self, text: str) -> None:
+        """生成途中のAI一言をデイリーレビューカードへ反映する (バックグラウンドスレッドから呼ばれる)。"""
+        self.controller.set_one_liner_partial(text)
+        self._update_one_liner_display()
+
     def _update_one_liner_display(self) -> None:
         """AI一言生成完了時にデイリーレビューカードを更新する。
 
@@ -3,18 +3,27 @@
 このモジュールは、Fletアプリケーションの全体レイアウト（サイドバー + コンテンツ領域）を管理し、
 ルーティングに基づいて適切なViewを表示する機能を提供します。
 AppBarは使用せず、サイドバーベースの設計となっています。
+
+`ViewCache` を渡すと、`keep_alive` な View のインスタンスと表示内容をルートごとに LRU で保持します。
+再訪時はキャッシュした表示内容を即座に表示し、`data_tables` のデータバージョンが変わっていた場合だけ
+バックグラウンドで `reload_data` を呼んで最新化します (stale-while-revalidate)。
+表示中の View は `notify_data_changed` で書き込みの通知を受け、再訪を待たずに同じ手順で最新化します。
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
 
 import flet as ft
+from loguru import logger
 
 from views.theme import get_light_color
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Collection
 
     from logic.application.apps import ApplicationServices
 
@@ -22,7 +31,7 @@ from views.home import HomeView
 from views.memos import CreateMemoView, MemosView
 from views.projects import ProjectsView
 from views.settings import SettingsView
-from views.shared.base_view import BaseViewProps
+from views.shared.base_view import BaseView, BaseViewProps
 from views.shared.sidebar import build_sidebar
 from views.tags import TagsView
 from views.tasks import TasksView
@@ -30,14 +39,163 @@ from views.terms import TermsView
 from views.theme import get_dark_color
 from views.weekly_review import WeeklyReviewView
 
+DEFAULT_VIEW_CACHE_SIZE: Final[int] = 4
+"""ViewCache が保持する View の既定の最大数"""
+
+_VIEW_CLASSES: Final[dict[str, type[BaseView]]] = {
+    "/": HomeView,
+    "/projects": ProjectsView,
+    "/tags": TagsView,
+    "/tasks": TasksView,
+    "/settings": SettingsView,
+    "/memos": MemosView,
+    "/memos/create": CreateMemoView,
+    "/terms": TermsView,
+    "/weekly-review": WeeklyReviewView,
+}
+
+
+@dataclass(slots=True)
+class _CachedView:
+    view: BaseView
+    host: ft.Container
+    data_version: int
+    theme_mode: ft.ThemeMode | None
+    reloading: bool = False
+
+
+class ViewCache:
+    """ルートごとに View のインスタンスと表示内容を保持する LRU キャッシュ。
+
+    ページ (セッション) ごとに 1 つ作成し、`build_layout` に渡して使う。
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_VIEW_CACHE_SIZE) -> None:
+        """ViewCache を初期化する。
+
+        Args:
+            max_entries: 保持する View の最大数 (超えた場合は最も長く使われていないものを破棄する)
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _CachedView] = OrderedDict()
+        self._lock = threading.Lock()
+        self._current_route: str | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_content(self, route: str, props: BaseViewProps, view_class: type[BaseView]) -> ft.Control:
+        """ルートの表示内容を返す (保持していれば再利用し、必要なら裏で最新化する)。
+
+        Args:
+            route: ルート文字列
+            props: View共通プロパティ
+            view_class: ルートに対応する View のクラス
 
-def build_layout(page: ft.Page, route: str, apps: ApplicationServices) -> ft.View:
+        Returns:
+            ft.Control: コンテンツ領域に配置する表示内容
+        """
+        with self._lock:
+            self._current_route = route
+            entry = self._entries.get(route)
+            if entry is not None and entry.theme_mode != props.page.theme_mode:
+                # 配色は構築時に決まるため、テーマが変わった View は作り直す
+                self._discard(route)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(route)
+                self._revalidate_if_stale(entry)
+                return entry.host
+
+        # データバージョンは読み込み前に取得し、構築中の書き込みも次回の再検証で拾えるようにする
+        data_version = props.apps.data_version(view_class.data_tables)
+        view = view_class(props)
+        host = ft.Container(content=view.build(), expand=True, padding=0)
+        if not view.keep_alive:
+            return host
+
+        with self._lock:
+            self._discard(route)
+            self._entries[route] = _CachedView(
+                view=view,
+                host=host,
+                data_version=data_version,
+                theme_mode=props.page.theme_mode,
+            )
+            while len(self._entries) > self._max_entries:
+                self._discard(next(iter(self._entries)))
+        return host
+
+    def clear(self) -> None:
+        """保持している View をすべて破棄する。"""
+        with self._lock:
+            for route in list(self._entries):
+                self._discard(route)
+
+    def notify_data_changed(self, tables: Collection[str]) -> None:
+        """書き込みのコミットを通知し、表示中の View が依存するテーブルであれば最新化する。
+
+        最新化中に届いた通知は、最新化の完了後にデータバージョンを確認して続けて反映する。
+
+        Args:
+            tables: 書き込みがコミットされたテーブル名
+        """
+        with self._lock:
+            entry = self._entries.get(self._current_route) if self._current_route is not None else None
+            if entry is None or not entry.view.reload_on_change:
+                return
+            if not set(entry.view.data_tables).intersection(tables):
+                return
+            self._revalidate_if_stale(entry)
+
+    def _revalidate_if_stale(self, entry: _CachedView) -> None:
+        if not entry.view.data_tables or entry.reloading:
+            return
+        data_version = entry.view.apps.data_version(entry.view.data_tables)
+        if data_version == entry.data_version:
+            return
+        entry.data_version = data_version
+        entry.reloading = True
+        threading.Thread(target=self._reload, args=(entry,), name="ViewCacheReload", daemon=True).start()
+
+    def _reload(self, entry: _CachedView) -> None:
+        view_name = type(entry.view).__name__
+        try:
+            content = entry.view.reload_data()
+            if content is not None:
+                entry.host.content = content
+            if entry.host.page is not None:
+                entry.host.update()
+            logger.debug(f"{view_name} をバックグラウンドで最新化しました")
+        except Exception:
+            logger.exception(f"{view_name} の最新化に失敗しました")
+        finally:
+            entry.reloading = False
+        with self._lock:
+            current = self._entries.get(self._current_route) if self._current_route is not None else None
+            if current is entry and entry.view.reload_on_change:
+                self._revalidate_if_stale(entry)
+
+    def _discard(self, route: str) -> None:
+        entry = self._entries.pop(route, None)
+        if entry is None:
+            return
+        try:
+            entry.view.will_unmount()
+        except Exception:
+            logger.exception(f"{type(entry.view).__name__} の破棄に失敗しました")
+
+
+def build_layout(
+    page: ft.Page, route: str, apps: ApplicationServices, *, view_cache: ViewCache | None = None
+) -> ft.View:
     """指定されたルートに対応するレイアウトとViewを構築する。
 
     Args:
         page: Fletのページオブジェクト
         route: 現在のルート文字列
         apps: アプリケーションサービスのコンテナ
+        view_cache: View のキャッシュ (None の場合は毎回 View を作り直す)
 
     Returns:
         構築されたFletビュー
@@ -47,7 +205,7 @@ def build_layout(page: ft.Page, route: str, apps: ApplicationServices) -> ft.Vie
         ルートとViewの対応は今後各画面実装時に追加される。
     """
     # Route to view mapping
-    content = _get_view_content(page, route, apps)
+    content = _get_view_content(page, route, apps, view_cache)
 
     # Build sidebar with current route
     sidebar = build_sidebar(page, route)
@@ -75,34 +233,26 @@ def build_layout(page: ft.Page, route: str, apps: ApplicationServices) -> ft.Vie
     )
 
 
-def _get_view_content(page: ft.Page, route: str, apps: ApplicationServices) -> ft.Control:
+def _get_view_content(
+    page: ft.Page, route: str, apps: ApplicationServices, view_cache: ViewCache | None = None
+) -> ft.Control:
     """ルートに基づいて適切なViewコンテンツを取得する。
 
     Args:
         page: Fletページオブジェクト
         route: 現在のルート文字列
         apps: アプリケーションサービスのコンテナ
+        view_cache: View のキャッシュ (None の場合は毎回 View を作り直す)
 
     Returns:
         対応するViewコンテンツ
     """
-    # Route to view mapping (factory pattern to reduce returns)
-    view_factory: dict[str, Callable[[BaseViewProps], ft.Control]] = {
-        "/": lambda p: HomeView(p).build(),
-        "/projects": lambda p: ProjectsView(p).build(),
-        "/tags": lambda p: TagsView(p).build(),
-        "/tasks": lambda p: TasksView(p).build(),
-        "/settings": lambda p: SettingsView(p).build(),
-        "/memos": lambda p: MemosView(p).build(),
-        "/memos/create": lambda p: CreateMemoView(p).build(),
-        "/terms": lambda p: TermsView(p).build(),
-        "/weekly-review": lambda p: WeeklyReviewView(p).build(),
-    }
-
-    factory = view_factory.get(route)
-    if factory:
+    view_class = _VIEW_CLASSES.get(route)
+    if view_class:
         props = BaseViewProps(page=page, apps=apps)
-        return factory(props)
+        if view_cache is not None:
+            return view_cache.get_content(route, props, view_class)
+        return view_class(props).build()
 
     # Other views are still placeholders
     # TODO: 未実装ルートに対しては随時追加
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 import flet as ft
 
 from views.memos import presenter
+from views.shared.components.virtual_list import VirtualList
 from views.theme import get_outline_color, get_text_secondary_color
 
 from .memo_card import MemoCard
@@ -25,6 +26,9 @@ if TYPE_CHECKING:
 
 _EMPTY_ICON_SIZE = 48
 _EMPTY_PADDING = 40
+_CARD_SPACING = 8
+# カード 1 枚の推定の高さ (タイトル・本文 2 行・タグ行) + 行間
+_MEMO_CARD_EXTENT = 132
 
 
 # ========================================
@@ -33,7 +37,11 @@ _EMPTY_PADDING = 40
 
 
 class MemoCardList(ft.Column):
-    """メモカードを一覧表示する親制御型リスト。"""
+    """メモカードを一覧表示する親制御型リスト。
+
+    VirtualList で表示範囲のカードだけを生成し、範囲内のカードはメモIDごとに再利用する。
+    末尾付近までスクロールすると on_load_more で続きのページを要求する。
+    """
 
     def __init__(
         self,
@@ -42,30 +50,30 @@ class MemoCardList(ft.Column):
         on_memo_select: Callable[[MemoRead], None] | None = None,
         empty_message: str = "メモがありません",
         selected_memo_id: str | None = None,
+        on_load_more: Callable[[], None] | None = None,
+        has_more: bool = False,
     ) -> None:
         self.memos = memos
+        self.has_more = has_more
         self.on_memo_select = on_memo_select
         self.empty_message = empty_message
         self.selected_memo_id = selected_memo_id
         self._memo_index: dict[str, MemoRead] = {}
 
-        super().__init__(
-            controls=self._build_controls(),
-            spacing=8,
-            scroll=ft.ScrollMode.AUTO,
-            expand=True,
+        self._cards: VirtualList[MemoRead] = VirtualList(
+            key=lambda memo: str(memo.id),
+            build=self._create_card,
+            item_extent=_MEMO_CARD_EXTENT,
+            empty=self._build_empty_state,
+            on_load_more=on_load_more,
+            spacing=_CARD_SPACING,
         )
+        super().__init__(controls=[self._cards.control], spacing=0, expand=True)
+        self._apply_memos()
 
-    def _build_controls(self) -> list[ft.Control]:
-        self._memo_index.clear()
-        if not self.memos:
-            return [self._build_empty_state()]
-        cards: list[ft.Control] = []
-        for memo in self.memos:
-            card = self._create_card(memo)
-            self._memo_index[str(memo.id)] = memo
-            cards.append(card)
-        return cards
+    def _apply_memos(self) -> None:
+        self._memo_index = {str(memo.id): memo for memo in self.memos}
+        self._cards.set_items(self.memos, has_more=self.has_more, selected_key=self.selected_memo_id)
 
     def _build_empty_state(self) -> ft.Control:
         return ft.Container(
@@ -87,11 +95,13 @@ class MemoCardList(ft.Column):
             padding=ft.padding.all(_EMPTY_PADDING),
         )
 
-    def _create_card(self, memo: MemoRead) -> MemoCard:
+    def _create_card(self, memo: MemoRead, is_selected: bool) -> MemoCard:  # noqa: FBT001
+        memo_id = str(memo.id)
         card_data = presenter.create_memo_card_data(
             memo=memo,
-            is_selected=self.selected_memo_id == str(memo.id),
-            on_click=lambda: self._handle_memo_select(memo),
+            is_selected=is_selected,
+            # カードは再利用されるため、クリック時に最新のメモを引き直す
+            on_click=lambda: self._handle_memo_select(self._memo_index.get(memo_id, memo)),
         )
         return MemoCard(card_data)
 
@@ -99,40 +109,30 @@ class MemoCardList(ft.Column):
         if self.on_memo_select:
             self.on_memo_select(memo)
 
-    def update_memos(self, memos: list[MemoRead], *, selected_memo_id: str | None = None) -> None:
+    def update_memos(
+        self,
+        memos: list[MemoRead],
+        *,
+        selected_memo_id: str | None = None,
+        has_more: bool = False,
+    ) -> None:
+        """メモ一覧を差分で反映する（表示範囲内で内容が変わったカードだけを作り直す）。"""
         self.memos = memos
+        self.has_more = has_more
         if selected_memo_id is not None:
             self.selected_memo_id = selected_memo_id
+        self._apply_memos()
 
-        if not memos:
-            self.controls = [self._build_empty_state()]
-            self._memo_index.clear()
-        else:
-            # 全てのカードを再作成（MemoCardは不変なので）
-            updated_controls: list[ft.Control] = []
-            new_index: dict[str, MemoRead] = {}
-            for memo in memos:
-                memo_id = str(memo.id)
-                card = self._create_card(memo)
-                updated_controls.append(card)
-                new_index[memo_id] = memo
-            self.controls = updated_controls
-            self._memo_index = new_index
-
-        if getattr(self, "page", None) is not None:
-            self.update()
+    def scroll_to_top(self) -> None:
+        """先頭までスクロールする（タブ切り替えで一覧が入れ替わったときに使う）。"""
+        self._cards.scroll_to_top()
 
     def set_selected_memo(self, memo_id: str | None) -> None:
-        """選択されたメモを変更（全カードを再構築）。"""
+        """選択されたメモを変更（旧選択・新選択のカードだけを更新する）。"""
         self.selected_memo_id = memo_id
-        # 全カードを再作成（MemoCardは不変なので）
-        self.controls = [self._create_card(memo) for memo in self.memos] if self.memos else [self._build_empty_state()]
-        if getattr(self, "page", None) is not None:
-            self.update()
+        self._cards.select(memo_id)
 
     def _find_card(self, memo_id: str) -> MemoCard | None:
-        """指定されたIDのメモカードを検索（MemoReadから再作成）。"""
-        memo = self._memo_index.get(memo_id)
-        if memo:
-            return self._create_card(memo)
-        return None
+        """指定されたIDの描画済みメモカードを取得。"""
+        card = self._cards.control_for(memo_id)
+        return card if isinstance(card, MemoCard) else None
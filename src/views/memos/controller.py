@@ -30,7 +30,7 @@
             reconcile()
 
 【主な機能】
-    - 初期メモ一覧の読み込みとソート
+    - 初期メモ一覧の読み込みとソート (タブごとにページ単位で段階的に読み込む)
     - タブ切り替え時の状態更新
     - 検索実行と結果反映
     - メモ選択状態の管理
@@ -41,12 +41,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Final, Protocol
 
 from loguru import logger
 
 from errors import NotFoundError
 from logic.application.memo_ai_job_queue import MemoAiJobSnapshot  # noqa: TC001 - runtime dependency
+from logic.repositories import DEFAULT_PAGE_SIZE
 from models import AiSuggestionStatus, MemoRead, MemoStatus, MemoUpdate, TagRead, TaskRead
 
 from .ordering import sort_memos
@@ -55,8 +56,13 @@ from .query import SearchQueryNormalizer
 if TYPE_CHECKING:
     from uuid import UUID
 
+    from logic.repositories import LoadProfileName, Page
+
     from .state import MemosViewState
 
+MEMO_PAGE_SIZE: Final[int] = 50
+"""一覧で 1 回に読み込むメモの件数"""
+
 
 class TagApplicationPort(Protocol):
     """TagApplicationService の利用に必要なメソッドを限定したポート。"""
@@ -69,10 +75,25 @@ class TagApplicationPort(Protocol):
 class MemoApplicationPort(Protocol):
     """MemoApplicationService の利用に必要なメソッドを限定したポート。"""
 
-    def get_all_memos(self, *, with_details: bool = False) -> list[MemoRead]:
+    def get_all_memos(self, *, with_details: bool = False, profile: LoadProfileName | None = None) -> list[MemoRead]:
         """メモを全件取得する。"""
         ...
 
+    def list_page(
+        self,
+        *,
+        status: MemoStatus | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        profile: LoadProfileName | None = None,
+    ) -> Page[MemoRead]:
+        """メモを 1 ページずつ取得する。"""
+        ...
+
+    def count_by_status(self) -> dict[MemoStatus, int]:
+        """ステータスごとのメモ件数を取得する。"""
+        ...
+
     def get_by_id(self, memo_id: UUID, *, with_details: bool = False) -> MemoRead:
         """ID で単一メモを取得する。"""
         ...
@@ -82,6 +103,7 @@ class MemoApplicationPort(Protocol):
         query: str,
         *,
         with_details: bool = False,
+        profile: LoadProfileName | None = None,
         status: MemoStatus | None = None,
     ) -> list[MemoRead]:
         """検索条件に一致するメモを返す。"""
@@ -158,17 +180,56 @@ class MemosController:
     query_normalizer: SearchQueryNormalizer = field(default_factory=SearchQueryNormalizer)
 
     def load_initial_memos(self) -> None:
-        """初期表示に使用するメモ一覧を読み込む。"""
-        memos = self.memo_app.get_all_memos(with_details=False)
-        ordered = sort_memos(memos)
-        self.state.set_all_memos(ordered)
+        """初期表示に使用するメモ一覧を読み込む。
+
+        全件ではなく現在のタブの先頭ページだけを読み込み、タブの件数はサーバー側で集計する。
+        """
+        self.state.reset_pages()
+        self.state.set_all_memos([])
         self.state.set_search_result("", None)
+        if self.state.current_tab is not None:
+            self._load_page(self.state.current_tab)
+        self.state.set_status_counts(self.memo_app.count_by_status())
         self.state.reconcile()
 
     def update_tab(self, tab: MemoStatus | None) -> None:
-        """タブ変更時に状態を更新する。"""
+        """タブ変更時に状態を更新する (未読み込みのタブは先頭ページを読み込む)。"""
         self.state.set_current_tab(tab)
+        if tab is not None and not self.state.is_page_loaded(tab):
+            self._load_page(tab)
+        self.state.reconcile()
+
+    def load_more_memos(self) -> bool:
+        """現在のタブの続きのページを読み込む。
+
+        Returns:
+            bool: 読み込んだ場合は True (続きがない・検索中の場合は False)
+        """
+        tab = self.state.current_tab
+        if tab is None or self.state.search_query or not self.state.has_more(tab):
+            return False
+        self._load_page(tab, cursor=self.state.page_cursor(tab))
         self.state.reconcile()
+        return True
+
+    def has_more_memos(self) -> bool:
+        """現在のタブにまだ読み込んでいないメモがあるかどうかを返す。"""
+        if self.state.search_query:
+            return False
+        return self.state.has_more(self.state.current_tab)
+
+    def _load_page(self, status: MemoStatus, *, cursor: str | None = None) -> None:
+        """ステータスのメモを 1 ページ読み込んで State に追加する。"""
+        # カードにはタグだけを表示するため、タスク等の関連は読み込まない
+        page = self.memo_app.list_page(status=status, page_size=MEMO_PAGE_SIZE, cursor=cursor, profile="card")
+        self.state.append_memos(page.items)
+        self.state.set_all_memos(sort_memos(self.state.all_memos))
+        self.state.set_page_cursor(status, page.next_cursor)
+        logger.debug(f"Loaded memo page: status={status}, items={len(page.items)}, has_next={page.has_next}")
+
+    def _refresh_status_counts(self) -> None:
+        """タブの件数をサーバー側で集計し直す。"""
+        self.state.set_status_counts(self.memo_app.count_by_status())
 
     def update_search(self, query: str) -> None:
         """検索クエリを更新し結果を反映する。"""
@@ -179,7 +240,7 @@ class MemosController:
             return
 
         try:
-            results = self.memo_app.search(normalized, with_details=False, status=self.state.current_tab)
+            results = self.memo_app.search(normalized, profile="card", status=self.state.current_tab)
         except NotFoundError:
             # 検索に一致しない場合は例外を無視して空配列として扱う
             logger.debug(f"No memos found for query: '{normalized}'")
@@ -227,10 +288,17 @@ class MemosController:
         """AIジョブの状態を取得する。"""
         return self.memo_app.get_ai_job_snapshot(job_id)
 
-    def refresh_memo(self, memo_id: UUID) -> MemoRead:
-        """指定メモを再取得してStateへ反映する。"""
+    def refresh_memo(self, memo_id: UUID, *, refresh_counts: bool = False) -> MemoRead:
+        """指定メモを再取得してStateへ反映する。
+
+        Args:
+            memo_id: メモID
+            refresh_counts: タブの件数も集計し直すか (他の画面で作成・ステータス変更された場合など)
+        """
         refreshed = self.memo_app.get_by_id(memo_id, with_details=True)
         self.state.upsert_memo(refreshed)
+        if refresh_counts:
+            self._refresh_status_counts()
         self.state.reconcile()
         return refreshed
 
@@ -241,6 +309,7 @@ class MemosController:
             MemoUpdate(status=MemoStatus.ARCHIVE, ai_suggestion_status=AiSuggestionStatus.REVIEWED),
         )
         self.state.upsert_memo(updated)
+        self._refresh_status_counts()
         self.state.reconcile()
         return updated
 
@@ -302,6 +371,7 @@ class MemosController:
         self.state.upsert_memo(created)
         self.state.set_all_memos(sort_memos(self.state.all_memos))
         self.state.set_selected_memo(created.id)
+        self._refresh_status_counts()
         if self.state.search_query:
             self._refresh_search_results()
         self.state.reconcile()
@@ -329,6 +399,8 @@ class MemosController:
         updated = self.memo_app.update(memo_id, update_payload)
         self.state.upsert_memo(updated)
         self.state.set_all_memos(sort_memos(self.state.all_memos))
+        if status is not None:
+            self._refresh_status_counts()
         if self.state.search_query:
             self._refresh_search_results()
         self.state.reconcile()
@@ -341,10 +413,18 @@ class MemosController:
             msg = f"メモが見つかりません (id={memo_id})"
             raise NotFoundError(msg)
 
+        self.forget_memo(memo_id)
+
+    def forget_memo(self, memo_id: UUID) -> None:
+        """削除されたメモを一覧・検索結果から取り除き、タブの件数を集計し直す。
+
+        他の画面などで削除されたことを変更イベントで知った場合にも使う。
+        """
         remaining = [memo for memo in self.state.all_memos if memo.id != memo_id]
         self.state.set_all_memos(sort_memos(remaining))
         if self.state.selected_memo_id == memo_id:
             self.state.set_selected_memo(None)
+        self._refresh_status_counts()
 
         if self.state.search_results is not None:
             filtered = [memo for memo in self.state.search_results if memo.id != memo_id]
@@ -382,7 +462,7 @@ class MemosController:
         try:
             results = self.memo_app.search(
                 query,
-                with_details=False,
+                profile="card",
                 status=self.state.current_tab,
             )
         except NotFoundError:
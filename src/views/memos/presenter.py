@@ -97,7 +97,7 @@ from .components.shared.constants import DEFAULT_DATE_TEXT, DEFAULT_SEARCH_PLACE
 from .components.types import MemoListData
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
     from uuid import UUID
 
     from models import MemoRead
@@ -636,6 +636,8 @@ def build_ai_task_flow_panel(  # noqa: PLR0913
     project_description: str | None = None,
     project_status: str | None = None,
     project_error: str | None = None,
+    progress_stage: str | None = None,
+    partial_task_titles: Sequence[str] = (),
     on_request_ai: Callable[[ft.ControlEvent], None] | None = None,
     on_retry_ai: Callable[[ft.ControlEvent], None] | None = None,
     on_mark_as_idea: Callable[[ft.ControlEvent], None] | None = None,
@@ -703,7 +705,7 @@ def build_ai_task_flow_panel(  # noqa: PLR0913
                                     theme_style=ft.TextThemeStyle.TITLE_MEDIUM,
                                 ),
                                 ft.Text(
-                                    "生成が完了すると承認待ちとしてActiveメモに切り替わります",
+                                    get_ai_progress_message(progress_stage),
                                     theme_style=ft.TextThemeStyle.BODY_MEDIUM,
                                     color=ft.Colors.ON_SURFACE_VARIANT,
                                 ),
@@ -714,6 +716,7 @@ def build_ai_task_flow_panel(  # noqa: PLR0913
                     spacing=16,
                 )
             )
+            body_controls.extend(_build_partial_task_titles(partial_task_titles))
         case AiSuggestionStatus.AVAILABLE:
             body_controls.extend(
                 _build_available_tasks_section(
@@ -837,6 +840,58 @@ def build_ai_task_flow_panel(  # noqa: PLR0913
     )
 
 
+_AI_PROGRESS_MESSAGES: dict[str, str] = {
+    "started": "メモを読み込んでいます",
+    "classify_memo": "メモの内容を分類しています",
+    "handle_idea": "アイデアとして整理しています",
+    "generate_task_seed": "タスクを抽出しています",
+    "evaluate_quick_action": "すぐ終わる作業か判定しています",
+    "apply_quick_action": "すぐ終わる作業か判定しています",
+    "evaluate_responsibility": "依頼すべき作業か判定しています",
+    "apply_delegate": "依頼すべき作業か判定しています",
+    "evaluate_schedule": "期日を判定しています",
+    "apply_schedule": "期日を判定しています",
+    "evaluate_bulk": "抽出したタスクを評価しています",
+    "prepare_next_action": "次のアクションを整理しています",
+    "finalize_response": "結果をまとめています",
+}
+
+
+def get_ai_progress_message(stage: str | None) -> str:
+    """AI生成の進行ステージ (エージェントのノード名) を表示用メッセージに変換する。
+
+    Args:
+        stage: ステージ名 (途中経過を受け取っていない場合は None)
+
+    Returns:
+        表示用メッセージ
+    """
+    if stage is None:
+        return "生成が完了すると承認待ちとしてActiveメモに切り替わります"
+    return _AI_PROGRESS_MESSAGES.get(stage, "タスクを生成しています")
+
+
+def _build_partial_task_titles(titles: Sequence[str]) -> list[ft.Control]:
+    if not titles:
+        return []
+    return [
+        ft.Text("生成中のタスク", theme_style=ft.TextThemeStyle.LABEL_LARGE),
+        ft.Column(
+            controls=[
+                ft.Row(
+                    controls=[
+                        ft.Icon(ft.Icons.PENDING_OUTLINED, size=16, color=ft.Colors.ON_SURFACE_VARIANT),
+                        ft.Text(title, theme_style=ft.TextThemeStyle.BODY_MEDIUM, expand=True),
+                    ],
+                    spacing=8,
+                )
+                for title in titles
+            ],
+            spacing=4,
+        ),
+    ]
+
+
 def _ai_flow_header_copy(memo_status: MemoStatus) -> tuple[str, str]:
     if memo_status == MemoStatus.INBOX:
         return (
@@ -38,6 +38,7 @@
     - ステータス別件数の集計
     - 選択整合性の自動調整（reconcile）
     - 単一メモの追加・更新（upsert_memo）
+    - ステータスごとのページ読み込み状況の管理（append_memos, page_cursor）
 """
 
 from __future__ import annotations
@@ -82,6 +83,8 @@ class MemoAiFlowState:
     job_id: UUID | None = None
     job_status: str | None = None
     error_message: str | None = None
+    progress_stage: str | None = None
+    partial_task_titles: list[str] = field(default_factory=list)
     project_id: str | None = None
     project_title: str | None = None
     project_description: str | None = None
@@ -102,9 +105,14 @@ class MemosViewState:
     search_results: list[MemoRead] | None = None
     selected_memo_id: UUID | None = None
     all_tags: list[TagRead] = field(default_factory=list)
+    # サーバー側で集計したステータス別件数 (None の間は読み込み済みのメモから数える)
+    status_counts: dict[MemoStatus, int] | None = None
     # id -> MemoRead のインデックス。全メモ(all_memos)に対して構築する。
     _by_id: dict[UUID, MemoRead] = field(default_factory=dict, repr=False)
     _ai_flow: dict[UUID, MemoAiFlowState] = field(default_factory=dict, repr=False)
+    # ステータスごとの次ページのカーソル。キーがあれば先頭ページは読み込み済み
+    # (値が None なら最終ページまで読み込み済み)
+    _page_cursors: dict[MemoStatus, str | None] = field(default_factory=dict, repr=False)
 
     def set_all_memos(self, memos: list[MemoRead]) -> None:
         """全メモ一覧を更新する。
@@ -117,6 +125,53 @@ class MemosViewState:
         self._rebuild_index()
         self._restore_ai_flow_from_iterable(self.all_memos)
 
+    def append_memos(self, memos: Iterable[MemoRead]) -> None:
+        """続きのページで読み込んだメモを末尾に追加する (読み込み済みのメモは置き換える)。
+
+        Args:
+            memos: 追加するメモ
+        """
+        for memo in memos:
+            if memo.id in self._by_id:
+                self.upsert_memo(memo)
+                continue
+            self.all_memos.append(memo)
+            self._by_id[memo.id] = memo
+            self._restore_ai_flow_from_memo(memo)
+
+    def reset_pages(self) -> None:
+        """ページの読み込み状況を破棄する (全件を読み直す前に呼ぶ)。"""
+        self._page_cursors.clear()
+
+    def set_page_cursor(self, status: MemoStatus, cursor: str | None) -> None:
+        """ステータスごとの次ページのカーソルを記録する。
+
+        Args:
+            status: ページを読み込んだステータス
+            cursor: 次ページのカーソル (最終ページまで読み込んだ場合は None)
+        """
+        self._page_cursors[status] = cursor
+
+    def page_cursor(self, status: MemoStatus) -> str | None:
+        """ステータスの次ページのカーソルを返す (未読み込み・最終ページの場合は None)。"""
+        return self._page_cursors.get(status)
+
+    def is_page_loaded(self, status: MemoStatus) -> bool:
+        """ステータスの先頭ページを読み込み済みかどうかを返す。"""
+        return status in self._page_cursors
+
+    def has_more(self, status: MemoStatus | None) -> bool:
+        """ステータスにまだ読み込んでいないページがあるかどうかを返す。"""
+        return status is not None and self._page_cursors.get(status) is not None
+
+    def set_status_counts(self, counts: dict[MemoStatus, int] | None) -> None:
+        """サーバー側で集計したステータス別件数を設定する。
+
+        Args:
+            counts: ステータス別件数 (None の場合は読み込み済みのメモから数える)
+        """
+        self.status_counts = dict(counts) if counts is not None else None
+
     def set_search_result(self, query: str, results: list[MemoRead] | None) -> None:
         """検索クエリと結果を保存する。
 
@@ -164,11 +219,15 @@ class MemosViewState:
         return self._filter_by_tab(base)
 
     def counts_by_status(self) -> dict[MemoStatus, int]:
-        """全メモからステータスごとの件数を算出する。
+        """ステータスごとの件数を返す。
+
+        サーバー側の集計があればそれを使い、なければ読み込み済みのメモから算出する。
 
         Returns:
             ステータス別件数を表す辞書
         """
+        if self.status_counts is not None:
+            return dict(self.status_counts)
         counts: dict[MemoStatus, int] = {
             MemoStatus.INBOX: 0,
             MemoStatus.ACTIVE: 0,
@@ -245,6 +304,8 @@ class MemosViewState:
         state.generated_tasks = list(tasks)
         state.selected_task_ids = {task.task_id for task in tasks}
         state.is_generating = False
+        state.progress_stage = None
+        state.partial_task_titles = []
         if state.editing_task_id and state.editing_task_id not in state.selected_task_ids:
             state.editing_task_id = None
 
@@ -287,6 +348,27 @@ class MemosViewState:
         state.job_status = status
         state.error_message = None
         state.is_generating = True
+        state.progress_stage = None
+        state.partial_task_titles = []
+
+    def apply_ai_progress(self, memo_id: UUID, job_id: UUID, *, stage: str, partial_task_titles: list[str]) -> bool:
+        """生成中ジョブの途中経過を反映する。
+
+        Args:
+            memo_id: 対象メモのID
+            job_id: 途中経過を送ってきたジョブのID
+            stage: 実行中のステージ名
+            partial_task_titles: 生成途中のタスクタイトル
+
+        Returns:
+            bool: 反映した場合 True (追跡中のジョブでない・生成が終わっている場合は False)
+        """
+        state = self._ai_flow.get(memo_id)
+        if state is None or not state.is_generating or state.job_id != job_id:
+            return False
+        state.progress_stage = stage
+        state.partial_task_titles = list(partial_task_titles)
+        return True
 
     def update_job_status(self, memo_id: UUID, *, status: str, error: str | None = None) -> None:
         """ジョブ状態を更新する。"""
@@ -295,6 +377,8 @@ class MemosViewState:
         state.error_message = error
         if error:
             state.is_generating = False
+            state.progress_stage = None
+            state.partial_task_titles = []
 
     def get_selected_tasks(self, memo_id: UUID) -> list[AiSuggestedTask]:
         """選択済みタスクを返す。"""
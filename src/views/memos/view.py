@@ -34,8 +34,6 @@
 
 from __future__ import annotations
 
-import asyncio
-import threading
 from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -43,9 +41,17 @@ from uuid import UUID
 import flet as ft
 from loguru import logger
 
-from logic.application.memo_ai_job_queue import GeneratedTaskPayload, MemoAiJobSnapshot, MemoAiJobStatus
+from errors import NotFoundError
+from logic.application.memo_ai_job_queue import (
+    GeneratedTaskPayload,
+    MemoAiJobProgress,
+    MemoAiJobSnapshot,
+    MemoAiJobStatus,
+    MemoAiJobUpdated,
+)
 from logic.application.memo_application_service import MemoApplicationService
 from logic.application.tag_application_service import TagApplicationService
+from logic.events import ChangeKind, MemoChanged
 from models import AiSuggestionStatus, MemoRead, MemoStatus
 from views.shared.base_view import BaseView, BaseViewProps
 from views.shared.components import HeaderButtonData
@@ -74,6 +80,11 @@ class MemosView(BaseView):
     - AI提案機能（将来実装）
     """
 
+    keep_alive = True
+    data_tables = ("memos", "tags", "memo_tag")
+    # メモの変更は MemoChanged を購読して 1 件ずつ反映する
+    reload_on_change = False
+
     def __init__(
         self,
         props: BaseViewProps,
@@ -103,16 +114,27 @@ class MemosView(BaseView):
         self._memo_list: MemoCardList | None = None
         self._memo_filters: MemoFilters | None = None
         self._detail_panel: ft.Container | None = None
-        self._pending_async_tasks: list[asyncio.Task[None]] = []
+        # 結果を待っている AI ジョブ (job_id -> memo_id)。完了の通知を受けたら取り除く
+        self._watched_ai_jobs: dict[UUID, UUID] = {}
 
         self.did_mount()
         self.with_loading(self._load_initial_memos, user_error_message="データの読み込みに失敗しました")
 
     def did_mount(self) -> None:
-        """マウント時の初期化処理。"""
+        """マウント時に AI ジョブとメモの変更イベントを購読する (解除は will_unmount で行われる)。"""
+        already_mounted = self.is_mounted
         super().did_mount()
+        if already_mounted:
+            return
+        self.subscribe_event(MemoAiJobProgress, self._handle_ai_job_progress)
+        self.subscribe_event(MemoAiJobUpdated, self._handle_ai_job_updated)
+        self.subscribe_event(MemoChanged, self._handle_memo_changed)
         logger.info("MemosView mounted")
 
+    def reload_data(self) -> None:
+        """メモとタグを読み直し、一覧・詳細をその場で更新する。"""
+        self._load_initial_memos()
+
     def build_content(self) -> ft.Control:  # BaseView.build が呼ぶ
         """メモビューのUIを構築。"""
         # アクションバー
@@ -176,6 +198,8 @@ class MemosView(BaseView):
             on_memo_select=self._handle_memo_select,
             empty_message=presenter.get_empty_message_for_status(self.memos_state.current_tab),
             selected_memo_id=selected_memo_id,
+            on_load_more=self._handle_load_more,
+            has_more=self.controller.has_more_memos(),
         )
 
         # 詳細パネル
@@ -223,6 +247,8 @@ class MemosView(BaseView):
             project_description=ai_state.project_description,
             project_status=ai_state.project_status,
             project_error=ai_state.project_error,
+            progress_stage=ai_state.progress_stage,
+            partial_task_titles=tuple(ai_state.partial_task_titles),
             on_request_ai=lambda _e, target=memo: self._handle_request_ai_generation(target),
             on_retry_ai=lambda _e, memo_id=memo.id: self._handle_retry_ai_generation(memo_id),
             on_mark_as_idea=lambda _e, memo_id=memo.id: self._handle_mark_memo_as_idea(memo_id),
@@ -270,6 +296,7 @@ class MemosView(BaseView):
                 self._memo_list.update_memos(
                     current_memos,
                     selected_memo_id=selected_memo_id,
+                    has_more=self.controller.has_more_memos(),
                 )
             except AssertionError as e:
                 if "Control must be added to the page first" in str(e):
@@ -327,10 +354,20 @@ class MemosView(BaseView):
             if self.memos_state.search_query:
                 self.controller.update_search(self.memos_state.search_query)
             self._refresh()
+            if self._memo_list:
+                self._memo_list.scroll_to_top()
         except Exception as e:
             self.notify_error("タブ切替に失敗しました", details=f"{type(e).__name__}: {e}")
         logger.debug(f"Tab changed to: {status}")
 
+    def _handle_load_more(self) -> None:
+        """一覧の末尾付近までスクロールしたときに続きのメモを読み込む。"""
+        try:
+            if self.controller.load_more_memos():
+                self._update_memo_list()
+        except Exception as e:
+            self.notify_error("メモの読み込みに失敗しました", details=f"{type(e).__name__}: {e}")
+
     def _handle_filter_change(self, filter_data: dict[str, object]) -> None:
         """フィルタ変更ハンドラー。
 
@@ -377,8 +414,13 @@ class MemosView(BaseView):
                     logger.warning(f"無効なメモID形式: {memo_id}")
                     return
 
-                # State内のインデックスから検索
+                # State内のインデックスから検索 (まだ読み込んでいないページのメモは個別に取得する)
                 memo = self.memos_state.memo_by_id(target_uuid)
+                if memo is None:
+                    try:
+                        memo = self.controller.refresh_memo(target_uuid)
+                    except NotFoundError:
+                        memo = None
                 if memo:
                     logger.debug(f"メモを発見: id={memo.id}, status={memo.status}")
                     # メモのステータスに合わせてタブを切り替え
@@ -416,8 +458,7 @@ class MemosView(BaseView):
             ai_state.editing_task_id = None
             self.memos_state.set_project_info(memo.id, None)
             self._refresh()
-            logger.debug(f"Polling scheduled for job_id={snapshot.job_id} memo_id={memo.id}")
-            self._start_ai_job_polling(snapshot.job_id, memo.id)
+            self._watch_ai_job(snapshot.job_id, memo.id)
 
         def _task() -> None:
             snapshot = _enqueue()
@@ -563,36 +604,66 @@ class MemosView(BaseView):
             logger.error(f"プロジェクト画面への遷移に失敗: {exc}", exc_info=True)
             self.notify_error("プロジェクト画面への遷移に失敗しました", details=str(exc))
 
-    def _start_ai_job_polling(self, job_id: UUID, memo_id: UUID) -> None:
-        async def _poll() -> None:
-            while True:
-                snapshot = await asyncio.to_thread(self.controller.get_ai_job_snapshot, job_id)
-                self._process_ai_job_snapshot(memo_id, snapshot)
-                if snapshot.status in {MemoAiJobStatus.SUCCEEDED, MemoAiJobStatus.FAILED}:
-                    break
-                await asyncio.sleep(1.5)
+    def _watch_ai_job(self, job_id: UUID, memo_id: UUID) -> None:
+        """AI ジョブの完了通知を待つ。登録から追跡開始までに完了していた場合はその場で反映する。"""
+        self._watched_ai_jobs[job_id] = memo_id
+        try:
+            snapshot = self.controller.get_ai_job_snapshot(job_id)
+        except Exception:
+            logger.exception(f"AIジョブの状態の取得に失敗しました: job_id={job_id}")
+            return
+        if snapshot.status in {MemoAiJobStatus.SUCCEEDED, MemoAiJobStatus.FAILED}:
+            self._handle_ai_job_updated(MemoAiJobUpdated(snapshot=snapshot))
+
+    def _handle_ai_job_updated(self, event: MemoAiJobUpdated) -> None:
+        """追跡中のジョブの状態の変化 (実行開始・完了) を反映する。"""
+        snapshot = event.snapshot
+        # 登録時の通知は実行開始の通知と前後しうるうえ、登録の戻り値で反映済みのため扱わない
+        if snapshot.status == MemoAiJobStatus.QUEUED:
+            return
+        if snapshot.status in {MemoAiJobStatus.SUCCEEDED, MemoAiJobStatus.FAILED}:
+            # 完了の通知と追跡開始時の確認の両方で届いても 1 回だけ反映する
+            memo_id = self._watched_ai_jobs.pop(snapshot.job_id, None)
+        else:
+            memo_id = self._watched_ai_jobs.get(snapshot.job_id)
+        if memo_id is None:
+            return
+        self._process_ai_job_snapshot(memo_id, snapshot)
 
-        if self.page and hasattr(self.page, "run_task"):
+    def _handle_memo_changed(self, event: MemoChanged) -> None:
+        """他の画面や AI ジョブでコミットされたメモの変更を、該当するメモだけ読み直して反映する。"""
+        if event.memo_id in self._watched_ai_jobs.copy().values():
+            # 生成中のメモはジョブの完了時にまとめて読み直す
+            return
+        current = self.memos_state.memo_by_id(event.memo_id)
+        if event.kind == ChangeKind.DELETED:
+            if current is None:
+                return
+            self.controller.forget_memo(event.memo_id)
+        else:
+            # この画面での書き込みは戻り値で反映済みのため、更新日時が一致するものは読み直さない
+            if current is not None and event.updated_at is not None and current.updated_at == event.updated_at:
+                return
             try:
-                self.page.run_task(_poll)
-            except Exception:
-                logger.exception("Failed to schedule AI job polling via page.run_task")
-            else:
+                self.controller.refresh_memo(event.memo_id, refresh_counts=True)
+            except NotFoundError:
                 return
+        self._refresh()
 
+    def _handle_ai_job_progress(self, progress: MemoAiJobProgress) -> None:
+        """ワーカーから届いた途中経過を反映し、表示中のメモであれば詳細パネルだけを更新する。"""
+        applied = self.memos_state.apply_ai_progress(
+            progress.memo_id,
+            progress.job_id,
+            stage=progress.stage,
+            partial_task_titles=list(progress.partial_task_titles),
+        )
+        if not applied or self.memos_state.selected_memo_id != progress.memo_id:
+            return
         try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-
-            def _runner() -> None:
-                logger.debug(f"Starting polling thread for job_id={job_id} memo_id={memo_id}")
-                asyncio.run(_poll())
-
-            thread = threading.Thread(target=_runner, name="MemoAiJobPoller", daemon=True)
-            thread.start()
-        else:
-            task = loop.create_task(_poll())
-            self._pending_async_tasks.append(task)
+            self._update_detail_panel()
+        except Exception:
+            logger.exception(f"AI生成の途中経過の表示に失敗しました: job_id={progress.job_id}")
 
     def _process_ai_job_snapshot(self, memo_id: UUID, snapshot: MemoAiJobSnapshot) -> None:
         self.memos_state.update_job_status(memo_id, status=snapshot.status.value, error=snapshot.error_message)
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import contextlib
 from typing import TYPE_CHECKING
 
 import flet as ft
 
 from views.projects.components.project_card import create_project_card_from_vm
+from views.shared.components.keyed_list import KeyedList
 
 from .empty_state import ProjectEmptyState
 
@@ -18,7 +18,10 @@ if TYPE_CHECKING:
 
 
 class ProjectCardList(ft.Column):
-    """プロジェクトカードを一覧表示するリストコンポーネント。"""
+    """プロジェクトカードを一覧表示するリストコンポーネント。
+
+    カードは KeyedList でプロジェクトIDごとに保持し、内容が変わったカードだけを作り直す。
+    """
 
     def __init__(
         self,
@@ -42,33 +45,36 @@ class ProjectCardList(ft.Column):
         self.on_create = on_create
 
         super().__init__(
-            controls=self._build_controls(),
+            controls=[],
             spacing=8,
             scroll=ft.ScrollMode.AUTO,
             expand=True,
         )
+        self._cards: KeyedList[ProjectCardVM] = KeyedList(
+            self,
+            key=lambda project: project.id,
+            build=self._create_card,
+            empty=lambda: ProjectEmptyState(on_create=self.on_create),
+        )
+        self._cards.set_items(projects, selected_key=selected_id)
 
-    def _build_controls(self) -> list[ft.Control]:
-        """リストコントロールを構築。
+    def _create_card(self, project: ProjectCardVM, is_selected: bool) -> ft.Control:  # noqa: FBT001
+        """プロジェクトカードを作成。
+
+        Args:
+            project: プロジェクトのViewModel
+            is_selected: 選択状態
 
         Returns:
-            プロジェクトカードのリスト、または空の状態
+            プロジェクトカード
         """
-        if not self.projects:
-            return [ProjectEmptyState(on_create=self.on_create)]
-
-        cards: list[ft.Control] = []
-        for project in self.projects:
-            is_selected = self.selected_id == project.id
-            # on_select が None の場合は空の関数を渡す
-            on_select_handler = self.on_select if self.on_select else lambda _: None
-            card = create_project_card_from_vm(
-                vm=project,
-                on_select=on_select_handler,
-                is_selected=is_selected,
-            )
-            cards.append(card)
-        return cards
+        # on_select が None の場合は空の関数を渡す
+        on_select_handler = self.on_select if self.on_select else lambda _: None
+        return create_project_card_from_vm(
+            vm=project,
+            on_select=on_select_handler,
+            is_selected=is_selected,
+        )
 
     def update_projects(
         self,
@@ -76,7 +82,7 @@ class ProjectCardList(ft.Column):
         *,
         selected_id: str | None = None,
     ) -> None:
-        """プロジェクトリストを更新。
+        """プロジェクトリストを差分で更新（内容が変わったカードだけを作り直す）。
 
         Args:
             projects: 新しいプロジェクトリスト
@@ -84,6 +90,4 @@ class ProjectCardList(ft.Column):
         """
         self.projects = projects
         self.selected_id = selected_id
-        self.controls = self._build_controls()
-        with contextlib.suppress(AssertionError):
-            self.update()
+        self._cards.set_items(projects, selected_key=selected_id)
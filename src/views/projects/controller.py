@@ -11,7 +11,7 @@ from uuid import UUID
 
 from loguru import logger
 
-from models import ProjectStatus, ProjectUpdate
+from models import ProjectStatus, ProjectUpdate, TaskStatus
 
 from .ordering import apply_order, get_order_strategy
 from .presenter import (
@@ -23,9 +23,9 @@ from .presenter import (
 from .state import ProjectState
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
-    from models import ProjectRead
+    from models import ProjectRead, ProjectSummary
 
 
 class ProjectApplicationPort(Protocol):
@@ -56,6 +56,10 @@ class ProjectApplicationPort(Protocol):
         """ステータス別一覧取得。"""
         ...
 
+    def get_summaries(self, project_ids: Iterable[UUID]) -> dict[UUID, ProjectSummary]:  # pragma: no cover - interface
+        """複数プロジェクトのタスク概要（件数・完了数・タスク行）を一括取得。"""
+        ...
+
     def create(
         self,
         title: str,
@@ -89,8 +93,6 @@ class ProjectController:
         on_list_change: Callable[[list[ProjectCardVM]], None],
         on_detail_change: Callable[[ProjectDetailVM | None], None],
         on_error: Callable[[str], None] | None = None,
-        *,
-        apps: object | None = None,
     ) -> None:
         """Controller 初期化。
 
@@ -99,14 +101,12 @@ class ProjectController:
             on_list_change: 一覧 VM 更新時コールバック
             on_detail_change: 詳細 VM 更新時コールバック
             on_error: ユーザ通知用エラーハンドラ（SnackBar 等）
-            apps: ApplicationServices インスタンス（タスク取得用）
         """
         self._service = service
         self._state = ProjectState()
         self._on_list_change = on_list_change
         self._on_detail_change = on_detail_change
         self._on_error = on_error
-        self._apps = apps
 
     def _notify_error(self, message: str) -> None:
         """UI 層へエラー通知（存在すれば）。"""
@@ -348,11 +348,12 @@ class ProjectController:
             task_service = TaskApplicationService(SqlModelUnitOfWork)
 
             # このプロジェクトに以前属していたタスクを取得してクリア
-            all_tasks = task_service.get_all_tasks()
-            for task in all_tasks:
-                if task.project_id == pid and str(task.id) not in task_ids:
+            summary = self._load_summaries([pid]).get(pid)
+            current_ids = summary.task_ids if summary is not None else []
+            for current_id in current_ids:
+                if str(current_id) not in task_ids:
                     # このプロジェクトから外す
-                    task_service.update(task.id, TaskUpdate(project_id=None))
+                    task_service.update(current_id, TaskUpdate(project_id=None))
 
             # 新しく選択されたタスクを更新
             for task_id_str in task_ids:
@@ -488,7 +489,8 @@ class ProjectController:
 
             if selected is not None:
                 # Presenter 互換の辞書へマッピング
-                detail_vm = to_detail_vm(self._project_read_to_presenter_dict(selected))
+                summary = self._load_summaries([selected.id]).get(selected.id)
+                detail_vm = to_detail_vm(self._project_read_to_presenter_dict(selected, summary))
                 self._on_detail_change(detail_vm)
                 logger.debug(f"プロジェクト詳細更新: {detail_vm.title}")
             else:
@@ -509,16 +511,27 @@ class ProjectController:
 
     # --- internal helpers -------------------------------------------------
 
+    def _load_summaries(self, project_ids: list[UUID]) -> dict[UUID, ProjectSummary]:
+        """プロジェクトのタスク概要を一括取得する（失敗時は空の辞書）。"""
+        if not project_ids:
+            return {}
+        try:
+            return self._service.get_summaries(project_ids)
+        except Exception as e:
+            logger.warning(f"プロジェクト概要の取得エラー: {e}")
+            return {}
+
     def _reads_to_presenter_dicts(self, items: list[ProjectRead]) -> list[dict[str, Any]]:
         """ProjectRead の配列を Presenter 互換の辞書リストへ正規化する。
 
         Note:
             Presenter は dict[str, str] を想定するため、文字列へ寄せる。
-            進捗系は未集計のため 0 を設定する（将来 ApplicationService に統合）。
+            進捗系はプロジェクト数に関わらず 1 回の概要取得でまとめて集計する。
         """
-        return [self._project_read_to_presenter_dict(p) for p in items]
+        summaries = self._load_summaries([p.id for p in items if p.id is not None])
+        return [self._project_read_to_presenter_dict(p, summaries.get(p.id)) for p in items]
 
-    def _project_read_to_presenter_dict(self, p: ProjectRead) -> dict[str, str]:
+    def _project_read_to_presenter_dict(self, p: ProjectRead, summary: ProjectSummary | None) -> dict[str, str]:
         def _s(v: object | None) -> str:
             return "" if v is None else str(v)
 
@@ -530,43 +543,19 @@ class ProjectController:
         else:
             status_text = _s(status_value)
 
-        # 関連タスクIDリストと完了数を取得
-        project_id = getattr(p, "id", None)
-        task_ids: list[str] = []
-        completed_count = 0
-        tasks_details: list[dict[str, str]] = []
-        if project_id:
-            try:
-                from logic.application.task_application_service import TaskApplicationService
-                from models import TaskStatus
-
-                if not hasattr(self._apps, "get_service"):
-                    return {}
-                task_service = self._apps.get_service(TaskApplicationService)  # type: ignore[union-attr]
-                all_tasks = task_service.get_all_tasks()
-                # プロジェクトに関連するタスクをフィルタ
-                related_tasks = [task for task in all_tasks if task.project_id == project_id]
-                task_ids = [str(task.id) for task in related_tasks]
-                # 完了タスクをカウント
-                completed_count = sum(1 for task in related_tasks if task.status == TaskStatus.COMPLETED)
-                # タスク詳細を作成
-                tasks_details.extend(
-                    [
-                        {
-                            "id": str(task.id),
-                            "title": str(task.title),
-                            "status": (
-                                task.status.display_label()
-                                if hasattr(task.status, "display_label")
-                                else str(task.status)
-                            ),
-                            "is_completed": str(task.status == TaskStatus.COMPLETED),
-                        }
-                        for task in related_tasks
-                    ]
-                )
-            except Exception as e:
-                logger.warning(f"プロジェクト {project_id} の関連タスク取得エラー: {e}")
+        # 関連タスクIDリストと完了数（概要が取得できない場合は 0 件）
+        tasks = summary.tasks if summary is not None else ()
+        task_ids = [str(task.id) for task in tasks]
+        completed_count = summary.completed_count if summary is not None else 0
+        tasks_details = [
+            {
+                "id": str(task.id),
+                "title": str(task.title),
+                "status": task.status.value,
+                "is_completed": str(task.status == TaskStatus.COMPLETED),
+            }
+            for task in tasks
+        ]
 
         return {
             "id": _s(getattr(p, "id", "")),
@@ -44,6 +44,10 @@ class ProjectsView(BaseView):
         _detail_container: プロジェクト詳細コンテナ
     """
 
+    # build_content が一覧を読み直すため、reload_data は既定の再構築で足りる
+    keep_alive = True
+    data_tables = ("projects", "tasks")
+
     def __init__(self, props: BaseViewProps) -> None:
         """ProjectsView を初期化する。
 
@@ -63,7 +67,6 @@ class ProjectsView(BaseView):
             on_detail_change=self._render_detail,
             # BaseView.show_error_snackbar は (page, message) 署名のためアダプタで統一
             on_error=lambda msg: self.show_error_snackbar(self.page, msg),
-            apps=self.apps,
         )
 
         # UI コンポーネント
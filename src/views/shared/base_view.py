@@ -8,11 +8,11 @@ OpenSpec `organize-view-layer` の `base-view-contract` 仕様に準拠した
     - エラーハンドリング (統一経路 notify_error)
     - ローディング状態管理 (state.loading + with_loading)
     - ライフサイクルフック (did_mount / will_unmount)
-    - クリーンアップ (非同期タスクキャンセル)
+    - クリーンアップ (非同期タスクキャンセル・イベント購読解除)
+    - ドメインイベント購読 (subscribe_event, page.pubsub 経由)
     - Header生成ヘルパー（統一されたヘッダー作成）
 
 今後の拡張ポイント:
-    - グローバルメッセージ購読
     - AsyncExecutor 改善 (現在は簡易実装)
 """
 
@@ -21,12 +21,13 @@ from __future__ import annotations
 import inspect
 import traceback
 from dataclasses import dataclass, replace
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import flet as ft
 from loguru import logger
 
 from views.shared.components import Header, HeaderButtonData, HeaderData
+from views.shared.page_events import get_page_events
 from views.theme import get_dark_color, get_grey_color, get_light_color
 
 if TYPE_CHECKING:
@@ -34,6 +35,7 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from logic.application.apps import ApplicationServices
+    from logic.events import DomainEvent
 
 
 class ErrorHandlingMixin:
@@ -160,9 +162,22 @@ class BaseView(ft.Container, ErrorHandlingMixin):
     - `notify_error()`: ログ + ユーザ通知単一経路
     - `with_loading()`: 処理ラップ (同期/非同期両対応)
     - Lifecycle: did_mount / will_unmount
-    - Cleanup: 実行中タスクキャンセル
+    - Cleanup: 実行中タスクキャンセル・イベント購読解除
+    - Events: `subscribe_event()` でドメインイベントを購読 (will_unmount で解除)
+    - Keep-alive: `keep_alive` / `data_tables` / `reload_on_change` / `reload_data`
+      (views.layout の View キャッシュが使用)
     """
 
+    keep_alive: ClassVar[bool] = False
+    """ルート移動後もインスタンスと表示内容を保持するか (`reload_data` を実装した View だけ True にする)"""
+
+    data_tables: ClassVar[tuple[str, ...]] = ()
+    """表示内容が依存するテーブル名。いずれかが更新されていれば再表示時に `reload_data` を呼ぶ"""
+
+    reload_on_change: ClassVar[bool] = True
+    """表示中に `data_tables` への書き込みがコミットされたら、その場で `reload_data` を呼ぶか
+    (変更イベントを購読して自分で差分を反映する View は False にする)"""
+
     def __init__(self, props: BaseViewProps) -> None:
         super().__init__()
         self.page: ft.Page = props.page
@@ -172,6 +187,8 @@ class BaseView(ft.Container, ErrorHandlingMixin):
         # 実行中タスク (async) を保持し unmount 時にキャンセル
         # 非同期タスク保持 (TYPE_CHECKING で Task インポート)
         self._running_tasks: list[Task[Any]] = []
+        # subscribe_event で登録したイベント購読の解除関数 (unmount 時に呼ぶ)
+        self._event_subscriptions: list[Callable[[], None]] = []
 
     def did_mount(self) -> None:  # type: ignore[override]
         """マウント時に呼び出される。
@@ -182,10 +199,6 @@ class BaseView(ft.Container, ErrorHandlingMixin):
         self.is_mounted = True
         logger.debug(f"{self.__class__.__name__} mounted")
 
-        # TODO: グローバルメッセージ購読機能を統合フェーズで追加
-        # 理由: Pub/Subシステムが未実装のため
-        # 置換先: page.pubsub.subscribe(self._on_global_message)
-
     def will_unmount(self) -> None:  # type: ignore[override]
         """アンマウント時のクリーンアップ (spec: Cleanup On Unmount)."""
         self.is_mounted = False
@@ -194,8 +207,38 @@ class BaseView(ft.Container, ErrorHandlingMixin):
             if not task.done():
                 task.cancel()
         self._running_tasks.clear()
+        for unsubscribe in self._event_subscriptions:
+            unsubscribe()
+        self._event_subscriptions.clear()
         logger.debug(f"{self.__class__.__name__} unmounted & tasks cancelled")
-        # 追加予定: グローバル購読解除
+
+    def subscribe_event[EventT: DomainEvent](
+        self, event_type: type[EventT], listener: Callable[[EventT], None]
+    ) -> None:
+        """ページへ中継されたドメインイベントを購読する (解除は will_unmount で行う)。
+
+        リスナーは page.pubsub のハンドラとして呼ばれるため、発行したスレッド (コミットした処理や
+        AI ジョブのワーカー) を待たせない。ページにイベントの中継がない場合 (テストなど) は何もしない。
+
+        Args:
+            event_type: 受け取るイベントの型
+            listener: イベントを受け取る関数
+        """
+        events = get_page_events(self.page)
+        if events is None:
+            return
+        self._event_subscriptions.append(events.subscribe(event_type, listener))
+
+    def reload_data(self) -> ft.Control | None:
+        """保持していた View を最新のデータで更新する (keep-alive 用)。
+
+        キャッシュした表示内容を先に表示したうえで、バックグラウンドスレッドから呼ばれる。
+        フィルタや選択などの画面状態は維持したまま、データだけを読み直すこと。
+
+        Returns:
+            ft.Control | None: 差し替える表示内容。既存のコントロールをその場で更新した場合は None
+        """
+        return self.build()
 
     def build(self) -> ft.Control:
         """UIを構築する。
@@ -248,20 +291,6 @@ class BaseView(ft.Container, ErrorHandlingMixin):
         except Exception as e:
             logger.error(f"Failed to update page: {e}")
 
-    def _on_global_message(self, message: object) -> None:
-        """グローバルメッセージを受信する。
-
-        Args:
-            message: 受信したメッセージ
-
-        Notes:
-            必要に応じてサブクラスでオーバーライドしてください。
-        """
-        # TODO: 統合フェーズで実装
-        # 理由: グローバル通信仕様が未定義のため
-        # 置換先: 具体的なメッセージハンドリングロジック
-        logger.debug(f"Global message received: {message}")
-
     # ---------------------------------------------------------------------
     # Spec: notify_error (Logging & User Messaging Policy)
     # ---------------------------------------------------------------------
@@ -5,7 +5,9 @@ views_new/shared/components/ で使用される再利用可能なUIコンポー
 
 from .card import Card, CardActionData, CardBadgeData, CardData, CardMetadataData, TagBadgeData
 from .header import Header, HeaderButtonData, HeaderData
+from .keyed_list import KeyedList
 from .status_tabs import StatusTabs, TabDefinition
+from .virtual_list import VirtualList
 
 __all__ = [
     "Card",
@@ -17,6 +19,8 @@ __all__ = [
     "Header",
     "HeaderData",
     "HeaderButtonData",
+    "KeyedList",
     "StatusTabs",
     "TabDefinition",
+    "VirtualList",
 ]
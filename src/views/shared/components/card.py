@@ -60,7 +60,7 @@ card = Card(data=data)
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Final
 
 import flet as ft
@@ -257,6 +257,22 @@ class Card(ft.Container):
             self.on_click = lambda _: self._data.on_click()  # type: ignore[misc]
             self.ink = True
 
+    def set_selected(self, is_selected: bool) -> bool:  # noqa: FBT001 - KeyedList から位置引数で呼ばれる
+        """選択状態だけを切り替える (カード全体は作り直さず、elevation のみ変更する)
+
+        Args:
+            is_selected: 新しい選択状態
+
+        Returns:
+            bool: その場で反映できた場合 True (呼び出し側は作り直さずに済む)
+        """
+        card = self.content
+        if not isinstance(card, ft.Card):
+            return False
+        self._data = replace(self._data, is_selected=is_selected)
+        card.elevation = CARD_ELEVATION_SELECTED if is_selected else CARD_ELEVATION_DEFAULT
+        return True
+
     def _build_header(self) -> ft.Control:
         """ヘッダー（タイトル + 説明 + バッジ）を構築する
 
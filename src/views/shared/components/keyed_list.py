@@ -0,0 +1,183 @@
+"""キー付きリストの差分更新ヘルパー
+
+【責務】
+- エンティティIDをキーに、前回描画したカードと新しいデータを突き合わせる
+- 内容が変わっていないカードはコントロールを再利用し、変わったカードだけ作り直す
+- 選択の切り替えは旧選択・新選択の 2 枚だけに反映する
+- 並びや件数が変わった場合だけリスト全体を update し、それ以外は変わったカードだけを update する
+
+【設計上の特徴】
+- コントロールではなく、既存の ft.Column / ft.ListView の `controls` を管理するヘルパー
+- Flet はコントロールの同一性で差分を取るため、再利用したカードは再送されない
+- 選択は `set_selected(is_selected) -> bool` を持つカード (共通 Card) ならその場で切り替え、
+  持たないカードや False を返すカードは 1 枚だけ作り直す
+
+【使用例】
+```python
+self._cards = KeyedList(
+    self,  # ft.Column
+    key=lambda memo: str(memo.id),
+    build=lambda memo, selected: MemoCard(create_memo_card_data(memo, is_selected=selected)),
+    empty=self._build_empty_state,
+)
+self._cards.set_items(memos, selected_key=selected_id)
+self._cards.select(new_id)
+```
+"""
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    import flet as ft
+
+_UNCHANGED: Final = object()
+"""`set_items` の selected_key 省略時の番兵 (現在の選択を維持する)"""
+
+
+@dataclass(slots=True)
+class _Rendered:
+    control: ft.Control
+    fingerprint: object
+    selected: bool
+
+
+class KeyedList[ItemT]:
+    """ID をキーにカード列を差分更新するヘルパー
+
+    Attributes:
+        selected_key: 選択中のキー (未選択は None)
+    """
+
+    def __init__(
+        self,
+        container: ft.Column | ft.ListView,
+        *,
+        key: Callable[[ItemT], str],
+        build: Callable[[ItemT, bool], ft.Control],
+        empty: Callable[[], ft.Control] | None = None,
+        fingerprint: Callable[[ItemT], object] | None = None,
+    ) -> None:
+        """KeyedList を初期化する
+
+        Args:
+            container: カードを並べるコントロール (`controls` をこのヘルパーが管理する)
+            key: 項目のキー (エンティティID) を返す関数
+            build: 項目と選択状態からカードを作る関数
+            empty: 項目が 0 件のときに表示するコントロールを作る関数
+            fingerprint: 内容の比較に使う値を返す関数 (既定は項目そのもの。コールバックを含む項目では除外した値を返す)
+        """
+        self._container = container
+        self._key = key
+        self._build = build
+        self._empty = empty
+        self._fingerprint = fingerprint or (lambda item: item)
+        self._rendered: dict[str, _Rendered] = {}
+        self._items: dict[str, ItemT] = {}
+        self._empty_control: ft.Control | None = None
+        self.selected_key: str | None = None
+
+    def set_items(self, items: Sequence[ItemT], *, selected_key: Any = _UNCHANGED) -> None:  # noqa: ANN401
+        """項目の一覧を反映する (変わったカードだけ作り直し、必要な範囲だけ update する)
+
+        Args:
+            items: 表示する項目 (表示順)
+            selected_key: 選択中のキー (省略時は現在の選択を維持する)
+        """
+        if selected_key is not _UNCHANGED:
+            self.selected_key = selected_key
+        controls: list[ft.Control] = []
+        rendered: dict[str, _Rendered] = {}
+        items_by_key: dict[str, ItemT] = {}
+        patched: list[ft.Control] = []
+        for item in items:
+            item_key = self._key(item)
+            if item_key in rendered:
+                # キーが重複した項目は最初の 1 件だけ表示する
+                continue
+            entry, was_patched = self._reconcile(item_key, item)
+            rendered[item_key] = entry
+            items_by_key[item_key] = item
+            controls.append(entry.control)
+            if was_patched:
+                patched.append(entry.control)
+        self._rendered = rendered
+        self._items = items_by_key
+        if not controls and self._empty is not None:
+            if self._empty_control is None:
+                self._empty_control = self._empty()
+            controls = [self._empty_control]
+
+        if self._same_controls(controls):
+            for control in patched:
+                _safe_update(control)
+            return
+        self._container.controls = controls
+        _safe_update(self._container)
+
+    def select(self, key: str | None) -> None:
+        """選択を切り替える (旧選択と新選択のカードだけを更新する)
+
+        Args:
+            key: 新しく選択するキー (None で選択解除)
+        """
+        previous, self.selected_key = self.selected_key, key
+        if previous == key:
+            return
+        replaced = False
+        for target in (previous, key):
+            if target is None or target not in self._rendered:
+                continue
+            entry = self._rendered[target]
+            if self._apply_selection(self._items[target], entry, selected=target == key):
+                _safe_update(entry.control)
+            else:
+                replaced = True
+        if replaced:
+            self._container.controls = [entry.control for entry in self._rendered.values()]
+            _safe_update(self._container)
+
+    def control_for(self, key: str) -> ft.Control | None:
+        """キーに対応する描画済みカードを返す (未描画なら None)"""
+        entry = self._rendered.get(key)
+        return entry.control if entry is not None else None
+
+    def _reconcile(self, item_key: str, item: ItemT) -> tuple[_Rendered, bool]:
+        """前回のカードを再利用できるか判定する。戻り値の bool はその場で更新したかどうか"""
+        selected = item_key == self.selected_key
+        fingerprint = self._fingerprint(item)
+        previous = self._rendered.get(item_key)
+        if previous is None or previous.fingerprint != fingerprint:
+            return _Rendered(self._build(item, selected), fingerprint, selected), False
+        if previous.selected == selected:
+            return previous, False
+        return previous, self._apply_selection(item, previous, selected=selected)
+
+    def _apply_selection(self, item: ItemT, entry: _Rendered, *, selected: bool) -> bool:
+        """カードの選択状態を切り替える。その場で切り替えた場合は True、カードを作り直した場合は False"""
+        entry.selected = selected
+        set_selected = getattr(entry.control, "set_selected", None)
+        if callable(set_selected) and set_selected(selected):
+            return True
+        entry.control = self._build(item, selected)
+        return False
+
+    def _same_controls(self, controls: list[ft.Control]) -> bool:
+        current = self._container.controls or []
+        return len(current) == len(controls) and all(a is b for a, b in zip(current, controls, strict=True))
+
+
+def _safe_update(control: ft.Control) -> None:
+    """ページに追加済みのコントロールだけを update する"""
+    if getattr(control, "page", None) is None:
+        return
+    with contextlib.suppress(AssertionError):
+        control.update()
+
+
+__all__ = ["KeyedList"]
@@ -0,0 +1,215 @@
+"""仮想スクロールリスト
+
+【責務】
+- 読み込み済みの項目のうち、表示範囲とその前後のバッファ分だけカードを生成して表示する
+- 表示範囲より前後の項目は、推定した高さを持つ空白 (スペーサー) に置き換えてスクロール量を保つ
+- 末尾付近までスクロールしたら `on_load_more` で続きのページを要求する
+
+【設計上の特徴】
+- 表示範囲のカードは KeyedList で管理し、スクロールで範囲がずれても残るカードは再利用する
+- 項目の高さは `item_extent` (カード高さ + 行間) の推定値で一定とみなす
+- 生成するカード数は件数によらず (表示行数 + バッファ × 2) 程度に収まる
+- 続きの読み込みは呼び出し側が `set_items` で反映するまで重複して要求しない
+
+【使用例】
+```python
+self._list = VirtualList(
+    key=lambda memo: str(memo.id),
+    build=lambda memo, selected: MemoCard(create_memo_card_data(memo, is_selected=selected)),
+    item_extent=MEMO_CARD_EXTENT,
+    on_load_more=self._handle_load_more,
+)
+self._list.set_items(memos, has_more=page.has_next, selected_key=selected_id)
+```
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+from typing import TYPE_CHECKING, Any, Final
+
+import flet as ft
+
+from .keyed_list import _UNCHANGED, KeyedList, _safe_update
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+DEFAULT_OVERSCAN: Final[int] = 10
+"""表示範囲の前後に余分に生成するカード数"""
+
+DEFAULT_INITIAL_ROWS: Final[int] = 20
+"""スクロールイベントを受け取る前 (ビューポートの高さが不明な間) に表示する行数"""
+
+SCROLL_INTERVAL_MS: Final[int] = 50
+"""スクロールイベントの通知間隔 (ミリ秒)"""
+
+
+def compute_window(offset: float, viewport: float, *, item_extent: float, count: int, overscan: int) -> tuple[int, int]:
+    """スクロール位置から生成すべき項目の範囲を求める
+
+    Args:
+        offset: スクロール位置 (ピクセル)
+        viewport: ビューポートの高さ (ピクセル)
+        item_extent: 1 項目あたりの推定の高さ (ピクセル)
+        count: 読み込み済みの項目数
+        overscan: 表示範囲の前後に余分に生成する項目数
+
+    Returns:
+        tuple[int, int]: 生成する範囲 [start, end)
+    """
+    visible = max(1, math.ceil(viewport / item_extent))
+    # 件数が減ってスクロール位置が末尾を越えた場合は、末尾の項目が見える位置とみなす
+    first = min(max(0, int(offset // item_extent)), max(0, count - visible))
+    start = min(max(0, first - overscan), count)
+    end = min(count, first + visible + overscan)
+    return start, max(start, end)
+
+
+class VirtualList[ItemT]:
+    """表示範囲のカードだけを生成し、末尾で続きを段階的に読み込むリスト (非継承パターン)
+
+    Attributes:
+        has_more: まだ読み込んでいない続きがあるかどうか
+    """
+
+    def __init__(  # noqa: PLR0913 - 描画方法をキーワード引数で受け取る
+        self,
+        *,
+        key: Callable[[ItemT], str],
+        build: Callable[[ItemT, bool], ft.Control],
+        item_extent: float,
+        overscan: int = DEFAULT_OVERSCAN,
+        empty: Callable[[], ft.Control] | None = None,
+        fingerprint: Callable[[ItemT], object] | None = None,
+        on_load_more: Callable[[], None] | None = None,
+        spacing: float = 8,
+        padding: ft.Padding | int | None = None,
+    ) -> None:
+        """VirtualList を初期化する
+
+        Args:
+            key: 項目のキー (エンティティID) を返す関数
+            build: 項目と選択状態からカードを作る関数
+            item_extent: 1 項目あたりの推定の高さ (カードの高さ + spacing)
+            overscan: 表示範囲の前後に余分に生成するカード数
+            empty: 項目が 0 件のときに表示するコントロールを作る関数
+            fingerprint: 内容の比較に使う値を返す関数 (KeyedList と同じ)
+            on_load_more: 末尾付近までスクロールしたときに続きを要求するコールバック
+            spacing: カード間の余白
+            padding: リスト全体の余白
+        """
+        self._item_extent = item_extent
+        self._overscan = overscan
+        self._on_load_more = on_load_more
+        self._items: list[ItemT] = []
+        self._offset = 0.0
+        self._viewport = item_extent * DEFAULT_INITIAL_ROWS
+        self._window = (0, 0)
+        self._loading = False
+        self.has_more = False
+
+        self._top = ft.Container(height=0)
+        self._bottom = ft.Container(height=0)
+        self._rows = ft.Column(spacing=spacing)
+        self._list = ft.ListView(
+            controls=[self._top, self._rows, self._bottom],
+            expand=True,
+            spacing=0,
+            padding=padding,
+            on_scroll=self._handle_scroll,
+            on_scroll_interval=SCROLL_INTERVAL_MS,
+        )
+        self._cards: KeyedList[ItemT] = KeyedList(
+            self._rows, key=key, build=build, empty=empty, fingerprint=fingerprint
+        )
+
+    @property
+    def control(self) -> ft.Control:
+        """レイアウトに配置するコントロール"""
+        return self._list
+
+    @property
+    def selected_key(self) -> str | None:
+        """選択中のキー (未選択は None)"""
+        return self._cards.selected_key
+
+    def set_items(
+        self,
+        items: Sequence[ItemT],
+        *,
+        has_more: bool = False,
+        selected_key: Any = _UNCHANGED,  # noqa: ANN401
+    ) -> None:
+        """読み込み済みの項目を反映する (表示範囲のカードだけを生成・更新する)
+
+        Args:
+            items: 読み込み済みの項目 (表示順)
+            has_more: まだ読み込んでいない続きがあるかどうか
+            selected_key: 選択中のキー (省略時は現在の選択を維持する)
+        """
+        self._items = list(items)
+        self.has_more = has_more
+        self._loading = False
+        self._render(selected_key=selected_key, force=True)
+        self._request_more_if_needed()
+
+    def select(self, key: str | None) -> None:
+        """選択を切り替える (表示範囲外のカードは次に表示されたときに反映される)
+
+        Args:
+            key: 新しく選択するキー (None で選択解除)
+        """
+        self._cards.select(key)
+
+    def scroll_to_top(self) -> None:
+        """先頭までスクロールする (タブ切り替えなどで一覧の中身が入れ替わったときに使う)"""
+        self._offset = 0.0
+        if self._list.page is not None:
+            with contextlib.suppress(AssertionError):
+                self._list.scroll_to(offset=0)
+        self._render()
+
+    def control_for(self, key: str) -> ft.Control | None:
+        """キーに対応する生成済みカードを返す (表示範囲外なら None)"""
+        return self._cards.control_for(key)
+
+    def _handle_scroll(self, e: ft.OnScrollEvent) -> None:
+        self._offset = e.pixels
+        if e.viewport_dimension:
+            self._viewport = e.viewport_dimension
+        self._render()
+        self._request_more_if_needed()
+
+    def _render(self, *, selected_key: Any = _UNCHANGED, force: bool = False) -> None:  # noqa: ANN401
+        count = len(self._items)
+        window = compute_window(
+            self._offset, self._viewport, item_extent=self._item_extent, count=count, overscan=self._overscan
+        )
+        if window == self._window and not force:
+            return
+        self._window = window
+        start, end = window
+        self._cards.set_items(self._items[start:end], selected_key=selected_key)
+        self._set_height(self._top, start * self._item_extent)
+        self._set_height(self._bottom, (count - end) * self._item_extent)
+
+    def _request_more_if_needed(self) -> None:
+        if not self.has_more or self._loading or self._on_load_more is None:
+            return
+        # バッファ分のカードが尽きる前に続きを要求する
+        if self._window[1] < len(self._items) - self._overscan:
+            return
+        self._loading = True
+        self._on_load_more()
+
+    @staticmethod
+    def _set_height(spacer: ft.Container, height: float) -> None:
+        if spacer.height == height:
+            return
+        spacer.height = height
+        _safe_update(spacer)
+
+
+__all__ = ["DEFAULT_OVERSCAN", "VirtualList", "compute_window"]
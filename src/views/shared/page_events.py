@@ -0,0 +1,147 @@
+"""ドメインイベントのページへの中継
+
+`logic.events` のイベントは、コミットしたスレッドや AI ジョブのワーカースレッドで同期的に発行される。
+ページ (セッション) ごとに `PageEvents` を 1 つ作り、受け取ったイベントを `page.pubsub` のセッション専用トピックへ
+送ることで、発行側を待たせずに pubsub のハンドラから View のリスナーへ配送する。
+
+【使用例】
+```python
+events = connect_page_events(page)  # ルーティングの初期化時に 1 回
+unsubscribe = events.subscribe(MemoChanged, self._handle_memo_changed)
+```
+View からは `BaseView.subscribe_event` を使うと、破棄時に購読が自動で解除される。
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Final, cast
+
+from loguru import logger
+
+from logic.events import DomainEvent, get_event_bus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import flet as ft
+
+    from logic.events import EventBus
+
+_SESSION_KEY: Final = "kage.page_events"
+"""`page.session` のキー"""
+
+_TOPIC_PREFIX: Final = "domain-events"
+
+
+class PageEvents:
+    """イベントバスのイベントをページの pubsub 経由で View のリスナーへ配送する
+
+    イベントバスはリスナーのいるイベント型だけ購読する。`MemoAiJobProgress` のように購読者の有無で
+    発行側の処理が変わるイベントも、表示中の View が必要としている間だけ購読される。
+    """
+
+    def __init__(self, page: ft.Page, bus: EventBus | None = None) -> None:
+        """PageEvents を初期化し、ページの pubsub を購読する
+
+        Args:
+            page: 配送先のページ
+            bus: 購読するイベントバス (None の場合はプロセス共有のバス)
+        """
+        self._page = page
+        self._bus = bus or get_event_bus()
+        self._topic = f"{_TOPIC_PREFIX}/{page.session_id}"
+        self._lock = threading.Lock()
+        self._listeners: list[tuple[type[DomainEvent], Callable[[DomainEvent], None]]] = []
+        self._bus_subscriptions: dict[type[DomainEvent], Callable[[], None]] = {}
+        page.pubsub.subscribe_topic(self._topic, self._dispatch)
+
+    def subscribe[EventT: DomainEvent](
+        self, event_type: type[EventT], listener: Callable[[EventT], None]
+    ) -> Callable[[], None]:
+        """ページへ届いたイベントのリスナーを登録する
+
+        Args:
+            event_type: 受け取るイベントの型 (サブクラスのイベントも受け取る)
+            listener: イベントを受け取る関数 (pubsub のハンドラとして呼ばれる)
+
+        Returns:
+            Callable[[], None]: 登録を解除する関数
+        """
+        entry = (cast("type[DomainEvent]", event_type), cast("Callable[[DomainEvent], None]", listener))
+        with self._lock:
+            self._listeners.append(entry)
+            if event_type not in self._bus_subscriptions:
+                self._bus_subscriptions[event_type] = self._bus.subscribe(
+                    event_type, lambda event: self._forward(event_type, event)
+                )
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if entry in self._listeners:
+                    self._listeners.remove(entry)
+                if any(subscribed is event_type for subscribed, _ in self._listeners):
+                    return
+                release = self._bus_subscriptions.pop(event_type, None)
+            if release is not None:
+                release()
+
+        return _unsubscribe
+
+    def close(self) -> None:
+        """イベントバスとページの pubsub の購読を解除する (ページを閉じたときに呼ぶ)"""
+        with self._lock:
+            self._listeners.clear()
+            releases = list(self._bus_subscriptions.values())
+            self._bus_subscriptions.clear()
+        for release in releases:
+            release()
+        try:
+            self._page.pubsub.unsubscribe_topic(self._topic)
+        except Exception:
+            # 切断済みのセッションでは解除に失敗してもよい
+            logger.debug(f"ページのイベント購読の解除に失敗しました: topic={self._topic}")
+
+    def _forward(self, event_type: type[DomainEvent], event: DomainEvent) -> None:
+        # 発行したスレッドで呼ばれるため、購読した型と一緒にすぐ pubsub へ渡す
+        self._page.pubsub.send_all_on_topic(self._topic, (event_type, event))
+
+    def _dispatch(self, _topic: str, message: object) -> None:
+        if not isinstance(message, tuple):
+            return
+        event_type, event = message
+        # 購読した型ごとにバスから届くため、同じ型で登録したリスナーだけに配送する (重複配送を防ぐ)
+        with self._lock:
+            listeners = [listener for subscribed, listener in self._listeners if subscribed is event_type]
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception(f"View のイベント処理で例外が発生しました: event={type(event).__name__}")
+
+
+def connect_page_events(page: ft.Page, bus: EventBus | None = None) -> PageEvents:
+    """ページにイベントの中継を作成し、`page.session` に保持する
+
+    Args:
+        page: 対象のページ
+        bus: 購読するイベントバス (None の場合はプロセス共有のバス)
+
+    Returns:
+        PageEvents: 作成した中継
+    """
+    events = PageEvents(page, bus)
+    page.session.set(_SESSION_KEY, events)
+    return events
+
+
+def get_page_events(page: ft.Page) -> PageEvents | None:
+    """ページのイベントの中継を返す (`connect_page_events` を呼んでいない場合は None)"""
+    session = getattr(page, "session", None)
+    if session is None:
+        return None
+    events = session.get(_SESSION_KEY)
+    return events if isinstance(events, PageEvents) else None
+
+
+__all__ = ["PageEvents", "connect_page_events", "get_page_events"]
@@ -60,6 +60,9 @@ class TagsView(BaseView):
         - データ取得はControllerに委譲し、ViewはUI組立に集中する。
     """
 
+    keep_alive = True
+    data_tables = ("tags", "memo_tag", "task_tag")
+
     def __init__(self, props: BaseViewProps) -> None:  # type: ignore[name-defined]
         super().__init__(props)
         self.tags_state = TagsViewState()
@@ -74,6 +77,11 @@ class TagsView(BaseView):
         self._detail_panel: TagDetailPanel | None = None
         self._header: ft.Control | None = None  # type: ignore[name-defined]
 
+    def reload_data(self) -> ft.Control:  # type: ignore[name-defined]
+        """選択と検索条件を保ったままタグを読み直して再構築する。"""
+        self.controller.refresh()
+        return self.build()
+
     # ------------------------------------------------------------------
     # Build
     # ------------------------------------------------------------------
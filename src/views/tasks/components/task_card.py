@@ -110,3 +110,7 @@ class TaskCard(Card):
         )
 
         super().__init__(card_data)
+
+    def set_selected(self, is_selected: bool) -> bool:  # noqa: ARG002, FBT001
+        """選択インジケータ (アクション) も変わるため、その場では切り替えない (KeyedList が作り直す)。"""
+        return False
@@ -5,17 +5,21 @@ ft.UserControl でタスク一覧を表示し、アイテムクリックをコ
 
 from __future__ import annotations
 
-import contextlib
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING
 
 import flet as ft
 
+from views.shared.components.virtual_list import VirtualList
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
     from views.tasks.components.task_card import TaskCardData
 
+# カード 1 枚の推定の高さ (タイトル・補助テキスト・バッジ行) + 行間
+_TASK_CARD_EXTENT = 120
+
 
 @dataclass(frozen=True)
 class TaskListProps:
@@ -23,22 +27,34 @@ class TaskListProps:
 
     Attributes:
         on_item_click: アイテムクリック時に呼ばれる (TaskCardVM を引数にとる)
+        on_load_more: 末尾付近までスクロールしたときに続きを要求する
     """
 
     on_item_click: Callable[[str], None] | None = None
+    on_load_more: Callable[[], None] | None = None
 
 
 class TaskList:
-    """タスクの一覧表示コンポーネント (非継承)。"""
+    """タスクの一覧表示コンポーネント (非継承)。
+
+    表示範囲のカードだけを生成する VirtualList で描画し、件数が増えてもコントロール数を一定に保つ。
+    """
 
     def __init__(self, props: TaskListProps) -> None:
         self._props = props
-        self._items: list[ft.Control] = []
-        self._list = ft.ListView(expand=True, spacing=8, padding=ft.padding.only(top=8))
+        self._cards: VirtualList[TaskCardData] = VirtualList(
+            key=lambda data: data.task_id,
+            build=_build_task_card,
+            item_extent=_TASK_CARD_EXTENT,
+            # クリック時のコールバックは描画のたびに作り直されるため、比較から除く
+            fingerprint=lambda data: replace(data, is_selected=False, on_click=None),
+            on_load_more=props.on_load_more,
+            padding=ft.padding.only(top=8),
+        )
 
     @property
     def control(self) -> ft.Control:
-        return self._list
+        return self._cards.control
 
     # Public API
     def set_items(self, items: list[object]) -> None:
@@ -47,8 +63,10 @@ class TaskList:
         Args:
             items: TaskCardVM のリスト
         """
-        # 後方互換: TaskCardVM/辞書を渡された場合は ListTile で表示
-        self._list.controls = []
+        from views.tasks.components.task_card import TaskCardData  # 局所 import で循環回避
+
+        # 後方互換: TaskCardVM/辞書を渡された場合も TaskCardData に変換して同じ経路で描画する
+        cards: list[TaskCardData] = []
         for vm in items:
             # vm は dataclass TaskCardVM or dict を想定
             title = getattr(vm, "title", None) or (vm.get("title") if isinstance(vm, dict) else "") or ""
@@ -62,37 +80,43 @@ class TaskList:
                 or ""
             )
             task_id = getattr(vm, "id", None) or (vm.get("id") if isinstance(vm, dict) else "") or ""
+            status = getattr(vm, "status", None) or (vm.get("status") if isinstance(vm, dict) else "") or ""
 
-            def _handle_click(_e: ft.ControlEvent, tid: str = str(task_id)) -> None:
+            def _handle_click(tid: str = str(task_id)) -> None:
                 if self._props.on_item_click:
                     self._props.on_item_click(tid)
 
-            self._list.controls.append(
-                ft.ListTile(
-                    title=ft.Text(str(title)),
-                    subtitle=ft.Text(str(subtitle)),
-                    data=str(task_id),
+            cards.append(
+                TaskCardData(
+                    task_id=str(task_id),
+                    title=str(title),
+                    subtitle=str(subtitle),
+                    status=str(status),
                     on_click=_handle_click if self._props.on_item_click else None,
                 )
             )
-        # 変更を即時反映
-        with contextlib.suppress(AssertionError):
-            self._list.update()
-        # TODO: 大量件数対応で差分更新 (DOM diff) や仮想スクロールを導入。現在は全件再描画。
+        self.set_cards(cards)
         # TODO: 複数選択 (shift/ctrl) やドラッグ&ドロップ並び替えにも対応できる設計へ拡張。
 
-    # ListView は親にぶら下がっているため、親側で update する
-    def set_cards(self, cards: list[TaskCardData]) -> None:
-        """TaskCardData リストを受け取り、TaskCard を描画する正式経路。"""
-        from views.tasks.components.task_card import TaskCard  # 局所 import で循環回避
-
-        self._items = []
-        self._list.controls = []
-        for data in cards:
-            card = TaskCard(data)
-            self._list.controls.append(card)
-        # 変更を即時反映
-        with contextlib.suppress(AssertionError):
-            self._list.update()
-        # TODO: 選択状態の差分適用 (前後の選択ID比較) で再描画コストを削減。
+    def set_cards(self, cards: list[TaskCardData], *, has_more: bool = False) -> None:
+        """TaskCardData リストを受け取り、TaskCard を描画する正式経路。
+
+        タスクIDごとにカードを保持し、表示範囲内で内容か選択状態が変わったカードだけを作り直して反映する。
+
+        Args:
+            cards: 読み込み済みのカードデータ (表示順)
+            has_more: まだ読み込んでいない続きがあるかどうか
+        """
+        selected = next((data.task_id for data in cards if data.is_selected), None)
+        self._cards.set_items(cards, has_more=has_more, selected_key=selected)
         # TODO: カード幅/レイアウトをレスポンシブに調整する仕組み (列数変更) が必要なら Grid 化を検討。
+
+    def scroll_to_top(self) -> None:
+        """先頭までスクロールする (タブ・並び順の切り替えで一覧が入れ替わったときに使う)。"""
+        self._cards.scroll_to_top()
+
+
+def _build_task_card(data: TaskCardData, is_selected: bool) -> ft.Control:  # noqa: FBT001
+    from views.tasks.components.task_card import TaskCard  # 局所 import で循環回避
+
+    return TaskCard(replace(data, is_selected=is_selected))
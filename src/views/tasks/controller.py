@@ -1,11 +1,12 @@
 """Tasks Controller.
 
 View と Query/Ordering/Presenter を調停し状態を不変更新する。
+一覧は作成日時・更新日時順ならページ単位で段階的に読み込み、件数はサーバー側で数える。
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Final, Protocol
 
 from loguru import logger
 
@@ -13,13 +14,26 @@ if TYPE_CHECKING:  # 型チェック専用
     from collections.abc import Callable
     from uuid import UUID
 
+    from logic.repositories import Page, PageOrderKey
     from models import TaskRead, TaskStatus, TaskUpdate
 
+    from .state import SortKey
+
 from .components.shared.constants import STATUS_ORDER
 from .ordering import ORDERING_MAP, apply_order
 from .presenter import TaskCardVM, to_card_vm
 from .state import TasksState
 
+TASK_PAGE_SIZE: Final[int] = 50
+"""一覧で 1 回に読み込むタスクの件数"""
+
+
+def _page_order_key(sort_key: SortKey) -> PageOrderKey | None:
+    """DB 側のキーセットページングで並べられるソートキーを返す (それ以外は全件取得して並び替えるため None)"""
+    if sort_key in ("created_at", "updated_at"):
+        return sort_key
+    return None
+
 
 class TaskApplicationPort(Protocol):
     """TaskApplicationService への依存を抽象化するポート。
@@ -54,6 +68,24 @@ class TaskApplicationPort(Protocol):
         """ステータス別一覧取得。"""
         ...
 
+    def list_page(  # noqa: PLR0913 - 検索条件をキーワード引数で受け取る
+        self,
+        *,
+        query: str = "",
+        status: TaskStatus | None = None,
+        sort: PageOrderKey = "updated_at",
+        descending: bool = True,
+        page_size: int = TASK_PAGE_SIZE,
+        cursor: str | None = None,
+        with_details: bool = False,
+    ) -> Page[TaskRead]:  # pragma: no cover - interface
+        """1 ページ分の一覧取得。"""
+        ...
+
+    def count(self, query: str = "", *, status: TaskStatus | None = None) -> int:  # pragma: no cover - interface
+        """条件に一致する件数。"""
+        ...
+
     def create(
         self,
         title: str,
@@ -116,6 +148,10 @@ class TasksController:
         self._on_error = on_error
         self._apps = apps
         self._tag_service = tag_service
+        # 読み込み済みのタスク (表示順) と次ページのカーソル
+        self._loaded: list[dict] = []
+        self._cursor: str | None = None
+        self._loaded_query: tuple[object, ...] | None = None
 
     def _notify_error(self, message: str) -> None:
         """UI 層へエラー通知(存在すれば)。"""
@@ -128,6 +164,11 @@ class TasksController:
         """現在の状態を返す。"""
         return self._state
 
+    @property
+    def has_more(self) -> bool:
+        """まだ読み込んでいないタスクがあるかどうか。"""
+        return self._cursor is not None
+
     # --- Public Events ---
     def set_keyword(self, keyword: str) -> None:
         """検索キーワードを設定する。
@@ -177,7 +218,34 @@ class TasksController:
     def set_selected(self, task_id: str | None) -> None:
         """選択中のタスクIDを更新する。"""
         logger.debug(f"タスク選択: {task_id}")
-        self._update_and_render(self._state.update(selected_id=task_id))
+        # 選択だけの変更では一覧を読み直さない (読み込み済みのページを維持する)
+        self._state = self._state.update(selected_id=task_id)
+        self._render()
+
+    def load_more(self) -> bool:
+        """続きのページを読み込んで一覧に追加する。
+
+        Returns:
+            bool: 読み込んだ場合は True (続きがない場合は False)
+        """
+        order_by = _page_order_key(self._state.sort_key)
+        if self._cursor is None or order_by is None:
+            return False
+        try:
+            page = self._fetch_page(self._state, order_by, cursor=self._cursor)
+        except Exception as e:
+            logger.error(f"タスク一覧の続きの取得エラー: {e}")
+            self._notify_error("タスクの読み込みに失敗しました。")
+            return False
+        loaded_ids = {item["id"] for item in self._loaded}
+        self._loaded.extend(
+            item
+            for item in (self._task_read_to_dict(task, include_project=False) for task in page.items)
+            if item["id"] not in loaded_ids
+        )
+        self._cursor = page.next_cursor
+        self._render()
+        return True
 
     def change_task_status(self, task_id: str, new_status: str) -> None:
         """タスクのステータスを変更し再描画する。
@@ -264,35 +332,22 @@ class TasksController:
 
     # --- Query helpers for View ---
     def get_counts(self) -> dict[str, int]:
-        """現在のキーワードフィルタでのステータス別件数を返す。"""
+        """現在のキーワードフィルタでのステータス別件数を返す (一覧は読み込まずに COUNT で数える)。"""
         from models import TaskStatus
 
         counts: dict[str, int] = {}
         for status in STATUS_ORDER:
             try:
                 status_enum = TaskStatus(status) if status else None
-                items = self._service.search(
-                    self._state.keyword,
-                    with_details=False,
-                    status=status_enum,
-                )
-                counts[status] = len(items)
+                counts[status] = self._service.count(self._state.keyword, status=status_enum)
             except Exception:
                 counts[status] = 0
         return counts
-        # TODO: counts は Query 側で集約できるようにするとクエリ回数を削減可能。
-        #       例: get_counts(keyword) -> dict[status, count]
 
     def get_total_count(self) -> int:
         """現在のキーワードでの総件数。"""
         try:
-            return len(
-                self._service.search(
-                    self._state.keyword,
-                    with_details=False,
-                    status=None,
-                )
-            )
+            return self._service.count(self._state.keyword, status=None)
         except Exception:
             return 0
 
@@ -325,36 +380,82 @@ class TasksController:
         """
         self._state = new_state
         try:
-            # データ取得
+            self._reload(new_state)
+        except Exception as e:
+            logger.error(f"タスク一覧更新エラー: {e}")
+            self._loaded = []
+            self._cursor = None
+            self._loaded_query = None
+            self._on_change([])
+            return
+        self._render()
+
+    def _reload(self, state: TasksState) -> None:
+        """現在の条件で一覧を読み直す。
+
+        作成日時・更新日時順は先頭ページだけを DB の並びのまま読み込む。条件が変わらない再読み込みでは
+        スクロール位置を保つため、読み込み済みの件数分 (上限 MAX_PAGE_SIZE) をまとめて読み直す。
+        期限日順は DB 側で並べられないため、従来どおり全件を取得して並び替える。
+        """
+        from logic.repositories import MAX_PAGE_SIZE
+
+        query_key = (state.keyword, state.status, state.sort_key, state.sort_desc)
+        order_by = _page_order_key(state.sort_key)
+        if order_by is not None:
+            page_size = TASK_PAGE_SIZE
+            if query_key == self._loaded_query:
+                page_size = min(MAX_PAGE_SIZE, max(TASK_PAGE_SIZE, len(self._loaded)))
+            page = self._fetch_page(state, order_by, page_size=page_size)
+            self._loaded = [self._task_read_to_dict(task, include_project=False) for task in page.items]
+            self._cursor = page.next_cursor
+        else:
             from models import TaskStatus
 
-            status_enum = TaskStatus(new_state.status) if new_state.status else None
+            status_enum = TaskStatus(state.status) if state.status else None
             items = self._service.search(
-                new_state.keyword,
+                state.keyword,
                 with_details=True,  # タグ情報を取得するためTrueに変更
                 status=status_enum,
             )
+            items_dict = [self._task_read_to_dict(item, include_project=False) for item in items]
+            strategy = ORDERING_MAP[state.sort_key]
+            self._loaded = apply_order(items_dict, strategy, descending=state.sort_desc)
+            self._cursor = None
+        self._loaded_query = query_key
 
-            # 辞書化してPresenterへ
-            items_dict = [self._task_read_to_dict(item) for item in items]
-
-            # 並び替え
-            strategy = ORDERING_MAP[new_state.sort_key]
-            ordered = apply_order(items_dict, strategy, descending=new_state.sort_desc)
-            vm: list[TaskCardVM] = to_card_vm(ordered)
-
-            logger.debug(
-                "Render tasks count={} keyword='{}' status={} sort={} desc={}",
-                len(vm),
-                new_state.keyword,
-                new_state.status,
-                new_state.sort_key,
-                new_state.sort_desc,
-            )
-            self._on_change(vm)
-        except Exception as e:
-            logger.error(f"タスク一覧更新エラー: {e}")
-            self._on_change([])
+    def _fetch_page(
+        self,
+        state: TasksState,
+        order_by: PageOrderKey,
+        *,
+        cursor: str | None = None,
+        page_size: int = TASK_PAGE_SIZE,
+    ) -> Page[TaskRead]:
+        from models import TaskStatus
+
+        return self._service.list_page(
+            query=state.keyword,
+            status=TaskStatus(state.status) if state.status else None,
+            sort=order_by,
+            descending=state.sort_desc,
+            page_size=page_size,
+            cursor=cursor,
+            with_details=True,  # カードにタグを表示するため
+        )
+
+    def _render(self) -> None:
+        """読み込み済みのタスクを VM に変換して通知する。"""
+        vm: list[TaskCardVM] = to_card_vm(self._loaded)
+        logger.debug(
+            "Render tasks count={} has_more={} keyword='{}' status={} sort={} desc={}",
+            len(vm),
+            self.has_more,
+            self._state.keyword,
+            self._state.status,
+            self._state.sort_key,
+            self._state.sort_desc,
+        )
+        self._on_change(vm)
 
     def get_all_tags(self) -> list:
         """全タグを取得する。
@@ -390,11 +491,12 @@ class TasksController:
             logger.error(f"タグ同期エラー: task_id={task_id}, error={e}")
             self._notify_error("タグの同期に失敗しました")
 
-    def _task_read_to_dict(self, task: TaskRead) -> dict:
+    def _task_read_to_dict(self, task: TaskRead, *, include_project: bool = True) -> dict:
         """TaskRead を辞書形式に変換する。
 
         Args:
             task: TaskRead インスタンス
+            include_project: プロジェクト情報と同じプロジェクトの他タスクを含めるか (詳細表示用。一覧では不要)
 
         Returns:
             タスク情報の辞書
@@ -407,7 +509,7 @@ class TasksController:
         project_name: str | None = None
         project_status: str | None = None
         project_tasks: list[dict[str, str]] = []
-        if task.project_id:
+        if include_project and task.project_id:
             try:
                 from uuid import UUID
 
@@ -51,6 +51,9 @@ class TasksView(BaseView):
     検索 / ステータスフィルタ / 並び替え / 降順切替 + リスト表示の最小UIを提供。
     """
 
+    keep_alive = True
+    data_tables = ("tasks", "tags", "task_tag", "projects")
+
     def __init__(self, props: BaseViewProps) -> None:
         """コンストラクタ。
 
@@ -76,7 +79,9 @@ class TasksView(BaseView):
         self._current_vm: list[TaskCardVM] = []
         # Components
         self._status_tabs: TaskStatusTabs | None = None
-        self._list_comp = TaskList(TaskListProps(on_item_click=self._on_item_clicked_id))
+        self._list_comp = TaskList(
+            TaskListProps(on_item_click=self._on_item_clicked_id, on_load_more=self._on_load_more)
+        )
         self._detail_panel = TaskDetailPanel(
             DetailPanelProps(
                 on_status_change=self._on_status_change,
@@ -98,6 +103,11 @@ class TasksView(BaseView):
             # エラーが発生しても空状態で画面を表示する
             self._current_vm = []
 
+    def reload_data(self) -> None:
+        """現在の検索条件のまま一覧を読み直し、タブの件数とともにその場で更新する。"""
+        self._controller.refresh()
+        self._refresh_tabs_badges()
+
     # BaseView から呼ばれる
     def build_content(self) -> ft.Control:
         """UIコンテンツを構築する。"""
@@ -220,7 +230,7 @@ class TasksView(BaseView):
         """ListViewへアイテムを反映。"""
         # 空状態の場合はTaskListに空カードリストを渡す
         if not items:
-            self._list_comp.set_cards([])
+            self._list_comp.set_cards([], has_more=self._controller.has_more)
             logger.debug("TasksView: タスクリストが空です")
             return
 
@@ -258,7 +268,7 @@ class TasksView(BaseView):
                     on_click=_on_click_vm,
                 )
             )
-        self._list_comp.set_cards(cards)
+        self._list_comp.set_cards(cards, has_more=self._controller.has_more)
 
     def _show_detail(self, vm: TaskCardVM) -> None:
         """選択タスク詳細を右ペインに表示する。"""
@@ -296,8 +306,13 @@ class TasksView(BaseView):
             status: 新しいステータス（Noneは「すべて」）
         """
         self._controller.set_status(status)
+        self._list_comp.scroll_to_top()
         self.safe_update()
 
+    def _on_load_more(self) -> None:
+        """一覧の末尾付近までスクロールしたときに続きのタスクを読み込む。"""
+        self._controller.load_more()
+
     def get_state_snapshot(self) -> TasksState:
         """現在の状態スナップショットを返す。テスト/デバッグ用。"""
         return self._controller.state
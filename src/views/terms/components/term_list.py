@@ -5,7 +5,7 @@
     - Props駆動のカードリスト描画
     - 空状態の表示
     - カードのクリックイベントハンドリング
-    - 差分更新による効率的な再描画
+    - 差分更新による効率的な再描画（表示範囲のカードだけを生成する仮想スクロール）
 
 【非責務】
     - データ取得・変換 → Presenter
@@ -15,12 +15,12 @@
 
 from __future__ import annotations
 
-import contextlib
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING
 
 import flet as ft
 
+from views.shared.components.virtual_list import VirtualList
 from views.theme import get_outline_color, get_text_secondary_color
 
 if TYPE_CHECKING:
@@ -28,6 +28,9 @@ if TYPE_CHECKING:
 
     from .term_card import TermCardData
 
+# カード 1 枚の推定の高さ (タイトル・キー・説明・バッジ行) + 行間
+_TERM_CARD_EXTENT = 140
+
 
 @dataclass(frozen=True, slots=True)
 class TermListProps:
@@ -36,10 +39,12 @@ class TermListProps:
     Attributes:
         on_item_click: アイテムクリック時のコールバック（用語IDを引数にとる）
         empty_message: 空状態時のメッセージ
+        on_load_more: 末尾付近までスクロールしたときに続きを要求するコールバック
     """
 
     on_item_click: Callable[[str], None] | None = None
     empty_message: str = "用語がありません"
+    on_load_more: Callable[[], None] | None = None
 
 
 class TermList:
@@ -52,11 +57,15 @@ class TermList:
             props: 初期化プロパティ
         """
         self._props = props
-        self._cards: list[ft.Control] = []
-        self._list = ft.Column(
-            spacing=8,
-            scroll=ft.ScrollMode.AUTO,
-            expand=True,
+        self._empty_text: ft.Text | None = None
+        self._cards: VirtualList[TermCardData] = VirtualList(
+            key=lambda data: data.term_id,
+            build=_build_term_card,
+            item_extent=_TERM_CARD_EXTENT,
+            empty=self._build_empty_state,
+            # クリック時のコールバックは描画のたびに作り直されるため、比較から除く
+            fingerprint=lambda data: replace(data, is_selected=False, on_click=None),
+            on_load_more=self._handle_load_more,
         )
 
     @property
@@ -66,29 +75,27 @@ class TermList:
         Returns:
             リストコントロール
         """
-        return self._list
+        return self._cards.control
 
-    def set_cards(self, cards: list[TermCardData]) -> None:
+    def set_cards(self, cards: list[TermCardData], *, has_more: bool = False) -> None:
         """カードリストを設定して再描画する。
 
+        表示範囲内で内容か選択状態が変わったカードだけを作り直す。
+
         Args:
-            cards: 表示するカードデータのリスト
+            cards: 読み込み済みのカードデータのリスト (表示順)
+            has_more: まだ読み込んでいない続きがあるかどうか
         """
-        from .term_card import TermCard
+        selected = next((data.term_id for data in cards if data.is_selected), None)
+        self._cards.set_items(cards, has_more=has_more, selected_key=selected)
 
-        self._cards = []
-        self._list.controls = []
+    def scroll_to_top(self) -> None:
+        """先頭までスクロールする（タブ切り替えで一覧が入れ替わったときに使う）。"""
+        self._cards.scroll_to_top()
 
-        if not cards:
-            self._list.controls = [self._build_empty_state()]
-        else:
-            for data in cards:
-                card = TermCard(data)
-                self._cards.append(card)
-                self._list.controls.append(card)
-
-        with contextlib.suppress(AssertionError):
-            self._list.update()
+    def _handle_load_more(self) -> None:
+        if self._props.on_load_more:
+            self._props.on_load_more()
 
     def _build_empty_state(self) -> ft.Control:
         """空状態の表示を構築する。
@@ -104,12 +111,7 @@ class TermList:
                         size=48,
                         color=get_outline_color(),
                     ),
-                    ft.Text(
-                        self._props.empty_message,
-                        size=16,
-                        color=get_text_secondary_color(),
-                        text_align=ft.TextAlign.CENTER,
-                    ),
+                    self._ensure_empty_text(),
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=16,
@@ -125,3 +127,24 @@ class TermList:
             props: 新しいプロパティ
         """
         self._props = props
+        # 空状態のコントロールは使い回されるため、メッセージだけを差し替える
+        if self._empty_text is not None and self._empty_text.value != props.empty_message:
+            self._empty_text.value = props.empty_message
+            if self._empty_text.page is not None:
+                self._empty_text.update()
+
+    def _ensure_empty_text(self) -> ft.Text:
+        if self._empty_text is None:
+            self._empty_text = ft.Text(
+                self._props.empty_message,
+                size=16,
+                color=get_text_secondary_color(),
+                text_align=ft.TextAlign.CENTER,
+            )
+        return self._empty_text
+
+
+def _build_term_card(data: TermCardData, is_selected: bool) -> ft.Control:  # noqa: FBT001
+    from .term_card import TermCard
+
+    return TermCard(replace(data, is_selected=is_selected))
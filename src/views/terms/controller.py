@@ -30,7 +30,7 @@
          自動整合性保証（derived property）
 
 【主な機能】
-    - 初期用語一覧の読み込みとソート
+    - 初期用語一覧の読み込みとソート (タブごとにページ単位で段階的に読み込む)
     - タブ切り替え時の状態更新
     - 検索実行と結果反映
     - 用語選択状態の管理
@@ -42,7 +42,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Protocol, TypedDict, TypeVar
+from typing import TYPE_CHECKING, Any, Final, Protocol, TypedDict, TypeVar
 
 from loguru import logger
 
@@ -59,11 +59,15 @@ if TYPE_CHECKING:
     from logic.application.terminology_application_service import (
         TerminologyApplicationService,
     )
+    from logic.repositories import Page
 
     from .state import TermsViewState
 
 T = TypeVar("T")
 
+TERM_PAGE_SIZE: Final[int] = 50
+"""一覧で 1 回に読み込む用語の件数"""
+
 
 class TermFormData(TypedDict, total=False):
     """用語作成・更新フォームデータの型定義。
@@ -96,6 +100,16 @@ class TermApplicationPort(Protocol):
         """用語一覧を取得する。"""
         ...
 
+    def list_terms_page(
+        self, status: TermStatus, *, page_size: int = TERM_PAGE_SIZE, cursor: str | None = None
+    ) -> Page[TermRead]:  # pragma: no cover - interface
+        """用語を 1 ページずつ取得する。"""
+        ...
+
+    def count_by_status(self) -> dict[TermStatus, int]:  # pragma: no cover - interface
+        """ステータスごとの用語件数を取得する。"""
+        ...
+
     def search_terms(self, query: str) -> list[TermRead]:  # pragma: no cover - interface
         """用語を検索する。"""
         ...
@@ -165,19 +179,57 @@ class TermsController:
             return updated_term
 
     async def load_initial_terms(self) -> None:
-        """初期表示に使用する用語一覧を読み込む。"""
+        """初期表示に使用する用語一覧を読み込む。
+
+        全件ではなく現在のタブの先頭ページだけを読み込み、タブの件数はサーバー側で集計する。
+        """
         logger.info("Loading initial terms")
-        terms = await self._call_service(self.service.list_terms)
-        ordered = sort_terms(terms)
-        self.state.set_all_terms(ordered)
+        self.state.reset_pages()
+        self.state.set_all_terms([])
         self.state.set_search_result("", None)
-        logger.info("Loaded {} terms", len(terms))
+        await self._load_page(self.state.current_tab)
+        await self._refresh_status_counts()
+        logger.info("Loaded {} terms", len(self.state.all_terms))
 
     def update_tab(self, tab: TermStatus) -> None:
         """タブ変更時に状態を更新する。"""
         logger.debug("Switching to tab: {}", tab)
         self.state.set_current_tab(tab)
 
+    def needs_tab_load(self) -> bool:
+        """現在のタブの先頭ページが未読み込みかどうかを返す。"""
+        return not self.state.is_page_loaded(self.state.current_tab)
+
+    async def ensure_tab_loaded(self) -> None:
+        """現在のタブの先頭ページが未読み込みなら読み込む。"""
+        if self.needs_tab_load():
+            await self._load_page(self.state.current_tab)
+
+    async def load_more(self) -> bool:
+        """現在のタブの続きのページを読み込む。
+
+        Returns:
+            bool: 読み込んだ場合は True (続きがない・検索中の場合は False)
+        """
+        if not self.state.has_more:
+            return False
+        tab = self.state.current_tab
+        await self._load_page(tab, cursor=self.state.page_cursor(tab))
+        return True
+
+    async def _load_page(self, status: TermStatus, *, cursor: str | None = None) -> None:
+        """ステータスの用語を 1 ページ読み込んで State に追加する。"""
+        page = await self._call_service(self.service.list_terms_page, status, cursor=cursor)
+        self.state.append_terms(page.items)
+        self.state.set_all_terms(sort_terms(self.state.all_terms))
+        self.state.set_page_cursor(status, page.next_cursor)
+        logger.debug("Loaded term page: status={} items={} has_next={}", status, len(page.items), page.has_next)
+
+    async def _refresh_status_counts(self) -> None:
+        """タブの件数をサーバー側で集計し直す。"""
+        counts = await self._call_service(self.service.count_by_status)
+        self.state.set_status_counts(counts)
+
     async def update_search(self, query: str) -> None:
         """検索クエリを更新し結果を反映する。"""
         normalized = self.query_normalizer.normalize(query)
@@ -204,6 +256,7 @@ class TermsController:
         logger.info("Creating term: {}", form_data.get("key"))
         created_term = await self._call_service(self.service.create_term, form_data)
         self.state.upsert_term(created_term)
+        await self._refresh_status_counts()
         logger.info("Created term: {} (ID: {})", created_term.key, created_term.id)
         return created_term
 
@@ -212,6 +265,7 @@ class TermsController:
         logger.info("Updating term: {}", term_id)
         updated_term = await self._call_service(self.service.update_term, term_id, form_data)
         self.state.upsert_term(updated_term)
+        await self._refresh_status_counts()
         logger.info("Updated term: {} (ID: {})", updated_term.key, updated_term.id)
         return updated_term
 
@@ -227,6 +281,7 @@ class TermsController:
             self.state.rebuild_index()
             if self.state.selected_term_id == term_id:
                 self.state.selected_term_id = None
+            await self._refresh_status_counts()
             logger.info("Deleted term: {}", term_id)
 
         return success
@@ -256,6 +311,14 @@ class TerminologyApplicationPortAdapter(TermApplicationPort):
             logger.info("TerminologyApplicationService returned no records.")
             return []
 
+    def list_terms_page(
+        self, status: TermStatus, *, page_size: int = TERM_PAGE_SIZE, cursor: str | None = None
+    ) -> Page[TermRead]:
+        return self._service.list_page(status=status, page_size=page_size, cursor=cursor)
+
+    def count_by_status(self) -> dict[TermStatus, int]:
+        return self._service.count_by_status()
+
     def search_terms(self, query: str) -> list[TermRead]:
         return self._service.search(query=query)
 
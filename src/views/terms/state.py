@@ -5,7 +5,7 @@
     Viewが必要とする全ての状態を一元管理し、整合性を保証する。
 
     - 表示状態の保持（current_tab, search_query, selected_term_id 等）
-    - 全用語データの保持（all_terms）
+    - 全用語データの保持（all_terms。タブごとにページ単位で読み込んだ分）
     - 検索結果の保持（search_results）
     - 派生データの計算（フィルタリング済み用語一覧、ステータス別件数）
     - 用語IDインデックスの管理（高速検索用）
@@ -41,6 +41,7 @@ from typing import TYPE_CHECKING
 from models import TermRead, TermStatus
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from uuid import UUID
 
 
@@ -60,8 +61,12 @@ class TermsViewState:
     all_terms: list[TermRead] = field(default_factory=list)
     search_results: list[TermRead] | None = None
     selected_term_id: UUID | None = None
+    # サーバー側で集計したステータス別件数 (None の間は読み込み済みの用語から数える)
+    status_counts: dict[TermStatus, int] | None = None
     # id -> TermRead のインデックス。全用語(all_terms)に対して構築する。
     _by_id: dict[UUID, TermRead] = field(default_factory=dict, repr=False)
+    # ステータスごとの次ページのカーソル。キーがあれば先頭ページは読み込み済み (None は最終ページまで読み込み済み)
+    _page_cursors: dict[TermStatus, str | None] = field(default_factory=dict, repr=False)
 
     def set_all_terms(self, terms: list[TermRead]) -> None:
         """全用語一覧を更新する。
@@ -115,6 +120,51 @@ class TermsViewState:
         self.all_terms.append(term)
         self._by_id[term.id] = term
 
+    def append_terms(self, terms: Iterable[TermRead]) -> None:
+        """続きのページで読み込んだ用語を追加する (読み込み済みの用語は置き換える)。
+
+        Args:
+            terms: 追加する用語
+        """
+        for term in terms:
+            self.upsert_term(term)
+
+    def reset_pages(self) -> None:
+        """ページの読み込み状況を破棄する。"""
+        self._page_cursors.clear()
+
+    def set_page_cursor(self, status: TermStatus, cursor: str | None) -> None:
+        """ステータスごとの次ページのカーソルを記録する。
+
+        Args:
+            status: ページを読み込んだステータス
+            cursor: 次ページのカーソル (最終ページまで読み込んだ場合は None)
+        """
+        self._page_cursors[status] = cursor
+
+    def page_cursor(self, status: TermStatus) -> str | None:
+        """ステータスの次ページのカーソルを返す (未読み込み・最終ページの場合は None)。"""
+        return self._page_cursors.get(status)
+
+    def is_page_loaded(self, status: TermStatus) -> bool:
+        """ステータスの先頭ページを読み込み済みかどうかを返す。"""
+        return status in self._page_cursors
+
+    def set_status_counts(self, counts: dict[TermStatus, int] | None) -> None:
+        """サーバー側で集計したステータス別件数を設定する。
+
+        Args:
+            counts: ステータス別件数 (None の場合は読み込み済みの用語から数える)
+        """
+        self.status_counts = dict(counts) if counts is not None else None
+
+    @property
+    def has_more(self) -> bool:
+        """現在のタブにまだ読み込んでいない用語があるかどうかを返す（検索中は False）。"""
+        if self.search_results is not None:
+            return False
+        return self._page_cursors.get(self.current_tab) is not None
+
     def _validate_selection(self) -> None:
         """選択中の用語が現在の派生リストに存在するかを検証し、存在しない場合は選択解除する。
 
@@ -195,11 +245,15 @@ class TermsViewState:
 
     @property
     def counts_by_status(self) -> dict[TermStatus, int]:
-        """ステータス別の用語件数を集計する（derived property）。
+        """ステータス別の用語件数を返す（derived property）。
+
+        サーバー側の集計があればそれを使い、なければ読み込み済みの用語から集計する。
 
         Returns:
             ステータスごとの件数を持つ辞書
         """
+        if self.status_counts is not None:
+            return dict(self.status_counts)
         counts: dict[TermStatus, int] = {
             TermStatus.APPROVED: 0,
             TermStatus.DRAFT: 0,
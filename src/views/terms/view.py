@@ -86,7 +86,7 @@ class TermsView(BaseView):
             await self.controller.load_initial_terms()
             self._refresh_term_list()
             self._refresh_status_tabs()
-            if not self.term_state.all_terms:
+            if not any(self.controller.get_counts().values()):
                 self.show_info_snackbar("まだ用語が登録されていません。新しい用語を作成してください。")
         except Exception:
             logger.exception("Failed to load initial terms")
@@ -96,7 +96,7 @@ class TermsView(BaseView):
     def build_content(self) -> ft.Control:
         """Build the main content area."""
         # Headerコンポーネント (検索と新規作成ボタン)
-        total_count = len(self.term_state.all_terms)
+        total_count = sum(self.controller.get_counts().values())
         header = self.create_header(
             title=self.title,
             subtitle=f"{self.description} ({total_count}件)",
@@ -126,6 +126,7 @@ class TermsView(BaseView):
         term_list_props = TermListProps(
             on_item_click=self._handle_term_select_str,
             empty_message=get_empty_message(self.term_state.current_tab),
+            on_load_more=self._handle_load_more,
         )
         self.term_list = TermList(term_list_props)
 
@@ -188,6 +189,35 @@ class TermsView(BaseView):
         self._refresh_term_list()
         self._refresh_status_tabs()
         self._set_active_status_tab(status)
+        if self.term_list:
+            self.term_list.scroll_to_top()
+        if self.controller.needs_tab_load() and self.page:
+            self.page.run_task(self._async_load_tab)
+
+    async def _async_load_tab(self) -> None:
+        """切り替えたタブの先頭ページを読み込む。"""
+        try:
+            await self.controller.ensure_tab_loaded()
+            self._refresh_term_list()
+        except Exception:
+            logger.exception("Failed to load terms for tab")
+            if self.page:
+                self.show_error_snackbar(self.page, "用語の読み込みに失敗しました")
+
+    def _handle_load_more(self) -> None:
+        """一覧の末尾付近までスクロールしたときに続きの用語を読み込む。"""
+        if self.page:
+            self.page.run_task(self._async_load_more)
+
+    async def _async_load_more(self) -> None:
+        """続きの用語を読み込んで一覧に追加する。"""
+        try:
+            if await self.controller.load_more():
+                self._refresh_term_list()
+        except Exception:
+            logger.exception("Failed to load more terms")
+            if self.page:
+                self.show_error_snackbar(self.page, "用語の読み込みに失敗しました")
 
     def _handle_term_select_uuid(self, term_id: UUID) -> None:
         """用語選択をハンドリングする（UUID）。
@@ -261,6 +291,7 @@ class TermsView(BaseView):
             TermListProps(
                 on_item_click=self._handle_term_select_str,
                 empty_message=get_empty_message(self.term_state.current_tab),
+                on_load_more=self._handle_load_more,
             )
         )
         derived_terms = self.term_state.visible_terms
@@ -300,7 +331,7 @@ class TermsView(BaseView):
             )
             cards.append(card_data)
 
-        self.term_list.set_cards(cards)
+        self.term_list.set_cards(cards, has_more=self.term_state.has_more)
 
     def _show_detail(self) -> None:
         """選択された用語の詳細を表示する。"""
@@ -422,6 +453,7 @@ class TermsView(BaseView):
             self.show_snack_bar(f"用語 '{created_term.key}' を作成しました")
             normalized_status = self._normalize_status(created_term.status)
             self.controller.update_tab(normalized_status)
+            await self.controller.ensure_tab_loaded()
             self.controller.select_term(created_term.id)
             self._refresh_term_list()
             self._refresh_status_tabs()
@@ -485,6 +517,7 @@ class TermsView(BaseView):
             self.show_snack_bar(f"用語 '{updated_term.key}' を更新しました")
             normalized_status = self._normalize_status(updated_term.status)
             self.controller.update_tab(normalized_status)
+            await self.controller.ensure_tab_loaded()
             self.controller.select_term(updated_term.id)
             self._refresh_term_list()
             self._refresh_status_tabs()
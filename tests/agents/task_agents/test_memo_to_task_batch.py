@@ -0,0 +1,105 @@
+"""MemoToTaskAgent のバッチ処理のテスト。"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from agents.agent_conf import LLMProvider
+from agents.base import AgentError
+from agents.task_agents.memo_to_task.agent import MemoToTaskAgent
+from agents.task_agents.memo_to_task.schema import (
+    MemoBatchItem,
+    MemoBatchSuggestion,
+    MemoClassification,
+    TaskDraft,
+    TaskListSuggestion,
+)
+from agents.task_agents.memo_to_task.state import MemoToTaskResult, MemoToTaskState
+from models import MemoRead, MemoStatus
+
+
+class _BatchRunner:
+    def __init__(self, *, drop_indexes: set[int] | None = None) -> None:
+        self.calls: list[dict[str, object]] = []
+        self._drop_indexes = drop_indexes or set()
+
+    def invoke(self, params: dict[str, object]) -> MemoBatchSuggestion:
+        self.calls.append(params)
+        batch_memos = params["batch_memos"]
+        assert isinstance(batch_memos, list)
+        items = [
+            MemoBatchItem(
+                memo_index=entry["memo_index"],
+                reason="テスト",
+                decision="idea" if "アイデア" in entry["memo_text"] else "task",
+                next_actions=[TaskDraft(title=f"{entry['memo_title']}のタスク")],
+            )
+            for entry in batch_memos
+            if entry["memo_index"] not in self._drop_indexes
+        ]
+        return MemoBatchSuggestion(items=items)
+
+
+class _CountingClassifier:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def invoke(self, _params: dict[str, object]) -> MemoClassification:
+        self.calls += 1
+        return MemoClassification(reason="単体", decision="task")
+
+
+class _TaskListRunner:
+    def invoke(self, params: dict[str, object]) -> TaskListSuggestion:
+        return TaskListSuggestion(next_actions=[TaskDraft(title=f"{params['memo_title']}の単体タスク")])
+
+
+def _agent() -> MemoToTaskAgent:
+    agent = MemoToTaskAgent(LLMProvider.FAKE)
+    # プリセット応答を無効にし、スキーマごとの疑似ランナーでグラフを実行する
+    agent._fake_responses = []
+    return agent
+
+
+def _state(title: str, content: str) -> MemoToTaskState:
+    memo = MemoRead(id=uuid4(), title=title, content=content, status=MemoStatus.INBOX)
+    return {"memo": memo, "existing_tags": [], "current_datetime_iso": "2026-10-16T09:00:00+00:00"}
+
+
+def test_invoke_batch_classifies_chunk_in_one_call() -> None:
+    """分類とタスク抽出はチャンクごとに 1 回の呼び出しで行われ、結果は入力順に返る"""
+    agent = _agent()
+    batch_runner = _BatchRunner()
+    classifier = _CountingClassifier()
+    agent._batch_runner = batch_runner  # type: ignore[attr-defined]
+    agent._classifier_runner = classifier  # type: ignore[attr-defined]
+    states = [_state("資料", "資料を送る"), _state("構想", "アイデアを温める"), _state("会議", "議事録を書く")]
+
+    results = agent.invoke_batch(states, batch_size=2)
+
+    assert len(batch_runner.calls) == 2  # noqa: PLR2004
+    assert classifier.calls == 0
+    assert all(isinstance(result, MemoToTaskResult) for result in results)
+    first, second, third = (result for result in results if isinstance(result, MemoToTaskResult))
+    assert [task.title for task in first.tasks] == ["資料のタスク"]
+    assert second.suggested_memo_status == "idea"
+    assert second.tasks == []
+    assert [task.title for task in third.tasks] == ["会議のタスク"]
+
+
+def test_invoke_batch_falls_back_to_single_path_for_missing_items() -> None:
+    """バッチ応答に含まれなかったメモだけが単体の分類にフォールバックする"""
+    agent = _agent()
+    agent._batch_runner = _BatchRunner(drop_indexes={1})  # type: ignore[attr-defined]
+    classifier = _CountingClassifier()
+    agent._classifier_runner = classifier  # type: ignore[attr-defined]
+    agent._task_list_runner = _TaskListRunner()  # type: ignore[attr-defined]
+    states = [_state("資料", "資料を送る"), _state("報告", "報告書を書く")]
+
+    results = agent.invoke_batch(states)
+
+    assert classifier.calls == 1
+    assert not any(isinstance(result, AgentError) for result in results)
+    fallback = results[1]
+    assert isinstance(fallback, MemoToTaskResult)
+    assert [task.title for task in fallback.tasks] == ["報告の単体タスク"]
@@ -0,0 +1,120 @@
+"""MemoToTaskAgent の複数タスク評価 (evaluate_bulk) のテスト。"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from agents.agent_conf import LLMProvider
+from agents.task_agents.memo_to_task.agent import QUICK_ACTION_THRESHOLD_MINUTES, MemoToTaskAgent
+from agents.task_agents.memo_to_task.schema import (
+    QuickActionAssessment,
+    ResponsibilityAssessment,
+    ScheduleAssessment,
+    TaskAssessment,
+    TaskDraft,
+)
+from models import MemoRead, MemoStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from agents.task_agents.memo_to_task.state import MemoToTaskState
+
+
+class _Runner:
+    """タスクタイトルに応じて応答し、呼び出したスレッドを記録するランナー"""
+
+    def __init__(self, respond: Callable[[str], object], *, delay_by_title: dict[str, float] | None = None) -> None:
+        self._respond = respond
+        self._delay_by_title = delay_by_title or {}
+        self.threads: set[str] = set()
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, params: dict[str, object]) -> object:
+        title = str(params["task_title"])
+        with self._lock:
+            self.calls += 1
+            self.threads.add(threading.current_thread().name)
+        time.sleep(self._delay_by_title.get(title, 0.0))
+        return self._respond(title)
+
+
+def _quick(title: str) -> QuickActionAssessment:
+    return QuickActionAssessment(reason="r", is_quick_action=title == "quick")
+
+
+def _responsibility(title: str) -> ResponsibilityAssessment:
+    return ResponsibilityAssessment(reason="r", should_delegate=title == "delegate")
+
+
+def _schedule(title: str) -> ScheduleAssessment:
+    due = "2026-10-20" if title == "calendar" else None
+    return ScheduleAssessment(reason="r", requires_specific_date=due is not None, due_date=due)
+
+
+def _combined(title: str) -> TaskAssessment:
+    due = "2026-10-20" if title == "calendar" else None
+    return TaskAssessment(
+        reason="r",
+        is_quick_action=title == "quick",
+        should_delegate=title == "delegate",
+        requires_specific_date=due is not None,
+        due_date=due,
+    )
+
+
+TITLES = ["calendar", "quick", "delegate", "plain"]
+
+
+def _state() -> MemoToTaskState:
+    memo = MemoRead(id=uuid4(), title="memo", content="body", status=MemoStatus.INBOX)
+    return {
+        "memo": memo,
+        "existing_tags": [],
+        "current_datetime_iso": "2026-10-16T09:00:00+00:00",
+        "routed_tasks": [TaskDraft(title=title) for title in TITLES],
+    }
+
+
+def _assert_routes(result: dict[str, object]) -> None:
+    tasks = result["routed_tasks"]
+    assert isinstance(tasks, list)
+    assert [task.title for task in tasks] == TITLES
+    assert [task.route for task in tasks] == ["calendar", "progress", "waiting", "next_action"]
+    assert tasks[0].due_date == "2026-10-20"
+    assert tasks[1].estimate_minutes == QUICK_ACTION_THRESHOLD_MINUTES
+
+
+def test_bulk_evaluation_runs_in_parallel_and_keeps_order() -> None:
+    """タスクごとの評価は複数スレッドで行われ、結果は入力順のまま"""
+    agent = MemoToTaskAgent(LLMProvider.FAKE, bulk_max_workers=4)
+    # 先頭のタスクほど遅く返し、完了順と入力順をずらす
+    delays = {title: 0.05 * (len(TITLES) - index) for index, title in enumerate(TITLES)}
+    quick = _Runner(_quick, delay_by_title=delays)
+    agent._quick_runner = quick  # type: ignore[attr-defined]
+    agent._responsibility_runner = _Runner(_responsibility)  # type: ignore[attr-defined]
+    agent._schedule_runner = _Runner(_schedule)  # type: ignore[attr-defined]
+
+    result = agent._evaluate_bulk(_state())
+
+    _assert_routes(result)
+    assert len(quick.threads) > 1
+
+
+def test_bulk_evaluation_can_combine_assessments() -> None:
+    """combine_assessments を有効にすると 1 タスクにつき 1 回の呼び出しで評価する"""
+    agent = MemoToTaskAgent(LLMProvider.FAKE, combine_assessments=True)
+    combined = _Runner(_combined)
+    quick = _Runner(_quick)
+    agent._task_assessment_runner = combined  # type: ignore[attr-defined]
+    agent._quick_runner = quick  # type: ignore[attr-defined]
+
+    result = agent._evaluate_bulk(_state())
+
+    _assert_routes(result)
+    assert combined.calls == len(TITLES)
+    assert quick.calls == 0
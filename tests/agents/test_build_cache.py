@@ -0,0 +1,70 @@
+"""コンパイル済みグラフ・構造化出力ランナーのキャッシュのテスト。"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from agents.agent_conf import LLMProvider
+from agents.base import AgentError
+from agents.build_cache import cached_runnable, get_build_stats, reset_build_stats
+from agents.task_agents.one_liner.agent import OneLinerAgent
+from agents.task_agents.one_liner.prompt import one_liner_prompt
+from agents.task_agents.one_liner.state import OneLinerOutput, OneLinerState
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+
+def _state() -> OneLinerState:
+    return OneLinerState(
+        today_task_count=1,
+        overdue_task_count=0,
+        completed_task_count=2,
+        progress_summary="順調",
+        user_name="テスト",
+    )
+
+
+def test_graph_is_compiled_once_per_agent_class() -> None:
+    reset_build_stats()
+
+    first = OneLinerAgent(LLMProvider.FAKE)
+    second = OneLinerAgent(LLMProvider.FAKE)
+
+    assert first._graph is second._graph
+    assert get_build_stats().graph_reuses >= 1
+
+
+def test_shared_graph_dispatches_to_invoking_instance(thread_id: str) -> None:
+    first = OneLinerAgent(LLMProvider.FAKE)
+    second = OneLinerAgent(LLMProvider.FAKE)
+
+    # 各インスタンスの FAKE モデルは応答を先頭から返すため、委譲先を取り違えると 2 件目が返る
+    second_result = second.invoke(_state(), thread_id)
+    first_result = first.invoke(_state(), f"{thread_id}-first")
+
+    assert not isinstance(first_result, AgentError)
+    assert not isinstance(second_result, AgentError)
+    assert first_result.response == second_result.response
+
+
+def test_structured_runnable_is_reused_per_model() -> None:
+    agent = OneLinerAgent(LLMProvider.FAKE)
+    reset_build_stats()
+
+    runnable = agent.get_structured_runnable(OneLinerOutput, one_liner_prompt)
+
+    assert agent.get_structured_runnable(OneLinerOutput, one_liner_prompt) is runnable
+    assert agent.get_structured_runnable(OneLinerOutput) is not runnable
+    stats = get_build_stats()
+    assert stats.runnable_builds == 2  # noqa: PLR2004
+    assert stats.runnable_reuses == 1
+
+
+def test_cached_runnable_counts_saved_time() -> None:
+    reset_build_stats()
+    cache: dict[Hashable, Any] = {}
+
+    assert cached_runnable(cache, "key", lambda: "built") == "built"
+    assert cached_runnable(cache, "key", lambda: "rebuilt") == "built"
+    assert get_build_stats().saved_seconds >= 0.0
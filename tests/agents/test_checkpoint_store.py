@@ -0,0 +1,72 @@
+"""共有チェックポイントストアのテスト。"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from agents.agent_conf import LLMProvider
+from agents.checkpoint_store import CheckpointStore
+from agents.task_agents.memo_to_task.agent import MemoToTaskAgent
+from agents.task_agents.one_liner.agent import OneLinerAgent
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+HOUR = 60 * 60
+
+
+def _save_checkpoint(store: CheckpointStore, thread_id: str) -> None:
+    with store.saver.cursor() as cur:
+        cur.execute(
+            "INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id) VALUES (?, '', ?)",
+            (thread_id, f"{thread_id}-1"),
+        )
+        cur.execute(
+            "INSERT INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel) "
+            "VALUES (?, '', ?, 'task', 0, 'messages')",
+            (thread_id, f"{thread_id}-1"),
+        )
+
+
+def _saved_threads(store: CheckpointStore) -> set[str]:
+    with store.saver.cursor(transaction=False) as cur:
+        rows = cur.execute("SELECT thread_id FROM checkpoints UNION SELECT thread_id FROM writes").fetchall()
+    return {row[0] for row in rows}
+
+
+def test_garbage_collection_by_age_and_count(tmp_path: Path) -> None:
+    store = CheckpointStore(tmp_path / "agents.db", max_age_seconds=HOUR, max_threads=2, gc_interval=1000)
+    try:
+        for thread_id in ("a", "b", "c"):
+            store.touch(thread_id)
+            _save_checkpoint(store, thread_id)
+            time.sleep(0.01)
+        _save_checkpoint(store, "untracked")
+
+        # 件数の上限 (2) を超えた最も古いスレッドと、利用記録のないスレッドを削除する
+        assert store.collect_garbage() == 2  # noqa: PLR2004
+        assert _saved_threads(store) == {"b", "c"}
+
+        # 期限を過ぎたスレッドはすべて削除する
+        assert store.collect_garbage(now=time.time() + 2 * HOUR) == 2  # noqa: PLR2004
+        assert _saved_threads(store) == set()
+        assert store.thread_count() == 0
+    finally:
+        store.close()
+
+
+def test_touch_runs_garbage_collection_periodically(tmp_path: Path) -> None:
+    store = CheckpointStore(tmp_path / "agents.db", max_threads=1, gc_interval=2)
+    try:
+        store.touch("a")
+        store.touch("b")
+
+        assert store.thread_count() == 1
+    finally:
+        store.close()
+
+
+def test_stateless_agents_skip_checkpoints() -> None:
+    assert OneLinerAgent(LLMProvider.FAKE)._graph.checkpointer is None  # type: ignore[union-attr]
+    assert MemoToTaskAgent(LLMProvider.FAKE)._graph.checkpointer is not None  # type: ignore[union-attr]
@@ -0,0 +1,109 @@
+"""共有モデルレジストリのテスト。"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from agents.agent_conf import HuggingFaceModel, LLMProvider
+from agents.model_registry import LoadedModel, ModelKey, ModelRegistry
+from agents.utils import FakeListChatModelWithBindTools
+
+MODEL_SIZE = 100
+
+
+class _CountingLoader:
+    def __init__(self, *, delay: float = 0.0) -> None:
+        self.calls: list[ModelKey] = []
+        self._delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, key: ModelKey) -> LoadedModel:
+        time.sleep(self._delay)
+        with self._lock:
+            self.calls.append(key)
+        return LoadedModel(FakeListChatModelWithBindTools(responses=["ok"]), MODEL_SIZE)
+
+
+def test_same_key_shares_one_model() -> None:
+    loader = _CountingLoader()
+    registry = ModelRegistry(loader=loader)
+
+    first = registry.acquire(LLMProvider.OPENVINO)
+    second = registry.acquire(LLMProvider.OPENVINO, HuggingFaceModel.QWEN_3_8B_INT4, device="cpu")
+
+    assert first.model is second.model
+    assert len(loader.calls) == 1
+    assert registry.stats()[0].ref_count == 2  # noqa: PLR2004
+
+
+def test_concurrent_acquire_loads_once() -> None:
+    loader = _CountingLoader(delay=0.05)
+    registry = ModelRegistry(loader=loader)
+    models: list[object] = []
+
+    def _worker() -> None:
+        models.append(registry.acquire(LLMProvider.GOOGLE).model)
+
+    threads = [threading.Thread(target=_worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loader.calls) == 1
+    assert len({id(model) for model in models}) == 1
+
+
+def test_idle_models_are_evicted_lru_under_budget() -> None:
+    loader = _CountingLoader()
+    registry = ModelRegistry(loader=loader, memory_budget_bytes=MODEL_SIZE * 2)
+
+    registry.preload(LLMProvider.OPENVINO, HuggingFaceModel.QWEN_3_8B_INT4)
+    in_use = registry.acquire(LLMProvider.OPENVINO, HuggingFaceModel.MISTRAL_7B_INS_V03_INT4)
+    registry.acquire(LLMProvider.GOOGLE).release()
+
+    keys = [entry.key.model_name for entry in registry.stats()]
+    assert HuggingFaceModel.QWEN_3_8B_INT4.value not in keys
+    assert HuggingFaceModel.MISTRAL_7B_INS_V03_INT4.value in keys
+    assert registry.loaded_bytes <= registry.memory_budget_bytes
+
+    in_use.release()
+    in_use.release()  # 2 回目は何もしない
+    assert registry.evict_idle() == 2  # noqa: PLR2004
+
+
+def test_warmup_hook_runs_once_per_load_and_failures_are_ignored() -> None:
+    registry = ModelRegistry(loader=_CountingLoader())
+    warmed: list[ModelKey] = []
+
+    def _failing(_key: ModelKey, _model: object) -> None:
+        msg = "warm-up failed"
+        raise RuntimeError(msg)
+
+    registry.add_warmup_hook(_failing)
+    registry.add_warmup_hook(lambda key, _model: warmed.append(key))
+
+    registry.acquire(LLMProvider.GOOGLE)
+    registry.acquire(LLMProvider.GOOGLE)
+
+    assert warmed == [ModelKey(LLMProvider.GOOGLE, "gemini-2.0-flash", None)]
+
+
+def test_failed_load_is_not_cached() -> None:
+    def _broken(_key: ModelKey) -> LoadedModel:
+        msg = "load failed"
+        raise OSError(msg)
+
+    registry = ModelRegistry(loader=_broken)
+
+    with pytest.raises(OSError, match="load failed"):
+        registry.acquire(LLMProvider.GOOGLE)
+    assert registry.stats() == []
+
+
+def test_fake_provider_is_not_shared() -> None:
+    with pytest.raises(ValueError, match="FAKE"):
+        ModelRegistry(loader=_CountingLoader()).acquire(LLMProvider.FAKE)
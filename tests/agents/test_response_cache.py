@@ -0,0 +1,98 @@
+"""構造化出力の LLM 応答キャッシュのテスト。"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel
+
+from agents.response_cache import LlmResponseCache, make_cache_key, schema_fingerprint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from langchain_core.prompt_values import PromptValue
+
+
+class _Answer(BaseModel):
+    text: str
+
+
+_PROMPT = ChatPromptTemplate.from_messages([("human", "質問: {question}")])
+
+
+def _structured(calls: list[str]) -> RunnableLambda:
+    def _answer(prompt_value: PromptValue) -> _Answer:
+        calls.append(prompt_value.to_string())
+        return _Answer(text=f"回答{len(calls)}")
+
+    return RunnableLambda(_answer)
+
+
+def test_wrapped_runnable_reuses_response_for_same_input(tmp_path: Path) -> None:
+    """同じ入力は LLM を呼ばずに保存済みの応答を返し、入力・モデルが変われば呼び出す"""
+    cache = LlmResponseCache(tmp_path / "cache.db")
+    calls: list[str] = []
+    runnable = cache.wrap(_PROMPT, _structured(calls), schema=_Answer, model_id="google:gemini")
+
+    first = runnable.invoke({"question": "a"})
+    second = runnable.invoke({"question": "a"})
+    runnable.invoke({"question": "b"})
+    other_model = cache.wrap(_PROMPT, _structured(calls), schema=_Answer, model_id="openvino:qwen")
+    other_model.invoke({"question": "a"})
+
+    assert first == second
+    assert len(calls) == 3  # noqa: PLR2004
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 3  # noqa: PLR2004
+    assert stats.hit_rate == 0.25  # noqa: PLR2004
+
+
+def test_cache_survives_reopen(tmp_path: Path) -> None:
+    """保存した応答は別インスタンス (再起動後) でも使える"""
+    path = tmp_path / "cache.db"
+    calls: list[str] = []
+    LlmResponseCache(path).wrap(_PROMPT, _structured(calls), schema=_Answer, model_id="m").invoke({"question": "a"})
+
+    reopened = LlmResponseCache(path).wrap(_PROMPT, _structured(calls), schema=_Answer, model_id="m")
+    result = reopened.invoke({"question": "a"})
+
+    assert result == _Answer(text="回答1")
+    assert len(calls) == 1
+
+
+def test_expired_entries_are_not_used(tmp_path: Path) -> None:
+    """TTL を過ぎた応答は使わない"""
+    cache = LlmResponseCache(tmp_path / "cache.db", ttl_seconds=-1)
+    cache.put("key", "_Answer", '{"text": "old"}')
+
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    """上限を超えると最後に使われた時刻が古いものから削除される"""
+    cache = LlmResponseCache(tmp_path / "cache.db", max_entries=2)
+    cache.put("a", "_Answer", "{}")
+    cache.put("b", "_Answer", "{}")
+    assert cache.get("a") is not None
+
+    cache.put("c", "_Answer", "{}")
+
+    assert cache.count() == 2  # noqa: PLR2004
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats().evictions == 1
+
+
+def test_cache_key_depends_on_every_component() -> None:
+    schema_id = schema_fingerprint(_Answer)
+    base = make_cache_key("t", "p", "m", schema_id)
+
+    assert base == make_cache_key("t", "p", "m", schema_id)
+    assert base != make_cache_key("t2", "p", "m", schema_id)
+    assert base != make_cache_key("t", "p2", "m", schema_id)
+    assert base != make_cache_key("t", "p", "m2", schema_id)
+    assert base != make_cache_key("t", "p", "m", "other")
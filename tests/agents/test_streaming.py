@@ -0,0 +1,46 @@
+"""エージェントの途中経過イベントのテスト。"""
+
+from __future__ import annotations
+
+from langchain_core.messages import AIMessageChunk
+
+from agents.agent_conf import LLMProvider
+from agents.base import AgentError
+from agents.streaming import AgentStreamEvent, message_chunk_text, partial_json_string_values
+from agents.task_agents.one_liner.agent import OneLinerAgent
+from agents.task_agents.one_liner.state import OneLinerState
+
+
+def test_partial_json_string_values_returns_unfinished_value() -> None:
+    text = '{"next_actions": [{"title": "資料を\\"作成\\""}, {"title": "送'
+
+    assert partial_json_string_values(text, "title") == ['資料を"作成"', "送"]
+    assert partial_json_string_values(text, "project_title") == []
+
+
+def test_message_chunk_text_includes_tool_call_arguments() -> None:
+    chunk = AIMessageChunk(
+        content="考え中",
+        tool_call_chunks=[{"name": "OneLinerOutput", "args": '{"response": "おは', "id": "1", "index": 0}],
+    )
+
+    assert message_chunk_text(chunk) == '考え中{"response": "おは'
+
+
+def test_invoke_with_on_event_reports_nodes_and_returns_same_result(thread_id: str) -> None:
+    state = OneLinerState(
+        today_task_count=1,
+        overdue_task_count=0,
+        completed_task_count=2,
+        progress_summary="順調",
+        user_name="テスト",
+    )
+    events: list[AgentStreamEvent] = []
+
+    streamed = OneLinerAgent(LLMProvider.FAKE).invoke(state, thread_id, on_event=events.append)
+    plain = OneLinerAgent(LLMProvider.FAKE).invoke(state, f"{thread_id}-plain")
+
+    assert not isinstance(streamed, AgentError)
+    assert not isinstance(plain, AgentError)
+    assert streamed.response == plain.response
+    assert "chatbot" in [event.node for event in events if event.kind == "node"]
@@ -0,0 +1,5 @@
+"""Logic層ベンチマークパッケージ
+
+合成データセット (`scripts/bench_dataset.py`) に対して主要なユースケースの所要時間を計測します。
+環境変数 `KAGE_BENCH` に規模 (例: `1k,100k`) を指定したときだけ実行されます。
+"""
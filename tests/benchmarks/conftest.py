@@ -0,0 +1,70 @@
+"""Logic層ベンチマークの共通設定とフィクスチャ
+
+環境変数:
+- `KAGE_BENCH`: 計測する規模 (カンマ区切り、例: `1k,100k`)。未設定ならベンチマークはスキップする
+- `KAGE_BENCH_ROUNDS`: 1 ベンチマークあたりの計測回数 (既定: 5)
+- `KAGE_BENCH_DATA_DIR`: 生成したデータベースの保存先 (既定: `.benchmarks/data`。同じ版なら再利用する)
+- `KAGE_BENCH_RESULTS`: 結果の追記先 (既定: `.benchmarks/results.jsonl`)
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from database import create_sqlite_engine
+from scripts.bench_dataset import DatasetSpec, build_database
+from scripts.bench_results import DEFAULT_RESULTS_PATH, append_results
+from tests.benchmarks.harness import BenchDatabase, Benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+SIZES = [size.strip() for size in os.environ.get("KAGE_BENCH", "").split(",") if size.strip()]
+ROUNDS = int(os.environ.get("KAGE_BENCH_ROUNDS", "5"))
+DATA_DIR = Path(os.environ.get("KAGE_BENCH_DATA_DIR", ".benchmarks/data"))
+RESULTS_PATH = Path(os.environ.get("KAGE_BENCH_RESULTS", str(DEFAULT_RESULTS_PATH)))
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """`KAGE_BENCH` が未設定のときはベンチマークをスキップする。"""
+    if SIZES:
+        return
+    skip = pytest.mark.skip(reason="KAGE_BENCH に規模 (例: 1k) を指定すると実行します")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="package", params=SIZES or ["1k"])
+def bench_db(request: pytest.FixtureRequest) -> Iterator[BenchDatabase]:
+    """規模ごとのデータベースを用意し、アプリケーションサービスの接続先を差し替える。"""
+    size: str = request.param
+    spec = DatasetSpec.parse(size)
+    path = DATA_DIR / f"bench_{size}.db"
+    build_database(path, spec)
+    engine = create_sqlite_engine(path)
+    read_engine = create_sqlite_engine(path, read_only=True)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("logic.unit_of_work.engine", engine)
+        mp.setattr("logic.unit_of_work.read_engine", read_engine)
+        yield BenchDatabase(size=size, spec=spec, engine=engine)
+    engine.dispose()
+    read_engine.dispose()
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest, bench_db: BenchDatabase) -> Iterator[Benchmark]:
+    """所要時間を計測し、テスト終了時に結果ファイルへ追記する。
+
+    pytest-benchmark (開発依存に含まれる) の `benchmark` フィクスチャと衝突しないよう別名にしている。
+    """
+    name = request.node.originalname.removeprefix("test_")
+    timer = Benchmark(name=name, dataset=bench_db.size, rounds=ROUNDS)
+    yield timer
+    result = timer.result()
+    if result is not None:
+        append_results(RESULTS_PATH, [result])
@@ -0,0 +1,95 @@
+"""ベンチマークの計測ヘルパー
+
+pytest-benchmark の `benchmark` フィクスチャと同じ呼び出し方 (`bench(func, ...)` と
+`bench.pedantic(...)`) の一部だけを実装し、計測結果を `scripts/bench_results.py` の形式で返します。
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from scripts.bench_results import BenchmarkResult
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy import Engine
+
+    from scripts.bench_dataset import DatasetSpec
+
+
+@dataclass(slots=True)
+class BenchDatabase:
+    """ベンチマーク用データベース
+
+    Attributes:
+        size: 規模の名前 (結果ファイルの dataset)
+        spec: 生成した件数
+        engine: 書き込み用のエンジン
+    """
+
+    size: str
+    spec: DatasetSpec
+    engine: Engine
+
+
+@dataclass(slots=True)
+class Benchmark:
+    """所要時間を計測するフィクスチャ
+
+    Attributes:
+        name: ベンチマーク名
+        dataset: データセットの規模名
+        rounds: 既定の計測回数
+        samples: 計測した所要時間 (秒)
+    """
+
+    name: str
+    dataset: str
+    rounds: int
+    samples: list[float] = field(default_factory=list)
+
+    def __call__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """関数を `rounds` 回実行して計測し、最後の戻り値を返す。"""
+        return self.pedantic(func, args=args, kwargs=kwargs)
+
+    def pedantic(
+        self,
+        target: Callable[..., Any],
+        *,
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        setup: Callable[[], tuple[tuple[Any, ...], dict[str, Any]] | None] | None = None,
+        rounds: int | None = None,
+    ) -> Any:  # noqa: ANN401
+        """計測のたびに `setup` (計測対象外) を実行してから関数を計測する。
+
+        Args:
+            target: 計測する関数
+            args: 位置引数 (`setup` が引数を返す場合はそちらを使う)
+            kwargs: キーワード引数
+            setup: 計測前に呼ぶ関数。(args, kwargs) を返すとその引数で `target` を呼ぶ
+            rounds: 計測回数 (既定は `self.rounds`)
+
+        Returns:
+            Any: 最後の実行の戻り値
+        """
+        result: Any = None
+        for _ in range(rounds or self.rounds):
+            call_args, call_kwargs = args, kwargs or {}
+            if setup is not None and (prepared := setup()) is not None:
+                call_args, call_kwargs = prepared
+            gc.collect()
+            started = time.perf_counter()
+            result = target(*call_args, **call_kwargs)
+            self.samples.append(time.perf_counter() - started)
+        return result
+
+    def result(self) -> BenchmarkResult | None:
+        """計測結果 (1 回も計測していなければ None)"""
+        if not self.samples:
+            return None
+        return BenchmarkResult.from_samples(self.name, self.dataset, self.samples)
@@ -0,0 +1,142 @@
+"""Logic層の主要ユースケースのベンチマーク
+
+`KAGE_BENCH=1k uv run pytest tests/benchmarks` で実行し、結果を `scripts/bench_results.py compare` で比較します。
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, col, select
+
+from agents.task_agents.review_copilot import ReviewCopilotAgent
+from logic.application.memo_application_service import MemoApplicationService
+from logic.application.project_application_service import ProjectApplicationService
+from logic.application.task_application_service import TaskApplicationService
+from logic.application.terminology_application_service import TerminologyApplicationService
+from logic.repositories.memo import MemoRepository
+from logic.repositories.project import ProjectRepository
+from logic.repositories.task import TaskRepository
+from logic.services.weekly_review_service import WeeklyReviewInsightsService
+from models import Memo, Tag, TaskStatus, WeeklyReviewInsightsQuery
+from scripts.bench_dataset import ANCHOR
+from settings.models import ReviewSettings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from tests.benchmarks.harness import BenchDatabase, Benchmark
+
+pytestmark = pytest.mark.benchmark
+
+IMPORT_KEY_PREFIX = "bench-import-"
+IMPORT_COUNT = 200
+
+
+def _delete_imported_terms(bench_db: BenchDatabase) -> None:
+    with bench_db.engine.begin() as conn:
+        for statement in (
+            "DELETE FROM synonyms WHERE term_id IN (SELECT id FROM terms WHERE key LIKE :prefix)",
+            "DELETE FROM term_tag WHERE term_id IN (SELECT id FROM terms WHERE key LIKE :prefix)",
+            "DELETE FROM terms WHERE key LIKE :prefix",
+        ):
+            conn.execute(text(statement), {"prefix": f"{IMPORT_KEY_PREFIX}%"})
+
+
+@pytest.fixture
+def imported_terms(bench_db: BenchDatabase) -> Iterator[None]:
+    """インポートした用語をテストの前後で削除する。"""
+    _delete_imported_terms(bench_db)
+    yield
+    _delete_imported_terms(bench_db)
+
+
+def test_memo_list_with_details(bench: Benchmark, bench_db: BenchDatabase) -> None:
+    memos = bench(MemoApplicationService().get_all_memos, with_details=True)
+
+    assert len(memos) == bench_db.spec.memos
+
+
+def test_task_search(bench: Benchmark) -> None:
+    tasks = bench(TaskApplicationService().search, "レビュー", limit=50)
+
+    assert 0 < len(tasks) <= 50  # noqa: PLR2004
+
+
+def test_task_search_by_status(bench: Benchmark) -> None:
+    tasks = bench(TaskApplicationService().search, "レビュー", status=TaskStatus.TODO, limit=50)
+
+    assert all(task.status == TaskStatus.TODO for task in tasks)
+
+
+def test_memo_sync_tags(bench: Benchmark, bench_db: BenchDatabase) -> None:
+    with Session(bench_db.engine) as session:
+        memo_id = session.exec(select(Memo.id).order_by(col(Memo.created_at).desc()).limit(1)).one()
+        tag_ids = list(session.exec(select(Tag.id).limit(10)).all())
+    # 毎回差分が出るよう 2 組のタグを交互に設定する
+    tag_sets = [tag_ids[:5], tag_ids[3:]]
+    rounds: list[int] = []
+
+    def setup() -> tuple[tuple[object, ...], dict[str, object]]:
+        rounds.append(len(rounds))
+        return (memo_id, tag_sets[len(rounds) % 2]), {}
+
+    memo = bench.pedantic(MemoApplicationService().sync_tags, setup=setup)
+
+    assert {tag.id for tag in memo.tags} == set(tag_sets[len(rounds) % 2])
+
+
+def test_weekly_review_insights(bench: Benchmark, bench_db: BenchDatabase) -> None:
+    query = WeeklyReviewInsightsQuery(start=ANCHOR - timedelta(days=7), end=ANCHOR)
+    with Session(bench_db.engine) as session:
+        service = WeeklyReviewInsightsService(
+            TaskRepository(session),
+            MemoRepository(session),
+            ProjectRepository(session),
+            ReviewCopilotAgent(),
+            ReviewSettings(),
+        )
+        insights = bench(service.generate_insights, query)
+
+    assert insights is not None
+
+
+def test_project_list(bench: Benchmark, bench_db: BenchDatabase) -> None:
+    projects = bench(ProjectApplicationService().get_all_projects)
+
+    assert len(projects) == bench_db.spec.projects
+
+
+def test_term_export(bench: Benchmark, bench_db: BenchDatabase, tmp_path: Path) -> None:
+    count = bench(TerminologyApplicationService().export_to_json, tmp_path / "terms.json")
+
+    assert count == bench_db.spec.terms
+
+
+@pytest.mark.usefixtures("imported_terms")
+def test_term_import(bench: Benchmark, bench_db: BenchDatabase, tmp_path: Path) -> None:
+    source = tmp_path / "terms.json"
+    items = [
+        {
+            "key": f"{IMPORT_KEY_PREFIX}{index}",
+            "title": f"インポート用語 {index}",
+            "description": "ベンチマーク用",
+            "status": "approved",
+            "synonyms": [f"{IMPORT_KEY_PREFIX}synonym-{index}"],
+        }
+        for index in range(IMPORT_COUNT)
+    ]
+    source.write_text(json.dumps(items, ensure_ascii=False), encoding="utf-8")
+
+    def setup() -> tuple[tuple[object, ...], dict[str, object]]:
+        _delete_imported_terms(bench_db)
+        return (source,), {}
+
+    result = bench.pedantic(TerminologyApplicationService().import_from_json, setup=setup)
+
+    assert result["success_count"] == IMPORT_COUNT
@@ -1,13 +1,33 @@
 from __future__ import annotations
 
+import time
+from threading import Event, Lock
 from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
+import pytest
+
+from agents.agent_conf import LLMProvider
+from agents.streaming import AgentStreamEvent
 from agents.task_agents.memo_to_task.schema import MemoToTaskAgentOutput, ProjectPlanSuggestion, TaskDraft
-from logic.application.memo_ai_job_queue import MemoAiJobQueue
+from logic.application.memo_ai_job_queue import (
+    PROGRESS_STAGE_STARTED,
+    MemoAiJobPriority,
+    MemoAiJobProgress,
+    MemoAiJobQueue,
+    MemoAiJobQueueFullError,
+    MemoAiJobStatus,
+    MemoAiJobUpdated,
+)
+from logic.application.memo_to_task_application_service import MemoToTaskApplicationService
 from logic.application.project_application_service import ProjectApplicationService
 from logic.application.task_application_service import TaskApplicationService
-from models import ProjectStatus, TaskStatus
+from logic.events import EventBus
+from models import ProjectStatus, TaskCreate, TaskStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 class FakeApps:
@@ -31,18 +51,25 @@ class FakeProjectService:
 class FakeTaskService:
     def __init__(self) -> None:
         self.created_payloads: list[dict[str, object]] = []
+        self.bulk_calls = 0
 
-    def create(self, **kwargs: object) -> SimpleNamespace:
-        self.created_payloads.append(kwargs)
-        task_id = uuid4()
-        return SimpleNamespace(
-            id=task_id,
-            title=kwargs.get("title"),
-            description=kwargs.get("description"),
-            status=kwargs.get("status", TaskStatus.DRAFT),
-            tags=[],
-            project_id=kwargs.get("project_id"),
-        )
+    def bulk_create(self, items: list[TaskCreate]) -> list[SimpleNamespace]:
+        self.bulk_calls += 1
+        created: list[SimpleNamespace] = []
+        for item in items:
+            payload = item.model_dump()
+            self.created_payloads.append(payload)
+            created.append(
+                SimpleNamespace(
+                    id=uuid4(),
+                    title=payload["title"],
+                    description=payload["description"],
+                    status=payload["status"],
+                    tags=[],
+                    project_id=payload["project_id"],
+                )
+            )
+        return created
 
 
 def _build_stub_memo(*, memo_id: UUID | None = None, title: str = "memo", content: str = "summary") -> SimpleNamespace:
@@ -81,7 +108,9 @@ def test_project_creation_and_task_linking() -> None:
     assert created_project_id is not None
 
     payloads = queue._create_draft_tasks(memo, output.tasks, created_project_id)  # type: ignore[attr-defined]
+    assert task_service.bulk_calls == 1
     assert task_service.created_payloads[0]["project_id"] == created_project_id
+    assert task_service.created_payloads[0]["status"] == TaskStatus.DRAFT
     assert payloads[0].project_id == created_project_id
     assert project_payload.status == ProjectStatus.DRAFT.value
 
@@ -110,3 +139,227 @@ def test_project_description_uses_memo_content() -> None:
     description = str(project_service.created[0]["description"])
     assert "第一行 第二行 詳細メモ" in description
     assert project_service.created[0]["status"] == ProjectStatus.DRAFT
+
+
+class BlockingMemoToTaskService:
+    """clarify_memo を release されるまで待たせ、同時実行数を記録する。"""
+
+    def __init__(self) -> None:
+        self.release = Event()
+        self.started: list[UUID] = []
+        self.max_running = 0
+        self._running = 0
+        self._lock = Lock()
+
+    def get_configured_provider(self) -> LLMProvider:
+        return LLMProvider.FAKE
+
+    def clarify_memo(self, memo: SimpleNamespace) -> MemoToTaskAgentOutput:
+        with self._lock:
+            self.started.append(memo.id)
+            self._running += 1
+            self.max_running = max(self.max_running, self._running)
+        self.release.wait(timeout=5)
+        with self._lock:
+            self._running -= 1
+        return MemoToTaskAgentOutput(tasks=[], suggested_memo_status="clarify")
+
+
+def _build_running_queue(service: BlockingMemoToTaskService, **kwargs: Any) -> MemoAiJobQueue:  # noqa: ANN401
+    apps = FakeApps(
+        {
+            MemoToTaskApplicationService: service,
+            TaskApplicationService: FakeTaskService(),
+            ProjectApplicationService: FakeProjectService(),
+        }
+    )
+    return MemoAiJobQueue(apps=apps, **kwargs)  # type: ignore[arg-type]
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_provider_concurrency_limits_running_jobs() -> None:
+    """プロバイダの同時実行数を超えてジョブが実行されない。"""
+    service = BlockingMemoToTaskService()
+    queue = _build_running_queue(service, max_workers=4, provider_concurrency={LLMProvider.FAKE: 2})
+    try:
+        snapshots = [queue.enqueue(_build_stub_memo()) for _ in range(4)]  # type: ignore[arg-type]
+        _wait_until(lambda: len(service.started) == 2)  # noqa: PLR2004
+        time.sleep(0.05)
+        assert len(service.started) == 2  # noqa: PLR2004
+
+        service.release.set()
+        _wait_until(
+            lambda: all(
+                (snapshot := queue.get_snapshot(s.job_id)) is not None and snapshot.status == MemoAiJobStatus.SUCCEEDED
+                for s in snapshots
+            )
+        )
+        assert service.max_running == 2  # noqa: PLR2004
+    finally:
+        service.release.set()
+        queue.shutdown()
+
+
+def test_interactive_lane_runs_before_background() -> None:
+    """待機中の INTERACTIVE ジョブが BACKGROUND ジョブより先に実行される。"""
+    service = BlockingMemoToTaskService()
+    queue = _build_running_queue(service, max_workers=1, provider_concurrency={LLMProvider.FAKE: 1})
+    try:
+        first = _build_stub_memo()
+        queue.enqueue(first, priority=MemoAiJobPriority.BACKGROUND)  # type: ignore[arg-type]
+        _wait_until(lambda: len(service.started) == 1)
+        background = _build_stub_memo()
+        interactive = _build_stub_memo()
+        queue.enqueue(background, priority=MemoAiJobPriority.BACKGROUND)  # type: ignore[arg-type]
+        queue.enqueue(interactive, priority=MemoAiJobPriority.INTERACTIVE)  # type: ignore[arg-type]
+
+        service.release.set()
+        _wait_until(lambda: len(service.started) == 3)  # noqa: PLR2004
+        assert service.started == [first.id, interactive.id, background.id]
+    finally:
+        service.release.set()
+        queue.shutdown()
+
+
+def test_prefetch_lane_waits_for_interactive_and_yields_to_same_memo() -> None:
+    """PREFETCH は INTERACTIVE がなくなってから実行され、同じメモの生成依頼が来たら取り下げられる。"""
+    service = BlockingMemoToTaskService()
+    queue = _build_running_queue(service, max_workers=2, provider_concurrency={LLMProvider.FAKE: 2})
+    try:
+        interactive = _build_stub_memo()
+        queue.enqueue(interactive)  # type: ignore[arg-type]
+        _wait_until(lambda: len(service.started) == 1)
+        prefetched = _build_stub_memo()
+        requested = _build_stub_memo()
+        queue.enqueue(prefetched, priority=MemoAiJobPriority.PREFETCH)  # type: ignore[arg-type]
+        superseded = queue.enqueue(requested, priority=MemoAiJobPriority.PREFETCH)  # type: ignore[arg-type]
+        time.sleep(0.05)
+        assert service.started == [interactive.id]
+        assert queue.interactive_idle_seconds() == 0.0
+
+        queue.enqueue(requested, priority=MemoAiJobPriority.BACKGROUND)  # type: ignore[arg-type]
+        assert queue.get_snapshot(superseded.job_id) is None
+
+        service.release.set()
+        _wait_until(lambda: len(service.started) == 3)  # noqa: PLR2004
+        assert service.started == [interactive.id, requested.id, prefetched.id]
+    finally:
+        service.release.set()
+        queue.shutdown()
+
+
+def test_full_queue_defers_background_and_rejects_interactive() -> None:
+    """満杯時は BACKGROUND を保留し、INTERACTIVE は拒否する。保留分は空きができたら実行される。"""
+    service = BlockingMemoToTaskService()
+    queue = _build_running_queue(
+        service, max_workers=1, provider_concurrency={LLMProvider.FAKE: 1}, max_pending=1, max_deferred=1
+    )
+    try:
+        queue.enqueue(_build_stub_memo())  # type: ignore[arg-type]
+        _wait_until(lambda: len(service.started) == 1)
+        queue.enqueue(_build_stub_memo(), priority=MemoAiJobPriority.BACKGROUND)  # type: ignore[arg-type]
+        deferred = queue.enqueue(_build_stub_memo(), priority=MemoAiJobPriority.BACKGROUND)  # type: ignore[arg-type]
+        assert deferred.status == MemoAiJobStatus.DEFERRED
+
+        with pytest.raises(MemoAiJobQueueFullError):
+            queue.enqueue(_build_stub_memo())  # type: ignore[arg-type]
+        with pytest.raises(MemoAiJobQueueFullError):
+            queue.enqueue(_build_stub_memo(), priority=MemoAiJobPriority.BACKGROUND)  # type: ignore[arg-type]
+
+        service.release.set()
+        _wait_until(
+            lambda: (snapshot := queue.get_snapshot(deferred.job_id)) is not None
+            and snapshot.status == MemoAiJobStatus.SUCCEEDED
+        )
+    finally:
+        service.release.set()
+        queue.shutdown()
+
+
+class StreamingMemoToTaskService:
+    """clarify_memo で途中経過のイベントを順に流す。"""
+
+    def get_configured_provider(self) -> LLMProvider:
+        return LLMProvider.FAKE
+
+    def clarify_memo(
+        self, _memo: SimpleNamespace, *, on_event: Callable[[AgentStreamEvent], None] | None = None
+    ) -> MemoToTaskAgentOutput:
+        if on_event is not None:
+            on_event(AgentStreamEvent(kind="node", node="classify_memo", update={"decision": "next_action"}))
+            for text in ['{"next_actions": [{"title": "資料', '作成"}, {"tit', 'le": "送付', '"}]}']:
+                on_event(AgentStreamEvent(kind="token", node="generate_task_seed", text=text))
+            routed = [TaskDraft(title="資料作成"), TaskDraft(title="送付")]
+            on_event(AgentStreamEvent(kind="node", node="generate_task_seed", update={"routed_tasks": routed}))
+        return MemoToTaskAgentOutput(tasks=[TaskDraft(title="資料作成")], suggested_memo_status="active")
+
+
+def test_progress_events_are_forwarded_to_subscribers() -> None:
+    """購読中はステージと生成途中のタスクタイトルが変化したときだけ通知され、解除後は通知されない。"""
+    service = StreamingMemoToTaskService()
+    apps = FakeApps(
+        {
+            MemoToTaskApplicationService: service,
+            TaskApplicationService: FakeTaskService(),
+            ProjectApplicationService: FakeProjectService(),
+        }
+    )
+    queue = MemoAiJobQueue(apps=apps, max_workers=1)  # type: ignore[arg-type]
+    received: list[MemoAiJobProgress] = []
+    unsubscribe = queue.subscribe_progress(received.append)
+    try:
+        memo = _build_stub_memo()
+        snapshot = queue.enqueue(memo)  # type: ignore[arg-type]
+        _wait_until(
+            lambda: (current := queue.get_snapshot(snapshot.job_id)) is not None
+            and current.status == MemoAiJobStatus.SUCCEEDED
+        )
+        assert {progress.job_id for progress in received} == {snapshot.job_id}
+        assert [(progress.stage, progress.partial_task_titles) for progress in received] == [
+            (PROGRESS_STAGE_STARTED, ()),
+            ("classify_memo", ()),
+            ("generate_task_seed", ("資料",)),
+            ("generate_task_seed", ("資料作成",)),
+            ("generate_task_seed", ("資料作成", "送付")),
+        ]
+
+        unsubscribe()
+        received.clear()
+        second = queue.enqueue(_build_stub_memo())  # type: ignore[arg-type]
+        _wait_until(
+            lambda: (current := queue.get_snapshot(second.job_id)) is not None
+            and current.status == MemoAiJobStatus.SUCCEEDED
+        )
+        assert received == []
+    finally:
+        queue.shutdown()
+
+
+def test_status_changes_are_published_as_events() -> None:
+    """登録・実行開始・完了のたびに MemoAiJobUpdated が発行され、完了の通知はコールバックより先に届く。"""
+    service = BlockingMemoToTaskService()
+    bus = EventBus()
+    queue = _build_running_queue(service, max_workers=1, events=bus)
+    received: list[tuple[str, MemoAiJobStatus]] = []
+    bus.subscribe(MemoAiJobUpdated, lambda event: received.append(("event", event.snapshot.status)))
+    try:
+        service.release.set()
+        snapshot = queue.enqueue(
+            _build_stub_memo(),  # type: ignore[arg-type]
+            callback=lambda done: received.append(("callback", done.status)),
+        )
+        _wait_until(lambda: len(received) == 4)  # noqa: PLR2004
+
+        # 登録と実行開始の通知は別スレッドから発行されるため、順序は問わない
+        assert set(received[:2]) == {("event", MemoAiJobStatus.QUEUED), ("event", MemoAiJobStatus.RUNNING)}
+        assert received[2:] == [("event", MemoAiJobStatus.SUCCEEDED), ("callback", MemoAiJobStatus.SUCCEEDED)]
+        assert queue.get_snapshot(snapshot.job_id) is not None
+    finally:
+        service.release.set()
+        queue.shutdown()
@@ -0,0 +1,204 @@
+"""メモAIジョブの永続化ストアのテスト。
+
+テスト対象：
+- 実行権 (lease) は 1 ワーカーだけが取得できること
+- lease が切れた RUNNING ジョブが起動時に再開・打ち切りされること
+- lease の期限前に再起動しても、同じホストの終了済みのプロセスのジョブが再開されること
+  (実行中のプロセスのジョブは奪わないこと)
+- 完了ジョブの履歴が上限件数に保たれること
+- キューが未完了ジョブを再開し、結果をストアへ保存すること
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+import pytest
+from sqlmodel import SQLModel
+
+from agents.agent_conf import LLMProvider
+from agents.task_agents.memo_to_task.schema import MemoToTaskAgentOutput, TaskDraft
+from database import create_sqlite_engine
+from logic.application.memo_ai_job_queue import (
+    MemoAiJobPriority,
+    MemoAiJobQueue,
+    MemoAiJobSnapshot,
+    MemoAiJobStatus,
+)
+from logic.application.memo_ai_job_store import MemoAiJobStore
+from logic.application.memo_to_task_application_service import MemoToTaskApplicationService
+from logic.application.project_application_service import ProjectApplicationService
+from logic.application.task_application_service import TaskApplicationService
+from tests.logic.application.test_memo_ai_job_queue import FakeApps, FakeProjectService, FakeTaskService
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy import Engine
+
+OWNER = "worker-a"
+OTHER_OWNER = "worker-b"
+
+
+@pytest.fixture
+def job_engine(tmp_path: Path) -> Engine:
+    """ワーカースレッドからも同じ DB を参照できるよう、ファイル DB を使う"""
+    engine = create_sqlite_engine(tmp_path / "jobs.db")
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _dead_pid() -> int:
+    """終了済みのプロセスの PID を返す"""
+    with subprocess.Popen([sys.executable, "-c", "pass"]) as process:  # noqa: S603
+        process.wait()
+    return process.pid
+
+
+def _add(store: MemoAiJobStore, *, memo_id: UUID | None = None) -> UUID:
+    job_id = uuid4()
+    store.add(
+        job_id,
+        memo_id or uuid4(),
+        status=MemoAiJobStatus.QUEUED,
+        priority=MemoAiJobPriority.BACKGROUND,
+        provider=LLMProvider.FAKE,
+    )
+    return job_id
+
+
+def test_claim_succeeds_only_once(job_engine: Engine) -> None:
+    """同じジョブの実行権は 1 ワーカーだけが取得できる"""
+    store = MemoAiJobStore(job_engine)
+    job_id = _add(store)
+
+    assert store.claim(job_id, OWNER) is True
+    assert store.claim(job_id, OTHER_OWNER) is False
+
+    assert store.complete(job_id, OTHER_OWNER, MemoAiJobStatus.SUCCEEDED) is False
+    assert store.complete(job_id, OWNER, MemoAiJobStatus.SUCCEEDED, result={"tasks": []}) is True
+    stored = store.get(job_id)
+    assert stored is not None
+    assert stored.status == MemoAiJobStatus.SUCCEEDED.value
+    assert stored.attempts == 1
+
+
+def test_recover_requeues_expired_and_abandons_exhausted(job_engine: Engine) -> None:
+    """lease 切れの RUNNING は QUEUED に戻り、再試行上限に達したものは FAILED になる"""
+    store = MemoAiJobStore(job_engine, lease_seconds=-1, max_attempts=2)
+    retry_id = _add(store)
+    exhausted_id = _add(store)
+    waiting_id = _add(store)
+    store.claim(retry_id, OWNER)
+    for _ in range(2):
+        store.claim(exhausted_id, OWNER)
+        store.recover()
+
+    recovered = store.recover()
+
+    assert [job.id for job in recovered.resumable] == [retry_id, waiting_id]
+    assert recovered.abandoned == []
+    exhausted = store.get(exhausted_id)
+    assert exhausted is not None
+    assert exhausted.status == MemoAiJobStatus.FAILED.value
+
+
+def test_heartbeat_keeps_lease_alive(job_engine: Engine) -> None:
+    """ハートビートで延長された lease は復旧対象にならない"""
+    store = MemoAiJobStore(job_engine, lease_seconds=-1)
+    job_id = _add(store)
+    store.claim(job_id, OWNER)
+    store.lease_seconds = 60
+
+    assert store.heartbeat(OWNER) == 1
+    assert store.recover().resumable == []
+
+
+def test_recover_reclaims_previous_process_before_lease_expires(job_engine: Engine) -> None:
+    """lease の期限前でも、同じホストの終了済みのプロセスが持つ RUNNING は起動時に QUEUED に戻る"""
+    store = MemoAiJobStore(job_engine, lease_seconds=60)
+    crashed_id = _add(store)
+    live_id = _add(store)
+    remote_id = _add(store)
+    store.claim(crashed_id, f"host-a:{_dead_pid()}:aaaa")
+    store.claim(live_id, f"host-a:{os.getpid()}:bbbb")
+    store.claim(remote_id, "host-b:200:cccc")
+
+    assert store.recover().resumable == []
+    recovered = store.recover(f"host-a:{os.getpid()}:dddd")
+
+    assert [job.id for job in recovered.resumable] == [crashed_id]
+    for job_id in (live_id, remote_id):
+        running = store.get(job_id)
+        assert running is not None
+        assert running.status == MemoAiJobStatus.RUNNING.value
+
+
+def test_latest_for_memo_and_prune(job_engine: Engine) -> None:
+    """メモごとの最新ジョブを取得でき、完了ジョブは新しいものから keep 件残る"""
+    store = MemoAiJobStore(job_engine)
+    memo_id = uuid4()
+    job_ids = [_add(store, memo_id=memo_id) for _ in range(3)]
+    for job_id in job_ids:
+        store.claim(job_id, OWNER)
+        store.complete(job_id, OWNER, MemoAiJobStatus.FAILED, error_message="boom")
+        time.sleep(0.01)
+
+    latest = store.latest_for_memo(memo_id)
+    assert latest is not None
+    assert latest.id == job_ids[-1]
+
+    assert store.prune(keep=1) == 2  # noqa: PLR2004
+    assert [job.id for job in store.list_by_status(MemoAiJobStatus.FAILED)] == [job_ids[-1]]
+
+
+class _MemoToTaskService:
+    def get_configured_provider(self) -> LLMProvider:
+        return LLMProvider.FAKE
+
+    def clarify_memo(self, _memo: SimpleNamespace) -> MemoToTaskAgentOutput:
+        return MemoToTaskAgentOutput(tasks=[TaskDraft(title="再開したタスク")], suggested_memo_status="active")
+
+
+@pytest.mark.parametrize("interrupted", [False, True])
+def test_queue_resumes_pending_jobs_and_persists_result(job_engine: Engine, *, interrupted: bool) -> None:
+    """再起動後のキューが未完了ジョブ (lease の期限前に中断されたものを含む) を処理し、結果を復元できる"""
+    store = MemoAiJobStore(job_engine)
+    memo = SimpleNamespace(id=uuid4(), title="memo", content="content")
+    job_id = _add(store, memo_id=memo.id)
+    if interrupted:
+        store.claim(job_id, f"{socket.gethostname()}:{_dead_pid()}:previous")
+    apps = FakeApps(
+        {
+            MemoToTaskApplicationService: _MemoToTaskService(),
+            TaskApplicationService: FakeTaskService(),
+            ProjectApplicationService: FakeProjectService(),
+        }
+    )
+    completed: list[MemoAiJobSnapshot] = []
+    queue = MemoAiJobQueue(apps=apps, store=store, max_workers=1)  # type: ignore[arg-type]
+    try:
+        load_memo = lambda _memo_id: memo  # noqa: E731
+        resumed = queue.resume_pending(load_memo, callback=completed.append)  # type: ignore[arg-type]
+        assert [snapshot.job_id for snapshot in resumed] == [job_id]
+
+        deadline = time.monotonic() + 5
+        while not completed:
+            assert time.monotonic() < deadline, "timed out"
+            time.sleep(0.01)
+    finally:
+        queue.shutdown()
+
+    stored = store.get(job_id)
+    assert stored is not None
+    snapshot = MemoAiJobSnapshot.from_stored(stored)
+    assert snapshot.status == MemoAiJobStatus.SUCCEEDED
+    assert [task.title for task in snapshot.tasks] == ["再開したタスク"]
+    assert snapshot.suggested_memo_status == "active"
@@ -0,0 +1,144 @@
+"""AI 提案の先読みスケジューラのテスト。"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+from agents.agent_conf import LLMProvider
+from logic.application.memo_ai_job_queue import MemoAiJobPriority, MemoAiJobSnapshot, MemoAiJobStatus
+from logic.application.memo_ai_prefetcher import MemoAiPrefetcher
+from settings.models import AgentsSettings, AiPrefetchSettings
+
+NOW = datetime(2026, 1, 5, 3, 0, tzinfo=UTC)
+
+
+class FakeQueue:
+    def __init__(self) -> None:
+        self.idle_seconds = 600.0
+        self.snapshots: dict[UUID, MemoAiJobSnapshot] = {}
+        self.created_today: int | None = None
+
+    def interactive_idle_seconds(self) -> float:
+        return self.idle_seconds
+
+    def active_count(self, priority: MemoAiJobPriority) -> int:
+        return sum(
+            1
+            for snapshot in self.snapshots.values()
+            if snapshot.priority == priority and snapshot.status == MemoAiJobStatus.QUEUED
+        )
+
+    def get_snapshot(self, job_id: UUID) -> MemoAiJobSnapshot | None:
+        return self.snapshots.get(job_id)
+
+    def count_created_since(self, _priority: MemoAiJobPriority, _since: datetime) -> int | None:
+        return self.created_today
+
+    def finish(self, job_id: UUID, finished_at: datetime) -> None:
+        snapshot = self.snapshots[job_id]
+        snapshot.status = MemoAiJobStatus.SUCCEEDED
+        snapshot.updated_at = finished_at
+
+
+class FakeMemoService:
+    def __init__(self, queue: FakeQueue, memo_ids: list[UUID]) -> None:
+        self._queue = queue
+        self.memo_ids = memo_ids
+        self.prefetched: list[UUID] = []
+
+    def list_prefetch_candidates(self, *, limit: int) -> list[SimpleNamespace]:
+        return [SimpleNamespace(id=memo_id) for memo_id in self.memo_ids[:limit]]
+
+    def prefetch_ai_generation(self, memo_id: UUID) -> MemoAiJobSnapshot:
+        self.prefetched.append(memo_id)
+        snapshot = MemoAiJobSnapshot(
+            job_id=uuid4(),
+            memo_id=memo_id,
+            status=MemoAiJobStatus.QUEUED,
+            priority=MemoAiJobPriority.PREFETCH,
+        )
+        self._queue.snapshots[snapshot.job_id] = snapshot
+        return snapshot
+
+
+class FakeSettingsService:
+    def __init__(self, settings: AgentsSettings) -> None:
+        self.settings = settings
+
+    def get_agents_settings(self) -> AgentsSettings:
+        return self.settings
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _build(
+    provider: LLMProvider, prefetch: AiPrefetchSettings, memo_count: int = 3
+) -> tuple[MemoAiPrefetcher, FakeQueue, FakeMemoService, Clock]:
+    queue = FakeQueue()
+    memo = FakeMemoService(queue, [uuid4() for _ in range(memo_count)])
+    settings = FakeSettingsService(AgentsSettings(provider=provider, prefetch=prefetch))
+    apps = SimpleNamespace(memo=memo, settings=settings)
+    clock = Clock()
+    prefetcher = MemoAiPrefetcher(apps, queue_factory=lambda: queue, clock=clock)  # type: ignore[arg-type]
+    return prefetcher, queue, memo, clock
+
+
+def test_disabled_by_default() -> None:
+    prefetcher, _queue, memo, _clock = _build(LLMProvider.FAKE, AiPrefetchSettings())
+
+    assert prefetcher.run_once() is None
+    assert memo.prefetched == []
+
+
+def test_waits_for_idle_and_runs_one_job_at_a_time() -> None:
+    prefetcher, queue, memo, clock = _build(LLMProvider.FAKE, AiPrefetchSettings(enabled=True, idle_seconds=30))
+    queue.idle_seconds = 5.0
+    assert prefetcher.run_once() is None
+
+    queue.idle_seconds = 60.0
+    first = prefetcher.run_once()
+    assert first is not None
+    assert prefetcher.run_once() is None
+
+    queue.finish(first.job_id, clock.now)
+    second = prefetcher.run_once()
+    assert second is not None
+    assert memo.prefetched == memo.memo_ids[:2]
+
+
+def test_openvino_rests_in_proportion_to_cpu_budget() -> None:
+    prefetcher, queue, memo, clock = _build(
+        LLMProvider.OPENVINO, AiPrefetchSettings(enabled=True, idle_seconds=0, cpu_budget=0.25)
+    )
+    first = prefetcher.run_once()
+    assert first is not None
+
+    # 60 秒かかったジョブの後は 180 秒休む (先読みに使う時間を 25% に抑える)
+    clock.now = NOW + timedelta(seconds=60)
+    queue.finish(first.job_id, clock.now)
+    clock.now = NOW + timedelta(seconds=200)
+    assert prefetcher.run_once() is None
+    clock.now = NOW + timedelta(seconds=240)
+    assert prefetcher.run_once() is not None
+    assert len(memo.prefetched) == 2  # noqa: PLR2004
+
+
+def test_cloud_provider_respects_daily_quota() -> None:
+    prefetcher, queue, memo, _clock = _build(
+        LLMProvider.GOOGLE, AiPrefetchSettings(enabled=True, idle_seconds=0, daily_quota=5)
+    )
+    queue.created_today = 5
+
+    assert prefetcher.run_once() is None
+    assert memo.prefetched == []
+
+    queue.created_today = 4
+    assert prefetcher.run_once() is not None
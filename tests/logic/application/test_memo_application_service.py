@@ -16,6 +16,7 @@ from agents.task_agents.memo_to_task.state import MemoToTaskState
 from logic.application.memo_ai_job_queue import (
     GeneratedProjectPayload,
     GeneratedTaskPayload,
+    MemoAiJobPriority,
     MemoAiJobSnapshot,
     MemoAiJobStatus,
 )
@@ -24,10 +25,11 @@ from logic.application.memo_application_service import (
     MemoApplicationError,
     MemoApplicationService,
 )
-from models import MemoRead, MemoStatus, MemoUpdate, ProjectStatus, ProjectUpdate, TaskStatus, TaskUpdate
+from models import AiSuggestionStatus, MemoRead, MemoStatus, MemoUpdate, ProjectStatus, ProjectUpdate, TaskStatus
 
 # テスト用定数
 EXPECTED_PAIR_COUNT = 2
+PAGE_LIMIT = 20
 
 
 class TestMemoApplicationService:
@@ -204,15 +206,29 @@ class TestMemoApplicationService:
 
         assert result == memos
         assert len(result) == EXPECTED_PAIR_COUNT
-        mock_memo_service.get_all.assert_called_once_with(with_details=False)
+        mock_memo_service.get_all.assert_called_once_with(with_details=False, profile=None)
+
+    def test_get_all_memos_paged(self, memo_app_service: MemoApplicationService, mock_unit_of_work: Mock) -> None:
+        """正常系: page_size 指定時はページ取得に委譲する"""
+        mock_memo_service = mock_unit_of_work.service_factory.get_service.return_value
+
+        result = memo_app_service.get_all_memos(page_size=20, order_by="updated_at")
+
+        assert result is mock_memo_service.get_page.return_value
+        mock_memo_service.get_page.assert_called_once_with(
+            page_size=20, cursor=None, order_by="updated_at", with_details=False, profile=None
+        )
+        mock_memo_service.get_all.assert_not_called()
 
     def test_approve_ai_tasks_updates_status(
         self,
         memo_app_service: MemoApplicationService,
+        mock_unit_of_work: Mock,
+        mock_unit_of_work_factory: Mock,
         monkeypatch: pytest.MonkeyPatch,
         sample_memo_read: MemoRead,
     ) -> None:
-        """Draftタスク承認時にTaskService.updateが呼ばれる。"""
+        """Draftタスク承認時にTaskService.bulk_update_statusが 1 回で呼ばれる。"""
 
         task_id = uuid.uuid4()
         project_id = uuid.uuid4()
@@ -232,7 +248,8 @@ class TestMemoApplicationService:
         }
         sample_memo_read.ai_analysis_log = json.dumps(log_payload)
 
-        memo_app_service.update = Mock()
+        mock_memo_service = mock_unit_of_work.get_service.return_value
+        mock_memo_service.get_by_id.return_value = sample_memo_read
 
         def _fake_get_by_id(*_args: object, **_kwargs: object) -> MemoRead:
             return sample_memo_read
@@ -243,12 +260,9 @@ class TestMemoApplicationService:
             def __init__(self) -> None:
                 self.updated: list[tuple[uuid.UUID, TaskStatus | None]] = []
 
-            def update(self, task_id: uuid.UUID, update_data: TaskUpdate) -> Mock:
-                self.updated.append((task_id, update_data.status))
-                mock_task = Mock()
-                mock_task.id = task_id
-                mock_task.status = update_data.status or TaskStatus.TODO
-                return mock_task
+            def bulk_update_status(self, status_by_task: dict[uuid.UUID, TaskStatus]) -> list[Mock]:
+                self.updated.extend(status_by_task.items())
+                return [Mock(id=task_id, status=status) for task_id, status in status_by_task.items()]
 
         dummy_service = DummyTaskApp()
 
@@ -276,11 +290,14 @@ class TestMemoApplicationService:
 
         assert dummy_service.updated == [(task_id, TaskStatus.PROGRESS)]
         assert dummy_project.updated == [(project_id, ProjectStatus.ACTIVE)]
-        memo_app_service.update.assert_called()
+        mock_unit_of_work_factory.assert_any_call(defer_commit=True)
+        mock_memo_service.update.assert_called()
 
     def test_delete_ai_task_removes_log(
         self,
         memo_app_service: MemoApplicationService,
+        mock_unit_of_work: Mock,
+        mock_unit_of_work_factory: Mock,
         monkeypatch: pytest.MonkeyPatch,
         sample_memo_read: MemoRead,
     ) -> None:
@@ -294,7 +311,8 @@ class TestMemoApplicationService:
             }
         )
 
-        memo_app_service.update = Mock()
+        mock_memo_service = mock_unit_of_work.get_service.return_value
+        mock_memo_service.get_by_id.return_value = sample_memo_read
 
         def _fake_get_by_id(*_args: object, **_kwargs: object) -> MemoRead:
             return sample_memo_read
@@ -315,18 +333,22 @@ class TestMemoApplicationService:
         memo_app_service.delete_ai_task(sample_memo_read.id, task_id)
 
         assert dummy_service.deleted == [task_id]
-        memo_app_service.update.assert_called()
+        mock_unit_of_work_factory.assert_any_call(defer_commit=True)
+        mock_memo_service.update.assert_called()
 
     def test_create_ai_task_persists_draft(
         self,
         memo_app_service: MemoApplicationService,
+        mock_unit_of_work: Mock,
+        mock_unit_of_work_factory: Mock,
         monkeypatch: pytest.MonkeyPatch,
         sample_memo_read: MemoRead,
     ) -> None:
         """Draft タスク追加時に TaskService.create が DRAFT で呼ばれる。"""
 
         sample_memo_read.ai_analysis_log = None
-        memo_app_service.update = Mock()
+        mock_memo_service = mock_unit_of_work.get_service.return_value
+        mock_memo_service.get_by_id.return_value = sample_memo_read
 
         def _fake_get_by_id(*_args: object, **_kwargs: object) -> MemoRead:
             return sample_memo_read
@@ -354,7 +376,8 @@ class TestMemoApplicationService:
 
         assert dummy_service.created_payloads
         assert dummy_service.created_payloads[0]["status"] == TaskStatus.DRAFT
-        memo_app_service.update.assert_called()
+        mock_unit_of_work_factory.assert_any_call(defer_commit=True)
+        mock_memo_service.update.assert_called()
 
     def test_persist_ai_snapshot_writes_project_info(
         self,
@@ -402,6 +425,61 @@ class TestMemoApplicationService:
         assert serialized["project_info"]["project_id"] == str(project_id)
         assert serialized["draft_task_refs"][0]["project_id"] == str(project_id)
 
+    @pytest.mark.parametrize(
+        ("memo_status", "ai_status", "kept"),
+        [
+            (MemoStatus.INBOX, AiSuggestionStatus.NOT_REQUESTED, True),
+            (MemoStatus.ACTIVE, AiSuggestionStatus.PENDING, False),
+        ],
+    )
+    def test_prefetch_result_is_kept_only_for_untouched_inbox_memo(
+        self,
+        memo_app_service: MemoApplicationService,
+        sample_memo_read: MemoRead,
+        memo_status: MemoStatus,
+        ai_status: AiSuggestionStatus,
+        *,
+        kept: bool,
+    ) -> None:
+        """先読みの結果は、メモが INBOX かつ未依頼のままなら AVAILABLE として保存し、そうでなければ破棄する。"""
+        memo = sample_memo_read.model_copy(update={"status": memo_status, "ai_suggestion_status": ai_status})
+        memo_app_service.get_by_id = Mock(return_value=memo)
+        memo_app_service._persist_ai_snapshot = Mock()
+        memo_app_service._mark_ai_status = Mock()
+        task_service = Mock()
+        memo_app_service._get_task_service = Mock(return_value=task_service)
+        task_id = uuid.uuid4()
+        snapshot = MemoAiJobSnapshot(
+            job_id=uuid.uuid4(),
+            memo_id=memo.id,
+            status=MemoAiJobStatus.SUCCEEDED,
+            tasks=(
+                GeneratedTaskPayload(
+                    task_id=task_id,
+                    title="下書き",
+                    description=None,
+                    tags=(),
+                    route="next_action",
+                    due_date=None,
+                    project_title=None,
+                    project_id=None,
+                    status=TaskStatus.DRAFT,
+                ),
+            ),
+            priority=MemoAiJobPriority.PREFETCH,
+        )
+
+        memo_app_service._handle_ai_job_callback(snapshot)
+
+        if kept:
+            memo_app_service._persist_ai_snapshot.assert_called_once_with(snapshot)
+            memo_app_service._mark_ai_status.assert_called_once_with(memo.id, ai_status=AiSuggestionStatus.AVAILABLE)
+            task_service.bulk_delete.assert_not_called()
+        else:
+            memo_app_service._persist_ai_snapshot.assert_not_called()
+            memo_app_service._mark_ai_status.assert_not_called()
+            task_service.bulk_delete.assert_called_once_with([task_id])
+
     def test_list_by_tag(self, memo_app_service: MemoApplicationService, mock_unit_of_work: Mock) -> None:
         """正常系: タグIDでメモ取得"""
         mock_memo_service = mock_unit_of_work.service_factory.get_service.return_value
@@ -537,41 +615,26 @@ class TestMemoApplicationService:
         """空クエリは空配列を返す"""
         assert memo_app_service.search("") == []
 
-    def test_search_delegates_to_service_and_filters_status(
-        self, memo_app_service: MemoApplicationService, mock_unit_of_work: Mock
-    ) -> None:
+    def test_search_builds_single_spec(self, memo_app_service: MemoApplicationService, mock_unit_of_work: Mock) -> None:
+        """正常系: テキスト・ステータス・タグ条件を 1 つの検索仕様にまとめて委譲する"""
         mock_memo_service = mock_unit_of_work.service_factory.get_service.return_value
         m1 = MemoRead(id=uuid.uuid4(), title="t1", content="c1", status=MemoStatus.INBOX)
-        m2 = MemoRead(id=uuid.uuid4(), title="t2", content="c2", status=MemoStatus.ARCHIVE)
-        mock_memo_service.search_memos.return_value = [m1, m2]
-        mock_memo_service.list_by_status.return_value = [m1]
+        mock_memo_service.find.return_value = [m1]
+        any_tag, all_tag = uuid.uuid4(), uuid.uuid4()
 
-        out = memo_app_service.search("t", status=MemoStatus.INBOX)
-
-        assert out == [m1]
-        mock_memo_service.search_memos.assert_called_once_with("t", with_details=False)
-        mock_memo_service.list_by_status.assert_called_once_with(MemoStatus.INBOX, with_details=False)
+        out = memo_app_service.search(
+            " 議事録 ", status=MemoStatus.INBOX, tags=[any_tag], all_tags=[all_tag], sort="created_at", limit=PAGE_LIMIT
+        )
 
-    def test_search_filters_by_tags_using_repository(
-        self, memo_app_service: MemoApplicationService, mock_unit_of_work: Mock
-    ) -> None:
-        # 準備: サービス検索は2件返る
-        mock_memo_service = mock_unit_of_work.service_factory.get_service.return_value
-        t1 = uuid.uuid4()
-        t2 = uuid.uuid4()
-        m1 = MemoRead(id=t1, title="x", content="x", status=MemoStatus.INBOX)
-        m2 = MemoRead(id=t2, title="y", content="y", status=MemoStatus.INBOX)
-        mock_memo_service.search_memos.return_value = [m1, m2]
-
-        # リポジトリファクトリとメモリポジトリのモック
-        memo_repo_mock = Mock()
-        memo_repo_mock.list_by_tag.return_value = [m1]
-        repo_factory_mock = Mock()
-        repo_factory_mock.create.return_value = memo_repo_mock
-        mock_unit_of_work.repository_factory = repo_factory_mock
-
-        out = memo_app_service.search("x", tags=[uuid.uuid4()])
         assert out == [m1]
+        spec = mock_memo_service.find.call_args.args[0]
+        assert spec.text == "議事録"
+        assert spec.statuses == (MemoStatus.INBOX,)
+        assert spec.any_tags == (any_tag,)
+        assert spec.all_tags == (all_tag,)
+        assert spec.sort == "created_at"
+        assert spec.limit == PAGE_LIMIT
+        assert mock_memo_service.find.call_args.kwargs == {"with_details": False, "profile": None}
 
     def test_memo_agent_uses_runtime_device(
         self, monkeypatch: pytest.MonkeyPatch, mock_unit_of_work_factory: Mock
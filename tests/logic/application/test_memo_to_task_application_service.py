@@ -80,3 +80,51 @@ def test_clarify_memo_injects_prompt_overrides(monkeypatch: pytest.MonkeyPatch,
     expected_count = RECOMMENDED_TASK_COUNT_BY_LEVEL[AgentDetailLevel.DETAILED]
     assert f"{expected_count} 件" in str(captured_state["task_count_hint"])
     assert captured_state["recommended_task_count"] == expected_count
+
+
+def test_clarify_memos_keeps_order_and_isolates_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    """バッチ処理は入力順に結果を返し、失敗したメモだけを例外として返す"""
+    from agents.base import AgentError
+    from logic.application.memo_to_task_application_service import MemoToTaskServiceError
+
+    class BatchAgentStub:
+        def __init__(self) -> None:
+            self.batches: list[list[MemoToTaskState]] = []
+
+        def invoke_batch(self, states: list[MemoToTaskState]) -> list[MemoToTaskResult | AgentError]:
+            self.batches.append(states)
+            return [
+                MemoToTaskResult(
+                    tasks=[TaskDraft(title="t")],
+                    suggested_memo_status="active",
+                    processed_data=MemoToTaskState,
+                ),
+                AgentError("failed"),
+            ]
+
+    overrides = {
+        "custom_instructions": "",
+        "detail_hint": "",
+        "task_count_hint": "",
+        "recommended_task_count": 3,
+    }
+    monkeypatch.setattr(MemoToTaskApplicationService, "_collect_existing_tag_names", lambda _self: ["work"])
+    monkeypatch.setattr(MemoToTaskApplicationService, "_get_prompt_overrides", lambda _self: overrides)
+    agent = BatchAgentStub()
+    service = MemoToTaskApplicationService(agent=agent)  # type: ignore[arg-type]
+    memos = [
+        MemoRead(id=uuid.uuid4(), title="a", content="body a", status=MemoStatus.INBOX),
+        MemoRead(id=uuid.uuid4(), title="empty", content="  ", status=MemoStatus.INBOX),
+        MemoRead(id=uuid.uuid4(), title="b", content="body b", status=MemoStatus.INBOX),
+    ]
+
+    outputs = service.clarify_memos(memos)
+
+    assert [state["memo"].title for state in agent.batches[0]] == ["a", "b"]
+    first, empty, failed = outputs
+    assert not isinstance(first, MemoToTaskServiceError)
+    assert [task.title for task in first.tasks] == ["t"]
+    assert not isinstance(empty, MemoToTaskServiceError)
+    assert empty.suggested_memo_status == "clarify"
+    assert isinstance(failed, MemoToTaskServiceError)
+    assert service.get_throughput()["batch"].memo_count == 2  # noqa: PLR2004
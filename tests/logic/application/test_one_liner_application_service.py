@@ -12,7 +12,7 @@ from logic.application.one_liner_application_service import (
     OneLinerApplicationService,
     OneLinerServiceError,
 )
-from models import TaskStatus
+from models import TaskStats, TaskStatus
 
 if TYPE_CHECKING:  # 型チェック専用のインポート
     from agents.task_agents.one_liner.state import OneLinerState
@@ -158,30 +158,24 @@ def test_generate_one_liner_without_query_returns_default(monkeypatch: pytest.Mo
     _stub_config(monkeypatch, provider=LLMProvider.FAKE, model=HuggingFaceModel.QWEN_3_8B_INT4, user_name="Tester")
     stub_agent.invoke_result = SimpleNamespace(response="")
 
-    class TaskServiceStub:
-        def __init__(self) -> None:
-            self._counts = {
-                TaskStatus.TODAYS: 2,
-                TaskStatus.COMPLETED: 1,
-                TaskStatus.OVERDUE: 3,
-            }
+    expected_counts = {
+        TaskStatus.TODAYS: 2,
+        TaskStatus.COMPLETED: 1,
+    }
+    expected_overdue = 3
 
-        def list_by_status(self, status: TaskStatus) -> list[int]:
-            return [0] * self._counts.get(status, 0)
+    class StatsServiceStub:
+        def get_task_stats(self) -> TaskStats:
+            return TaskStats(by_status=expected_counts, overdue=expected_overdue)
 
     class AppServicesStub:
-        def __init__(self, task_service: TaskServiceStub) -> None:
-            self._task_service = task_service
-
-        def get_service(self, service_type: type) -> TaskServiceStub:
-            assert service_type is one_liner_module.TaskApplicationService
-            return self._task_service
+        def get_service(self, service_type: type) -> StatsServiceStub:
+            assert service_type is one_liner_module.StatsApplicationService
+            return StatsServiceStub()
 
-    task_service = TaskServiceStub()
-    app_services = AppServicesStub(task_service)
     monkeypatch.setattr(
         "logic.application.apps.ApplicationServices.create",
-        lambda: app_services,
+        AppServicesStub,
     )
 
     service = OneLinerApplicationService()
@@ -189,10 +183,9 @@ def test_generate_one_liner_without_query_returns_default(monkeypatch: pytest.Mo
 
     assert result == "今日も一日、お疲れさまです。"
     generated_state = stub_agent.invocations[0][0]
-    expected_counts = task_service._counts
     assert generated_state["today_task_count"] == expected_counts[TaskStatus.TODAYS]
     assert generated_state["completed_task_count"] == expected_counts[TaskStatus.COMPLETED]
-    assert generated_state["overdue_task_count"] == expected_counts[TaskStatus.OVERDUE]
+    assert generated_state["overdue_task_count"] == expected_overdue
     assert generated_state["user_name"] == "Tester"
 
 
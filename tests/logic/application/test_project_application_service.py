@@ -7,13 +7,12 @@ Unit of Work をモックして Application Service の主要フローのみを
 from __future__ import annotations
 
 import uuid
-from types import SimpleNamespace
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 import pytest
 
 from logic.application.project_application_service import ProjectApplicationService, ProjectValidationError
-from models import ProjectRead, ProjectStatus, ProjectUpdate
+from models import ProjectRead, ProjectStatus, ProjectSummary, ProjectUpdate
 
 
 @pytest.fixture
@@ -73,19 +72,21 @@ def test_create_success(
 def test_create_with_task_ids_syncs_relations(
     project_app_service: ProjectApplicationService,
     mock_unit_of_work: Mock,
+    mock_unit_of_work_factory: Mock,
     sample_project_read: ProjectRead,
 ) -> None:
+    """正常系: 作成時のタスク関連付けを一括同期し、1 回だけコミットする。"""
     mock_proj_service = mock_unit_of_work.service_factory.get_service.return_value
     mock_proj_service.create.return_value = sample_project_read
-    mock_project_repo = mock_unit_of_work.repository_factory.create.return_value
-    mock_project_repo.get_by_id.return_value = SimpleNamespace(tasks=[])
 
     task_ids = [uuid.uuid4(), uuid.uuid4()]
 
     project_app_service.create(title="P", description=None, task_ids=task_ids)
 
-    mock_proj_service.add_task.assert_has_calls([call(sample_project_read.id, tid) for tid in task_ids])
-    assert mock_proj_service.add_task.call_count == len(task_ids)
+    mock_proj_service.sync_tasks.assert_called_once_with(sample_project_read.id, task_ids)
+    mock_proj_service.add_task.assert_not_called()
+    mock_unit_of_work_factory.assert_called_once_with(defer_commit=True)
+    mock_unit_of_work.commit.assert_not_called()
 
 
 def test_create_validation_error(project_app_service: ProjectApplicationService) -> None:
@@ -134,20 +135,20 @@ def test_update_success(
 def test_update_with_task_ids_syncs_add_and_remove(
     project_app_service: ProjectApplicationService,
     mock_unit_of_work: Mock,
+    mock_unit_of_work_factory: Mock,
     sample_project_read: ProjectRead,
 ) -> None:
+    """正常系: 更新時のタスク関連付けを一括同期し、1 回だけコミットする。"""
     mock_proj_service = mock_unit_of_work.service_factory.get_service.return_value
     mock_proj_service.update.return_value = sample_project_read
-    existing_task = uuid.uuid4()
-    mock_project_repo = mock_unit_of_work.repository_factory.create.return_value
-    mock_project_repo.get_by_id.return_value = SimpleNamespace(tasks=[SimpleNamespace(id=existing_task)])
-
     new_task = uuid.uuid4()
 
     project_app_service.update(sample_project_read.id, ProjectUpdate(title="更新"), task_ids=[new_task])
 
-    mock_proj_service.add_task.assert_called_once_with(sample_project_read.id, new_task)
-    mock_proj_service.remove_task.assert_called_once_with(sample_project_read.id, existing_task)
+    mock_proj_service.sync_tasks.assert_called_once_with(sample_project_read.id, [new_task])
+    mock_proj_service.remove_task.assert_not_called()
+    mock_unit_of_work_factory.assert_called_once_with(defer_commit=True)
+    mock_unit_of_work.commit.assert_not_called()
 
 
 def test_get_by_id_success(
@@ -191,6 +192,32 @@ def test_list_by_status(
     mock_proj_service.list_by_status.assert_called_once_with(ProjectStatus.COMPLETED)
 
 
+def test_get_summaries_delegates_to_service(
+    project_app_service: ProjectApplicationService,
+    mock_unit_of_work_factory: Mock,
+    mock_unit_of_work: Mock,
+) -> None:
+    """正常系: 概要の一括取得を読み取り専用の UoW で Service へ委譲。"""
+    mock_proj_service = mock_unit_of_work.service_factory.get_service.return_value
+    project_id = uuid.uuid4()
+    summary = ProjectSummary(project_id=project_id)
+    mock_proj_service.get_summaries.return_value = {project_id: summary}
+
+    res = project_app_service.get_summaries([project_id])
+
+    assert res == {project_id: summary}
+    mock_proj_service.get_summaries.assert_called_once_with([project_id])
+    mock_unit_of_work_factory.assert_called_once_with(read_only=True)
+
+
+def test_get_summaries_empty_ids_skips_unit_of_work(
+    project_app_service: ProjectApplicationService, mock_unit_of_work_factory: Mock
+) -> None:
+    """正常系: 対象が空なら UoW を開かずに空の辞書を返す。"""
+    assert project_app_service.get_summaries([]) == {}
+    mock_unit_of_work_factory.assert_not_called()
+
+
 def test_search_empty_returns_empty(project_app_service: ProjectApplicationService) -> None:
     assert project_app_service.search("") == []
 
@@ -4,14 +4,17 @@ Unit of Work のモックを用い、TaskApplicationService の公開APIを検
 """
 
 import uuid
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from unittest.mock import Mock
 
 import pytest
 
+from errors import NotFoundError, ValidationError
 from logic.application.task_application_service import TaskApplicationService, TaskContentValidationError
 from models import TaskCreate, TaskRead, TaskStatus, TaskUpdate
 
+PAGE_LIMIT = 20
+
 
 class TestTaskApplicationService:
     """TaskApplicationServiceのApplication Service層機能をテストするクラス"""
@@ -176,7 +179,24 @@ class TestTaskApplicationService:
 
     # ステータス更新の個別APIは現行Application層に存在しないため対象外
 
-    # ステータス更新NotFoundは対象外
+    def test_bulk_update_status_raises_when_task_missing(
+        self,
+        task_application_service: TaskApplicationService,
+        mock_unit_of_work: Mock,
+        sample_task_read: TaskRead,
+    ) -> None:
+        """異常系: 存在しないタスクが含まれる場合は NotFoundError になり、UoW はロールバックされる"""
+        mock_task_service = mock_unit_of_work.service_factory.get_service.return_value
+        mock_task_service.get_by_ids.return_value = [sample_task_read]
+        missing_id = uuid.uuid4()
+
+        with pytest.raises(NotFoundError, match=str(missing_id)):
+            task_application_service.bulk_update_status(
+                {sample_task_read.id: TaskStatus.TODO, missing_id: TaskStatus.TODO}
+            )
+
+        exc_type = mock_unit_of_work.__exit__.call_args.args[0]
+        assert exc_type is NotFoundError
 
     def test_list_by_status(
         self,
@@ -291,6 +311,20 @@ class TestTaskApplicationService:
         assert isinstance(result, list)
         mock_task_service.get_all.assert_called_once()
 
+    def test_get_all_tasks_paged(
+        self, task_application_service: TaskApplicationService, mock_unit_of_work: Mock
+    ) -> None:
+        """正常系: page_size 指定時はページ取得に委譲する"""
+        mock_task_service = mock_unit_of_work.service_factory.get_service.return_value
+
+        result = task_application_service.get_all_tasks(page_size=20, cursor="abc")
+
+        assert result is mock_task_service.get_page.return_value
+        mock_task_service.get_page.assert_called_once_with(
+            page_size=20, cursor="abc", order_by="created_at", with_details=False
+        )
+        mock_task_service.get_all.assert_not_called()
+
     def test_create_with_explicit_status(
         self,
         task_application_service: TaskApplicationService,
@@ -305,43 +339,50 @@ class TestTaskApplicationService:
         assert args[0].status is TaskStatus.PROGRESS
 
     # 追加: 検索API
-    def test_search_empty_query_returns_all(
+    def test_search_empty_query_has_no_text_condition(
         self, task_application_service: TaskApplicationService, mock_unit_of_work: Mock, sample_task_read: TaskRead
     ) -> None:
-        """空クエリの場合は全件取得する"""
+        """正常系: 空クエリの場合はテキスト条件なしで検索する"""
         mock_task_service = mock_unit_of_work.service_factory.get_service.return_value
-        mock_task_service.get_all.return_value = [sample_task_read]
-
-        result = task_application_service.search("")
-        assert result == [sample_task_read]
-        mock_task_service.get_all.assert_called_once()
+        mock_task_service.find.return_value = [sample_task_read]
 
-    def test_search_delegates_and_filters_status(
-        self, task_application_service: TaskApplicationService, mock_unit_of_work: Mock, sample_task_read: TaskRead
-    ) -> None:
-        mock_task_service = mock_unit_of_work.service_factory.get_service.return_value
-        other = sample_task_read.model_copy(update={"id": uuid.uuid4(), "status": TaskStatus.COMPLETED})
-        mock_task_service.search_tasks.return_value = [sample_task_read, other]
-        mock_task_service.list_by_status.return_value = [sample_task_read]
+        result = task_application_service.search("", status=TaskStatus.TODO)
 
-        out = task_application_service.search("x", status=TaskStatus.TODO)
-        assert out == [sample_task_read]
-        mock_task_service.search_tasks.assert_called_once_with("x", with_details=False)
-        mock_task_service.list_by_status.assert_called_once_with(TaskStatus.TODO, with_details=False)
+        assert result == [sample_task_read]
+        spec = mock_task_service.find.call_args.args[0]
+        assert spec.text is None
+        assert spec.statuses == (TaskStatus.TODO,)
 
-    def test_search_filters_by_tags_using_repository(
+    def test_search_builds_single_spec(
         self, task_application_service: TaskApplicationService, mock_unit_of_work: Mock, sample_task_read: TaskRead
     ) -> None:
+        """正常系: すべての条件を 1 つの検索仕様にまとめて委譲する"""
         mock_task_service = mock_unit_of_work.service_factory.get_service.return_value
-        other = sample_task_read.model_copy(update={"id": uuid.uuid4()})
-        mock_task_service.search_tasks.return_value = [sample_task_read, other]
-
-        # TaskRepositoryモックでタグにマッチするのは sample_task_read のみ
-        task_repo_mock = Mock()
-        task_repo_mock.list_by_tag.return_value = [sample_task_read]
-        repo_factory_mock = Mock()
-        repo_factory_mock.create.return_value = task_repo_mock
-        mock_unit_of_work.repository_factory = repo_factory_mock
+        mock_task_service.find.return_value = [sample_task_read]
+        tag_id, project_id = uuid.uuid4(), uuid.uuid4()
+        due_from, due_to = date(2026, 1, 1), date(2026, 1, 31)
+
+        out = task_application_service.search(
+            "x",
+            with_details=True,
+            tags=[tag_id],
+            project_id=project_id,
+            due_from=due_from,
+            due_to=due_to,
+            sort="due_date",
+            limit=PAGE_LIMIT,
+            offset=PAGE_LIMIT,
+        )
 
-        out = task_application_service.search("x", tags=[uuid.uuid4()])
         assert out == [sample_task_read]
+        spec = mock_task_service.find.call_args.args[0]
+        assert spec.any_tags == (tag_id,)
+        assert spec.project_id == project_id
+        assert (spec.due_from, spec.due_to) == (due_from, due_to)
+        assert (spec.sort, spec.limit, spec.offset) == ("due_date", PAGE_LIMIT, PAGE_LIMIT)
+        assert mock_task_service.find.call_args.kwargs == {"with_details": True}
+
+    def test_search_invalid_due_range(self, task_application_service: TaskApplicationService) -> None:
+        """異常系: 期限日の下限が上限より後なら ValidationError"""
+        with pytest.raises(ValidationError):
+            task_application_service.search("", due_from=date(2026, 2, 1), due_to=date(2026, 1, 1))
@@ -1,5 +1,6 @@
 import uuid
 from datetime import date
+from typing import Protocol
 
 from models import Project, Tag, Task, TaskCreate, TaskStatus
 
@@ -99,3 +100,24 @@ def create_test_task_create(
         due_date=due_date,
         project_id=project_id,
     )
+
+
+class _HasId(Protocol):
+    @property
+    def id(self) -> uuid.UUID | None: ...
+
+
+def saved_ids(*entities: _HasId) -> list[uuid.UUID]:
+    """保存済みエンティティのIDを取得 (id が None でないことを確認して型を絞り込む)
+
+    Args:
+        *entities: 保存済みのエンティティ
+
+    Returns:
+        list[uuid.UUID]: 引数順のID一覧
+    """
+    ids: list[uuid.UUID] = []
+    for entity in entities:
+        assert entity.id is not None
+        ids.append(entity.id)
+    return ids
@@ -22,6 +22,11 @@
 - find/list API（必要に応じてTaskRepositoryの search_by_title / list_by_status を使用）:
     - 条件一致時: リストが返る
     - 条件不一致時: NotFoundError を送出
+- get_page（キーセットページング）:
+    - カーソルを辿ると全件を重複なく (created_at, id) 降順で取得できる
+    - 作成日時が同一でも id で順序が確定し、ページ境界で欠落しない
+    - データ0件のとき空のページを返す（NotFoundErrorではない）
+    - 不正なカーソル・ページサイズは ValidationError
 
 注記:
 - BaseRepository._gets_by_statement は0件時に NotFoundError を送出するため、
@@ -31,11 +36,13 @@
 """
 
 import uuid
+from datetime import datetime, timedelta
 
 import pytest
 from sqlmodel import Session
 
-from errors import NotFoundError, RepositoryError
+from errors import NotFoundError, RepositoryError, ValidationError
+from logic.repositories.query import QuerySpec
 from logic.repositories.task import TaskRepository
 from models import TaskStatus
 from tests.logic.helpers import create_test_task, create_test_task_create
@@ -222,3 +229,96 @@ class TestBaseRepository:
         # 5. 削除後確認
         with pytest.raises(NotFoundError):
             task_repository.get_by_id(created_task.id)
+
+
+class TestBaseRepositoryPagination:
+    """BaseRepository.get_page のキーセットページングをテストするクラス"""
+
+    PAGE_SIZE = 2
+    TOTAL = 5
+
+    def _seed(self, session: Session, *, same_timestamp: bool = False) -> list[uuid.UUID]:
+        # モデルはナイーブな datetime.now で作成日時を保持する
+        base = datetime(2025, 1, 1, 9, 0, 0)  # noqa: DTZ001
+        ids: list[uuid.UUID] = []
+        for i in range(self.TOTAL):
+            task = create_test_task(title=f"タスク{i}")
+            task.created_at = base if same_timestamp else base + timedelta(minutes=i)
+            session.add(task)
+            assert task.id is not None
+            ids.append(task.id)
+        session.commit()
+        return ids
+
+    def _walk(self, repo: TaskRepository, **kwargs: object) -> list[uuid.UUID]:
+        collected: list[uuid.UUID] = []
+        cursor: str | None = None
+        while True:
+            page = repo.get_page(page_size=self.PAGE_SIZE, cursor=cursor, **kwargs)  # type: ignore[arg-type]
+            assert len(page.items) <= self.PAGE_SIZE
+            collected.extend(t.id for t in page.items if t.id is not None)
+            if not page.has_next:
+                return collected
+            cursor = page.next_cursor
+
+    def test_walk_all_pages_descending(self, task_repository: TaskRepository, test_session: Session) -> None:
+        """正常系: カーソルを辿ると新しい順に全件を重複なく取得できる"""
+        ids = self._seed(test_session)
+
+        assert self._walk(task_repository) == list(reversed(ids))
+
+    def test_walk_all_pages_ascending(self, task_repository: TaskRepository, test_session: Session) -> None:
+        """正常系: 昇順指定で古い順に取得できる"""
+        ids = self._seed(test_session)
+
+        assert self._walk(task_repository, descending=False) == ids
+
+    def test_ties_are_broken_by_id(self, task_repository: TaskRepository, test_session: Session) -> None:
+        """正常系: 作成日時が同一でも id で順序が確定しページ境界で欠落しない"""
+        ids = self._seed(test_session, same_timestamp=True)
+
+        walked = self._walk(task_repository)
+
+        assert walked == sorted(ids, reverse=True)
+
+    def test_empty_page(self, task_repository: TaskRepository) -> None:
+        """正常系: データ0件のとき空のページを返す"""
+        page = task_repository.get_page(page_size=self.PAGE_SIZE)
+
+        assert page.items == []
+        assert page.has_next is False
+
+    def test_invalid_cursor(self, task_repository: TaskRepository) -> None:
+        """異常系: 不正なカーソルは ValidationError"""
+        with pytest.raises(ValidationError):
+            task_repository.get_page(cursor="not-a-cursor")
+
+    @pytest.mark.parametrize("page_size", [0, 501])
+    def test_invalid_page_size(self, task_repository: TaskRepository, page_size: int) -> None:
+        """異常系: 範囲外のページサイズは ValidationError"""
+        with pytest.raises(ValidationError):
+            task_repository.get_page(page_size=page_size)
+
+    def test_find_page_filters_and_walks(self, task_repository: TaskRepository, test_session: Session) -> None:
+        """正常系: find_page は条件で絞り込んだうえでカーソルを辿れる"""
+        ids = self._seed(test_session)
+        done = create_test_task(title="完了タスク", status=TaskStatus.COMPLETED)
+        test_session.add(done)
+        test_session.commit()
+        spec = QuerySpec().with_statuses(TaskStatus.TODO).order_by("created_at")
+
+        collected: list[uuid.UUID] = []
+        cursor: str | None = None
+        while True:
+            page = task_repository.find_page(spec, page_size=self.PAGE_SIZE, cursor=cursor)
+            collected.extend(t.id for t in page.items if t.id is not None)
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+
+        assert collected == list(reversed(ids))
+
+    def test_find_page_rejects_unpageable_sort(self, task_repository: TaskRepository) -> None:
+        """異常系: キーセットで扱えない並び順は ValidationError"""
+        with pytest.raises(ValidationError):
+            task_repository.find_page(QuerySpec().order_by("due_date"))
@@ -0,0 +1,106 @@
+"""エンティティ単位の変更イベントのテストケース
+
+テスト対象：
+- コミットしたメモ・タスクの作成・更新・削除が MemoChanged / TaskChanged として発行される
+- タスクの更新では更新前のステータスが分かる
+- ロールバックした変更は発行されず、テーブル単位の DataChanged はバージョンを進めた後に発行される
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from logic.events import ChangeKind, DataChanged, DomainEvent, MemoChanged, TaskChanged, get_event_bus
+from logic.repositories import DEFER_COMMIT_KEY, get_data_version
+from models import MemoCreate, MemoStatus, MemoUpdate, TaskCreate, TaskStatus, TaskUpdate
+from tests.logic.helpers import saved_ids
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from sqlmodel import Session
+
+    from logic.repositories.memo import MemoRepository
+    from logic.repositories.task import TaskRepository
+
+
+@pytest.fixture
+def received() -> Generator[list[DomainEvent], None, None]:
+    """テスト中に発行されたイベントを記録する"""
+    events: list[DomainEvent] = []
+    unsubscribe = get_event_bus().subscribe(DomainEvent, events.append)
+    yield events
+    unsubscribe()
+
+
+def _of_type[EventT: DomainEvent](events: list[DomainEvent], event_type: type[EventT]) -> list[EventT]:
+    return [event for event in events if isinstance(event, event_type)]
+
+
+def test_memo_lifecycle_is_published(memo_repository: MemoRepository, received: list[DomainEvent]) -> None:
+    """メモの作成・更新・削除がコミットごとに発行されることをテスト"""
+    [memo_id] = saved_ids(memo_repository.create(MemoCreate(title="メモ", content="本文")))
+    updated = memo_repository.update(memo_id, MemoUpdate(status=MemoStatus.ACTIVE))
+    memo_repository.delete(memo_id)
+
+    events = _of_type(received, MemoChanged)
+    assert [(event.memo_id, event.kind) for event in events] == [
+        (memo_id, ChangeKind.CREATED),
+        (memo_id, ChangeKind.UPDATED),
+        (memo_id, ChangeKind.DELETED),
+    ]
+    assert events[1].status == MemoStatus.ACTIVE
+    assert events[1].updated_at == updated.updated_at
+
+
+def test_task_status_change_has_previous_status(task_repository: TaskRepository, received: list[DomainEvent]) -> None:
+    """タスクのステータス変更で更新前のステータスが通知されることをテスト"""
+    [task_id] = saved_ids(task_repository.create(TaskCreate(title="タスク", status=TaskStatus.TODO)))
+    task_repository.update(task_id, TaskUpdate(status=TaskStatus.COMPLETED))
+    task_repository.update(task_id, TaskUpdate(title="タイトルだけ変更"))
+
+    events = _of_type(received, TaskChanged)
+    assert [event.kind for event in events] == [ChangeKind.CREATED, ChangeKind.UPDATED, ChangeKind.UPDATED]
+    assert events[1].status == TaskStatus.COMPLETED
+    assert events[1].previous_status == TaskStatus.TODO
+    assert events[1].status_changed
+    assert not events[2].status_changed
+
+
+def test_rollback_publishes_nothing_and_commit_merges_changes(
+    memo_repository: MemoRepository, test_session: Session, received: list[DomainEvent]
+) -> None:
+    """ロールバックした変更は発行されず、1 回のコミット内の変更は 1 件にまとまることをテスト"""
+    test_session.info[DEFER_COMMIT_KEY] = True
+
+    memo_repository.create(MemoCreate(title="取り消し", content="本文"))
+    test_session.rollback()
+    assert received == []
+
+    [memo_id] = saved_ids(memo_repository.create(MemoCreate(title="まとめる", content="本文")))
+    memo_repository.update(memo_id, MemoUpdate(status=MemoStatus.IDEA))
+    test_session.commit()
+
+    events = _of_type(received, MemoChanged)
+    assert [(event.kind, event.status) for event in events] == [(ChangeKind.CREATED, MemoStatus.IDEA)]
+    data_changed = _of_type(received, DataChanged)
+    assert [event.tables for event in data_changed] == [frozenset({"memos"})]
+
+
+def test_data_changed_is_published_after_version_bump(
+    memo_repository: MemoRepository, received: list[DomainEvent]
+) -> None:
+    """DataChanged を受け取った時点でデータバージョンが進んでいることをテスト"""
+    before = get_data_version(["memos"])
+    versions: list[int] = []
+    unsubscribe = get_event_bus().subscribe(DataChanged, lambda _event: versions.append(get_data_version(["memos"])))
+    try:
+        memo_repository.create(MemoCreate(title="メモ", content="本文"))
+    finally:
+        unsubscribe()
+
+    assert versions
+    assert versions[0] > before
+    assert _of_type(received, DataChanged)
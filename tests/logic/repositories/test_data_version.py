@@ -0,0 +1,67 @@
+"""テーブル単位のデータバージョンのテストケース
+
+テスト対象：
+- コミットした書き込み (作成・一括 DELETE) でバージョンが進む
+- ロールバックした書き込みと、他のテーブルへの書き込みではバージョンが変わらない
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from logic.repositories import DEFER_COMMIT_KEY, bump_data_version, get_data_version
+from models import MemoCreate, TagCreate
+from tests.logic.helpers import saved_ids
+
+if TYPE_CHECKING:
+    from sqlmodel import Session
+
+    from logic.repositories.memo import MemoRepository
+    from logic.repositories.tag import TagRepository
+
+
+def test_commit_bumps_written_table_only(
+    tag_repository: TagRepository, memo_repository: MemoRepository, test_session: Session
+) -> None:
+    """コミットした書き込みのテーブルだけバージョンが進むことをテスト"""
+    tags_before = get_data_version(["tags"])
+    memos_before = get_data_version(["memos"])
+    test_session.info[DEFER_COMMIT_KEY] = True
+
+    tag_repository.create(TagCreate(name="仕事"))
+    assert get_data_version(["tags"]) == tags_before
+    test_session.commit()
+
+    assert get_data_version(["tags"]) > tags_before
+    assert get_data_version(["memos"]) == memos_before
+
+    memo_repository.create(MemoCreate(title="メモ", content="本文"))
+    test_session.commit()
+
+    assert get_data_version(["memos"]) > memos_before
+
+
+def test_rollback_does_not_bump(tag_repository: TagRepository, test_session: Session) -> None:
+    """ロールバックした書き込みはバージョンを進めないことをテスト"""
+    before = get_data_version(["tags"])
+    test_session.info[DEFER_COMMIT_KEY] = True
+
+    tag_repository.create(TagCreate(name="取り消し"))
+    test_session.rollback()
+
+    assert get_data_version(["tags"]) == before
+
+
+def test_bulk_delete_and_manual_bump(tag_repository: TagRepository, test_session: Session) -> None:
+    """一括 DELETE と手動の bump でバージョンが進むことをテスト"""
+    tag_ids = saved_ids(tag_repository.create(TagCreate(name="削除対象")))
+    test_session.commit()
+    before = get_data_version(["tags"])
+
+    tag_repository.bulk_delete(tag_ids)
+    test_session.commit()
+    after_delete = get_data_version(["tags"])
+    bump_data_version(["tags"])
+
+    assert after_delete > before
+    assert get_data_version(["tags"]) == after_delete + 1
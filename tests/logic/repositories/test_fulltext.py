@@ -0,0 +1,168 @@
+"""全文検索 (FTS5 trigram) のテスト項目
+
+BaseRepository.search_fulltext と logic.repositories.fulltext を検証する。
+
+テスト項目:
+- FTS 索引あり:
+    - 日本語の部分一致で検索でき、関連度 (score) 順に並ぶ
+    - 一致箇所を [] で囲んだ snippet が返る
+    - 更新・削除がトリガーで索引へ反映される
+    - 空白区切りの語は AND 条件になる
+- フォールバック:
+    - 3 文字未満の語は LIKE 検索で見つかる
+    - 索引が未作成でも LIKE 検索で結果が返る
+- プロジェクト・用語の検索も索引で照合する (タイトル限定の列フィルタを含む)
+- build_match_query: 引用符のエスケープ、列フィルタ、短い語は None
+- 全文検索非対応のリポジトリは ValidationError
+"""
+
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from errors import ValidationError
+from logic.repositories.fulltext import SNIPPET_CLOSE, SNIPPET_OPEN, build_match_query, ensure_fts_schema
+from logic.repositories.memo import MemoRepository
+from logic.repositories.project import ProjectRepository
+from logic.repositories.tag import TagRepository
+from logic.repositories.task import TaskRepository
+from logic.repositories.term import TermRepository
+from models import MemoCreate, MemoUpdate, ProjectCreate, TermCreate
+from tests.logic.helpers import create_test_task_create
+
+
+@pytest.fixture
+def fts_session(test_engine: Engine) -> Generator[Session, None, None]:
+    ensure_fts_schema(test_engine)
+    with Session(test_engine) as session:
+        yield session
+
+
+class TestSearchFulltext:
+    """FTS 索引を使った検索のテストクラス"""
+
+    def test_ranked_japanese_substring(self, fts_session: Session) -> None:
+        """正常系: 日本語の部分一致で検索でき、一致の多いメモが上位に来る"""
+        repo = MemoRepository(fts_session)
+        weak = repo.create(MemoCreate(title="買い物メモ", content="週末に予算を確認する"))
+        strong = repo.create(MemoCreate(title="予算会議", content="予算の見直しと予算案の作成"))
+        repo.create(MemoCreate(title="無関係", content="天気がよい"))
+
+        hits = repo.search_fulltext("予算")  # 2 文字 -> フォールバック
+        assert {h.item.id for h in hits} == {weak.id, strong.id}
+
+        hits = repo.search_fulltext("予算の見直し")
+        assert [h.item.id for h in hits] == [strong.id]
+        assert hits[0].score > 0
+
+        hits = repo.search_fulltext("予算を確認")
+        assert [h.item.id for h in hits] == [weak.id]
+
+    def test_snippet_highlights_match(self, fts_session: Session) -> None:
+        """正常系: snippet に一致箇所のマーカーが含まれる"""
+        repo = MemoRepository(fts_session)
+        repo.create(MemoCreate(title="議事録", content="来週のプロジェクト会議で予算について議論する"))
+
+        hits = repo.search_fulltext("予算について")
+
+        assert len(hits) == 1
+        assert f"{SNIPPET_OPEN}予算について{SNIPPET_CLOSE}" in hits[0].snippet
+
+    def test_triggers_keep_index_in_sync(self, fts_session: Session) -> None:
+        """正常系: 更新・削除がトリガーで索引へ反映される"""
+        repo = MemoRepository(fts_session)
+        memo = repo.create(MemoCreate(title="旧タイトル", content="古い内容です"))
+        assert memo.id is not None
+
+        repo.update(memo.id, MemoUpdate(content="新しい本文です"))
+        assert repo.search_fulltext("古い内容") == []
+        assert [h.item.id for h in repo.search_fulltext("新しい本文")] == [memo.id]
+
+        repo.delete(memo.id)
+        assert repo.search_fulltext("新しい本文") == []
+
+    def test_multiple_terms_are_and(self, fts_session: Session) -> None:
+        """正常系: 空白区切りの語はすべて含むものだけが一致する"""
+        repo = TaskRepository(fts_session)
+        both = repo.create(create_test_task_create(title="Write docs", description="user guide"))
+        repo.create(create_test_task_create(title="Write code", description="backend"))
+
+        hits = repo.search_fulltext("write guide")
+
+        assert [h.item.id for h in hits] == [both.id]
+
+    def test_case_insensitive(self, fts_session: Session) -> None:
+        """正常系: 英字は大文字小文字を区別しない"""
+        repo = TaskRepository(fts_session)
+        task = repo.create(create_test_task_create(title="Python Project"))
+
+        assert [h.item.id for h in repo.search_fulltext("PYTHON")] == [task.id]
+
+
+class TestEntitySearchUsesIndex:
+    """プロジェクト・用語の検索が索引を使うことのテストクラス"""
+
+    def test_project_search_by_title_matches_title_only(self, fts_session: Session) -> None:
+        """正常系: タイトルだけを照合し、説明にだけ含まれる語では一致しない"""
+        repo = ProjectRepository(fts_session)
+        project = repo.create(ProjectCreate(title="Website Renewal", description="design"))
+        repo.create(ProjectCreate(title="Other", description="website design"))
+
+        assert [p.id for p in repo.search_by_title("WEBSITE")] == [project.id]
+        assert [p.id for p in repo.search_by_title("We")] == [project.id]  # 2 文字 -> LIKE
+
+    def test_term_search_matches_indexed_columns_and_synonyms(self, fts_session: Session) -> None:
+        """正常系: キー・タイトル・説明は索引、同義語は LIKE で照合する"""
+        repo = TermRepository(fts_session)
+        by_description = repo.create(TermCreate(key="LLM", title="大規模言語モデル", description="Transformer ベース"))
+        by_synonym = repo.create(TermCreate(key="GPU", title="画像処理装置"))
+        assert by_synonym.id is not None
+        repo.add_synonym(by_synonym.id, "グラフィックスカード")
+
+        assert [t.id for t in repo.search("transformer")] == [by_description.id]
+        assert [t.id for t in repo.search("グラフィックス")] == [by_synonym.id]
+        assert repo.search("グラフィックス", include_synonyms=False) == []
+
+
+class TestSearchFulltextFallback:
+    """LIKE 検索へのフォールバックのテストクラス"""
+
+    def test_without_fts_schema(self, test_session: Session) -> None:
+        """正常系: 索引が未作成でも LIKE 検索で結果が返る"""
+        repo = MemoRepository(test_session)
+        memo = repo.create(MemoCreate(title="議事録", content="来週の会議で予算について議論する"))
+
+        hits = repo.search_fulltext("予算について", with_details=True)
+
+        assert [h.item.id for h in hits] == [memo.id]
+        assert hits[0].score == 0.0
+        assert f"{SNIPPET_OPEN}予算について{SNIPPET_CLOSE}" in hits[0].snippet
+
+    def test_blank_query_returns_empty(self, test_session: Session) -> None:
+        """正常系: 空白のみのクエリは空リスト"""
+        assert MemoRepository(test_session).search_fulltext("   ") == []
+
+    def test_repository_without_index(self, test_session: Session) -> None:
+        """異常系: 全文検索非対応のリポジトリは ValidationError"""
+        with pytest.raises(ValidationError):
+            TagRepository(test_session).search_fulltext("tag")
+
+
+class TestBuildMatchQuery:
+    """build_match_query のテストクラス"""
+
+    def test_quotes_each_term(self) -> None:
+        """正常系: 語ごとにフレーズ化し AND で結合する"""
+        assert build_match_query('foo "bar" OR') is None
+        assert build_match_query('foo "bar"') == '"foo" AND """bar"""'
+
+    def test_column_filter(self) -> None:
+        """正常系: 列を指定すると列フィルタで囲む"""
+        assert build_match_query("foo bar", ["title"]) == '{title} : ("foo" AND "bar")'
+
+    def test_short_term_returns_none(self) -> None:
+        """正常系: 3 文字未満の語を含む場合は None"""
+        assert build_match_query("予算") is None
+        assert build_match_query("") is None
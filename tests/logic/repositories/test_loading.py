@@ -0,0 +1,128 @@
+"""読み込みプロファイルのテストケース
+
+テスト対象：
+- プロファイルごとに発行される SQL の本数 (N+1 にならないこと)
+- プロファイルで読み込まなかった関連・列は読み取りモデルの既定値になること
+- 読み込まなかった関連へのアクセスは暗黙の遅延読み込みではなく例外になること
+"""
+
+from __future__ import annotations
+
+import uuid
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+
+from logic.repositories.loading import as_loaded
+from models import Memo, MemoRead, MemoStatus, Tag
+from tests.logic.helpers import create_test_task, saved_ids
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy import Engine
+    from sqlmodel import Session
+
+    from logic.repositories.memo import MemoRepository
+
+MEMO_COUNT = 3
+
+
+@contextmanager
+def _count_statements(engine: Engine) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def _on_execute(*args: Any) -> None:  # noqa: ANN401
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _on_execute)
+
+
+@pytest.fixture
+def seeded_memos(test_session: Session) -> list[uuid.UUID]:
+    """タグ 1 件・タスク 1 件 (タグ付き) を持つメモを作成する"""
+    memo_ids: list[uuid.UUID] = []
+    for index in range(MEMO_COUNT):
+        tag = Tag(id=uuid.uuid4(), name=f"タグ{index}")
+        memo = Memo(
+            id=uuid.uuid4(),
+            title=f"メモ{index}",
+            content=f"内容{index}",
+            status=MemoStatus.INBOX,
+            ai_analysis_log='{"tasks": []}',
+        )
+        memo.tags.append(tag)
+        task = create_test_task(title=f"タスク{index}")
+        task.memo_id = memo.id
+        task.tags.append(tag)
+        test_session.add_all([tag, memo, task])
+        memo_ids.extend(saved_ids(memo))
+    test_session.commit()
+    test_session.expunge_all()
+    return memo_ids
+
+
+@pytest.mark.usefixtures("seeded_memos")
+class TestMemoLoadProfiles:
+    """メモの読み込みプロファイルのテストクラス"""
+
+    def _load(self, repo: MemoRepository, engine: Engine, **kwargs: Any) -> tuple[list[MemoRead], int]:  # noqa: ANN401
+        with _count_statements(engine) as statements:
+            reads = [MemoRead.model_validate(as_loaded(memo)) for memo in repo.get_all(**kwargs)]
+        return reads, len(statements)
+
+    def test_list_profile_issues_single_statement(self, memo_repository: MemoRepository, test_engine: Engine) -> None:
+        """list は関連を読まず、AI 分析ログも読み込まないことをテスト"""
+        reads, count = self._load(memo_repository, test_engine, profile="list")
+
+        assert count == 1
+        assert len(reads) == MEMO_COUNT
+        assert all(read.tags == [] and read.tasks == [] for read in reads)
+        assert all(read.ai_analysis_log is None for read in reads)
+        assert all(read.content.startswith("内容") for read in reads)
+
+    def test_card_profile_loads_tags_only(self, memo_repository: MemoRepository, test_engine: Engine) -> None:
+        """card はタグだけを 1 本の追加クエリで読むことをテスト"""
+        reads, count = self._load(memo_repository, test_engine, profile="card")
+
+        assert count == 2  # noqa: PLR2004 - メモ + タグ
+        assert all(len(read.tags) == 1 and read.tasks == [] for read in reads)
+        assert all(read.ai_analysis_log is not None for read in reads)
+
+    def test_detail_profile_loads_nested_relations(self, memo_repository: MemoRepository, test_engine: Engine) -> None:
+        """detail はタスクのタグまで含めて関連ごとに 1 本のクエリで読むことをテスト"""
+        reads, count = self._load(memo_repository, test_engine, profile="detail")
+
+        assert count == 4  # noqa: PLR2004 - メモ + タグ + タスク + タスクのタグ
+        assert all(len(read.tasks) == 1 and len(read.tasks[0].tags) == 1 for read in reads)
+
+    def test_profiles_are_cheaper_than_lazy_loading(
+        self, memo_repository: MemoRepository, test_engine: Engine, test_session: Session
+    ) -> None:
+        """プロファイル指定なしの変換はメモごとに関連を読み込む (N+1) ことをテスト"""
+        _, lazy_count = self._load(memo_repository, test_engine)
+        test_session.expunge_all()
+        _, card_count = self._load(memo_repository, test_engine, profile="card")
+
+        assert lazy_count > MEMO_COUNT
+        assert card_count < lazy_count
+
+    def test_unloaded_relation_raises(self, memo_repository: MemoRepository) -> None:
+        """プロファイルで読み込まなかった関連へのアクセスは例外になることをテスト"""
+        memo = memo_repository.get_all(profile="card")[0]
+
+        assert len(memo.tags) == 1
+        with pytest.raises(InvalidRequestError):
+            _ = memo.tasks
+
+    def test_unknown_profile_raises(self, memo_repository: MemoRepository) -> None:
+        """存在しないプロファイル名は ValueError になることをテスト"""
+        with pytest.raises(ValueError, match="unknown"):
+            memo_repository.get_all(profile="unknown")  # type: ignore[arg-type]
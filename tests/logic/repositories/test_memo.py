@@ -7,14 +7,15 @@ from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 import pytest
+from sqlmodel import select
 
 if TYPE_CHECKING:  # 型チェック時のみインポート
     from sqlmodel import Session
 
 from errors import NotFoundError, RepositoryError
 from logic.repositories.memo import MemoRepository
-from models import Memo, MemoCreate, MemoStatus, MemoUpdate, Tag
-from tests.logic.helpers import create_test_task
+from models import Memo, MemoCreate, MemoStatus, MemoTagLink, MemoUpdate, Tag, Task
+from tests.logic.helpers import create_test_task, saved_ids
 
 EXPECTED_MEMO_PAIR_COUNT = 2
 
@@ -379,3 +380,26 @@ class TestMemoRepository:
 
         with pytest.raises(NotFoundError):
             memo_repo.search_by_title("見つからない")
+
+    def test_bulk_delete_detaches_tasks_and_tags(self, test_session: Session) -> None:
+        """一括削除で、ORM の削除と同じくタスクの memo_id が NULL になり、タグの関連も消えることを検証する"""
+        memo_repo = MemoRepository(test_session)
+        tag = Tag(id=uuid.uuid4(), name="重要")
+        memo = Memo(id=uuid.uuid4(), title="削除対象", content="", status=MemoStatus.INBOX)
+        task = create_test_task(title="メモ由来のタスク")
+        task.memo_id = memo.id
+        test_session.add_all([tag, memo, task])
+        test_session.commit()
+        memo_id, tag_id, task_id = saved_ids(memo, tag, task)
+        memo_repo.add_tag(memo_id, tag_id)
+
+        deleted = memo_repo.bulk_delete([memo_id])
+        test_session.commit()
+        test_session.expire_all()
+
+        assert deleted == 1
+        remaining = test_session.get(Task, task_id)
+        assert remaining is not None
+        assert remaining.memo_id is None
+        assert test_session.exec(select(MemoTagLink)).all() == []
+        assert test_session.get(Tag, tag_id) is not None
@@ -9,6 +9,7 @@
 - search_by_title: タイトル検索
 - get_active_projects: アクティブプロジェクト取得
 - get_completed_projects: 完了プロジェクト取得
+- list_task_rows: 複数プロジェクトのタスク行の一括取得
 """
 
 from __future__ import annotations
@@ -24,7 +25,7 @@ if TYPE_CHECKING:
     from logic.repositories.project import ProjectRepository
 
 from errors import NotFoundError, RepositoryError
-from models import Project, ProjectCreate, ProjectStatus, ProjectUpdate
+from models import Project, ProjectCreate, ProjectStatus, ProjectUpdate, TaskStatus
 from tests.logic.helpers import create_test_task
 
 
@@ -364,3 +365,39 @@ class TestProjectRepositoryRelations:
 
         # [AI GENERATED] Falseが返されることを確認
         assert result is False
+
+
+class TestProjectRepositoryListTaskRows:
+    """list_task_rowsメソッドのテストクラス"""
+
+    def test_returns_rows_for_requested_projects(
+        self, test_session: Session, project_repository: ProjectRepository, sample_projects: list[Project]
+    ) -> None:
+        """指定したプロジェクトのタスク行だけを (プロジェクトID, タスクID, タイトル, ステータス) で返すことをテスト"""
+        first, second, other = sample_projects[0], sample_projects[1], sample_projects[2]
+        tasks = [
+            create_test_task("A-1", project_id=first.id),
+            create_test_task("A-2", status=TaskStatus.COMPLETED, project_id=first.id),
+            create_test_task("B-1", project_id=second.id),
+            create_test_task("C-1", project_id=other.id),
+            create_test_task("no project"),
+        ]
+        test_session.add_all(tasks)
+        test_session.commit()
+
+        assert first.id is not None
+        assert second.id is not None
+        rows = project_repository.list_task_rows([first.id, second.id, first.id])
+
+        assert sorted((pid, title, status) for pid, _tid, title, status in rows) == sorted(
+            [
+                (first.id, "A-1", TaskStatus.TODO),
+                (first.id, "A-2", TaskStatus.COMPLETED),
+                (second.id, "B-1", TaskStatus.TODO),
+            ]
+        )
+        assert {tid for _pid, tid, _title, _status in rows} == {tasks[0].id, tasks[1].id, tasks[2].id}
+
+    def test_empty_ids_returns_empty(self, project_repository: ProjectRepository) -> None:
+        """空のID指定ではクエリを発行せず空配列を返すことをテスト"""
+        assert project_repository.list_task_rows([]) == []
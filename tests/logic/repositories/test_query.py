@@ -0,0 +1,156 @@
+"""検索条件の仕様 (QuerySpec) のテスト項目
+
+BaseRepository.find / count と logic.repositories.query を検証する。
+
+テスト項目:
+- 条件の組み合わせ:
+    - テキスト (FTS 索引あり・なし) とステータスの組み合わせ
+    - タグの OR 条件・AND 条件 (重複行が出ない)
+    - プロジェクト・期限日範囲での絞り込み
+- 並び順と件数:
+    - 並び順のキーと LIMIT/OFFSET が DB 側で適用される
+    - count は LIMIT/OFFSET を無視した件数を返す
+- 単一クエリ: find は SELECT を 1 回だけ発行する (タグ・テキスト条件込み)
+- 異常系:
+    - 対応していない列での絞り込みは ValidationError
+    - 期限日の範囲や件数が不正なら ValidationError
+"""
+
+from collections.abc import Generator
+from datetime import date
+
+import pytest
+from sqlalchemy import Engine, event
+from sqlmodel import Session
+
+from errors import ValidationError
+from logic.repositories.fulltext import ensure_fts_schema
+from logic.repositories.memo import MemoRepository
+from logic.repositories.project import ProjectRepository
+from logic.repositories.query import QuerySpec
+from logic.repositories.tag import TagRepository
+from logic.repositories.task import TaskRepository
+from models import MemoCreate, MemoStatus, ProjectCreate, TagCreate, TaskStatus
+from tests.logic.helpers import create_test_task_create, saved_ids
+
+TOTAL_TASKS = 5
+PAGE_SIZE = 2
+
+
+@pytest.fixture
+def fts_session(test_engine: Engine) -> Generator[Session, None, None]:
+    ensure_fts_schema(test_engine)
+    with Session(test_engine) as session:
+        yield session
+
+
+class TestQuerySpecFilters:
+    """条件の組み合わせのテストクラス"""
+
+    @pytest.mark.parametrize("use_fts", [True, False])
+    def test_text_and_status(self, test_engine: Engine, *, use_fts: bool) -> None:
+        """正常系: テキストとステータスを同時に満たすメモだけが返る (索引の有無に関わらず)"""
+        if use_fts:
+            ensure_fts_schema(test_engine)
+        with Session(test_engine) as session:
+            repo = MemoRepository(session)
+            inbox = repo.create(MemoCreate(title="定例会議の議事録", content="予算"))
+            archived = repo.create(MemoCreate(title="議事録まとめ", content="旧", status=MemoStatus.ARCHIVE))
+            repo.create(MemoCreate(title="買い物", content="牛乳"))
+
+            result = repo.find(QuerySpec().with_text("議事録").with_statuses(MemoStatus.INBOX))
+            assert [m.id for m in result] == [inbox.id]
+
+            result = repo.find(QuerySpec().with_text("議事録"))
+            assert {m.id for m in result} == {inbox.id, archived.id}
+
+    def test_tags_or_and(self, test_session: Session) -> None:
+        """正常系: any_tags は OR、all_tags は AND で評価され、重複行は出ない"""
+        repo = MemoRepository(test_session)
+        tag_repo = TagRepository(test_session)
+        tag_a, tag_b = saved_ids(tag_repo.create(TagCreate(name="A")), tag_repo.create(TagCreate(name="B")))
+        both, only_a = saved_ids(
+            repo.create(MemoCreate(title="both", content="")), repo.create(MemoCreate(title="only a", content=""))
+        )
+        repo.create(MemoCreate(title="none", content=""))
+        repo.add_tag(both, tag_a)
+        repo.add_tag(both, tag_b)
+        repo.add_tag(only_a, tag_a)
+
+        any_result = repo.find(QuerySpec().with_any_tags([tag_a, tag_b]))
+        all_result = repo.find(QuerySpec().with_all_tags([tag_a, tag_b]))
+
+        assert sorted(m.title for m in any_result) == ["both", "only a"]
+        assert [m.id for m in all_result] == [both]
+
+    def test_project_and_due_range(self, fts_session: Session) -> None:
+        """正常系: プロジェクトと期限日範囲で絞り込める"""
+        project = ProjectRepository(fts_session).create(ProjectCreate(title="P"))
+        repo = TaskRepository(fts_session)
+        in_range = repo.create(create_test_task_create(title="a", due_date=date(2026, 1, 10), project_id=project.id))
+        repo.create(create_test_task_create(title="b", due_date=date(2026, 2, 10), project_id=project.id))
+        repo.create(create_test_task_create(title="c", due_date=date(2026, 1, 10)))
+
+        spec = QuerySpec().with_project(project.id).with_due_range(date(2026, 1, 1), date(2026, 1, 31))
+
+        assert [t.id for t in repo.find(spec)] == [in_range.id]
+
+
+class TestQuerySpecOrdering:
+    """並び順と件数のテストクラス"""
+
+    def test_sort_limit_offset(self, test_session: Session) -> None:
+        """正常系: 並び順と LIMIT/OFFSET が DB 側で適用される"""
+        repo = TaskRepository(test_session)
+        for i in range(TOTAL_TASKS):
+            repo.create(create_test_task_create(title=f"task-{i}", due_date=date(2026, 1, i + 1)))
+
+        first = repo.find(QuerySpec().order_by("due_date", descending=False).paginate(PAGE_SIZE))
+        second = repo.find(QuerySpec().order_by("due_date", descending=False).paginate(PAGE_SIZE, PAGE_SIZE))
+
+        assert [t.title for t in first] == ["task-0", "task-1"]
+        assert [t.title for t in second] == ["task-2", "task-3"]
+        assert repo.count(QuerySpec().paginate(PAGE_SIZE)) == TOTAL_TASKS
+
+    def test_single_select_statement(self, fts_session: Session, test_engine: Engine) -> None:
+        """正常系: テキスト・ステータス・タグ条件込みでも SELECT は 1 回だけ"""
+        repo = TaskRepository(fts_session)
+        tag_id, task_id = saved_ids(
+            TagRepository(fts_session).create(TagCreate(name="tag")),
+            repo.create(create_test_task_create(title="Write documentation")),
+        )
+        repo.add_tag(task_id, tag_id)
+
+        statements: list[str] = []
+
+        def _record(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        spec = QuerySpec().with_text("documentation").with_statuses(TaskStatus.TODO).with_any_tags([tag_id])
+        repo.find(spec)  # 索引の有無の確認はエンジンごとに初回のみ
+        event.listen(test_engine, "before_cursor_execute", _record)
+        try:
+            result = repo.find(spec)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _record)
+
+        assert [t.id for t in result] == [task_id]
+        assert len(statements) == 1
+        assert "MATCH" in statements[0]
+
+
+class TestQuerySpecValidation:
+    """不正な条件のテストクラス"""
+
+    def test_unsupported_column(self, test_session: Session) -> None:
+        """異常系: メモは期限日を持たないため ValidationError"""
+        with pytest.raises(ValidationError):
+            MemoRepository(test_session).find(QuerySpec().with_due_range(due_to=date(2026, 1, 1)))
+
+    def test_invalid_ranges(self) -> None:
+        """異常系: 期限日の範囲や件数が不正なら ValidationError"""
+        with pytest.raises(ValidationError):
+            QuerySpec().with_due_range(date(2026, 2, 1), date(2026, 1, 1))
+        with pytest.raises(ValidationError):
+            QuerySpec().paginate(-1)
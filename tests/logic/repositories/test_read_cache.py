@@ -0,0 +1,151 @@
+"""読み取りキャッシュ (タグ・プロジェクト) のテストケース
+
+テスト対象：
+- リードスルー: 初回のみ DB から読み込み、以降はスナップショットから応答する
+- 無効化: リポジトリ経由の作成・更新、一括 DELETE でバージョンが進み、最新の内容を返す
+- 未コミットの書き込みを含むセッションではキャッシュを使わない
+- 読み込み中に無効化されたスナップショットは共有しない
+- get_entity: セッションに取り込んだエンティティを関連付けに使える
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from errors import NotFoundError
+from logic.repositories import DEFER_COMMIT_KEY
+from logic.repositories.read_cache import PROJECT_READ_CACHE, TAG_READ_CACHE, get_read_cache_stats
+from models import MemoCreate, ProjectCreate, TagCreate, TagRead, TagUpdate
+from tests.logic.helpers import saved_ids
+
+if TYPE_CHECKING:
+    from sqlmodel import Session
+
+    from logic.repositories.memo import MemoRepository
+    from logic.repositories.project import ProjectRepository
+    from logic.repositories.tag import TagRepository
+
+
+class TestTagReadCache:
+    """タグの読み取りキャッシュのテストクラス"""
+
+    def test_second_read_is_served_from_snapshot(self, tag_repository: TagRepository, test_session: Session) -> None:
+        """2 回目以降の参照は DB を読まずにヒットとして数えられることをテスト"""
+        tag_repository.create(TagCreate(name="仕事"))
+        test_session.commit()
+
+        before = TAG_READ_CACHE.stats()
+        first = tag_repository.list_reads()
+        second = tag_repository.list_reads()
+        after = TAG_READ_CACHE.stats()
+
+        assert [tag.name for tag in first] == ["仕事"]
+        assert second == first
+        assert isinstance(first[0], TagRead)
+        assert after.loads - before.loads == 1
+        assert after.hits - before.hits == 1
+
+    def test_write_invalidates_snapshot(self, tag_repository: TagRepository, test_session: Session) -> None:
+        """作成・更新後の参照には最新の内容が反映されることをテスト"""
+        [created] = saved_ids(tag_repository.create(TagCreate(name="仕事")))
+        test_session.commit()
+        assert tag_repository.get_read(created).name == "仕事"
+        version = TAG_READ_CACHE.version
+
+        tag_repository.update(created, TagUpdate(name="個人"))
+        test_session.commit()
+
+        assert TAG_READ_CACHE.version > version
+        assert tag_repository.get_read(created).name == "個人"
+        assert tag_repository.get_by_name("個人").id == created
+        with pytest.raises(NotFoundError):
+            tag_repository.get_by_name("仕事")
+
+    def test_bulk_delete_invalidates_snapshot(self, tag_repository: TagRepository, test_session: Session) -> None:
+        """一括 DELETE でもキャッシュが無効化されることをテスト"""
+        [created] = saved_ids(tag_repository.create(TagCreate(name="削除対象")))
+        test_session.commit()
+        assert tag_repository.get_read(created).name == "削除対象"
+
+        tag_repository.bulk_delete([created])
+        test_session.commit()
+
+        with pytest.raises(NotFoundError):
+            tag_repository.get_read(created)
+
+    def test_snapshot_loaded_during_write_is_not_shared(
+        self, tag_repository: TagRepository, test_session: Session, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """読み込み中に無効化された場合、読み込んだ内容は共有されず次回読み直されることをテスト"""
+        tag_repository.create(TagCreate(name="仕事"))
+        test_session.commit()
+        read_rows = TAG_READ_CACHE._read_rows
+
+        def _read_rows_racing_with_write(session: Session) -> tuple[dict, dict]:
+            rows = read_rows(session)
+            TAG_READ_CACHE.invalidate()
+            return rows
+
+        monkeypatch.setattr(TAG_READ_CACHE, "_read_rows", _read_rows_racing_with_write)
+        assert [tag.name for tag in tag_repository.list_reads()] == ["仕事"]
+        monkeypatch.undo()
+
+        before = TAG_READ_CACHE.stats()
+        tag_repository.list_reads()
+        assert TAG_READ_CACHE.stats().loads - before.loads == 1
+
+    def test_pending_session_bypasses_cache(self, tag_repository: TagRepository, test_session: Session) -> None:
+        """未コミットの書き込みがあるセッションは自分の変更を DB から読むことをテスト"""
+        tag_repository.create(TagCreate(name="既存"))
+        test_session.commit()
+        assert [tag.name for tag in tag_repository.list_reads()] == ["既存"]
+
+        test_session.info[DEFER_COMMIT_KEY] = True
+        tag_repository.create(TagCreate(name="追加"))
+
+        assert [tag.name for tag in tag_repository.list_reads()] == ["既存", "追加"]
+        assert tag_repository.get_by_name("追加").name == "追加"
+
+    def test_cached_entity_can_be_linked(
+        self, tag_repository: TagRepository, memo_repository: MemoRepository, test_session: Session
+    ) -> None:
+        """キャッシュから取り込んだタグをメモへ関連付けられることをテスト"""
+        tag_id, memo_id = saved_ids(
+            tag_repository.create(TagCreate(name="仕事")),
+            memo_repository.create(MemoCreate(title="メモ", content="内容")),
+        )
+        test_session.commit()
+        tag_repository.list_reads()
+        test_session.expunge_all()
+
+        updated = memo_repository.add_tag(memo_id, tag_id)
+
+        assert [t.id for t in updated.tags] == [tag_id]
+
+
+class TestProjectReadCache:
+    """プロジェクトの読み取りキャッシュのテストクラス"""
+
+    def test_check_exists_uses_cache(self, project_repository: ProjectRepository, test_session: Session) -> None:
+        """check_exists がキャッシュから応答し、存在しない場合は NotFoundError を送出することをテスト"""
+        [created] = saved_ids(project_repository.create(ProjectCreate(title="プロジェクト")))
+        test_session.commit()
+        project_repository.check_exists(created)
+
+        before = PROJECT_READ_CACHE.stats()
+        assert project_repository.check_exists(created).title == "プロジェクト"
+        assert PROJECT_READ_CACHE.stats().hits - before.hits == 1
+
+        project_repository.delete(created)
+        with pytest.raises(NotFoundError):
+            project_repository.check_exists(created)
+
+
+def test_get_read_cache_stats_lists_all_caches() -> None:
+    """監視用のカウンタが全キャッシュ分取得できることをテスト"""
+    stats = {entry.name: entry for entry in get_read_cache_stats()}
+
+    assert set(stats) == {"tags", "projects"}
+    assert 0.0 <= stats["tags"].hit_rate <= 1.0
@@ -6,6 +6,7 @@
 - list_by_project: プロジェクトIDによるタスク一覧
 - list_by_status: ステータス別タスク一覧
 - search_by_title: タイトル検索
+- bulk_create / bulk_update_status / bulk_delete / bulk_link_tags: 一括操作
 
 注意：
 - BaseRepository方針により、該当データがない場合は NotFoundError を送出する
@@ -15,11 +16,12 @@ import uuid
 from datetime import date, datetime, timedelta
 
 import pytest
-from sqlmodel import Session
+from sqlmodel import Session, select
 
-from errors import NotFoundError
+from errors import NotFoundError, ValidationError
+from logic.repositories.tag import TagRepository
 from logic.repositories.task import TaskRepository
-from models import Tag, Task, TaskStatus
+from models import Tag, Task, TaskCreate, TaskStatus, TaskTagLink
 
 
 def create_test_task(
@@ -306,3 +308,65 @@ class TestTaskRepository:
         res = task_repository.search_by_description("doc", with_details=True)
         assert len(res) == 1
         assert res[0].title == "D"
+
+
+class TestTaskRepositoryBulkOperations:
+    """一括操作 (bulk_*) のテストクラス"""
+
+    def test_bulk_create_assigns_ids_without_commit(
+        self, task_repository: TaskRepository, test_session: Session
+    ) -> None:
+        """1 回のフラッシュで作成し、コミットは呼び出し側に委ねる"""
+        created = task_repository.bulk_create(
+            [TaskCreate(title="a", status=TaskStatus.DRAFT), TaskCreate(title="b", status=TaskStatus.DRAFT)]
+        )
+
+        assert [t.title for t in created] == ["a", "b"]
+        assert all(t.id is not None and t.tags == [] for t in created)
+        test_session.rollback()
+        assert task_repository.get_by_ids([t.id for t in created if t.id is not None]) == []
+
+    def test_bulk_update_status_and_get_by_ids(self, task_repository: TaskRepository, test_session: Session) -> None:
+        """指定したタスクだけステータスを更新し、get_by_ids は指定順で返す"""
+        tasks = [create_test_task(title=f"t{i}", status=TaskStatus.DRAFT) for i in range(3)]
+        test_session.add_all(tasks)
+        test_session.commit()
+        ids = [t.id for t in tasks if t.id is not None]
+
+        updated = task_repository.bulk_update_status(ids[:2], TaskStatus.TODO)
+        test_session.commit()
+
+        assert updated == len(ids[:2])
+        reloaded = task_repository.get_by_ids([ids[2], ids[0], ids[1], uuid.uuid4()])
+        assert [(t.title, t.status) for t in reloaded] == [
+            ("t2", TaskStatus.DRAFT),
+            ("t0", TaskStatus.TODO),
+            ("t1", TaskStatus.TODO),
+        ]
+
+    def test_bulk_link_tags_skips_existing_and_bulk_delete_removes_links(
+        self, task_repository: TaskRepository, test_session: Session
+    ) -> None:
+        """既存の関連はスキップして追加し、一括削除でタグの関連も消える"""
+        tags = [Tag(name="x"), Tag(name="y")]
+        tasks = [create_test_task(title="a"), create_test_task(title="b")]
+        test_session.add_all([*tags, *tasks])
+        test_session.commit()
+        task_ids = [t.id for t in tasks if t.id is not None]
+        tag_ids = [t.id for t in tags if t.id is not None]
+        task_repository.add_tag(task_ids[0], tag_ids[0])
+
+        linked = task_repository.bulk_link_tags(task_ids, tag_ids)
+        test_session.commit()
+
+        assert linked == len(task_ids) * len(tag_ids) - 1
+        deleted = task_repository.bulk_delete(task_ids)
+        test_session.commit()
+        assert deleted == len(task_ids)
+        assert test_session.exec(select(TaskTagLink)).all() == []
+        assert len(test_session.exec(select(Tag)).all()) == len(tags)
+
+    def test_bulk_update_status_requires_status_column(self, tag_repository: TagRepository) -> None:
+        """ステータスを持たないエンティティは ValidationError"""
+        with pytest.raises(ValidationError):
+            tag_repository.bulk_update_status([uuid.uuid4()], TaskStatus.TODO)
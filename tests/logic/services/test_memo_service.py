@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import uuid
+from typing import TYPE_CHECKING
 
 import pytest
 
 from errors import NotFoundError, RepositoryError
+from logic.repositories import SearchHit
 from logic.services.base import MyBaseError
 from logic.services.memo_service import MemoService, MemoServiceError
 from models import Memo, MemoCreate, MemoRead, MemoStatus
 
+if TYPE_CHECKING:
+    from logic.repositories import MemoRepository
+
 
 class DummyMemoRepo:
     def __init__(self) -> None:
@@ -24,14 +29,14 @@ class DummyMemoRepo:
     def link_tag(self, memo_id: uuid.UUID, tag_id: uuid.UUID) -> None:
         self.tag_links.setdefault(tag_id, set()).add(memo_id)
 
-    def get_by_id(self, memo_id: uuid.UUID, *, with_details: bool = False) -> Memo:
+    def get_by_id(self, memo_id: uuid.UUID, *, with_details: bool = False, profile: str | None = None) -> Memo:
         m = self.storage.get(memo_id)
         if m is None:
             msg = "memo not found"
             raise NotFoundError(msg)
         return m
 
-    def get_all(self, *, with_details: bool = False) -> list[Memo]:
+    def get_all(self, *, with_details: bool = False, profile: str | None = None) -> list[Memo]:
         if not self.storage:
             msg = "no memos"
             raise NotFoundError(msg)
@@ -40,7 +45,9 @@ class DummyMemoRepo:
     def delete(self, memo_id: uuid.UUID) -> bool:
         return bool(self.storage.pop(memo_id, None))
 
-    def list_by_status(self, status: MemoStatus, *, with_details: bool = False) -> list[Memo]:
+    def list_by_status(
+        self, status: MemoStatus, *, with_details: bool = False, profile: str | None = None
+    ) -> list[Memo]:
         """指定ステータスのメモ一覧を返すダミー実装。
 
         Dummy では単純フィルタのみ。該当がなければ NotFoundError を送出する。
@@ -63,7 +70,13 @@ class DummyMemoRepo:
     def search_by_content(self, query: str, *, with_details: bool = False) -> list[Memo]:
         return [memo for memo in self.storage.values() if query in memo.content]
 
-    def list_by_tag(self, tag_id: uuid.UUID, *, with_details: bool = False) -> list[Memo]:
+    def search_fulltext(
+        self, query: str, *, limit: int | None = None, with_details: bool = False
+    ) -> list[SearchHit[Memo]]:
+        matched = [memo for memo in self.storage.values() if query in memo.title or query in memo.content]
+        return [SearchHit(item=memo, score=0.0, snippet=memo.content) for memo in matched[:limit]]
+
+    def list_by_tag(self, tag_id: uuid.UUID, *, with_details: bool = False, profile: str | None = None) -> list[Memo]:
         memo_ids = self.tag_links.get(tag_id)
         if not memo_ids:
             msg = "no memos with tag"
@@ -231,3 +244,18 @@ def test_add_task_returns_read_model(memo_service: MemoService) -> None:
 
     result = memo_service.add_task(memo.id, uuid.uuid4())
     assert isinstance(result, MemoRead)
+
+
+def test_get_page_converts_to_read_model(memo_repository: MemoRepository) -> None:
+    for i in range(3):
+        memo_repository.create(MemoCreate(title=f"m{i}", content="c"))
+    service = MemoService(memo_repo=memo_repository)
+
+    first = service.get_page(page_size=2)
+    assert all(isinstance(m, MemoRead) for m in first.items)
+    assert first.has_next
+
+    second = service.get_page(page_size=2, cursor=first.next_cursor)
+    assert len(second.items) == 1
+    assert not second.has_next
+    assert {m.id for m in first.items}.isdisjoint({m.id for m in second.items})
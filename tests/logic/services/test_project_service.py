@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import uuid
+from typing import TYPE_CHECKING
 
 import pytest
+from sqlalchemy import event
 
 from errors import NotFoundError, RepositoryError
+from logic.repositories.project import ProjectRepository
+from logic.repositories.task import TaskRepository
 from logic.services.project_service import ProjectService, ProjectServiceError
 from models import Project, ProjectCreate, ProjectRead, ProjectStatus, ProjectUpdate, Task, TaskStatus
+from tests.logic.helpers import create_test_task_create, saved_ids
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+    from sqlmodel import Session
 
 
 class DummyProjectRepo:
@@ -221,3 +230,54 @@ def test_search_projects() -> None:
     assert isinstance(res, list)
     assert len(res) == 1
     assert res[0].title == "Alpha"
+
+
+def test_get_summaries_uses_single_query(test_session: Session, test_engine: Engine) -> None:
+    """正常系: プロジェクト数に関わらず 1 回のクエリで件数・完了数・タスク行を返す"""
+    project_repo = ProjectRepository(test_session)
+    task_repo = TaskRepository(test_session)
+    projects = [project_repo.create(ProjectCreate(title=f"P{i}")) for i in range(3)]
+    project_ids = [p.id for p in projects if p.id is not None]
+    first, second, empty = project_ids
+    task_repo.create(create_test_task_create(title="done", status=TaskStatus.COMPLETED, project_id=first))
+    task_repo.create(create_test_task_create(title="todo", project_id=first))
+    task_repo.create(create_test_task_create(title="other", project_id=second))
+    service = ProjectService(project_repo=project_repo)
+
+    statements: list[str] = []
+
+    def _record(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", _record)
+    try:
+        summaries = service.get_summaries(project_ids)
+    finally:
+        event.remove(test_engine, "before_cursor_execute", _record)
+
+    assert len(statements) == 1
+    assert list(summaries) == project_ids
+    assert (summaries[first].task_count, summaries[first].completed_count) == (2, 1)
+    assert [t.title for t in summaries[second].tasks] == ["other"]
+    assert (summaries[empty].task_count, summaries[empty].task_ids) == (0, [])
+
+
+def test_sync_tasks_assigns_and_unassigns_in_bulk(test_session: Session) -> None:
+    """正常系: 差分のタスクだけを追加・解除し、存在しないタスクは NotFoundError"""
+    project_repo = ProjectRepository(test_session)
+    task_repo = TaskRepository(test_session)
+    project = project_repo.create(ProjectCreate(title="P"))
+    assert project.id is not None
+    keep, drop, add = saved_ids(*(task_repo.create(create_test_task_create(title=t)) for t in ("keep", "drop", "add")))
+    service = ProjectService(project_repo=project_repo)
+    service.sync_tasks(project.id, [keep, drop])
+    test_session.commit()
+
+    added, removed = service.sync_tasks(project.id, [keep, add, add])
+    test_session.commit()
+
+    assert (added, removed) == (1, 1)
+    titles = {t.title for t in service.get_summaries([project.id])[project.id].tasks}
+    assert titles == {"keep", "add"}
+    with pytest.raises(NotFoundError):
+        service.sync_tasks(project.id, [uuid.uuid4()])
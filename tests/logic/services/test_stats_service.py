@@ -0,0 +1,152 @@
+"""StatsService のテスト項目
+
+実DB (インメモリ SQLite) のリポジトリを使い、GROUP BY 集計の結果を検証する。
+
+テスト項目:
+- タスクのステータス別件数と期限超過件数 (OVERDUE ステータス + 期限日超過の未完了)
+- プロジェクト別・ステータス別のタスク件数
+- メモのステータス別・AI提案状態別の件数
+- タグの利用件数 (多い順、未使用タグは 0 件)
+- 空の DB では 0 件の統計を返す (NotFoundError にならない)
+- 集計は一覧を読み込まず、ステータス件数に依存しない SELECT 回数で完結する
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import event
+
+from logic.repositories import RepositoryFactory
+from logic.repositories.memo import MemoRepository
+from logic.repositories.project import ProjectRepository
+from logic.repositories.tag import TagRepository
+from logic.repositories.task import TaskRepository
+from logic.services.stats_service import StatsService
+from models import AiSuggestionStatus, MemoCreate, MemoStatus, ProjectCreate, ProjectStatus, TagCreate, TaskStatus
+from tests.logic.helpers import create_test_task_create, saved_ids
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+    from sqlmodel import Session
+
+TODAY = date(2026, 1, 15)
+DASHBOARD_QUERY_COUNT = 4
+
+
+@pytest.fixture
+def stats_service(test_session: Session) -> StatsService:
+    return StatsService.build_service(RepositoryFactory(test_session))
+
+
+def test_task_stats_counts_status_and_overdue(test_session: Session, stats_service: StatsService) -> None:
+    """正常系: ステータス別件数と期限超過件数を返す"""
+    repo = TaskRepository(test_session)
+    yesterday = TODAY - timedelta(days=1)
+    repo.create(create_test_task_create(status=TaskStatus.TODAYS))
+    repo.create(create_test_task_create(status=TaskStatus.TODAYS, due_date=yesterday))
+    repo.create(create_test_task_create(status=TaskStatus.COMPLETED, due_date=yesterday))
+    repo.create(create_test_task_create(status=TaskStatus.OVERDUE))
+    repo.create(create_test_task_create(status=TaskStatus.TODO, due_date=TODAY))
+
+    stats = stats_service.get_task_stats(TODAY)
+
+    assert stats.by_status == {
+        TaskStatus.TODAYS: 2,
+        TaskStatus.COMPLETED: 1,
+        TaskStatus.OVERDUE: 1,
+        TaskStatus.TODO: 1,
+    }
+    assert stats.count(TaskStatus.COMPLETED, TaskStatus.WAITING) == 1
+    # OVERDUE ステータス 1 件 + 期限日超過の未完了 1 件 (完了済み・当日期限は除外)
+    assert (stats.total, stats.overdue) == (5, 2)
+
+
+def test_project_task_stats(test_session: Session, stats_service: StatsService) -> None:
+    """正常系: プロジェクトごとに総数と完了数を返す"""
+    project_repo = ProjectRepository(test_session)
+    p1, p2 = saved_ids(project_repo.create(ProjectCreate(title="P1")), project_repo.create(ProjectCreate(title="P2")))
+    task_repo = TaskRepository(test_session)
+    task_repo.create(create_test_task_create(project_id=p1, status=TaskStatus.COMPLETED))
+    task_repo.create(create_test_task_create(project_id=p1, status=TaskStatus.TODO))
+    task_repo.create(create_test_task_create(project_id=p2, status=TaskStatus.TODO))
+    task_repo.create(create_test_task_create())
+
+    all_stats = stats_service.get_project_task_stats()
+    only_p2 = stats_service.get_project_task_stats([p2])
+
+    assert set(all_stats) == {p1, p2}
+    assert (all_stats[p1].total, all_stats[p1].completed) == (2, 1)
+    assert list(only_p2) == [p2]
+    assert only_p2[p2].completed == 0
+
+
+def test_memo_stats(test_session: Session, stats_service: StatsService) -> None:
+    """正常系: ステータス別・AI提案状態別の件数を返す"""
+    repo = MemoRepository(test_session)
+    repo.create(MemoCreate(title="a", content=""))
+    repo.create(MemoCreate(title="b", content="", ai_suggestion_status=AiSuggestionStatus.AVAILABLE))
+    repo.create(MemoCreate(title="c", content="", status=MemoStatus.ARCHIVE))
+
+    stats = stats_service.get_memo_stats()
+
+    assert stats.by_status == {MemoStatus.INBOX: 2, MemoStatus.ARCHIVE: 1}
+    assert stats.by_ai_status == {AiSuggestionStatus.NOT_REQUESTED: 2, AiSuggestionStatus.AVAILABLE: 1}
+    assert (stats.count(MemoStatus.INBOX, MemoStatus.ACTIVE), stats.total) == (2, 3)
+
+
+def test_tag_usage(test_session: Session, stats_service: StatsService) -> None:
+    """正常系: タグの利用件数を多い順に返し、未使用タグは 0 件"""
+    tag_repo = TagRepository(test_session)
+    [popular] = saved_ids(tag_repo.create(TagCreate(name="popular")))
+    tag_repo.create(TagCreate(name="unused"))
+    [memo] = saved_ids(MemoRepository(test_session).create(MemoCreate(title="m", content="")))
+    task_repo = TaskRepository(test_session)
+    t1, t2 = saved_ids(task_repo.create(create_test_task_create()), task_repo.create(create_test_task_create()))
+    MemoRepository(test_session).add_tag(memo, popular)
+    task_repo.add_tag(t1, popular)
+    task_repo.add_tag(t2, popular)
+
+    usage = stats_service.get_tag_usage()
+
+    assert [(u.name, u.memo_count, u.task_count) for u in usage] == [("popular", 1, 2), ("unused", 0, 0)]
+    assert [u.name for u in stats_service.get_tag_usage(limit=1)] == ["popular"]
+
+
+def test_empty_database(stats_service: StatsService) -> None:
+    """正常系: データがなくても 0 件の統計を返す"""
+    stats = stats_service.get_dashboard_stats(TODAY)
+
+    assert stats.tasks.total == 0
+    assert stats.tasks.overdue == 0
+    assert stats.memos.total == 0
+    assert stats.projects_by_status == {}
+    assert stats_service.get_tag_usage() == []
+
+
+def test_dashboard_uses_fixed_number_of_queries(
+    test_session: Session, test_engine: Engine, stats_service: StatsService
+) -> None:
+    """正常系: 件数に関わらず集計クエリの回数は一定"""
+    task_repo = TaskRepository(test_session)
+    for status in TaskStatus:
+        task_repo.create(create_test_task_create(status=status))
+    ProjectRepository(test_session).create(ProjectCreate(title="P"))
+
+    statements: list[str] = []
+
+    def _record(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", _record)
+    try:
+        stats = stats_service.get_dashboard_stats(TODAY)
+    finally:
+        event.remove(test_engine, "before_cursor_execute", _record)
+
+    assert stats.tasks.total == len(TaskStatus)
+    assert stats.projects_by_status == {ProjectStatus.ACTIVE: 1}
+    # タスク (GROUP BY + 期限超過) / メモ / プロジェクト
+    assert len(statements) == DASHBOARD_QUERY_COUNT
@@ -40,6 +40,12 @@ class DummyTagRepo:
             raise NotFoundError(msg)
         return list(self.storage.values())
 
+    def get_read(self, tag_id: uuid.UUID) -> TagRead:
+        return TagRead.model_validate(self.get_by_id(tag_id))
+
+    def list_reads(self) -> list[TagRead]:
+        return [TagRead.model_validate(t) for t in self.get_all()]
+
     def delete(self, tag_id: uuid.UUID) -> bool:
         return bool(self.storage.pop(tag_id, None))
 
@@ -0,0 +1,111 @@
+"""タスク一括書き込みのベンチマーク
+
+AI が生成した Draft タスク 50 件の承認を、1 件ずつの更新 (行ごとにコミット) と
+一括更新 (1 回の UPDATE + 1 回のコミット) で比較する。
+
+テスト項目:
+- 一括作成は 1 回のコミットで 50 件を INSERT する
+- 一括承認は行ごとの更新に比べてコミット数・SQL 文の数が件数に依存しない
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from sqlalchemy import event
+
+from logic.repositories.task import TaskRepository
+from logic.services.task_service import TaskService
+from models import TaskCreate, TaskStatus, TaskUpdate
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Callable
+
+    from sqlalchemy import Engine
+    from sqlmodel import Session
+
+DRAFT_COUNT = 50
+# 承認ステータスごとの UPDATE 2 回 (TODO / PROGRESS)
+BULK_APPROVE_STATEMENTS = 2
+
+
+def _measure(engine: Engine, action: Callable[[], object]) -> tuple[int, int, float]:
+    """action 実行中のコミット数・SQL 文の数・経過秒を計測する。"""
+    statements: list[str] = []
+    commits: list[object] = []
+
+    def _on_statement(_conn: object, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(statement)
+
+    def _on_commit(conn: object) -> None:
+        commits.append(conn)
+
+    event.listen(engine, "before_cursor_execute", _on_statement)
+    event.listen(engine, "commit", _on_commit)
+    started = time.perf_counter()
+    try:
+        action()
+    finally:
+        elapsed = time.perf_counter() - started
+        event.remove(engine, "before_cursor_execute", _on_statement)
+        event.remove(engine, "commit", _on_commit)
+    return len(commits), len(statements), elapsed
+
+
+def _drafts() -> list[TaskCreate]:
+    return [TaskCreate(title=f"draft-{i}", status=TaskStatus.DRAFT) for i in range(DRAFT_COUNT)]
+
+
+def _approved_status(index: int) -> TaskStatus:
+    return TaskStatus.PROGRESS if index % 2 else TaskStatus.TODO
+
+
+def test_bulk_create_commits_once(test_session: Session, test_engine: Engine) -> None:
+    """正常系: 50 件の Draft 作成が 1 回のコミットで完了する"""
+    service = TaskService(task_repo=TaskRepository(test_session))
+
+    def _create() -> None:
+        created = service.bulk_create(_drafts())
+        test_session.commit()
+        assert len(created) == DRAFT_COUNT
+
+    commits, _statements, elapsed = _measure(test_engine, _create)
+
+    logger.info(f"bulk_create {DRAFT_COUNT} 件: commits={commits} elapsed={elapsed * 1000:.1f}ms")
+    assert commits == 1
+
+
+def test_bulk_approve_beats_per_row_updates(test_session: Session, test_engine: Engine) -> None:
+    """正常系: 50 件の承認で一括更新はコミット 1 回・UPDATE 2 回に収まる"""
+    service = TaskService(task_repo=TaskRepository(test_session))
+    per_row_ids = [t.id for t in service.bulk_create(_drafts())]
+    bulk_ids = [t.id for t in service.bulk_create(_drafts())]
+    test_session.commit()
+
+    def _approve_per_row() -> None:
+        for index, task_id in enumerate(per_row_ids):
+            service.update(task_id, TaskUpdate(status=_approved_status(index)))
+
+    def _approve_bulk() -> None:
+        groups: dict[TaskStatus, list[uuid.UUID]] = {}
+        for index, task_id in enumerate(bulk_ids):
+            groups.setdefault(_approved_status(index), []).append(task_id)
+        for status, task_ids in groups.items():
+            service.bulk_update_status(task_ids, status)
+        test_session.commit()
+
+    row_commits, row_statements, row_elapsed = _measure(test_engine, _approve_per_row)
+    bulk_commits, bulk_statements, bulk_elapsed = _measure(test_engine, _approve_bulk)
+
+    logger.info(
+        f"承認 {DRAFT_COUNT} 件: per-row commits={row_commits} statements={row_statements} "
+        f"elapsed={row_elapsed * 1000:.1f}ms / bulk commits={bulk_commits} statements={bulk_statements} "
+        f"elapsed={bulk_elapsed * 1000:.1f}ms"
+    )
+    assert row_commits == DRAFT_COUNT
+    assert (bulk_commits, bulk_statements) == (1, BULK_APPROVE_STATEMENTS)
+    approved = service.get_by_ids(bulk_ids)
+    assert [t.status for t in approved] == [_approved_status(i) for i in range(DRAFT_COUNT)]
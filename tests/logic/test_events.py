@@ -0,0 +1,81 @@
+"""プロセス内のドメインイベントバスのテストケース
+
+テスト対象：
+- 購読した型とそのサブクラスのイベントだけがリスナーへ配送される
+- 解除後は配送されず、購読者の有無を判定できる
+- リスナーの例外は他のリスナーへ影響しない
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import uuid4
+
+from logic.events import ChangeKind, DataChanged, DomainEvent, EventBus, MemoChanged, TaskChanged
+from models import TaskStatus
+
+
+@dataclass(frozen=True, slots=True)
+class _Other(DomainEvent):
+    value: int
+
+
+def test_publish_delivers_to_matching_subscribers() -> None:
+    """イベントの型 (基底クラスを含む) で購読したリスナーだけに配送されることをテスト"""
+    bus = EventBus()
+    memos: list[MemoChanged] = []
+    everything: list[DomainEvent] = []
+    bus.subscribe(MemoChanged, memos.append)
+    bus.subscribe(DomainEvent, everything.append)
+
+    memo_event = MemoChanged(memo_id=uuid4(), kind=ChangeKind.CREATED)
+    bus.publish(memo_event)
+    bus.publish(DataChanged(tables=frozenset({"memos"})))
+
+    assert memos == [memo_event]
+    assert len(everything) == 2  # noqa: PLR2004
+
+
+def test_unsubscribe_and_has_subscribers() -> None:
+    """解除後は配送されず、購読者の有無が更新されることをテスト"""
+    bus = EventBus()
+    received: list[_Other] = []
+    assert not bus.has_subscribers(_Other)
+
+    unsubscribe = bus.subscribe(_Other, received.append)
+    assert bus.has_subscribers(_Other)
+    bus.publish(_Other(value=1))
+
+    unsubscribe()
+    unsubscribe()
+    bus.publish(_Other(value=2))
+
+    assert received == [_Other(value=1)]
+    assert not bus.has_subscribers(_Other)
+
+
+def test_listener_error_does_not_stop_other_listeners() -> None:
+    """リスナーの例外が発行側や他のリスナーへ伝播しないことをテスト"""
+    bus = EventBus()
+    received: list[_Other] = []
+
+    def _broken(_event: _Other) -> None:
+        raise RuntimeError
+
+    bus.subscribe(_Other, _broken)
+    bus.subscribe(_Other, received.append)
+    bus.publish(_Other(value=1))
+
+    assert received == [_Other(value=1)]
+
+
+def test_task_changed_status_changed() -> None:
+    """ステータスが変わった更新だけ status_changed が True になることをテスト"""
+    task_id = uuid4()
+    changed = TaskChanged(
+        task_id=task_id, kind=ChangeKind.UPDATED, status=TaskStatus.COMPLETED, previous_status=TaskStatus.TODO
+    )
+    unchanged = TaskChanged(task_id=task_id, kind=ChangeKind.UPDATED, status=TaskStatus.TODO)
+
+    assert changed.status_changed
+    assert not unchanged.status_changed
@@ -11,6 +11,8 @@ UnitOfWork/SqlModelUnitOfWork のトランザクション管理とファクト
 - トランザクション:
     - commit が永続化し、rollback は破棄する
     - 同一トランザクション内で複数操作が可能
+    - defer_commit=True ではリポジトリは flush のみ行い、終了時に 1 回だけコミットする
+    - defer_commit=True で書き込みロックを取れない場合も、接続はプールへ返却される
 - ファクトリ整合性:
     - repository_factory.create(...) で作られたリポジトリと
         service_factory.get_service(...) で作られたサービスは同じセッションを共有
@@ -19,19 +21,24 @@ UnitOfWork/SqlModelUnitOfWork のトランザクション管理とファクト
     - TaskService を取得してタスクを保存後、get_by_id で取得できる
 """
 
+import sqlite3
 import uuid
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from sqlalchemy import Engine, create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
 from sqlmodel import Session, SQLModel
 
+from database import SqliteProfile, create_sqlite_engine
 from logic.factory import RepositoryFactory, ServiceFactory
 from logic.repositories.task import TaskRepository
 from logic.services.task_service import TaskService
 from logic.unit_of_work import SqlModelUnitOfWork, UnitOfWork
 from models import Task, TaskStatus
-from tests.logic.helpers import create_test_task
+from tests.logic.helpers import create_test_task, create_test_task_create
 
 
 class TestSqlModelUnitOfWork:
@@ -230,6 +237,80 @@ class TestSqlModelUnitOfWork:
                 assert saved_task1.title == "タスク1"
                 assert saved_task2.title == "タスク2"
 
+    def test_read_only_uses_read_engine(self, clean_engine: Engine) -> None:
+        """read_only=True の場合は読み取り専用エンジンのセッションを使うことをテスト"""
+        read_engine = create_engine("sqlite:///:memory:", echo=False)
+        with patch("logic.unit_of_work.engine", clean_engine), patch("logic.unit_of_work.read_engine", read_engine):
+            with SqlModelUnitOfWork(read_only=True) as uow:
+                assert uow.read_only is True
+                assert uow.session.get_bind() is read_engine
+
+            with SqlModelUnitOfWork() as uow:
+                assert uow.read_only is False
+                assert uow.session.get_bind() is clean_engine
+
+    def test_defer_commit_commits_once_on_exit(self, clean_engine: Engine) -> None:
+        """defer_commit=True の場合、リポジトリは flush のみ行い終了時に 1 回だけコミットすることをテスト"""
+        with patch("logic.unit_of_work.engine", clean_engine):
+            uow = SqlModelUnitOfWork(defer_commit=True)
+            with patch.object(Session, "commit", autospec=True, side_effect=Session.commit) as mock_commit:
+                with uow:
+                    task_repo = uow.repository_factory.create(TaskRepository)
+                    assert task_repo.commit_deferred is True
+                    created = task_repo.create(create_test_task_create("タスク1", "説明1"))
+                    task_repo.create(create_test_task_create("タスク2", "説明2"))
+                    mock_commit.assert_not_called()
+
+                assert mock_commit.call_count == 1
+            # expire_on_commit=False のため、終了後も属性を参照できる
+            assert created.title == "タスク1"
+            with Session(clean_engine) as verify_session:
+                assert verify_session.get(Task, created.id) is not None
+
+    def test_defer_commit_rolls_back_all_steps_on_exception(self, clean_engine: Engine) -> None:
+        """defer_commit=True で例外が発生すると、途中のリポジトリ操作もすべて取り消されることをテスト"""
+        with patch("logic.unit_of_work.engine", clean_engine):
+            error_message = "boom"
+            created_ids: list[uuid.UUID] = []
+
+            def _create_and_fail() -> None:
+                with SqlModelUnitOfWork(defer_commit=True) as uow:
+                    created = uow.repository_factory.create(TaskRepository).create(create_test_task_create())
+                    assert created.id is not None
+                    created_ids.append(created.id)
+                    raise RuntimeError(error_message)
+
+            with pytest.raises(RuntimeError, match=error_message):
+                _create_and_fail()
+
+            with Session(clean_engine) as verify_session:
+                assert verify_session.get(Task, created_ids[0]) is None
+
+    def test_defer_commit_returns_connection_when_begin_fails(self, tmp_path: Path) -> None:
+        """defer_commit=True で BEGIN IMMEDIATE がロック待ちで失敗しても、接続がプールへ返却されることをテスト"""
+        db_path = tmp_path / "locked.db"
+        engine = create_sqlite_engine(db_path, SqliteProfile(busy_timeout_ms=10, pool_size=1, max_overflow=0))
+        blocker = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            # 接続時の PRAGMA journal_mode=WAL がロック待ちにならないよう、先に WAL にしておく
+            blocker.execute("PRAGMA journal_mode=WAL")
+            blocker.execute("BEGIN IMMEDIATE")
+            # __exit__ が呼ばれない状況で、GC による回収に頼らないよう UoW への参照を保持する
+            uow = SqlModelUnitOfWork(defer_commit=True)
+            with patch("logic.unit_of_work.engine", engine), pytest.raises(OperationalError), uow:
+                pass
+
+            assert isinstance(engine.pool, QueuePool)
+            assert engine.pool.checkedout() == 0
+        finally:
+            blocker.close()
+            engine.dispose()
+
+    def test_defer_commit_cannot_be_combined_with_read_only(self) -> None:
+        """read_only と defer_commit の同時指定はエラーになることをテスト"""
+        with pytest.raises(ValueError, match="同時に指定できません"):
+            SqlModelUnitOfWork(read_only=True, defer_commit=True)
+
 
 class TestUnitOfWorkAbstractInterface:
     """UnitOfWork 抽象クラスのテストクラス
@@ -0,0 +1,130 @@
+"""database モジュール (SQLite エンジン/チューニングプロファイル) のテスト
+
+テスト項目:
+- ファイル DB のエンジンで接続ごとに PRAGMA が適用される
+- 読み取り専用エンジンは書き込みを拒否する
+- ファイル DB は QueuePool、インメモリ DB は StaticPool が選ばれる
+- apply_profile でプロファイルとプールサイズが差し替わる
+- 不正なプロファイル値は ValueError
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from database import SqliteProfile, apply_profile, create_sqlite_engine, get_profile
+from settings.models import DatabaseSettings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# PRAGMA synchronous / temp_store が返す数値
+SYNCHRONOUS_NORMAL = 1
+SYNCHRONOUS_FULL = 2
+TEMP_STORE_MEMORY = 2
+BUSY_TIMEOUT_MS = 1234
+CACHE_SIZE_KIB = 2048
+POOL_SIZE = 3
+RESIZED_POOL_SIZE = 7
+
+
+def _pragma(engine, name: str) -> object:  # noqa: ANN001
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_file_engine_applies_pragmas(tmp_path: Path) -> None:
+    """ファイル DB のエンジンで PRAGMA が適用されることをテスト"""
+    profile = SqliteProfile(
+        synchronous="normal", busy_timeout_ms=BUSY_TIMEOUT_MS, temp_store="memory", cache_size_kib=CACHE_SIZE_KIB
+    )
+    engine = create_sqlite_engine(tmp_path / "kage.db", profile)
+
+    assert isinstance(engine.pool, QueuePool)
+    assert _pragma(engine, "journal_mode") == "wal"
+    assert _pragma(engine, "synchronous") == SYNCHRONOUS_NORMAL
+    assert _pragma(engine, "busy_timeout") == BUSY_TIMEOUT_MS
+    assert _pragma(engine, "temp_store") == TEMP_STORE_MEMORY
+    assert _pragma(engine, "cache_size") == -CACHE_SIZE_KIB
+    assert _pragma(engine, "query_only") == 0
+    engine.dispose()
+
+
+def test_read_only_engine_rejects_writes(tmp_path: Path) -> None:
+    """読み取り専用エンジンが書き込みを拒否することをテスト"""
+    db_path = tmp_path / "kage.db"
+    writer = create_sqlite_engine(db_path)
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO t (id) VALUES (1)"))
+
+    reader = create_sqlite_engine(db_path, read_only=True)
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM t")).scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO t (id) VALUES (2)"))
+    writer.dispose()
+    reader.dispose()
+
+
+def test_memory_engine_uses_static_pool() -> None:
+    """インメモリ DB では StaticPool が選ばれることをテスト"""
+    engine = create_sqlite_engine(":memory:")
+    assert isinstance(engine.pool, StaticPool)
+
+
+def test_apply_profile_swaps_profile_and_pool_size(tmp_path: Path) -> None:
+    """apply_profile でプロファイルとプールサイズが差し替わることをテスト"""
+    engine = create_sqlite_engine(tmp_path / "kage.db", SqliteProfile(pool_size=POOL_SIZE))
+
+    apply_profile(engine, SqliteProfile(synchronous="FULL", pool_size=RESIZED_POOL_SIZE))
+
+    profile = get_profile(engine)
+    assert profile is not None
+    assert profile.synchronous == "FULL"
+    assert profile.pool_size == RESIZED_POOL_SIZE
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == RESIZED_POOL_SIZE
+    # 作り直したプールでも接続時の PRAGMA が適用される
+    assert _pragma(engine, "synchronous") == SYNCHRONOUS_FULL
+    engine.dispose()
+    assert engine.pool.size() == RESIZED_POOL_SIZE
+
+
+def test_apply_profile_rejects_foreign_engine() -> None:
+    """未登録エンジンへの apply_profile が ValueError になることをテスト"""
+    from sqlalchemy import create_engine
+
+    with pytest.raises(ValueError, match="create_sqlite_engine"):
+        apply_profile(create_engine("sqlite://"), SqliteProfile())
+
+
+def test_profile_from_settings() -> None:
+    """DatabaseSettings からプロファイルを生成できることをテスト"""
+    settings = DatabaseSettings(journal_mode="DELETE", mmap_size=0, pool_size=POOL_SIZE)
+    profile = SqliteProfile.from_settings(settings)
+
+    assert profile.journal_mode == "DELETE"
+    assert profile.mmap_size == 0
+    assert profile.pool_size == POOL_SIZE
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"journal_mode": "FAST"},
+        {"synchronous": "SOMETIMES"},
+        {"temp_store": "DISK"},
+        {"busy_timeout_ms": -1},
+        {"pool_size": 0},
+    ],
+)
+def test_profile_validation(kwargs: dict[str, object]) -> None:
+    """不正なプロファイル値が ValueError になることをテスト"""
+    with pytest.raises(ValueError):  # noqa: PT011
+        SqliteProfile(**kwargs)  # type: ignore[arg-type]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Never
 from uuid import uuid4
 
@@ -12,11 +12,14 @@ if TYPE_CHECKING:
 
 from models import (
     AiSuggestionStatus,
+    DashboardStats,
     MemoRead,
+    MemoStats,
     MemoStatus,
     ProjectRead,
     ProjectStatus,
     TaskRead,
+    TaskStats,
     TaskStatus,
 )
 from views.home.query import ApplicationHomeQuery, OneLinerServicePort
@@ -28,7 +31,7 @@ class FakeMemoService:
     def __init__(self, memos: list[MemoRead]) -> None:
         self._memos = memos
 
-    def get_all_memos(self, *, with_details: bool = False) -> list[MemoRead]:
+    def get_all_memos(self, *, with_details: bool = False, profile: str | None = None) -> list[MemoRead]:
         return self._memos
 
 
@@ -88,12 +91,13 @@ def _memo(
     )
 
 
-def _task(*, title: str, status: TaskStatus) -> TaskRead:
+def _task(*, title: str, status: TaskStatus, due_date: date | None = None) -> TaskRead:
     """テスト用のTaskReadインスタンスを生成する。"""
     return TaskRead(
         id=uuid4(),
         title=title,
         status=status,
+        due_date=due_date,
     )
 
 
@@ -181,6 +185,20 @@ def test_daily_review_prefers_overdue_tasks() -> None:
     assert one_liner.call_count == 0
 
 
+def test_daily_review_fallback_counts_past_due_tasks_as_overdue() -> None:
+    """集計サービスがない場合も、期限日を過ぎた未完了タスクを集計クエリと同じく期限超過として扱う。"""
+    yesterday = datetime.now().astimezone().date() - timedelta(days=1)
+    tasks = [
+        _task(title="Past due", status=TaskStatus.TODO, due_date=yesterday),
+        _task(title="Done", status=TaskStatus.COMPLETED, due_date=yesterday),
+    ]
+    query = _create_query(memos=[], tasks=tasks, projects=[], one_liner_service=FakeOneLinerService())
+
+    review = query.get_daily_review()
+
+    assert "1件の期限超過タスク" in review["message"]
+
+
 def test_get_one_liner_message_returns_ai_text() -> None:
     """OneLiner生成APIは専用メソッド経由で呼び出される。"""
     one_liner = FakeOneLinerService(message="AIの一言")
@@ -235,3 +253,52 @@ def test_get_tasks_handles_not_found_error_and_returns_empty(caplog: pytest.LogC
     assert isinstance(review, dict)
     assert "message" in review
     assert any("No tasks found" in r.message for r in caplog.records)
+
+
+class FakeStatsService:
+    """StatsApplicationService互換のフェイク。"""
+
+    def __init__(self, stats: DashboardStats) -> None:
+        self._stats = stats
+        self.call_count = 0
+
+    def get_dashboard_stats(self) -> DashboardStats:
+        self.call_count += 1
+        return self._stats
+
+
+class ForbiddenListService:
+    """全件取得が呼ばれたら失敗するフェイク。"""
+
+    def get_all_memos(self, *, with_details: bool = False, profile: str | None = None) -> Never:
+        raise AssertionError
+
+    def get_all_tasks(self) -> Never:
+        raise AssertionError
+
+    def get_all_projects(self) -> Never:
+        raise AssertionError
+
+
+def test_stats_service_replaces_full_list_loading() -> None:
+    """集計サービス指定時は一覧を読み込まず、集計値から統計とレビューを作ること。"""
+    stats = DashboardStats(
+        tasks=TaskStats(by_status={TaskStatus.TODAYS: 3, TaskStatus.TODO: 1}, overdue=2),
+        memos=MemoStats(by_status={MemoStatus.INBOX: 4}),
+        projects_by_status={ProjectStatus.ACTIVE: 5},
+    )
+    stats_service = FakeStatsService(stats)
+    forbidden = ForbiddenListService()
+    query = ApplicationHomeQuery(
+        memo_service=forbidden,
+        task_service=forbidden,
+        project_service=forbidden,
+        one_liner_service=FakeOneLinerService(),
+        stats_service=stats_service,
+    )
+
+    assert query.get_stats() == {"todays_tasks": 3, "todo_tasks": 1, "active_projects": 5}
+    review = query.get_daily_review()
+
+    assert "2件の期限超過タスク" in review["message"]
+    assert stats_service.call_count == 1
@@ -36,6 +36,9 @@ class _DummyMemoApp:
         self.last_update_data = update_data
         return self.memo_to_return
 
+    def count_by_status(self) -> dict[MemoStatus, int]:
+        return dict.fromkeys(MemoStatus, 0)
+
 
 class _DummyState:
     """controller が参照する最小限の State を提供する。"""
@@ -52,6 +55,9 @@ class _DummyState:
     def set_all_memos(self, memos: list[MemoRead]) -> None:
         self.all_memos = memos
 
+    def set_status_counts(self, counts: dict[MemoStatus, int] | None) -> None:
+        self.status_counts = counts
+
     def set_selected_memo(self, memo_id: UUID | None) -> None:  # pragma: no cover - unused but kept for safety
         self.selected_memo_id = memo_id
 
@@ -57,3 +57,32 @@ def test_restore_ai_flow_sets_project_info() -> None:
     assert ai_state.project_title == "LLM連携"
     assert ai_state.project_status == "active"
     assert ai_state.generated_tasks[0].project_id == str(project_id)
+
+
+def test_append_memos_tracks_pages_and_prefers_server_counts() -> None:
+    first = MemoRead(
+        id=uuid4(),
+        title="first",
+        content="",
+        status=MemoStatus.INBOX,
+        ai_suggestion_status=AiSuggestionStatus.NOT_REQUESTED,
+    )
+    second = first.model_copy(update={"id": uuid4(), "title": "second"})
+    state = MemosViewState()
+    state.append_memos([first])
+    state.set_page_cursor(MemoStatus.INBOX, "cursor-1")
+
+    assert state.is_page_loaded(MemoStatus.INBOX)
+    assert not state.is_page_loaded(MemoStatus.IDEA)
+    assert state.has_more(MemoStatus.INBOX)
+
+    state.append_memos([first.model_copy(update={"title": "renamed"}), second])
+    state.set_page_cursor(MemoStatus.INBOX, None)
+
+    assert [memo.title for memo in state.all_memos] == ["renamed", "second"]
+    assert not state.has_more(MemoStatus.INBOX)
+    assert state.counts_by_status()[MemoStatus.INBOX] == len(state.all_memos)
+
+    server_counts = dict.fromkeys(MemoStatus, 0) | {MemoStatus.INBOX: 120}
+    state.set_status_counts(server_counts)
+    assert state.counts_by_status() == server_counts
@@ -0,0 +1 @@
+"""tests.views.projects パッケージ。"""
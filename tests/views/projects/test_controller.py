@@ -0,0 +1,67 @@
+"""ProjectController の挙動に関するテスト。"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+from models import ProjectRead, ProjectStatus, ProjectSummary, ProjectTaskRow, TaskStatus
+from views.projects.controller import ProjectController
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from views.projects.presenter import ProjectCardVM, ProjectDetailVM
+
+
+def _build_project_read(title: str) -> ProjectRead:
+    """テスト用の ProjectRead を生成する。"""
+    return ProjectRead(id=uuid4(), title=title, description="", status=ProjectStatus.ACTIVE)
+
+
+class _SummaryProjectApp:
+    """get_all_projects / get_by_id / get_summaries だけを提供するスタブ。"""
+
+    def __init__(self, projects: list[ProjectRead], summaries: dict[UUID, ProjectSummary]) -> None:
+        self.projects = projects
+        self.summaries = summaries
+        self.summary_calls: list[list[UUID]] = []
+
+    def get_all_projects(self) -> list[ProjectRead]:
+        return self.projects
+
+    def get_by_id(self, project_id: UUID) -> ProjectRead | None:
+        return next((p for p in self.projects if p.id == project_id), None)
+
+    def get_summaries(self, project_ids: Iterable[UUID]) -> dict[UUID, ProjectSummary]:
+        ids = list(project_ids)
+        self.summary_calls.append(ids)
+        return {pid: self.summaries[pid] for pid in ids if pid in self.summaries}
+
+
+def test_refresh_loads_summaries_once_for_all_projects() -> None:
+    """正常系: 一覧描画はプロジェクト数に関わらず概要を 1 回だけ一括取得する"""
+    first, second = _build_project_read("first"), _build_project_read("second")
+    assert first.id is not None
+    assert second.id is not None
+    rows = (
+        ProjectTaskRow(id=uuid4(), title="done", status=TaskStatus.COMPLETED),
+        ProjectTaskRow(id=uuid4(), title="todo", status=TaskStatus.TODO),
+    )
+    app = _SummaryProjectApp([first, second], {first.id: ProjectSummary(project_id=first.id, tasks=rows)})
+    cards: list[ProjectCardVM] = []
+    details: list[ProjectDetailVM | None] = []
+    controller = ProjectController(app, on_list_change=cards.extend, on_detail_change=details.append)  # type: ignore[arg-type]
+
+    controller.refresh()
+
+    assert app.summary_calls == [[first.id, second.id]]
+    progress = {card.title: (card.completed_count, card.task_count) for card in cards}
+    assert progress == {"first": (1, 2), "second": (0, 0)}
+
+    controller.select_project(str(first.id))
+
+    assert app.summary_calls[-1] == [first.id]
+    detail = details[-1]
+    assert detail is not None
+    assert [(t.title, t.is_completed) for t in detail.tasks] == [("done", True), ("todo", False)]
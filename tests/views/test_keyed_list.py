@@ -0,0 +1,122 @@
+"""KeyedList (キー付きリストの差分更新) のテスト。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from views.shared.components.keyed_list import KeyedList
+
+
+@dataclass(frozen=True)
+class Item:
+    id: str
+    title: str
+
+
+class FakeCard:
+    def __init__(self, item: Item, *, selected: bool, selectable: bool) -> None:
+        self.item = item
+        self.selected = selected
+        self.selectable = selectable
+        self.page = object()
+        self.updates = 0
+
+    def set_selected(self, is_selected: bool) -> bool:  # noqa: FBT001
+        if not self.selectable:
+            return False
+        self.selected = is_selected
+        return True
+
+    def update(self) -> None:
+        self.updates += 1
+
+
+class FakeContainer:
+    def __init__(self) -> None:
+        self.controls: list[Any] = []
+        self.page = object()
+        self.updates = 0
+
+    def update(self) -> None:
+        self.updates += 1
+
+
+def _build(*, selectable: bool = True) -> tuple[KeyedList[Item], FakeContainer, list[Item]]:
+    container = FakeContainer()
+    built: list[Item] = []
+
+    def build(item: Item, selected: bool) -> FakeCard:  # noqa: FBT001
+        built.append(item)
+        return FakeCard(item, selected=selected, selectable=selectable)
+
+    keyed = KeyedList(
+        container,  # type: ignore[arg-type]
+        key=lambda item: item.id,
+        build=build,  # type: ignore[arg-type]
+        empty=lambda: SimpleNamespace(page=None),  # type: ignore[arg-type, return-value]
+    )
+    return keyed, container, built
+
+
+def test_unchanged_cards_are_reused_and_only_changed_ones_rebuilt() -> None:
+    keyed, container, built = _build()
+    keyed.set_items([Item("a", "A"), Item("b", "B"), Item("c", "C")])
+    first = list(container.controls)
+    built.clear()
+
+    keyed.set_items([Item("c", "C"), Item("a", "A"), Item("b", "B2")])
+
+    assert built == [Item("b", "B2")]
+    assert container.controls[0] is first[2]
+    assert container.controls[1] is first[0]
+    assert container.updates == 2  # noqa: PLR2004
+
+
+def test_same_items_do_not_update_container() -> None:
+    keyed, container, _built = _build()
+    keyed.set_items([Item("a", "A")])
+    updates = container.updates
+
+    keyed.set_items([Item("a", "A")])
+
+    assert container.updates == updates
+
+
+def test_select_patches_only_old_and_new_cards() -> None:
+    keyed, container, built = _build()
+    keyed.set_items([Item("a", "A"), Item("b", "B"), Item("c", "C")], selected_key="a")
+    a, b, c = container.controls
+    updates = container.updates
+    built.clear()
+
+    keyed.select("b")
+
+    assert built == []
+    assert (a.selected, b.selected, c.selected) == (False, True, False)
+    assert (a.updates, b.updates, c.updates) == (1, 1, 0)
+    assert container.updates == updates
+
+
+def test_select_rebuilds_cards_that_cannot_toggle_in_place() -> None:
+    keyed, container, built = _build(selectable=False)
+    keyed.set_items([Item("a", "A"), Item("b", "B")])
+    a = container.controls[0]
+    built.clear()
+
+    keyed.select("b")
+
+    assert built == [Item("b", "B")]
+    assert container.controls[0] is a
+    assert container.controls[1].selected is True
+
+
+def test_empty_state_is_shown_for_no_items() -> None:
+    keyed, container, _built = _build()
+    keyed.set_items([Item("a", "A")])
+
+    keyed.set_items([])
+
+    assert len(container.controls) == 1
+    assert container.controls[0].page is None
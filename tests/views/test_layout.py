@@ -0,0 +1,135 @@
+"""ViewCache (View の keep-alive と stale-while-revalidate) のテスト。"""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, ClassVar
+
+import flet as ft
+
+from views.layout import ViewCache
+from views.shared.base_view import BaseView, BaseViewProps
+
+
+class FakeApps:
+    def __init__(self) -> None:
+        self.version = 0
+
+    def data_version(self, _tables: Any) -> int:  # noqa: ANN401
+        return self.version
+
+
+class CountingView(BaseView):
+    keep_alive = True
+    data_tables = ("memos",)
+    created: ClassVar[int] = 0
+
+    def __init__(self, props: BaseViewProps) -> None:
+        super().__init__(props)
+        type(self).created += 1
+        self.reloaded = threading.Event()
+
+    def build_content(self) -> ft.Control:
+        return ft.Text("content")
+
+    def reload_data(self) -> ft.Control:
+        content = ft.Text("reloaded")
+        self.reloaded.set()
+        return content
+
+
+class DisposableView(CountingView):
+    created: ClassVar[int] = 0
+
+
+def _cached_view(cache: ViewCache, route: str) -> CountingView:
+    view = cache._entries[route].view
+    assert isinstance(view, CountingView)
+    return view
+
+
+def _text_of(host: ft.Control) -> str | None:
+    assert isinstance(host, ft.Container)
+    assert isinstance(host.content, ft.Text)
+    return host.content.value
+
+
+def _wait_reloaded(cache: ViewCache, route: str) -> None:
+    for _ in range(100):
+        if not cache._entries[route].reloading:
+            return
+        time.sleep(0.01)
+
+
+def _props(apps: FakeApps, theme_mode: ft.ThemeMode = ft.ThemeMode.LIGHT) -> BaseViewProps:
+    page = SimpleNamespace(theme_mode=theme_mode)
+    return BaseViewProps(page=page, apps=apps)  # type: ignore[arg-type]
+
+
+def test_cached_view_is_reused_without_reload_when_data_unchanged() -> None:
+    CountingView.created = 0
+    cache = ViewCache()
+    apps = FakeApps()
+
+    first = cache.get_content("/memos", _props(apps), CountingView)
+    second = cache.get_content("/memos", _props(apps), CountingView)
+
+    assert second is first
+    assert CountingView.created == 1
+    assert _text_of(first) == "content"
+
+
+def test_stale_view_is_shown_then_reloaded_in_background() -> None:
+    CountingView.created = 0
+    cache = ViewCache()
+    apps = FakeApps()
+    host = cache.get_content("/memos", _props(apps), CountingView)
+    view = _cached_view(cache, "/memos")
+
+    apps.version = 1
+    again = cache.get_content("/memos", _props(apps), CountingView)
+
+    assert again is host
+    assert view.reloaded.wait(timeout=5)
+    _wait_reloaded(cache, "/memos")
+    assert _text_of(host) == "reloaded"
+    assert CountingView.created == 1
+
+
+def test_lru_limit_and_theme_change_rebuild_views() -> None:
+    CountingView.created = 0
+    DisposableView.created = 0
+    cache = ViewCache(max_entries=1)
+    apps = FakeApps()
+
+    cache.get_content("/memos", _props(apps), CountingView)
+    cache.get_content("/tasks", _props(apps), DisposableView)
+    cache.get_content("/memos", _props(apps), CountingView)
+    assert len(cache) == 1
+    assert CountingView.created == 2  # noqa: PLR2004
+
+    cache.get_content("/memos", _props(apps, ft.ThemeMode.DARK), CountingView)
+    assert CountingView.created == 3  # noqa: PLR2004
+
+
+def test_data_change_reloads_only_displayed_dependent_view() -> None:
+    CountingView.created = 0
+    DisposableView.created = 0
+    cache = ViewCache()
+    apps = FakeApps()
+    cache.get_content("/memos", _props(apps), CountingView)
+    cache.get_content("/tasks", _props(apps), DisposableView)
+    memos_view = _cached_view(cache, "/memos")
+    tasks_view = _cached_view(cache, "/tasks")
+
+    apps.version = 1
+    cache.notify_data_changed({"projects"})
+    cache.notify_data_changed({"memos"})
+
+    # 表示中 (/tasks) の View だけがその場で最新化され、裏にある View は再訪時まで待つ
+    assert tasks_view.reloaded.wait(timeout=5)
+    _wait_reloaded(cache, "/tasks")
+    assert not memos_view.reloaded.is_set()
+    assert cache._entries["/tasks"].data_version == 1
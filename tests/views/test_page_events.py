@@ -0,0 +1,111 @@
+"""PageEvents (ドメインイベントの page.pubsub 経由の中継) のテスト。"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from logic.events import DomainEvent, EventBus
+from views.shared.page_events import connect_page_events, get_page_events
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@dataclass(frozen=True, slots=True)
+class Changed(DomainEvent):
+    value: int
+
+
+@dataclass(frozen=True, slots=True)
+class Progress(Changed):
+    pass
+
+
+class FakePubSub:
+    """送信したメッセージを同じスレッドでハンドラへ渡す pubsub。"""
+
+    def __init__(self) -> None:
+        self.handlers: dict[str, list[Callable[[str, Any], None]]] = defaultdict(list)
+        self.sent = 0
+
+    def subscribe_topic(self, topic: str, handler: Callable[[str, Any], None]) -> None:
+        self.handlers[topic].append(handler)
+
+    def unsubscribe_topic(self, topic: str) -> None:
+        self.handlers.pop(topic, None)
+
+    def send_all_on_topic(self, topic: str, message: Any) -> None:  # noqa: ANN401
+        self.sent += 1
+        for handler in list(self.handlers.get(topic, [])):
+            handler(topic, message)
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self._store: dict[str, Any] = {}
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        self._store[key] = value
+
+    def get(self, key: str) -> Any:  # noqa: ANN401
+        return self._store.get(key)
+
+
+class FakePage:
+    def __init__(self) -> None:
+        self.session_id = "session-1"
+        self.pubsub = FakePubSub()
+        self.session = FakeSession()
+
+
+def test_events_are_delivered_once_per_listener_via_pubsub() -> None:
+    bus = EventBus()
+    page = FakePage()
+    events = connect_page_events(page, bus)  # type: ignore[arg-type]
+    changed: list[Changed] = []
+    progress: list[Progress] = []
+    events.subscribe(Changed, changed.append)
+    events.subscribe(Progress, progress.append)
+
+    bus.publish(Changed(value=1))
+    bus.publish(Progress(value=2))
+
+    assert get_page_events(page) is events  # type: ignore[arg-type]
+    assert changed == [Changed(value=1), Progress(value=2)]
+    assert progress == [Progress(value=2)]
+
+
+def test_bus_is_subscribed_only_while_listeners_exist() -> None:
+    bus = EventBus()
+    page = FakePage()
+    events = connect_page_events(page, bus)  # type: ignore[arg-type]
+    assert not bus.has_subscribers(Progress)
+
+    first = events.subscribe(Progress, lambda _event: None)
+    second = events.subscribe(Progress, lambda _event: None)
+    assert bus.has_subscribers(Progress)
+
+    first()
+    assert bus.has_subscribers(Progress)
+    second()
+    assert not bus.has_subscribers(Progress)
+
+    bus.publish(Progress(value=1))
+    assert page.pubsub.sent == 0
+
+
+def test_close_releases_bus_and_topic() -> None:
+    bus = EventBus()
+    page = FakePage()
+    events = connect_page_events(page, bus)  # type: ignore[arg-type]
+    received: list[Changed] = []
+    events.subscribe(Changed, received.append)
+
+    events.close()
+    bus.publish(Changed(value=1))
+
+    assert received == []
+    assert not bus.has_subscribers(Changed)
+    assert not page.pubsub.handlers
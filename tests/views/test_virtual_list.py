@@ -0,0 +1,105 @@
+"""VirtualList (表示範囲だけを生成する仮想スクロールリスト) のテスト。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import flet as ft
+import pytest
+
+from views.shared.components.virtual_list import VirtualList, compute_window
+
+EXTENT = 100
+
+
+@dataclass(frozen=True)
+class Item:
+    id: str
+
+
+def _items(count: int) -> list[Item]:
+    return [Item(id=str(i)) for i in range(count)]
+
+
+def _build(*, overscan: int = 2) -> tuple[VirtualList[Item], list[int]]:
+    requests: list[int] = []
+    virtual: VirtualList[Item] = VirtualList(
+        key=lambda item: item.id,
+        build=lambda item, _selected: ft.Text(item.id),
+        item_extent=EXTENT,
+        overscan=overscan,
+        on_load_more=lambda: requests.append(1),
+    )
+    return virtual, requests
+
+
+def _scroll(virtual: VirtualList[Item], offset: float, viewport: float = 5 * EXTENT) -> None:
+    virtual._handle_scroll(SimpleNamespace(pixels=offset, viewport_dimension=viewport))  # type: ignore[arg-type]
+
+
+def _rendered_ids(virtual: VirtualList[Item]) -> list[str]:
+    return [item.id for item in virtual._items if virtual.control_for(item.id) is not None]
+
+
+@pytest.mark.parametrize(
+    ("offset", "count", "expected"),
+    [
+        (0, 100, (0, 7)),
+        (1000, 100, (8, 17)),
+        (9600, 100, (93, 100)),
+        (0, 3, (0, 3)),
+        (0, 0, (0, 0)),
+        # 件数が減ってスクロール位置が末尾を越えた場合も末尾の項目を生成する
+        (5000, 10, (3, 10)),
+    ],
+)
+def test_compute_window(offset: float, count: int, expected: tuple[int, int]) -> None:
+    assert compute_window(offset, 5 * EXTENT, item_extent=EXTENT, count=count, overscan=2) == expected
+
+
+def test_renders_only_window_and_pads_with_spacers() -> None:
+    virtual, _ = _build()
+    virtual.set_items(_items(1000))
+    _scroll(virtual, 10 * EXTENT)
+
+    assert _rendered_ids(virtual) == [str(i) for i in range(8, 17)]
+    assert virtual._top.height == 8 * EXTENT
+    assert virtual._bottom.height == (1000 - 17) * EXTENT
+
+
+def test_scroll_reuses_cards_still_in_window() -> None:
+    virtual, _ = _build()
+    virtual.set_items(_items(100))
+    _scroll(virtual, 10 * EXTENT)
+    kept = virtual.control_for("12")
+
+    _scroll(virtual, 11 * EXTENT)
+
+    assert virtual.control_for("12") is kept
+    assert virtual.control_for("8") is None
+
+
+def test_requests_more_once_near_the_end() -> None:
+    virtual, requests = _build()
+    virtual.set_items(_items(50), has_more=True)
+    _scroll(virtual, 0)
+    assert requests == []
+
+    _scroll(virtual, 44 * EXTENT)
+    _scroll(virtual, 45 * EXTENT)
+    assert requests == [1]
+
+    # 次のページが反映されたら、再び末尾付近で要求できる
+    virtual.set_items(_items(80), has_more=True)
+    assert requests == [1]
+    _scroll(virtual, 74 * EXTENT)
+    assert requests == [1, 1]
+
+
+def test_does_not_request_when_no_more_pages() -> None:
+    virtual, requests = _build()
+    virtual.set_items(_items(5), has_more=False)
+    _scroll(virtual, 0)
+
+    assert requests == []